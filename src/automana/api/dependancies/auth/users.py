@@ -7,6 +7,7 @@ from automana.api.dependancies.general import ipDep
 from automana.api.dependancies.service_deps import ServiceManagerDep
 from automana.api.schemas.user_management.user import UserInDB
 from automana.api.services.auth.auth import decode_access_token
+from automana.api.services.auth.session_cache import cache_session_user, get_cached_session_user
 from automana.core.exceptions import session_exceptions
 from automana.core.config.settings import get_settings
 
@@ -48,6 +49,11 @@ async def get_current_active_user(
 
     # --- Cookie path ---
     if session_id:
+        # Served from the short-TTL session cache, this skips the service
+        # round (pool acquire + transaction + query) entirely.
+        cached_user = await get_cached_session_user(session_id, ip_address, user_agent)
+        if cached_user is not None:
+            return cached_user
         try:
             user = await service_manager.execute_service(
                 "auth.session.get_user_from_session",
@@ -60,6 +66,7 @@ async def get_current_active_user(
             validated = UserInDB.model_validate(user)
             if validated.disabled:
                 _raise_auth_error(request, "Account is disabled")
+            await cache_session_user(session_id, ip_address, user_agent, user, user.get("session_expires_at"))
             return validated
         except session_exceptions.SessionError:
             pass  # fall through to Bearer path
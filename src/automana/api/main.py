@@ -2,7 +2,8 @@
 import time, logging, uuid
 #from backend.modules.ebay import routers as ebay_router
 #from backend import api
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from automana.core.config.settings import get_settings
 #for fasvicon
 from pathlib import Path
@@ -25,6 +26,7 @@ class AppState:
     def __init__(self):
         """Centralized application state"""
         self.async_db_pool = None
+        self.db_pools = None
         self.sync_db_pool = None
         self.query_executor = None
         self.error_handler = None
@@ -39,10 +41,12 @@ async def lifespan(app: FastAPI):
         settings = get_settings()
         from automana.api.request_handling.ErrorHandler import AsyncpgExceptionHandler
         from automana.core.db.query_executor import AsyncQueryExecutor
-        from automana.core.db.database import init_async_pool, close_async_pool, init_sync_pool_with_retry, close_sync_pool    
+        from automana.core.db.database import init_async_pools, close_async_pool, close_async_pools, init_sync_pool_with_retry, close_sync_pool
         from automana.core.framework.service_manager import ServiceManager
         app.state.error_handler = AsyncpgExceptionHandler()
-        app.state.async_db_pool = await init_async_pool(settings)
+        # primary always; read/bulk only when configured (see init_async_pools)
+        app.state.db_pools = await init_async_pools(settings)
+        app.state.async_db_pool = app.state.db_pools["primary"]
         try:
             from automana.core.db.database import init_agent_pool
             app.state.agent_pool = await init_agent_pool(settings)
@@ -55,25 +59,35 @@ async def lifespan(app: FastAPI):
         app.state.query_executor = AsyncQueryExecutor(app.state.error_handler)
         app.state.service_manager = await ServiceManager.initialize(
             connection_pool=app.state.async_db_pool,
-            query_executor=app.state.query_executor
+            query_executor=app.state.query_executor,
+            pools=app.state.db_pools,
         )
+        from automana.core.utils.redis_cache import start_invalidation_listener
+        app.state.cache_invalidation_listener = start_invalidation_listener()
         yield
 
     finally:
           # Shutdown (always runs)
         logger.info("ðŸ”„ Application shutdown initiated")
         
+        listener = getattr(app.state, 'cache_invalidation_listener', None)
+        if listener is not None:
+            listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await listener
+
         if hasattr(app.state, 'service_manager') and app.state.service_manager:
             await ServiceManager.close()
             
-        if hasattr(app.state, 'async_db_pool') and app.state.async_db_pool:
-            await close_async_pool(app.state.async_db_pool)
+        if getattr(app.state, 'db_pools', None):
+            await close_async_pools(app.state.db_pools)
 
         if hasattr(app.state, 'agent_pool') and app.state.agent_pool:
             await close_async_pool(app.state.agent_pool)
 
-        if hasattr(app.state, 'ollama_repo') and app.state.ollama_repo and app.state.ollama_repo._client:
-            await app.state.ollama_repo._client.aclose()
+        # Pooled outbound clients (Ollama, eBay, Scryfall, ...)
+        from automana.core.utils.http_clients import close_http_clients
+        await close_http_clients()
 
         if hasattr(app.state, 'sync_db_pool') and app.state.sync_db_pool:
             close_sync_pool(app.state.sync_db_pool)
@@ -58,6 +58,18 @@ class SessionRepository(AbstractRepository):
         """
         return await self.execute_query(query, (session_id, user_agent, ip_address))
 
+    async def get_session_user(self, session_id: UUID, ip_address: str, user_agent: str) -> dict:
+        """Validate session credentials and fetch the enabled user in one round trip."""
+        query = """
+        SELECT u.*, s.session_expires_at
+        FROM user_management.v_active_sessions s
+        JOIN user_management.users u ON u.unique_id = s.user_id
+        WHERE s.session_id = $1 AND s.user_agent = $2 AND s.ip_address = $3
+          AND u.disabled = FALSE;
+        """
+        result = await self.execute_query(query, (session_id, user_agent, ip_address))
+        return result[0] if result else None
+
     async def list(self):
         query = "SELECT * FROM user_management.v_active_sessions;"
         return await self.execute_query(query)
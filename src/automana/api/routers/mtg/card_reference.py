@@ -7,6 +7,7 @@ from automana.api.schemas.StandardisedQueryResponse import ApiResponse, Paginate
 from automana.core.models.card_catalog.card import BaseCard, CardDetail, CardSuggestionResponse, CreateCard, CreateCards, CatalogStats, CardVersionRow, OtherSetRow
 from automana.core.models.card_catalog.price_history import CardPricesResponse, PriceHistoryResponse
 from automana.api.dependancies.service_deps import ServiceManagerDep
+from automana.core.exceptions.service_layer_exceptions.card_catalogue.card_exception import InvalidSearchCursorError
 from automana.api.dependancies.auth.users import AdminUserDep
 from automana.api.dependancies.query_deps import (
     sort_params,
@@ -281,11 +282,17 @@ async def get_card_prices(
         "filtering: `name`, `oracle_text`, `format`, `set`, `rarity`, and more. "
         "Also accepts `released_after` / `released_before` date range filters and "
         "standard `sort_by` / `sort_order` / `limit` / `offset` controls. "
-        "Results are cached for 60 minutes per unique filter combination."
+        "For deep browsing pass `pagination.next_cursor` from the previous page as "
+        "`cursor`: it seeks straight to the next page, so every page costs the same. "
+        "Results are cached for 60 minutes per unique filter combination; the total "
+        "count and facets are cached once per filter set and shared by all its pages."
     ),
     response_model=PaginatedResponse[BaseCard],
     operation_id="cards_list",
-    responses=_CARD_ERRORS,
+    responses={
+        400: {"description": "Invalid or mismatched cursor"},
+        **_CARD_ERRORS,
+    },
 )
 async def list_cards(
     service_manager: ServiceManagerDep,
@@ -293,12 +300,14 @@ async def list_cards(
     sorting: SortParams = Depends(sort_params),
     search: dict = Depends(card_search_params),
     date_range: DateRangeParams = Depends(date_range_params),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from `pagination.next_cursor`; takes precedence over `offset`"),
 ):
     try:
         result = await service_manager.execute_service(
             "card_catalog.card.search",
             limit=pagination.limit,
             offset=pagination.offset,
+            cursor=cursor,
             released_after=date_range.created_after,
             released_before=date_range.created_before,
             sort_by=sorting.sort_by,
@@ -313,13 +322,16 @@ async def list_cards(
                 limit=pagination.limit,
                 offset=pagination.offset,
                 total_count=total_count,
-                has_next=len(cards) == pagination.limit,
-                has_previous=pagination.offset > 0,
+                has_next=result.next_cursor is not None if result else False,
+                has_previous=pagination.offset > 0 or cursor is not None,
+                next_cursor=result.next_cursor if result else None,
             ),
             facets={"promo_types": result.promo_type_facets, "rarities": result.rarity_facets},
         )
     except HTTPException:
         raise
+    except InvalidSearchCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
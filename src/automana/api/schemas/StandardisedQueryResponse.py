@@ -12,6 +12,7 @@ class PaginationInfo(BaseModel):
     total_count: Optional[int] = None
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 class ApiResponse(BaseModel, Generic[DataT]):
     success: bool = True
@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordBearer
 from uuid import UUID
 from automana.core.config.settings import get_settings as get_general_settings
 from automana.api.services.auth.session_service import rotate_session_token, create_new_session
+from automana.api.services.auth.session_cache import invalidate_session_user
 from automana.api.repositories.user_management.user_repository import UserRepository
 from automana.api.repositories.auth.session_repository import SessionRepository
 from automana.api.schemas.user_management.user import UserInDB
@@ -61,6 +62,7 @@ async def logout(
         ip_address: str,
 ):
     await session_repository.invalidate_session(session_id, ip_address)
+    await invalidate_session_user(session_id)
     # Verify the session is gone from active sessions
     row = await session_repository.get(session_id)
     if row:
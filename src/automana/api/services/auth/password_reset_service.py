@@ -7,6 +7,7 @@ from automana.api.repositories.auth.password_reset_repository import PasswordRes
 from automana.api.repositories.auth.session_repository import SessionRepository
 from automana.api.repositories.user_management.user_repository import UserRepository
 from automana.api.services.auth.auth import get_hash_password
+from automana.api.services.auth.session_cache import invalidate_user_sessions
 from automana.api.services.email.email_service import EmailService
 from automana.core.exceptions.service_layer_exceptions.user_management.user_exceptions import InvalidResetTokenError
 from automana.core.framework.registry import ServiceRegistry
@@ -71,6 +72,7 @@ async def reset_password(
     await user_repository.update_password(user_id=row["user_id"], hashed_password=hashed)
     await password_reset_repository.mark_used(row["id"])
     await session_repository.invalidate_all_for_user(row["user_id"])
+    await invalidate_user_sessions(row["user_id"])
 
     logger.info("password_reset_complete", extra={"user_id": str(row["user_id"])})
     return {"status": "ok"}
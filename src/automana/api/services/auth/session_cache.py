@@ -0,0 +1,119 @@
+"""Short-TTL cache of session -> user lookups for `get_current_active_user`.
+
+Entries live in the two-tier cache (L1 + Redis) under `auth_session:{session_id}`
+and are HMAC-signed with the JWT secret, so a value planted in Redis by
+anything else is ignored. Each entry records the client fingerprint
+(ip + user agent) it was validated for and the user's auth generation:
+
+- `invalidate_session_user()` drops one session (logout, token rotation).
+- `invalidate_user_sessions()` bumps the user's generation (update, delete,
+  password reset), which orphans every cached session of that user at once.
+
+Both are called from transactional services, so they run twice: immediately,
+and again after the service commits (post_commit.after_commit). A request
+that re-cached the pre-commit state in between is wiped by the second pass.
+
+The hashed password is never cached.
+"""
+import hashlib
+import hmac
+import logging
+import time
+from datetime import datetime
+from typing import Any, Mapping, Optional
+from uuid import UUID
+
+import orjson
+
+from automana.api.schemas.user_management.user import UserInDB
+from automana.core.config.settings import get_settings
+from automana.core.framework.post_commit import after_commit
+from automana.core.utils.redis_cache import (
+    delete_from_cache,
+    get_from_cache,
+    get_namespace_generation,
+    invalidate_namespace,
+    set_to_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _session_key(session_id: str | UUID) -> str:
+    return f"auth_session:{session_id}"
+
+
+def _user_namespace(user_id: str | UUID) -> str:
+    return f"auth_user:{user_id}"
+
+
+def _fingerprint(ip_address: str, user_agent: str) -> str:
+    return hashlib.sha256(f"{ip_address}\0{user_agent}".encode()).hexdigest()
+
+
+def _signature(secret: str, payload: str) -> str:
+    return hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+async def get_cached_session_user(session_id: str, ip_address: str, user_agent: str) -> Optional[UserInDB]:
+    """Return the cached user for a session, or None if it must be validated against the DB."""
+    settings = get_settings()
+    if not settings.jwt_secret_key or settings.session_cache_ttl_seconds <= 0:
+        return None
+    entry = await get_from_cache(_session_key(session_id))
+    if not isinstance(entry, dict) or not isinstance(entry.get("payload"), str):
+        return None
+    if not hmac.compare_digest(entry.get("sig", ""), _signature(settings.jwt_secret_key, entry["payload"])):
+        logger.warning("session_cache_bad_signature", extra={"session_id": str(session_id)})
+        return None
+
+    payload = orjson.loads(entry["payload"])
+    if payload["fp"] != _fingerprint(ip_address, user_agent) or payload["exp"] <= time.time():
+        return None
+    user = payload["user"]
+    if payload["gen"] != await get_namespace_generation(_user_namespace(user["unique_id"])):
+        return None
+    return UserInDB.model_validate({**user, "hashed_password": ""})
+
+
+async def cache_session_user(
+    session_id: str,
+    ip_address: str,
+    user_agent: str,
+    user: Mapping[str, Any],
+    session_expires_at: Optional[datetime],
+) -> None:
+    """Cache a freshly validated session -> user lookup (never past the session's expiry)."""
+    settings = get_settings()
+    if not settings.jwt_secret_key or settings.session_cache_ttl_seconds <= 0 or session_expires_at is None:
+        return
+    expires_at = min(time.time() + settings.session_cache_ttl_seconds, session_expires_at.timestamp())
+    ttl = int(expires_at - time.time())
+    if ttl <= 0:
+        return
+    user_data = UserInDB.model_validate(dict(user)).model_dump(mode="json")
+    payload = orjson.dumps({
+        "user": user_data,
+        "fp": _fingerprint(ip_address, user_agent),
+        "exp": expires_at,
+        "gen": await get_namespace_generation(_user_namespace(user_data["unique_id"])),
+    }).decode()
+    await set_to_cache(
+        _session_key(session_id),
+        {"payload": payload, "sig": _signature(settings.jwt_secret_key, payload)},
+        expiry_seconds=ttl,
+    )
+
+
+async def invalidate_session_user(session_id: str | UUID) -> None:
+    """Drop a session entry now and again once the calling service commits."""
+    key = _session_key(session_id)
+    await delete_from_cache(key)
+    after_commit(lambda: delete_from_cache(key))
+
+
+async def invalidate_user_sessions(user_id: str | UUID) -> None:
+    """Orphan a user's session entries now and again once the calling service commits."""
+    namespace = _user_namespace(user_id)
+    await invalidate_namespace(namespace)
+    after_commit(lambda: invalidate_namespace(namespace))
@@ -10,6 +10,7 @@ from automana.core.config.settings import get_settings as get_general_settings
 import logging 
 from typing import Dict, Any
 from automana.core.framework.registry import ServiceRegistry
+from automana.api.services.auth.session_cache import invalidate_session_user
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,9 @@ async def validate_session_credentials(
 @ServiceRegistry.register(
     "auth.session.get_user_from_session",
     db_repositories=["session", "user"],
+    read_only=True,
+    # A replica may not have the session row yet right after login.
+    pool="primary",
 )
 async def get_user_from_session(
     session_repository,
@@ -52,29 +56,23 @@ async def get_user_from_session(
     ip_address: str,
     user_agent: str
 ) -> Dict[str, Any]:
-    """Get user information from a session ID"""
-    try:
-        # First validate the session
-        session = await validate_session_credentials(session_repository, session_id, ip_address, user_agent)
-        # Get the user ID from the session
-        user_id = session.get("user_id")
-        
-        if not user_id:
-            logger.warning(f"Session {session_id} has no user_id")
-            raise session_exceptions.SessionUserNotFoundError( "Session has no user_id")
+    """Get user information from a session ID.
 
-        # Get the user from the repository
-        user = await user_repository.get_by_id(user_id)
-        
-        if not user:
-            logger.warning(f"User not found for session {session_id}")
-            raise session_exceptions.UserSessionNotFoundError("Session has no user_id")
-        return user
-    except session_exceptions.SessionError:
-        raise
+    One joined query validates the session credentials and loads the enabled
+    user. The returned row also carries `session_expires_at`, which bounds how
+    long the caller may cache the result (see session_cache).
+    """
+    try:
+        user = await session_repository.get_session_user(session_id, ip_address, user_agent)
     except Exception as e:
-        logger.error(f"Error getting user from session: {str(e)}")
+        logger.error("session_fetch_failed", extra={"session_id": str(session_id), "error": str(e)})
         raise session_exceptions.SessionNotFoundError("Failed to get user from session")
+    if not user:
+        logger.warning("session_user_not_found", extra={"session_id": str(session_id)})
+        raise session_exceptions.SessionNotFoundError(f"Session {session_id} not found")
+    if user["session_expires_at"] < datetime.now(timezone.utc):
+        raise session_exceptions.SessionExpiredError(f"Session {session_id} is expired")
+    return user
 
 
 @ServiceRegistry.register(
@@ -98,6 +96,7 @@ async def delete_session(session_repository: SessionRepository
         bool: True if the session was deleted successfully, otherwise False.
     """
     await session_repository.delete(ip_address, user_id, session_id)
+    await invalidate_session_user(session_id)
 
 async def insert_session(session_repository: SessionRepository, new_session : CreateSession):
     """"Inserts a new session into the database."""
@@ -235,6 +234,7 @@ async def refresh_session(
         expire_time,
         session["token_id"],
     )
+    await invalidate_session_user(session["session_id"])
     access_token = create_access_token(
         data={"sub": user["username"], "user_id": str(user["unique_id"])},
         secret_key=settings.jwt_secret_key,
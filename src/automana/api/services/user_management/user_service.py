@@ -7,6 +7,7 @@ from uuid import UUID
 from automana.core.exceptions.service_layer_exceptions.user_management import user_exceptions
 import logging
 from automana.core.framework.registry import ServiceRegistry
+from automana.api.services.auth.session_cache import invalidate_user_sessions
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ async def update(user_repository : UserRepository
     """
     try:
         result = await user_repository.update(user_id, **user.model_dump())
+        await invalidate_user_sessions(user_id)
         return UserPublic.model_validate(result)
     except Exception as e:
         raise user_exceptions.UserError(f"Error updating user: {e}")
@@ -125,6 +127,7 @@ async def search_users(user_repository : UserRepository,
 async def delete_user(user_repository  : UserRepository, user_id : UUID) :
 
     await user_repository.delete(user_id)
+    await invalidate_user_sessions(user_id)
     return None
 
 
@@ -105,6 +105,22 @@ class Settings(BaseSettings):
     db_pool_min_conn: int = Field(default=1, alias="DB_POOL_MIN_CONN")
     db_pool_max_conn: int = Field(default=4, alias="DB_POOL_MAX_CONN")
 
+    # Async pool topology. Services pick a pool via ServiceRegistry.register(pool=...);
+    # a pool that is not configured falls back to the primary pool.
+    db_async_pool_min_size: int = Field(default=2, alias="DB_ASYNC_POOL_MIN_SIZE")
+    db_async_pool_max_size: int = Field(default=10, alias="DB_ASYNC_POOL_MAX_SIZE")
+    db_async_command_timeout: float = Field(default=60.0, alias="DB_ASYNC_COMMAND_TIMEOUT")
+    db_statement_cache_size: int = Field(default=100, alias="DB_STATEMENT_CACHE_SIZE")
+    db_max_inactive_connection_lifetime: float = Field(default=3600.0, alias="DB_MAX_INACTIVE_CONNECTION_LIFETIME")
+    # Read pool: a streaming replica when DB_READ_REPLICA_HOST is set
+    db_read_replica_host: str | None = Field(default=None, alias="DB_READ_REPLICA_HOST")
+    db_read_replica_port: int | None = Field(default=None, alias="DB_READ_REPLICA_PORT")
+    db_read_pool_min_size: int = Field(default=1, alias="DB_READ_POOL_MIN_SIZE")
+    db_read_pool_max_size: int = Field(default=10, alias="DB_READ_POOL_MAX_SIZE")
+    # Bulk pool for long ETL procedures (0 max size = share the primary pool)
+    db_bulk_pool_min_size: int = Field(default=0, alias="DB_BULK_POOL_MIN_SIZE")
+    db_bulk_pool_max_size: int = Field(default=3, alias="DB_BULK_POOL_MAX_SIZE")
+
     # Metrics
     metrics: MetricsSettings = Field(default_factory=MetricsSettings)
 
@@ -119,6 +135,13 @@ class Settings(BaseSettings):
     ebay_scope: str | None = None  # store as space-separated string in env
     ebay_secret: str | None = None
 
+    # MTGJson pipelined staging (used for the 90-day AllPrices backfill)
+    mtgjson_copy_writers: int = Field(default=3, alias="MTGJSON_COPY_WRITERS")
+    mtgjson_parse_processes: int = Field(default=2, alias="MTGJSON_PARSE_PROCESSES")
+
+    # MTGStock download: processes decoding/writing fetched batches (0 = thread)
+    mtgstock_convert_processes: int = Field(default=2, alias="MTGSTOCK_CONVERT_PROCESSES")
+
     # Internal
     internal_api_key: str | None = None
     staging_path: str | None = None
@@ -141,6 +164,16 @@ class Settings(BaseSettings):
         validation_alias="REDIS_CACHE_URL",
         description="Redis URL for cache operations (separate from Celery broker)"
     )
+    # In-process L1 in front of the Redis cache (per API/worker process)
+    cache_l1_max_entries: int = Field(default=2048, alias="CACHE_L1_MAX_ENTRIES")
+    cache_l1_ttl_seconds: float = Field(default=30.0, alias="CACHE_L1_TTL_SECONDS")
+    # Session -> user lookups cached for get_current_active_user (0 disables)
+    session_cache_ttl_seconds: int = Field(default=60, alias="SESSION_CACHE_TTL_SECONDS")
+
+    # Outbound HTTP: pooled clients shared by every API repository
+    http_max_connections: int = Field(default=100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry: float = Field(default=30.0, alias="HTTP_KEEPALIVE_EXPIRY")
 
     # Ollama / Agent chat
     ollama_base_url: str = Field(default="http://ollama:11434", alias="OLLAMA_BASE_URL")
@@ -184,6 +217,17 @@ class Settings(BaseSettings):
         f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     )
 
+    @property
+    def DATABASE_URL_READ_REPLICA(self) -> str | None:
+        if not self.db_read_replica_host:
+            return None
+        password = quote_plus(self.DB_PASSWORD)
+        port = self.db_read_replica_port or self.DB_PORT
+        return (
+        f"postgresql://{self.DB_USER}:{password}"
+        f"@{self.db_read_replica_host}:{port}/{self.DB_NAME}"
+    )
+
 @lru_cache()
 def get_settings():
     """Get cached settings"""
@@ -25,13 +25,21 @@ def _compute_backoff_seconds(attempt: int, base_delay: float, max_delay: float)
     delay = base_delay * (2 ** max(0, attempt - 1))
     return min(delay, max_delay)
 
-async def init_async_pool(settings:Settings) -> asyncpg.Pool:
-    """
-    Create asyncpg connection pool
-    Called once during app startup in lifespan
-    """
-    dsn = settings.DATABASE_URL_ASYNC
 
+# Pool names a service can request via ServiceRegistry.register(pool=...)
+PRIMARY_POOL = "primary"
+READ_POOL = "read"
+BULK_POOL = "bulk"
+
+
+async def _create_async_pool(
+    settings: Settings,
+    dsn: str,
+    min_size: int,
+    max_size: int,
+    label: str = PRIMARY_POOL,
+) -> asyncpg.Pool:
+    """Create one asyncpg pool with retry/backoff, using the settings-driven connection options."""
     max_attempts = settings.DB_CONNECT_MAX_ATTEMPTS
     base_delay = settings.DB_CONNECT_BASE_DELAY_SECONDS
     max_delay = settings.DB_CONNECT_MAX_DELAY_SECONDS
@@ -39,19 +47,20 @@ async def init_async_pool(settings:Settings) -> asyncpg.Pool:
     last_exc: Exception | None = None
     for attempt in range(1, max_attempts + 1):
         try:
-            logger.info("Creating async database pool (attempt %s/%s)", attempt, max_attempts)
+            logger.info("Creating async %s database pool (attempt %s/%s)", label, attempt, max_attempts)
             async_pool = await asyncpg.create_pool(
                 dsn=dsn,
-                min_size=2,
-                max_size=10,
-                command_timeout=60,
+                min_size=min_size,
+                max_size=max_size,
+                command_timeout=settings.db_async_command_timeout,
+                statement_cache_size=settings.db_statement_cache_size,
                 # Keep long-lived acquired connections alive across the
                 # CPU-heavy inter-batch windows in bulk_load (~30-50 s of
                 # no DB activity).  Without keepalive the OS TCP stack can
                 # silently drop the connection and asyncpg raises
                 # InterfaceError("connection has been released back to the
                 # pool") on the next query.
-                max_inactive_connection_lifetime=3600,
+                max_inactive_connection_lifetime=settings.db_max_inactive_connection_lifetime,
                 server_settings={
                     "client_encoding": "UTF8",
                     "search_path": _SEARCH_PATH,
@@ -75,7 +84,7 @@ async def init_async_pool(settings:Settings) -> asyncpg.Pool:
                     "tcp_keepalives_count": "5",
                 },
             )
-            logger.info("Async pool created")
+            logger.info("Async %s pool created", label)
             return async_pool
         except Exception as exc:  # asyncpg raises a variety of network/PG exceptions
             last_exc = exc
@@ -84,7 +93,8 @@ async def init_async_pool(settings:Settings) -> asyncpg.Pool:
 
             delay = _compute_backoff_seconds(attempt, base_delay, max_delay)
             logger.warning(
-                "Async DB pool creation failed (attempt %s/%s): %s. Retrying in %.2fs",
+                "Async %s DB pool creation failed (attempt %s/%s): %s. Retrying in %.2fs",
+                label,
                 attempt,
                 max_attempts,
                 exc,
@@ -92,7 +102,54 @@ async def init_async_pool(settings:Settings) -> asyncpg.Pool:
             )
             await asyncio.sleep(delay)
 
-    raise RuntimeError("Failed to create async DB pool after retries") from last_exc
+    raise RuntimeError(f"Failed to create async {label} DB pool after retries") from last_exc
+
+
+async def init_async_pool(settings:Settings) -> asyncpg.Pool:
+    """
+    Create the primary asyncpg connection pool
+    Called once during app startup in lifespan
+    """
+    return await _create_async_pool(
+        settings,
+        settings.DATABASE_URL_ASYNC,
+        min_size=settings.db_async_pool_min_size,
+        max_size=settings.db_async_pool_max_size,
+    )
+
+
+async def init_async_pools(settings: Settings) -> dict[str, asyncpg.Pool]:
+    """Create the async pool topology: primary, plus read and bulk pools when configured.
+
+    The read pool points at DB_READ_REPLICA_HOST; without a replica, read
+    services share the primary pool. The bulk pool (DB_BULK_POOL_MAX_SIZE > 0)
+    isolates long ETL procedures so they cannot exhaust the connections the
+    API's short queries need. With the default min size of 0 it holds no
+    connections until a bulk service runs.
+    """
+    pools = {PRIMARY_POOL: await init_async_pool(settings)}
+    try:
+        replica_dsn = settings.DATABASE_URL_READ_REPLICA
+        if replica_dsn:
+            pools[READ_POOL] = await _create_async_pool(
+                settings,
+                replica_dsn,
+                min_size=settings.db_read_pool_min_size,
+                max_size=settings.db_read_pool_max_size,
+                label=READ_POOL,
+            )
+        if settings.db_bulk_pool_max_size > 0:
+            pools[BULK_POOL] = await _create_async_pool(
+                settings,
+                settings.DATABASE_URL_ASYNC,
+                min_size=settings.db_bulk_pool_min_size,
+                max_size=settings.db_bulk_pool_max_size,
+                label=BULK_POOL,
+            )
+    except Exception:
+        await close_async_pools(pools)
+        raise
+    return pools
 
 async def init_agent_pool(settings: Settings) -> asyncpg.Pool:
     """Create a read-only asyncpg pool for the app_agent DB role."""
@@ -175,6 +232,12 @@ async def close_async_pool(pool: asyncpg.Pool) -> None:
         logger.info("Async pool closed")
 
 
+async def close_async_pools(pools: dict[str, asyncpg.Pool]) -> None:
+    """Close every pool created by init_async_pools"""
+    for pool in (pools or {}).values():
+        await close_async_pool(pool)
+
+
 def close_sync_pool(pool: pool.SimpleConnectionPool) -> None:
     """Close sync pool gracefully"""
     if pool:
@@ -22,3 +22,6 @@ class CardRetrievalError(CardCatalogueError):
 class UnknownIdentifierNameError(CardCatalogueError):
     """Raised when an external identifier name is not registered in card_identifier_ref"""
     pass
+class InvalidSearchCursorError(CardCatalogueError):
+    """Raised when a search cursor is malformed or was issued for a different query"""
+    pass
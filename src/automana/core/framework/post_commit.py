@@ -0,0 +1,53 @@
+"""Callbacks that run once the current service call has committed.
+
+Side effects outside Postgres (cache invalidation, mostly) must not happen
+before the transaction they describe is visible: a concurrent request could
+otherwise read the old, still-committed state and cache it again.
+Services queue such work with ``after_commit``; ServiceManager runs it after
+the service's transaction commits and drops it when the service fails.
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+PostCommitCallback = Callable[[], Awaitable[Any]]
+
+_pending: contextvars.ContextVar[Optional[list[PostCommitCallback]]] = contextvars.ContextVar(
+    "post_commit_callbacks", default=None
+)
+
+
+def after_commit(callback: PostCommitCallback) -> bool:
+    """Queue ``callback`` for after the enclosing service commits.
+
+    Returns False (and queues nothing) outside a ServiceManager call, e.g.
+    when a service function is invoked directly.
+    """
+    pending = _pending.get()
+    if pending is None:
+        return False
+    pending.append(callback)
+    return True
+
+
+def begin() -> tuple[list[PostCommitCallback], contextvars.Token]:
+    """Open a fresh callback scope for one service call."""
+    callbacks: list[PostCommitCallback] = []
+    return callbacks, _pending.set(callbacks)
+
+
+def end(token: contextvars.Token) -> None:
+    _pending.reset(token)
+
+
+async def run(callbacks: list[PostCommitCallback]) -> None:
+    """Run queued callbacks in order; the commit already happened, so failures are only logged."""
+    for callback in callbacks:
+        try:
+            await callback()
+        except Exception:
+            logger.exception("post_commit_callback_failed")
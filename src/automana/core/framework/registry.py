@@ -27,6 +27,18 @@ class ServiceConfig:
     operations (e.g. bulk-ETL procs). None keeps the role's `statement_timeout`
     GUC; there is no way to fully "disable" the timeout — pick a generous
     number instead.
+
+    `read_only` (default False) — the service only reads. ServiceManager runs
+    it on a plain pooled connection with no BEGIN/COMMIT, saving two round
+    trips per call. Each statement autocommits, so never set this on a
+    service that writes.
+
+    `pool` (default None) — which async pool the call runs on: "primary",
+    "read" (replica) or "bulk" (long ETL procedures). None means "read" for
+    read_only services and "primary" otherwise. A pool that is not configured
+    falls back to the primary pool. Read-only services that must see their
+    own just-committed writes (e.g. session lookup right after login) should
+    pin pool="primary", since a replica may lag.
     """
     module: str
     function: str
@@ -35,6 +47,14 @@ class ServiceConfig:
     storage_services: List[str] = field(default_factory=list)
     runs_in_transaction: bool = True
     command_timeout: Optional[float] = None
+    read_only: bool = False
+    pool: Optional[str] = None
+
+    @property
+    def pool_name(self) -> str:
+        if self.pool:
+            return self.pool
+        return "read" if self.read_only else "primary"
 
 
 class ServiceRegistry:
@@ -61,6 +81,8 @@ class ServiceRegistry:
         storage_services: List[str] = None,
         runs_in_transaction: bool = True,
         command_timeout: Optional[float] = None,
+        read_only: bool = False,
+        pool: Optional[str] = None,
     ) -> Callable:
         """
         Decorator to register a service function.
@@ -73,8 +95,8 @@ class ServiceRegistry:
             async def search_cards(card_repository, **kwargs):
                 ...
 
-        See `ServiceConfig` for the semantics of `runs_in_transaction` and
-        `command_timeout`.
+        See `ServiceConfig` for the semantics of `runs_in_transaction`,
+        `command_timeout`, `read_only` and `pool`.
         """
         def decorator(func: Callable) -> Callable:
             cls._services[path] = ServiceConfig(
@@ -85,6 +107,8 @@ class ServiceRegistry:
                 storage_services=storage_services or [],
                 runs_in_transaction=runs_in_transaction,
                 command_timeout=command_timeout,
+                read_only=read_only,
+                pool=pool,
             )
             logger.debug("registered_service", extra={"path": path})
             return func
@@ -129,6 +153,16 @@ class ServiceRegistry:
         cls._storage_registry[name] = {"backend": backend, **config}
         logger.debug("registered_storage", extra={"name": name, "backend": backend})
 
+    @classmethod
+    def all_db_repositories(cls) -> Dict[str, tuple[str, str]]:
+        """Get all registered DB repositories (name → (module, class))"""
+        return cls._repository_registry.copy()
+
+    @classmethod
+    def all_api_repositories(cls) -> Dict[str, tuple[str, str]]:
+        """Get all registered API repositories (name → (module, class))"""
+        return cls._api_repository_registry.copy()
+
     @classmethod
     def get_db_repository(cls, name: str) -> Optional[tuple[str, str]]:
         """Get DB repository module path and class name"""
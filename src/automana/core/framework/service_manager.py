@@ -1,9 +1,10 @@
 ﻿import importlib, logging
-from typing import  Optional
+from typing import  Callable, Optional
 from contextlib import asynccontextmanager
 from automana.core.db.query_executor import QueryExecutor
 from automana.core.framework.service_modules import SERVICE_MODULES
 from automana.core.framework.registry import ServiceRegistry
+from automana.core.framework import post_commit
 from automana.core.storage import StorageService
 
 from automana.core.log.logging_context import set_service_path
@@ -21,14 +22,23 @@ class ServiceManager:
             cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self, connection_pool, query_executor: Optional[QueryExecutor] = None):
+    def __init__(self, connection_pool, query_executor: Optional[QueryExecutor] = None, pools: Optional[dict] = None):
         if hasattr(self, '_initialized') and self._initialized:
             return
             
         self.query_executor = query_executor
         self.connection_pool = connection_pool
+        # Named pools ("read", "bulk", ...) that services route to via
+        # ServiceConfig.pool_name; names missing here use connection_pool.
+        self.pools = dict(pools or {})
         self._initialized = True
 
+        # Resolved once at discovery so each call is a dict lookup rather
+        # than importlib.import_module + getattr per service and repository.
+        self._service_callables: dict[str, Callable] = {}
+        self._db_repository_classes: dict[str, type] = {}
+        self._api_repository_classes: dict[str, type] = {}
+
         self._discover_services()
        
     def _discover_services(self):
@@ -58,19 +68,87 @@ class ServiceManager:
                 },
             )
             raise RuntimeError("Error loading service modules") from e
+        self._resolve_registered()
+
+    def _resolve_registered(self):
+        """Resolve every registered service function and repository class.
+
+        Anything that fails to resolve here is left to `_execute_service`,
+        which retries the import and raises ValueError for that service only.
+        """
+        for path, config in ServiceRegistry.all_services().items():
+            try:
+                self._service_callables[path] = getattr(importlib.import_module(config.module), config.function)
+            except (ImportError, AttributeError):
+                logger.warning("service_resolve_failed", extra={"service_path": path})
+        for cache, registered in (
+            (self._db_repository_classes, ServiceRegistry.all_db_repositories()),
+            (self._api_repository_classes, ServiceRegistry.all_api_repositories()),
+        ):
+            for name, (module_path, class_name) in registered.items():
+                try:
+                    cache[name] = getattr(importlib.import_module(module_path), class_name)
+                except (ImportError, AttributeError):
+                    logger.warning("repository_resolve_failed", extra={"repository": name})
+
+    def _service_callable(self, service_path: str, service_config) -> Callable:
+        service_method = self._service_callables.get(service_path)
+        if service_method is None:
+            try:
+                module = importlib.import_module(service_config.module)
+                service_method = getattr(module, service_config.function)
+            except (ImportError, AttributeError) as e:
+                raise ValueError(
+                    f"Service {service_path} could not be loaded "
+                    f"({service_config.module}.{service_config.function})"
+                ) from e
+            self._service_callables[service_path] = service_method
+        return service_method
+
+    @staticmethod
+    def _repository_class(repo_type: str, cache: dict, repo_info, kind: str) -> type:
+        repo_class = cache.get(repo_type)
+        if repo_class is None:
+            if not repo_info:
+                raise ValueError(f"Unknown {kind} repository type: {repo_type}")
+            module_path, class_name = repo_info
+            repo_class = getattr(importlib.import_module(module_path), class_name)
+            cache[repo_type] = repo_class
+        return repo_class
+
+    def _pool_for(self, service_config):
+        """Pool a service runs on; unconfigured pool names fall back to the primary pool"""
+        return self.pools.get(service_config.pool_name) or self.connection_pool
 
     @asynccontextmanager
-    async def _get_connection(self):
+    async def _get_connection(self, pool=None):
         """Get a connection from the pool"""
-        async with self.connection_pool.acquire() as connection:
+        async with (pool or self.connection_pool).acquire() as connection:
             yield connection
 
+    @classmethod
+    def connection_source(cls, pool_name: Optional[str] = None) -> Optional[Callable]:
+        """Factory of pooled connections for services that fan work out.
+
+        Calling the result gives an async context manager over a fresh
+        connection from ``pool_name`` (primary when unset or unconfigured).
+        Returns None when the manager is not initialized (e.g. unit tests).
+        """
+        instance = cls._instance
+        if instance is None or not getattr(instance, "_initialized", False):
+            return None
+        pool = instance.pools.get(pool_name) or instance.connection_pool
+        if pool is None:
+            return None
+        return lambda: instance._get_connection(pool)
+
     @asynccontextmanager
-    async def transaction(self):
+    async def transaction(self, pool=None):
         """Execute operations in a transaction"""
+        pool = pool or self.connection_pool
         connection = None
         try:
-            connection = await self.connection_pool.acquire()
+            connection = await pool.acquire()
             transaction = connection.transaction()
             await transaction.start()
             try:
@@ -83,14 +161,14 @@ class ServiceManager:
                 raise
         finally:
             if connection is not None:
-                await self.connection_pool.release(connection)
+                await pool.release(connection)
 
 
     @classmethod
-    async def initialize(cls, connection_pool, query_executor: QueryExecutor = None):
+    async def initialize(cls, connection_pool, query_executor: QueryExecutor = None, pools: Optional[dict] = None):
         """Initialize the singleton instance with dependencies"""
         try:
-            instance = cls(connection_pool, query_executor)
+            instance = cls(connection_pool, query_executor, pools)
             logger.info(
                 "service_manager_initialized",
                 extra={
@@ -182,21 +260,14 @@ class ServiceManager:
     async def _execute_service(self, service_path: str, **kwargs):
         """Execute a service with its required repositories"""
         set_service_path(service_path)
+        post_commit_token = None
         try:
         # Get service configuration from registry
             service_config = ServiceRegistry.get(service_path)
             if not service_config:
                 raise ValueError(f"Service not found: {service_path}")
         
-            # Import service module and get function
-            try:
-                module = importlib.import_module(service_config.module)
-                service_method = getattr(module, service_config.function)
-            except (ImportError, AttributeError) as e:
-                raise ValueError(
-                f"Service {service_path} could not be loaded "
-                f"({service_config.module}.{service_config.function})"
-            ) from e
+            service_method = self._service_callable(service_path, service_config)
         
         #storage
             if len(service_config.storage_services) > 0:
@@ -204,17 +275,22 @@ class ServiceManager:
                 for extra_name in service_config.storage_services[1:]:
                     kwargs[f"{extra_name}_storage_service"] = self.get_storage_service(extra_name)
 
-            # Connection acquisition path is chosen per-service:
+            # The pool comes from ServiceConfig.pool_name (primary / read /
+            # bulk). Connection acquisition path is chosen per-service:
+            #   read_only=True            → plain connection, no txn (the hot
+            #                               read endpoints skip BEGIN/COMMIT).
             #   runs_in_transaction=True  → explicit BEGIN/COMMIT around the call.
             #   runs_in_transaction=False → raw pool connection, no txn started.
-            # The second mode exists for SQL that manages its own transaction
+            # The last mode exists for SQL that manages its own transaction
             # control (e.g. stored procs with internal COMMIT/ROLLBACK), which
             # Postgres rejects when CALL is issued from an atomic block.
-            conn_ctx = (
-                self.transaction() if service_config.runs_in_transaction
-                else self._get_connection()
-            )
+            pool = self._pool_for(service_config)
+            in_transaction = service_config.runs_in_transaction and not service_config.read_only
+            conn_ctx = self.transaction(pool) if in_transaction else self._get_connection(pool)
 
+            # Work queued with post_commit.after_commit runs only once the
+            # block below has committed; a failing service drops it.
+            post_commit_callbacks, post_commit_token = post_commit.begin()
             async with conn_ctx as conn:
                 # Per-service command_timeout is applied on two axes:
                 #
@@ -249,7 +325,7 @@ class ServiceManager:
                     # session-level `SET` needs an explicit RESET on the way out
                     # (see finally block) so the pooled connection doesn't
                     # leak the override to the next acquirer.
-                    scope = "LOCAL" if service_config.runs_in_transaction else "SESSION"
+                    scope = "LOCAL" if in_transaction else "SESSION"
                     await conn.execute(
                         f"SET {scope} statement_timeout = {timeout_ms}"
                     )
@@ -260,25 +336,19 @@ class ServiceManager:
 
                     # Create DB repositories
                     for repo_type in service_config.db_repositories:
-                        repo_info = ServiceRegistry.get_db_repository(repo_type)
-                        if not repo_info:
-                            raise ValueError(f"Unknown DB repository type: {repo_type}")
-
-                        module_path, class_name = repo_info
-                        repo_module = importlib.import_module(module_path)
-                        repo_class = getattr(repo_module, class_name)
+                        repo_class = self._repository_class(
+                            repo_type, self._db_repository_classes,
+                            ServiceRegistry.get_db_repository(repo_type), "DB",
+                        )
                         repositories[f"{repo_type}_repository"] = repo_class(conn, self.query_executor)
 
                     # Create API repositories
                     env = kwargs.pop("environment", "sandbox")
                     for repo_type in service_config.api_repositories:
-                        repo_info = ServiceRegistry.get_api_repository(repo_type)
-                        if not repo_info:
-                            raise ValueError(f"Unknown API repository type: {repo_type}")
-
-                        module_path, class_name = repo_info
-                        repo_module = importlib.import_module(module_path)
-                        repo_class = getattr(repo_module, class_name)
+                        repo_class = self._repository_class(
+                            repo_type, self._api_repository_classes,
+                            ServiceRegistry.get_api_repository(repo_type), "API",
+                        )
                         repositories[f"{repo_type}_repository"] = repo_class(environment=env)
 
                     logger.debug(
@@ -287,7 +357,9 @@ class ServiceManager:
                             "action": "execute_service",
                             "service_path": service_path,
                             "repository_keys": list(repositories.keys()),
-                            "runs_in_transaction": service_config.runs_in_transaction,
+                            "runs_in_transaction": in_transaction,
+                            "read_only": service_config.read_only,
+                            "pool": service_config.pool_name,
                             "command_timeout": service_config.command_timeout,
                         },
                     )
@@ -302,7 +374,7 @@ class ServiceManager:
                     # reset; LOCAL scope unwinds at COMMIT/ROLLBACK. Swallow
                     # errors on RESET so a broken connection can't mask the
                     # original exception.
-                    if timeout_applied and not service_config.runs_in_transaction:
+                    if timeout_applied and not in_transaction:
                         try:
                             await conn.execute("RESET statement_timeout")
                         except Exception:
@@ -310,6 +382,9 @@ class ServiceManager:
                                 "failed_to_reset_statement_timeout",
                                 extra={"service_path": service_path},
                             )
+            post_commit.end(post_commit_token)
+            post_commit_token = None
+            await post_commit.run(post_commit_callbacks)
             return result
         except Exception:
             logger.exception(
@@ -318,6 +393,8 @@ class ServiceManager:
             )
             raise
         finally:
+            if post_commit_token is not None:
+                post_commit.end(post_commit_token)
             set_service_path(None)
                 
     @classmethod
@@ -30,6 +30,7 @@ SERVICE_MODULES : dict[str, list[str]]= {
             "automana.core.services.ops.metrics_service",
             "automana.core.services.app_integration.scryfall.data_loader",
             "automana.core.services.app_integration.scryfall.price_loader",
+            "automana.core.services.app_integration.scryfall.bulk_ingest",
             "automana.core.services.app_integration.open_tcg.data_loader",
             "automana.core.services.app_integration.mtg_stock.data_loader",
             "automana.core.services.app_integration.mtg_stock.data_staging",
@@ -60,6 +61,7 @@ SERVICE_MODULES : dict[str, list[str]]= {
             "automana.core.services.ops.metrics_service",
             "automana.core.services.app_integration.scryfall.data_loader",
             "automana.core.services.app_integration.scryfall.price_loader",
+            "automana.core.services.app_integration.scryfall.bulk_ingest",
             "automana.core.services.app_integration.open_tcg.data_loader",
             "automana.core.services.app_integration.mtg_stock.data_loader",
             "automana.core.services.app_integration.mtg_stock.data_staging",
@@ -123,6 +125,7 @@ SERVICE_MODULES : dict[str, list[str]]= {
             "automana.core.services.ops.metrics_service",
             "automana.core.services.app_integration.scryfall.data_loader",
             "automana.core.services.app_integration.scryfall.price_loader",
+            "automana.core.services.app_integration.scryfall.bulk_ingest",
             "automana.core.services.app_integration.open_tcg.data_loader",
             "automana.core.services.app_integration.mtg_stock.data_loader",
             "automana.core.services.app_integration.mtg_stock.data_staging",
@@ -19,8 +19,11 @@ from automana.core.repositories.app_integration.mtg_stock.price_repository impor
 @MetricRegistry.register(
     path="mtgstock.raw_prints_loaded",
     category="volume",
-    description="Distinct print_id count currently in pricing.raw_mtg_stock_price.",
-    severity=Threshold(warn=50_000, error=1_000, direction="lower_is_worse"),
+    # bulk_load is delta-only (per-print watermarks), so this counts prints
+    # with new observations this run, not the whole catalogue. A day with no
+    # new MTGStock data legitimately lands 0, so a low count only warns.
+    description="Distinct print_id count currently in pricing.raw_mtg_stock_price (prints with new rows this run).",
+    severity=Threshold(warn=1_000, error=-1, direction="lower_is_worse"),
     db_repositories=["price"],
 )
 async def raw_prints_loaded(
@@ -33,8 +36,9 @@ async def raw_prints_loaded(
 @MetricRegistry.register(
     path="mtgstock.raw_rows_loaded",
     category="volume",
-    description="Total row count currently in pricing.raw_mtg_stock_price.",
-    severity=Threshold(warn=500_000, error=10_000, direction="lower_is_worse"),
+    description="Total row count currently in pricing.raw_mtg_stock_price (rows newer than the watermarks).",
+    # As above: 0 new rows is a quiet day, not a failure.
+    severity=Threshold(warn=1_000, error=-1, direction="lower_is_worse"),
     db_repositories=["price"],
 )
 async def raw_rows_loaded(
@@ -7,6 +7,7 @@ import httpx, logging,  xmltodict
 from httpx import Response
 from automana.core.exceptions.repository_layer_exceptions import api_errors
 from automana.core.exceptions.repository_layer_exceptions.base_repository_exception import RepositoryError
+from automana.core.utils.http_clients import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,27 +19,23 @@ class BaseApiClient(ABC):
     Integration-specific concerns (exception mapping, auth headers, base URLs) belong in subclasses.
     """
 
-    def __init__(self, timeout: float = 30.0, http2: bool = True, **kwargs):
+    def __init__(self, timeout: float = 30.0, http2: bool = True, limits: Optional[httpx.Limits] = None, **kwargs):
         self.timeout = timeout
         self.base_url = self._get_base_url()
         self.http2 = http2
-        self._client : Optional[httpx.AsyncClient] = None
+        self.limits = limits
         logger.info("Client initialized", extra={"client": self.__class__.__name__, "base_url": self.base_url})
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(http2=self.http2, timeout=self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # The pooled client outlives this repository; close_http_clients() owns it.
+        return None
 
     def _get_client(self) -> httpx.AsyncClient:
-        # If user didn't use "async with", still work (but not ideal)
-        if self._client is None:
-            self._client = httpx.AsyncClient(http2=self.http2, timeout=self.timeout)
-        return self._client
+        # Repositories are built per call; the connection pool is process-wide.
+        return get_http_client(self.base_url, http2=self.http2, limits=self.limits, timeout=self.timeout)
     
     # NB: `default_headers` is intentionally concrete with a sensible empty
     # default — Template Method pattern. Subclasses override only when they
@@ -1,5 +1,5 @@
 ﻿from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import asyncpg, psycopg2
 import logging
 from typing import Optional,  TypeVar,  Generic, Union
@@ -23,7 +23,6 @@ class AbstractRepository(Generic[T], ABC):
         """
         self.connection = connection
         self.executor = executor
-        self._thread_pool = ThreadPoolExecutor(max_workers=4)
 
 
     def execute_query_sync(self, query, *args):
@@ -99,6 +98,29 @@ class AbstractRepository(Generic[T], ABC):
             table_name, records=records, columns=columns, schema_name=schema_name
         )
 
+    async def execute_copy_dataframe(
+        self, data, table_name: str, *, schema_name: str, chunk_rows: int = 50_000
+    ) -> int:
+        """COPY a pandas DataFrame or Arrow table into ``schema_name.table_name``.
+
+        Columns are matched by name. The data is streamed as Arrow-encoded
+        chunks of ``chunk_rows`` rows instead of one in-memory CSV.
+        """
+        # Imported lazily so repositories that never COPY don't pull in pyarrow.
+        from automana.core.db.arrow_copy import iter_csv_chunks, to_arrow
+
+        if len(data) == 0:
+            return 0
+        table = await asyncio.to_thread(to_arrow, data)
+        await self.execute_copy_to_table(
+            table_name,
+            iter_csv_chunks(table, chunk_rows),
+            schema_name=schema_name,
+            columns=table.column_names,
+            format="csv",
+        )
+        return table.num_rows
+
     async def execute_procedure(
         self, proc_name: str, args: tuple = (), timeout: float | None = None
     ) -> None:
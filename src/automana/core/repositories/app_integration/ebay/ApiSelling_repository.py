@@ -153,9 +153,12 @@ class EbaySellingRepository(EbayApiClient):
         if not token:
             raise ValueError("Token is required")
 
+        # A per-call environment lets concurrent callers share one client
+        # without mutating self.environment under each other.
+        environment = (payload.get("environment") or self.environment).lower()
         url = (
             "https://api.sandbox.ebay.com/sell/fulfillment/v1/order"
-            if self.environment == "sandbox"
+            if environment == "sandbox"
             else "https://api.ebay.com/sell/fulfillment/v1/order"
         )
 
@@ -205,9 +208,8 @@ class EbaySellingRepository(EbayApiClient):
             "XML Payload": ("payload.xml", xml_payload.encode("utf-8"), "text/xml;charset=utf-8"),
             "image": ("image", file_bytes, content_type),
         }
-        # send() only supports XML text bodies; multipart requires a direct httpx call.
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(self._get_base_url(), files=files, headers=headers)
+        # send() only supports XML text bodies; multipart goes straight to the pooled client.
+        response = await self._get_client().post(self._get_base_url(), files=files, headers=headers, timeout=30)
         response.raise_for_status()
 
         parsed = xmltodict.parse(response.text)
@@ -86,3 +86,15 @@ ON CONFLICT (order_id, app_code) DO UPDATE SET
                                app_integration.ebay_order_status.shipped_at),
     updated_at      = now()
 """
+
+# Batch form of upsert_order_status_query for order ids sharing one status;
+# tracking fields are left untouched.
+upsert_order_statuses_query = """
+INSERT INTO app_integration.ebay_order_status
+    (order_id, app_code, local_status, updated_at)
+SELECT DISTINCT order_id, $2, $3, now()
+FROM unnest($1::TEXT[]) AS t(order_id)
+ON CONFLICT (order_id, app_code) DO UPDATE SET
+    local_status = EXCLUDED.local_status,
+    updated_at   = now()
+"""
@@ -105,3 +105,14 @@ class EbayAppRepository(AbstractRepository):
             app_queries.upsert_order_status_query,
             (order_id, app_code, local_status, tracking_number, carrier_code, shipped_at),
         )
+
+    async def upsert_order_statuses(
+        self, order_ids: list[str], app_code: str, local_status: str
+    ) -> None:
+        """Set ``local_status`` on many orders in one statement."""
+        if not order_ids:
+            return
+        await self.execute_command(
+            app_queries.upsert_order_statuses_query,
+            (order_ids, app_code, local_status),
+        )
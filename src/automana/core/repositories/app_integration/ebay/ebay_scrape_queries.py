@@ -15,8 +15,29 @@ FROM pricing.ebay_scraped_sold
 WHERE promoted_to_obs = false AND source_product_id IS NOT NULL;
 """
 
-MARK_SCRAPED_PROMOTED = """
-UPDATE pricing.ebay_scraped_sold
-SET promoted_to_obs = true
-WHERE scrape_id = ANY($1::bigint[]);
+# Same shape as sales_queries.PROMOTE_OWN_SALES_BATCH, marking scrape rows.
+PROMOTE_SCRAPED_BATCH = """
+WITH obs AS (
+    INSERT INTO pricing.price_observation
+        (ts_date, source_product_id, price_type_id, finish_id, condition_id,
+         language_id, data_provider_id, sold_avg_cents, sold_count)
+    SELECT g.ts_date, g.source_product_id, $8::integer, g.finish_id, g.condition_id,
+           g.language_id, $9::smallint, g.sold_avg_cents, g.sold_count
+    FROM unnest($1::date[], $2::bigint[], $3::smallint[], $4::smallint[],
+                $5::smallint[], $6::integer[], $7::integer[])
+         AS g(ts_date, source_product_id, finish_id, condition_id,
+              language_id, sold_avg_cents, sold_count)
+    ON CONFLICT (ts_date, source_product_id, price_type_id, finish_id, condition_id, language_id, data_provider_id)
+    DO UPDATE SET
+        sold_avg_cents = EXCLUDED.sold_avg_cents,
+        sold_count     = EXCLUDED.sold_count,
+        updated_at     = now()
+    RETURNING 1
+), marked AS (
+    UPDATE pricing.ebay_scraped_sold
+    SET promoted_to_obs = true
+    WHERE scrape_id = ANY($10::bigint[])
+    RETURNING 1
+)
+SELECT (SELECT count(*) FROM obs) AS upserted, (SELECT count(*) FROM marked) AS marked;
 """
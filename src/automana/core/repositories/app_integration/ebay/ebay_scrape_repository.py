@@ -1,9 +1,11 @@
 """DB repository for the pricing.ebay_scraped_sold table.
 
-Serves the promote_sold_obs scrape channel (get_unpromoted / mark_promoted) and
-inserts into ebay_scraped_sold. The eBay Finding-API scrapers that previously
-populated this table were removed when eBay deprecated findCompletedItems; rows
-now arrive from external/manual sources (e.g. TCGPLAYER).
+Serves the promote_sold_obs scrape channel (get_unpromoted, then promote_batch,
+which upserts price_observation and marks the staging rows in one statement)
+and inserts into ebay_scraped_sold. The eBay Finding-API scrapers that
+previously populated this table were removed when eBay deprecated
+findCompletedItems; rows now arrive from external/manual sources (e.g.
+TCGPLAYER).
 """
 from __future__ import annotations
 
@@ -77,10 +79,33 @@ class EbayScrapeSoldRepository(AbstractRepository):
         )
         return [dict(r) for r in rows]
 
-    async def mark_promoted(self, scrape_ids: list[int]) -> None:
-        if not scrape_ids:
-            return
-        await self.execute_command(
-            ebay_scrape_queries.MARK_SCRAPED_PROMOTED,
-            (scrape_ids,),
+    async def promote_batch(
+        self,
+        groups: list[dict],
+        scrape_ids: list[int],
+        price_type_id: int,
+        data_provider_id: int,
+    ) -> int:
+        """Upsert aggregated groups into price_observation and mark their staging rows.
+
+        One statement, so the upsert and the mark commit (or fail) together.
+        Returns the number of staging rows marked promoted.
+        """
+        if not groups:
+            return 0
+        rows = await self.execute_query(
+            ebay_scrape_queries.PROMOTE_SCRAPED_BATCH,
+            (
+                [g["ts_date"] for g in groups],
+                [g["source_product_id"] for g in groups],
+                [g["finish_id"] for g in groups],
+                [g["condition_id"] for g in groups],
+                [g["language_id"] for g in groups],
+                [g["sold_avg_cents"] for g in groups],
+                [g["sold_count"] for g in groups],
+                price_type_id,
+                data_provider_id,
+                scrape_ids,
+            ),
         )
+        return int(rows[0]["marked"]) if rows else 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -15,30 +16,39 @@ VALUES ($1, $2, $3, $4, $5, $6)
 RETURNING id;
 """
 
-_GET_PENDING = """
-SELECT id, item_id, user_id, app_code, action_type, strategy_kind, suggested_price, status
-FROM app_integration.listing_pending_actions
-WHERE status = 'pending'
-ORDER BY created_at
-LIMIT $1;
-"""
-
-_MARK_PROCESSING = """
-UPDATE app_integration.listing_pending_actions
-SET status = 'processing'
-WHERE id = $1;
+# Atomically move up to $1 claimable rows to 'processing' and return them.
+# SKIP LOCKED lets overlapping drains claim disjoint rows instead of blocking
+# on (or double-processing) each other's. A 'processing' row whose claim is
+# older than $2 seconds belongs to a drain that died; it is claimed again.
+_CLAIM_PENDING = """
+UPDATE app_integration.listing_pending_actions a
+SET status = 'processing', claimed_at = now()
+WHERE a.id IN (
+    SELECT id
+    FROM app_integration.listing_pending_actions
+    WHERE status = 'pending'
+       OR (status = 'processing'
+           AND (claimed_at IS NULL OR claimed_at < now() - make_interval(secs => $2)))
+    ORDER BY created_at
+    LIMIT $1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING a.id, a.item_id, a.user_id, a.app_code, a.action_type,
+          a.strategy_kind, a.suggested_price, a.status, a.claimed_at;
 """
 
-_MARK_DONE = """
-UPDATE app_integration.listing_pending_actions
-SET status = 'done', executed_at = now()
-WHERE id = $1;
-"""
-
-_MARK_FAILED = """
-UPDATE app_integration.listing_pending_actions
-SET status = 'failed', error = $1
-WHERE id = $2;
+# Done and failed outcomes in one statement (NULL error = done). claimed_at
+# fences the write: a drain whose row was reclaimed after its lease lapsed
+# no longer owns it and its late outcome is dropped.
+_RECORD_OUTCOMES = """
+UPDATE app_integration.listing_pending_actions a
+SET status      = CASE WHEN o.error IS NULL THEN 'done' ELSE 'failed' END,
+    executed_at = CASE WHEN o.error IS NULL THEN now() ELSE a.executed_at END,
+    error       = COALESCE(o.error, a.error)
+FROM unnest($1::uuid[], $2::timestamptz[], $3::text[]) AS o(id, claimed_at, error)
+WHERE a.id = o.id
+  AND a.status = 'processing'
+  AND a.claimed_at = o.claimed_at;
 """
 
 _GET_PENDING_FOR_ITEM = """
@@ -88,18 +98,16 @@ class EbayListingActionsRepository(AbstractRepository):
         )
         return str(rows[0]['id'])
 
-    async def get_pending(self, limit: int = 50) -> list[dict]:
-        rows = await self.execute_query(_GET_PENDING, (limit,))
-        return list(rows)
-
-    async def mark_processing(self, action_id: UUID) -> None:
-        await self.execute_command(_MARK_PROCESSING, (action_id,))
-
-    async def mark_done(self, action_id: UUID) -> None:
-        await self.execute_command(_MARK_DONE, (action_id,))
+    async def claim_pending(self, limit: int = 50, lease_seconds: float = 900) -> list[dict]:
+        rows = await self.execute_query(_CLAIM_PENDING, (limit, lease_seconds))
+        return [dict(r) for r in rows]
 
-    async def mark_failed(self, action_id: UUID, error: str) -> None:
-        await self.execute_command(_MARK_FAILED, (error, action_id))
+    async def record_outcomes(self, outcomes: list[tuple[UUID, datetime, Optional[str]]]) -> None:
+        """Record (action_id, claimed_at, error) per claimed action; error None means done."""
+        if not outcomes:
+            return
+        ids, claimed_at, errors = (list(col) for col in zip(*outcomes))
+        await self.execute_command(_RECORD_OUTCOMES, (ids, claimed_at, errors))
 
     async def get_pending_for_item(self, item_id: str) -> Optional[dict]:
         rows = await self.execute_query(_GET_PENDING_FOR_ITEM, (item_id,))
@@ -40,6 +40,12 @@ FROM app_integration.ebay_active_listings
 WHERE item_id = $1;
 """
 
+GET_LISTING_VARIANTS_BATCH = """
+SELECT item_id, card_version_id, condition_id, finish_id, language_id, marketplace_id
+FROM app_integration.ebay_active_listings
+WHERE item_id = ANY($1::TEXT[]);
+"""
+
 ENSURE_SOURCE_PRODUCT = """
 WITH ins AS (
     INSERT INTO pricing.source_product (product_id, source_id)
@@ -58,6 +64,29 @@ WHERE mcp.card_version_id = $1 AND sp.source_id = $2
 LIMIT 1;
 """
 
+# Batch form of ENSURE_SOURCE_PRODUCT. The outer SELECT can't see rows inserted
+# by the CTE (same snapshot), hence the COALESCE over both sources.
+ENSURE_SOURCE_PRODUCTS_BATCH = """
+WITH cv AS (
+    SELECT DISTINCT card_version_id FROM unnest($1::UUID[]) AS t(card_version_id)
+),
+ins AS (
+    INSERT INTO pricing.source_product (product_id, source_id)
+    SELECT mcp.product_id, $2
+    FROM cv
+    JOIN pricing.mtg_card_products mcp ON mcp.card_version_id = cv.card_version_id
+    ON CONFLICT (product_id, source_id) DO NOTHING
+    RETURNING source_product_id, product_id
+)
+SELECT mcp.card_version_id,
+       COALESCE(ins.source_product_id, sp.source_product_id) AS source_product_id
+FROM cv
+JOIN pricing.mtg_card_products mcp ON mcp.card_version_id = cv.card_version_id
+LEFT JOIN ins ON ins.product_id = mcp.product_id
+LEFT JOIN pricing.source_product sp
+       ON sp.product_id = mcp.product_id AND sp.source_id = $2;
+"""
+
 UPSERT_ACTIVE_LISTING = """
 INSERT INTO app_integration.ebay_active_listings
     (item_id, app_code, card_version_id, product_id,
@@ -97,6 +126,22 @@ ON CONFLICT (order_id, app_code, item_id) DO UPDATE SET
     updated_at         = now();
 """
 
+UPSERT_ORDER_SOURCE_PRODUCTS_BATCH = """
+INSERT INTO app_integration.ebay_order_source_product
+    (order_id, app_code, item_id, title, source_product_id,
+     quantity, sold_price_cents, currency, finish_id, condition_id,
+     language_id, sold_at, buyer_username, marketplace_id)
+SELECT * FROM unnest(
+    $1::TEXT[], $2::TEXT[], $3::TEXT[], $4::TEXT[], $5::BIGINT[],
+    $6::SMALLINT[], $7::INTEGER[], $8::TEXT[], $9::SMALLINT[], $10::SMALLINT[],
+    $11::SMALLINT[], $12::TIMESTAMPTZ[], $13::TEXT[], $14::TEXT[]
+)
+ON CONFLICT (order_id, app_code, item_id) DO UPDATE SET
+    source_product_id = EXCLUDED.source_product_id,
+    sold_price_cents   = EXCLUDED.sold_price_cents,
+    updated_at         = now();
+"""
+
 GET_UNPROMOTED_OWN_SALES = """
 SELECT ebay_osp_id, source_product_id, sold_price_cents, sold_at,
        finish_id, condition_id, language_id
@@ -104,12 +149,6 @@ FROM app_integration.ebay_order_source_product
 WHERE promoted_to_obs = false AND source_product_id IS NOT NULL;
 """
 
-MARK_OWN_SALES_PROMOTED = """
-UPDATE app_integration.ebay_order_source_product
-SET promoted_to_obs = true
-WHERE ebay_osp_id = ANY($1::bigint[]);
-"""
-
 LIST_LOCAL_SALES = """
 SELECT osp.order_id, osp.item_id, osp.title, osp.quantity,
        osp.sold_price_cents, osp.currency, osp.buyer_username,
@@ -123,16 +162,32 @@ SELECT osp.order_id, osp.item_id, osp.title, osp.quantity,
  LIMIT $3 OFFSET $4;
 """
 
-UPSERT_PRICE_OBSERVATION = """
-INSERT INTO pricing.price_observation
-    (ts_date, source_product_id, price_type_id, finish_id, condition_id,
-     language_id, data_provider_id, sold_avg_cents, sold_count)
-VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-ON CONFLICT (ts_date, source_product_id, price_type_id, finish_id, condition_id, language_id, data_provider_id)
-DO UPDATE SET
-    sold_avg_cents = EXCLUDED.sold_avg_cents,
-    sold_count     = EXCLUDED.sold_count,
-    updated_at     = now();
+# One batch of aggregated groups: upsert into price_observation and mark the
+# staging rows they came from, in a single (atomic) statement.
+PROMOTE_OWN_SALES_BATCH = """
+WITH obs AS (
+    INSERT INTO pricing.price_observation
+        (ts_date, source_product_id, price_type_id, finish_id, condition_id,
+         language_id, data_provider_id, sold_avg_cents, sold_count)
+    SELECT g.ts_date, g.source_product_id, $8::integer, g.finish_id, g.condition_id,
+           g.language_id, $9::smallint, g.sold_avg_cents, g.sold_count
+    FROM unnest($1::date[], $2::bigint[], $3::smallint[], $4::smallint[],
+                $5::smallint[], $6::integer[], $7::integer[])
+         AS g(ts_date, source_product_id, finish_id, condition_id,
+              language_id, sold_avg_cents, sold_count)
+    ON CONFLICT (ts_date, source_product_id, price_type_id, finish_id, condition_id, language_id, data_provider_id)
+    DO UPDATE SET
+        sold_avg_cents = EXCLUDED.sold_avg_cents,
+        sold_count     = EXCLUDED.sold_count,
+        updated_at     = now()
+    RETURNING 1
+), marked AS (
+    UPDATE app_integration.ebay_order_source_product
+    SET promoted_to_obs = true
+    WHERE ebay_osp_id = ANY($10::bigint[])
+    RETURNING 1
+)
+SELECT (SELECT count(*) FROM obs) AS upserted, (SELECT count(*) FROM marked) AS marked;
 """
 
 GET_LISTING_META_BATCH = """
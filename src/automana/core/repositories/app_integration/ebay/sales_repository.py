@@ -88,6 +88,32 @@ class EbaySalesRepository(AbstractRepository):
             return rows[0]["source_product_id"]
         return None
 
+    async def get_listing_variants(self, item_ids: list[str]) -> dict[str, dict]:
+        """item_id → {card_version_id, condition_id, finish_id, language_id, marketplace_id}."""
+        if not item_ids:
+            return {}
+        rows = await self.execute_query(
+            sales_queries.GET_LISTING_VARIANTS_BATCH,
+            (list(item_ids),),
+        )
+        return {str(r["item_id"]): dict(r) for r in rows}
+
+    async def ensure_source_products(
+        self, card_version_ids: list[UUID], source_id: int
+    ) -> dict[UUID, int]:
+        """Batch ``ensure_source_product``. Card versions without a product are omitted."""
+        if not card_version_ids:
+            return {}
+        rows = await self.execute_query(
+            sales_queries.ENSURE_SOURCE_PRODUCTS_BATCH,
+            ([str(cv) for cv in card_version_ids], source_id),
+        )
+        return {
+            UUID(str(r["card_version_id"])): r["source_product_id"]
+            for r in rows
+            if r["source_product_id"] is not None
+        }
+
     async def upsert_active_listing(
         self,
         item_id: str,
@@ -158,46 +184,60 @@ class EbaySalesRepository(AbstractRepository):
             ),
         )
 
+    async def upsert_order_source_products(self, rows: list[dict]) -> int:
+        """Upsert many order lines (``upsert_order_source_product`` kwargs) in one
+        statement. A repeated (order_id, app_code, item_id) keeps its last row,
+        as sequential upserts would. Returns the number of rows sent."""
+        latest = {(r["order_id"], r["app_code"], r["item_id"]): r for r in rows}
+        if not latest:
+            return 0
+        cols = (
+            "order_id", "app_code", "item_id", "title", "source_product_id",
+            "quantity", "sold_price_cents", "currency", "finish_id", "condition_id",
+            "language_id", "sold_at", "buyer_username", "marketplace_id",
+        )
+        await self.execute_command(
+            sales_queries.UPSERT_ORDER_SOURCE_PRODUCTS_BATCH,
+            tuple([r.get(c) for r in latest.values()] for c in cols),
+        )
+        return len(latest)
+
     async def get_unpromoted(self) -> list[dict]:
         rows = await self.execute_query(
             sales_queries.GET_UNPROMOTED_OWN_SALES, ()
         )
         return [dict(r) for r in rows]
 
-    async def mark_promoted(self, ebay_osp_ids: list[int]) -> None:
-        if not ebay_osp_ids:
-            return
-        await self.execute_command(
-            sales_queries.MARK_OWN_SALES_PROMOTED,
-            (ebay_osp_ids,),
-        )
-
-    async def upsert_price_observation(
+    async def promote_batch(
         self,
-        ts_date,
-        source_product_id: int,
+        groups: list[dict],
+        ebay_osp_ids: list[int],
         price_type_id: int,
-        finish_id: int,
-        condition_id: int,
-        language_id: int,
         data_provider_id: int,
-        sold_avg_cents: int,
-        sold_count: int,
-    ) -> None:
-        await self.execute_command(
-            sales_queries.UPSERT_PRICE_OBSERVATION,
+    ) -> int:
+        """Upsert aggregated groups into price_observation and mark their staging rows.
+
+        One statement, so the upsert and the mark commit (or fail) together.
+        Returns the number of staging rows marked promoted.
+        """
+        if not groups:
+            return 0
+        rows = await self.execute_query(
+            sales_queries.PROMOTE_OWN_SALES_BATCH,
             (
-                ts_date,
-                source_product_id,
+                [g["ts_date"] for g in groups],
+                [g["source_product_id"] for g in groups],
+                [g["finish_id"] for g in groups],
+                [g["condition_id"] for g in groups],
+                [g["language_id"] for g in groups],
+                [g["sold_avg_cents"] for g in groups],
+                [g["sold_count"] for g in groups],
                 price_type_id,
-                finish_id,
-                condition_id,
-                language_id,
                 data_provider_id,
-                sold_avg_cents,
-                sold_count,
+                ebay_osp_ids,
             ),
         )
+        return int(rows[0]["marked"]) if rows else 0
 
     async def get_listing_meta_batch(
         self, item_ids: list[str], app_code: str
@@ -1,5 +1,5 @@
 ﻿from automana.core.repositories.abstract_repositories.AbstractDBRepository import AbstractRepository
-import asyncio, io, logging
+import logging
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -23,21 +23,13 @@ class PriceRepository(AbstractRepository):
             logger.error("Error rolling back transaction", extra={"error": str(e)})
 
     async def _copy_to_table(self, df, schema_name, table_name):
-        # Serialise to CSV in a thread so the event loop stays alive during
-        # what can be several minutes of CPU work on a 20M+ row DataFrame.
-        # Blocking the event loop here lets asyncpg's internal pool keepalive
-        # fire and reclaim the connection, causing InterfaceError on the next
-        # copy_to_table call.
-        def _to_csv():
-            buf = io.BytesIO()
-            df.to_csv(buf, index=False, header=True, encoding='utf-8')
-            buf.seek(0)
-            return buf
-
-        buf = await asyncio.to_thread(_to_csv)
+        # Text COPY streamed from Arrow chunks (see core/db/arrow_copy.py): each
+        # record batch is CSV-encoded by Arrow in a worker thread, so there is
+        # no full CSV copy of the frame in memory and asyncpg's keepalive is
+        # never starved on a 20M+ row frame.
         # No explicit timeout: inherits conn._config.command_timeout, which
         # ServiceManager overrides per-service (3 600 s for bulk_load).
-        await self.execute_copy_to_table(table_name, buf, schema_name=schema_name, format='csv', header=True)
+        await self.execute_copy_dataframe(df, table_name, schema_name=schema_name)
 
     async def call_load_stage_from_raw(
         self, source_name: str = "mtgstocks", batch_days: int = 30,
@@ -120,6 +112,37 @@ class PriceRepository(AbstractRepository):
         )
         return rows[0]["n"] if rows else 0
 
+    async def fetch_mtgstock_watermarks(self, source_code: str) -> dict:
+        """Return {print_id: last_ts_date} for one source from ops.mtgstock_print_watermark."""
+        rows = await self.execute_query(
+            "SELECT print_id, last_ts_date FROM ops.mtgstock_print_watermark WHERE source_code = $1",
+            (source_code,),
+        )
+        return {r["print_id"]: r["last_ts_date"] for r in rows}
+
+    async def advance_mtgstock_watermarks(self) -> int:
+        """Raise each print's watermark to the newest ts_date in the raw table.
+
+        Called once the raw rows have been promoted; never moves a watermark
+        backwards. Returns the number of watermarks inserted or advanced."""
+        rows = await self.execute_query(
+            """
+            WITH upserted AS (
+                INSERT INTO ops.mtgstock_print_watermark (print_id, source_code, last_ts_date)
+                SELECT print_id, source_code, max(ts_date)
+                FROM pricing.raw_mtg_stock_price
+                GROUP BY print_id, source_code
+                ON CONFLICT (print_id, source_code) DO UPDATE
+                SET last_ts_date = EXCLUDED.last_ts_date,
+                    updated_at   = now()
+                WHERE EXCLUDED.last_ts_date > ops.mtgstock_print_watermark.last_ts_date
+                RETURNING 1
+            )
+            SELECT count(*)::int AS n FROM upserted
+            """
+        )
+        return rows[0]["n"] if rows else 0
+
     # ------------------------------------------------------------------
     # Metric-registry primitives
     # ------------------------------------------------------------------
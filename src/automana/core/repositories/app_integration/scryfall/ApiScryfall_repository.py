@@ -53,10 +53,9 @@ class ScryfallAPIRepository(BaseApiClient):
     
     async def download_data_from_url(self, url: str) -> dict:
         full_url = self.get_full_url(url) 
-        async with self._get_client() as client:
-            response = await client.get(full_url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().get(full_url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
 
     
     async def _fetch_migrations(self) -> AsyncGenerator[Dict[str, Any], None]:
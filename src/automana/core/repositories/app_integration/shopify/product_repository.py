@@ -1,7 +1,7 @@
 ﻿from automana.core.repositories.abstract_repositories.AbstractDBRepository import AbstractRepository
 from typing import List, Optional, Any
 from automana.core.models.shopify import Market as Market_Model
-import io, logging
+import logging
 
 class ProductRepository(AbstractRepository):
     def __init__(self, connection, executor=None):
@@ -12,14 +12,8 @@ class ProductRepository(AbstractRepository):
     def name(self) -> str:
         return "ProductShopifyRepository"
     
-    async def _copy_to_table(self, df, table):
-        buf = io.BytesIO()
-        df.to_csv(buf, index=False, header=True, encoding='utf-8')
-        buf.seek(0)
-        await self.execute_copy_to_table(table, buf, format='csv', header=True)
-    
     async def bulk_copy_prices(self, df):
-        await self._copy_to_table(df, "pricing.shopify_staging_raw")
+        await self.execute_copy_dataframe(df, "shopify_staging_raw", schema_name="pricing")
 
     async def bulk_insert_products(self, products: List[dict]):
         query = 'CALL add_product_batch_arrays(%s, %s, %s, %s, %s)'
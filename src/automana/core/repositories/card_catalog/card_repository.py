@@ -81,6 +81,180 @@ class CardReferenceRepository(AbstractRepository[Any]):
         )
         return response
 
+    # ------------------------------------------------------------------
+    # COPY-based loader (migration 65)
+    # ------------------------------------------------------------------
+
+    _STAGE_CARD_COLUMNS = (
+        "load_id", "batch_seq", "row_index",
+        "card_name", "cmc", "mana_cost", "reserved", "oracle_text",
+        "set_name", "collector_number", "rarity_name", "border_color",
+        "frame_year", "layout_name", "is_promo", "is_digital",
+        "keywords", "colors", "artist", "artist_ids", "legalities",
+        "illustration_id", "types", "supertypes", "subtypes", "games",
+        "oversized", "booster", "full_art", "textless",
+        "power", "toughness", "loyalty", "defense",
+        "promo_types", "variation", "image_uris", "finishes",
+        "frame_effects", "lang", "scryfall_id", "oracle_id",
+        "multiverse_ids", "tcgplayer_id", "tcgplayer_etched_id",
+        "cardmarket_id", "card_back_id",
+    )
+
+    _STAGE_FACE_COLUMNS = (
+        "load_id", "batch_seq", "row_index", "face_position",
+        "face_index", "name", "mana_cost", "type_line", "oracle_text",
+        "power", "toughness", "flavor_text", "artist", "artist_id",
+        "illustration_id", "image_uris", "supertypes", "types", "subtypes",
+    )
+
+    @staticmethod
+    def _stage_text(value) -> str | None:
+        return str(value) if value is not None else None
+
+    @classmethod
+    def _stage_rows(cls, load_id: UUID, batch_seq: int, cards: list[dict]) -> tuple[list[tuple], list[tuple]]:
+        """Flatten `CreateCard.model_dump_for_sql()` dicts into stage records.
+
+        Values are normalised the same way `insert_batch_card_versions` casts
+        its JSONB input, so both loaders write identical rows.
+        """
+        card_rows: list[tuple] = []
+        face_rows: list[tuple] = []
+        for row_index, card in enumerate(cards):
+            illustration_id = card.get("illustration_id")
+            if isinstance(illustration_id, list):
+                illustration_id = illustration_id[0] if illustration_id else None
+            image_uris = card.get("image_uris")
+            card_rows.append((
+                load_id, batch_seq, row_index,
+                card["card_name"],
+                card.get("cmc"),
+                card.get("mana_cost"),
+                card.get("reserved"),
+                card.get("oracle_text"),
+                card.get("set_name"),
+                card.get("collector_number"),
+                card.get("rarity_name"),
+                card.get("border_color"),
+                cls._stage_text(card.get("frame_year")),
+                card.get("layout_name"),
+                card.get("is_promo"),
+                card.get("is_digital"),
+                card.get("keywords") or [],
+                card.get("colors") or [],
+                [a for a in card.get("artist") or [] if a is not None],
+                [str(a) for a in card.get("artist_ids") or []],
+                json.dumps(card["legalities"]) if card.get("legalities") is not None else None,
+                cls._stage_text(illustration_id),
+                card.get("types") or [],
+                card.get("supertypes") or [],
+                card.get("subtypes") or [],
+                card.get("games") or [],
+                card.get("oversized"),
+                card.get("booster"),
+                card.get("full_art"),
+                card.get("textless"),
+                cls._stage_text(card.get("power")),
+                cls._stage_text(card.get("toughness")),
+                cls._stage_text(card.get("loyalty")),
+                cls._stage_text(card.get("defense")),
+                card.get("promo_types") or [],
+                card.get("variation"),
+                json.dumps(image_uris) if image_uris is not None else None,
+                card.get("finishes") or ["nonfoil"],
+                card.get("frame_effects") or [],
+                card.get("lang") or "en",
+                cls._stage_text(card.get("scryfall_id")),
+                cls._stage_text(card.get("oracle_id")),
+                [int(m) for m in card.get("multiverse_ids") or []],
+                card.get("tcgplayer_id"),
+                card.get("tcgplayer_etched_id"),
+                card.get("cardmarket_id"),
+                cls._stage_text(card.get("card_back_id")),
+            ))
+            for face_position, face in enumerate(card.get("card_faces") or []):
+                artist = face.get("artist")
+                if isinstance(artist, list):
+                    # Mirrors `v_face ->> 'artist'` on a JSON array.
+                    artist = json.dumps(artist)
+                face_image_uris = face.get("image_uris")
+                face_rows.append((
+                    load_id, batch_seq, row_index, face_position,
+                    face.get("face_index"),
+                    face.get("name"),
+                    face.get("mana_cost"),
+                    face.get("type_line"),
+                    face.get("oracle_text"),
+                    cls._stage_text(face.get("power")),
+                    cls._stage_text(face.get("toughness")),
+                    face.get("flavor_text"),
+                    artist,
+                    cls._stage_text(face.get("artist_id")),
+                    cls._stage_text(face.get("illustration_id")),
+                    json.dumps(face_image_uris) if face_image_uris is not None else None,
+                    face.get("supertypes") or [],
+                    face.get("types") or [],
+                    face.get("subtypes") or [],
+                ))
+        return card_rows, face_rows
+
+    async def stage_card_batch(self, load_id: UUID, batch_seq: int, cards: list[dict]) -> int:
+        """Binary-COPY one batch of prepared cards into the load stage tables."""
+        card_rows, face_rows = self._stage_rows(load_id, batch_seq, cards)
+        await self.execute_copy_records_to_table(
+            "card_version_load_stage",
+            records=card_rows,
+            columns=list(self._STAGE_CARD_COLUMNS),
+            schema_name="card_catalog",
+        )
+        if face_rows:
+            await self.execute_copy_records_to_table(
+                "card_face_load_stage",
+                records=face_rows,
+                columns=list(self._STAGE_FACE_COLUMNS),
+                schema_name="card_catalog",
+            )
+        return len(card_rows)
+
+    async def merge_staged_cards(self, load_id: UUID) -> list[tuple[int, "CardReferenceRepository.BatchInsertResponse"]]:
+        """Merge a staged load; returns `(batch_seq, BatchInsertResponse)` per staged batch."""
+        rows = await self.execute_query(
+            "SELECT * FROM card_catalog.merge_card_version_stage($1::uuid)", (load_id,)
+        )
+        results = []
+        for row in rows:
+            errors = row["error_details"]
+            if isinstance(errors, str):
+                errors = json.loads(errors)
+            results.append((
+                row["batch_seq"],
+                CardReferenceRepository.BatchInsertResponse(
+                    total_processed=row["total_processed"],
+                    successful_inserts=row["successful_inserts"],
+                    failed_inserts=row["failed_inserts"],
+                    inserted_card_ids=list(row["inserted_card_ids"] or []),
+                    errors=errors or [],
+                ),
+            ))
+        return results
+
+    async def clear_card_stage(self, load_id: UUID, batch_seq: int | None = None) -> None:
+        await self.execute_command(
+            "SELECT card_catalog.clear_card_version_stage($1::uuid, $2::int)", (load_id, batch_seq)
+        )
+
+    async def refresh_search_tables(self, full_threshold: int = 10000, force_full: bool = False) -> dict:
+        """Sync v_card_versions_complete / v_card_name_suggest from the cards marked dirty.
+
+        Falls back to a whole-catalog sync when more than `full_threshold`
+        cards are dirty or `force_full` is set. Returns the mode and row counts.
+        """
+        rows = await self.execute_query(
+            "SELECT * FROM card_catalog.refresh_card_search_tables($1::int, $2::boolean)",
+            (full_threshold, force_full),
+        )
+        return dict(rows[0]) if rows else {}
+
     async def delete(self, card_id: UUID):
         rows = await self.execute_query(queries.delete_card_query, (card_id,))
         return len(rows) > 0
@@ -189,6 +363,35 @@ class CardReferenceRepository(AbstractRepository[Any]):
         rows = await self.execute_query(sql, (query, limit))
         return [dict(r) for r in rows]
 
+    async def suggest_many(self, queries: list[str], limit: int = 10) -> dict[str, list[dict]]:
+        """``suggest`` for many queries in one round-trip: {query: [candidates]}."""
+        if not queries:
+            return {}
+        sql = """
+            SELECT q.query, s.*
+            FROM unnest($1::text[]) AS q(query)
+            CROSS JOIN LATERAL (
+                SELECT v.card_version_id, v.card_name, v.set_code, v.rarity_name,
+                       cv.collector_number,
+                       cei.value AS scryfall_id,
+                       word_similarity(q.query, v.card_name) AS score
+                FROM card_catalog.v_card_name_suggest v
+                JOIN card_catalog.card_version cv ON cv.card_version_id = v.card_version_id
+                LEFT JOIN card_catalog.card_external_identifier cei
+                    ON cei.card_version_id = v.card_version_id AND cei.card_identifier_ref_id = 1
+                WHERE q.query % v.card_name
+                  AND cv.is_digital = false
+                ORDER BY score DESC
+                LIMIT $2
+            ) s
+        """
+        rows = await self.execute_query(sql, (list(dict.fromkeys(queries)), limit))
+        out: dict[str, list[dict]] = {q: [] for q in queries}
+        for r in rows:
+            row = dict(r)
+            out[row.pop("query")].append(row)
+        return out
+
     async def get_purchase_uris(self, card_version_id) -> dict | None:
         sql = "SELECT purchase_uris FROM card_catalog.card_version WHERE card_version_id = $1"
         rows = await self.execute_query(sql, (card_version_id,))
@@ -354,8 +557,59 @@ class CardReferenceRepository(AbstractRepository[Any]):
         "finish": "non-foil",
     }
 
-    async def search(
-            self,
+    @dataclass
+    class _SearchFilters:
+        """WHERE fragments shared by the search page, count and facet queries."""
+        conditions: list[str]
+        values: list[Any]
+        # conditions/values before the promo_type predicate (promo facet query)
+        facet_cond_stop: int
+        facet_val_stop: int
+        # every condition except rarity (rarity facet query)
+        rf_conditions: list[str]
+        rf_values: list[Any]
+        name_param_idx: Optional[int]
+        oracle_param_idx: Optional[int]
+
+    # JOIN sets for released_at (not projected by the view) and to filter on date range.
+    _SEARCH_FROM = (
+        "FROM card_catalog.v_card_versions_complete v"
+        " JOIN card_catalog.sets s ON s.set_id = v.set_id"
+        " LEFT JOIN card_catalog.card_version_illustration cvi ON cvi.card_version_id = v.card_version_id"
+        " LEFT JOIN pricing.mv_card_price_spark psp ON psp.card_version_id = v.card_version_id"  # mv_card_price_spark is keyed on card_version_id (one row per version) — no fan-out risk
+    )
+
+    # Keyset-pageable sorts: sort_by -> (inner expression, outer/result column, SQL type).
+    _KEYSET_SORTS = {
+        "card_name": ("v.card_name", "card_name", "text"),
+        "cmc": ("v.cmc", "cmc", "integer"),
+        "rarity_name": ("v.rarity_name", "rarity_name", "text"),
+        "set_name": ("v.set_name", "set_name", "text"),
+        "set_code": ("v.set_code", "set_code", "text"),
+        "released_at": ("s.released_at", "released_at", "date"),
+        "price": ("psp.price", "sort_price", "numeric"),
+    }
+
+    @staticmethod
+    def _keyset_predicate(
+        col: str, id_col: str, desc: bool, nulls_last: bool,
+        key: Any, key_idx: Optional[int], id_idx: int, sql_type: str,
+    ) -> str:
+        """Rows strictly after (key, id) in `ORDER BY col, id_col` order.
+
+        The key is bound as text and cast so cursors round-trip through JSON.
+        NULL sort keys form their own block at the end (nulls_last) or start.
+        """
+        op = "<" if desc else ">"
+        if key is None:
+            if nulls_last:
+                return f"({col} IS NULL AND {id_col} {op} ${id_idx})"
+            return f"(({col} IS NULL AND {id_col} {op} ${id_idx}) OR {col} IS NOT NULL)"
+        after = f"(({col}, {id_col}) {op} (${key_idx}::text::{sql_type}, ${id_idx}))"
+        return f"({after} OR {col} IS NULL)" if nulls_last else after
+
+    @staticmethod
+    def _search_filters(
             name: Optional[str] = None,
             colors: Optional[list[str]] = None,
             rarity: Optional[str] = None,
@@ -374,30 +628,8 @@ class CardReferenceRepository(AbstractRepository[Any]):
             format: Optional[str] = None,
             layout: Optional[str] = None,
             promo_type: Optional[List[str]] = None,
-            collapse: bool = False,
-            limit: int = 100,
-            offset: int = 0,
-            sort_by: Optional[str] = "card_name",
-            sort_order: Optional[str] = "asc",
-    ) -> dict[str, Any]:
-        """Search card versions using the v_card_versions_complete materialized view.
-
-        Filters are ANDed together. When ``name`` or ``oracle_text`` are provided
-        the result is ranked by relevance; otherwise the ``sort_by`` / ``sort_order``
-        pair controls ordering.
-
-        Notes:
-            - ``colors`` matches against ``color_identity`` (text[]) stored as
-              proper-cased colour names (e.g. 'White', 'Blue'). Each entry adds
-              an AND condition — cards must contain ALL listed colours. Callers
-              must pass values in that casing.
-            - ``card_type`` matches against the ``types`` array (e.g. 'Creature').
-            - ``digital`` uses the per-card-version ``is_digital`` flag, not the
-              legacy per-set ``sets.digital`` column.
-            - ``released_after`` / ``released_before`` are satisfied via a JOIN to
-              ``card_catalog.sets`` because ``v_card_versions_complete`` does not
-              project ``released_at``.
-        """
+    ) -> "CardReferenceRepository._SearchFilters":
+        """Build the search WHERE conditions; see `search` for filter semantics."""
         conditions: list[str] = []
         values: list[Any] = []
         counter = 1
@@ -596,93 +828,153 @@ class CardReferenceRepository(AbstractRepository[Any]):
             counter += 1
             rf_counter += 1
 
-        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-        facet_where_clause = (
-            "WHERE " + " AND ".join(conditions[:facet_cond_stop])
-            if facet_cond_stop else ""
+        return CardReferenceRepository._SearchFilters(
+            conditions=conditions,
+            values=values,
+            facet_cond_stop=facet_cond_stop,
+            facet_val_stop=facet_val_stop,
+            rf_conditions=rf_conditions,
+            rf_values=rf_values,
+            name_param_idx=name_param_idx,
+            oracle_param_idx=oracle_param_idx,
         )
-        rarity_facet_where = "WHERE " + " AND ".join(rf_conditions) if rf_conditions else ""
+
+    async def search(
+            self,
+            name: Optional[str] = None,
+            colors: Optional[list[str]] = None,
+            rarity: Optional[str] = None,
+            set_name: Optional[str] = None,
+            set_code: Optional[str] = None,
+            mana_cost: Optional[int] = None,
+            digital: Optional[bool] = None,
+            card_type: Optional[str] = None,
+            finish: Optional[str] = None,
+            frame_effects: Optional[list[str]] = None,
+            released_after: Optional[str] = None,
+            released_before: Optional[str] = None,
+            oracle_text: Optional[str] = None,
+            artist: Optional[str] = None,
+            unique_card_id: Optional[UUID] = None,
+            format: Optional[str] = None,
+            layout: Optional[str] = None,
+            promo_type: Optional[List[str]] = None,
+            collapse: bool = False,
+            limit: int = 100,
+            offset: int = 0,
+            sort_by: Optional[str] = "card_name",
+            sort_order: Optional[str] = "asc",
+            after: Optional[dict] = None,
+            with_facets: bool = True,
+    ) -> dict[str, Any]:
+        """Search card versions using the v_card_versions_complete search table.
+
+        Filters are ANDed together. When ``name`` or ``oracle_text`` are provided
+        the result is ranked by relevance; otherwise the ``sort_by`` / ``sort_order``
+        pair controls ordering, with ``card_version_id`` as the tie-breaker.
+
+        Pagination:
+            - ``after`` (``{"key": <sort key>, "id": <card_version_id>}``) seeks
+              past the last row of the previous page instead of using OFFSET,
+              so deep pages cost the same as the first. Only column sorts are
+              keyset-pageable; relevance-ranked searches raise ValueError.
+            - ``next_after`` in the result is the seek position for the next
+              page (None when the page is short or the sort is relevance).
+            - ``with_facets=False`` skips the count and facet queries; the
+              caller is expected to have them cached for this filter set.
+
+        Notes:
+            - ``colors`` matches against ``color_identity`` (text[]) stored as
+              proper-cased colour names (e.g. 'White', 'Blue'). Each entry adds
+              an AND condition — cards must contain ALL listed colours. Callers
+              must pass values in that casing.
+            - ``card_type`` matches against the ``types`` array (e.g. 'Creature').
+            - ``digital`` uses the per-card-version ``is_digital`` flag, not the
+              legacy per-set ``sets.digital`` column.
+            - ``released_after`` / ``released_before`` are satisfied via a JOIN to
+              ``card_catalog.sets`` because ``v_card_versions_complete`` does not
+              project ``released_at``.
+        """
+        f = self._search_filters(
+            name=name, colors=colors, rarity=rarity, set_name=set_name, set_code=set_code,
+            mana_cost=mana_cost, digital=digital, card_type=card_type, finish=finish,
+            frame_effects=frame_effects, released_after=released_after,
+            released_before=released_before, oracle_text=oracle_text, artist=artist,
+            unique_card_id=unique_card_id, format=format, layout=layout, promo_type=promo_type,
+        )
+        name_param_idx, oracle_param_idx = f.name_param_idx, f.oracle_param_idx
+        conditions = list(f.conditions)
+        values = list(f.values)
+        counter = len(values) + 1
+        from_clause = self._SEARCH_FROM
+        safe_sort_order = "DESC" if (sort_order or "").upper() == "DESC" else "ASC"
+
+        # Keyset column for non-relevance sorts; unknown sort_by falls back to card_name.
+        keyset = None
+        if not (name_param_idx or oracle_param_idx):
+            keyset = self._KEYSET_SORTS.get(sort_by) or self._KEYSET_SORTS["card_name"]
+        elif after is not None:
+            raise ValueError("Keyset pagination is not available for relevance-ranked searches")
 
         # Dynamic ORDER BY: prefer relevance when text search params are present.
-        # collapse_order_clause mirrors order_clause but uses bare column names (no v./s.
-        # prefix) so it can be applied to the outer SELECT of the DISTINCT ON subquery.
         if name_param_idx and oracle_param_idx:
             order_clause = (
                 f"ORDER BY ("
                 f"word_similarity(LOWER(${name_param_idx}), LOWER(v.card_name)) + "
                 f"ts_rank_cd(v.search_vector, websearch_to_tsquery('english', ${oracle_param_idx}))"
-                f") DESC"
+                f") DESC, v.card_version_id"
             )
-            collapse_order_clause = (
+            outer_order = (
                 f"ORDER BY ("
                 f"word_similarity(LOWER(${name_param_idx}), LOWER(card_name)) + "
                 f"ts_rank_cd(search_vector, websearch_to_tsquery('english', ${oracle_param_idx}))"
-                f") DESC"
+                f") DESC, card_version_id"
             )
         elif name_param_idx:
-            order_clause = f"ORDER BY word_similarity(LOWER(${name_param_idx}), LOWER(v.card_name)) DESC"
-            collapse_order_clause = f"ORDER BY word_similarity(LOWER(${name_param_idx}), LOWER(card_name)) DESC"
+            order_clause = f"ORDER BY word_similarity(LOWER(${name_param_idx}), LOWER(v.card_name)) DESC, v.card_version_id"
+            outer_order = f"ORDER BY word_similarity(LOWER(${name_param_idx}), LOWER(card_name)) DESC, card_version_id"
         elif oracle_param_idx:
             order_clause = (
                 f"ORDER BY ts_rank_cd(v.search_vector, "
-                f"websearch_to_tsquery('english', ${oracle_param_idx})) DESC"
+                f"websearch_to_tsquery('english', ${oracle_param_idx})) DESC, v.card_version_id"
             )
-            collapse_order_clause = (
+            outer_order = (
                 f"ORDER BY ts_rank_cd(search_vector, "
-                f"websearch_to_tsquery('english', ${oracle_param_idx})) DESC"
+                f"websearch_to_tsquery('english', ${oracle_param_idx})) DESC, card_version_id"
             )
         else:
-            _set_cols = {"released_at"}
-            _price_cols = {"price"}
-            _view_cols = {"card_name", "cmc", "rarity_name", "set_name", "set_code"}
-            safe_sort_order = "DESC" if (sort_order or "").upper() == "DESC" else "ASC"
-            if sort_by in _set_cols:
-                order_clause = f"ORDER BY s.{sort_by} {safe_sort_order}"
-                collapse_order_clause = f"ORDER BY {sort_by} {safe_sort_order}"
-            elif sort_by in _price_cols:
-                order_clause = f"ORDER BY psp.price {safe_sort_order} NULLS LAST"
-                collapse_order_clause = f"ORDER BY sort_price {safe_sort_order} NULLS LAST"
-            else:
-                safe_sort_by = sort_by if sort_by in _view_cols else "card_name"
-                order_clause = f"ORDER BY v.{safe_sort_by} {safe_sort_order}"
-                collapse_order_clause = f"ORDER BY {safe_sort_by} {safe_sort_order}"
-
-        # JOIN sets for released_at (not projected by the view) and to filter on date range.
-        from_clause = (
-            "FROM card_catalog.v_card_versions_complete v"
-            " JOIN card_catalog.sets s ON s.set_id = v.set_id"
-            " LEFT JOIN card_catalog.card_version_illustration cvi ON cvi.card_version_id = v.card_version_id"
-            " LEFT JOIN pricing.mv_card_price_spark psp ON psp.card_version_id = v.card_version_id"  # mv_card_price_spark is keyed on card_version_id (one row per version) — no fan-out risk
-        )
-
-        # Outer ORDER BY for collapse mode — references subquery columns (no table prefix).
-        if collapse:
-            if name_param_idx and oracle_param_idx:
-                outer_order = (
-                    f"ORDER BY ("
-                    f"word_similarity(LOWER(${name_param_idx}), LOWER(card_name)) + "
-                    f"ts_rank_cd(search_vector, websearch_to_tsquery('english', ${oracle_param_idx}))"
-                    f") DESC"
-                )
-            elif name_param_idx:
-                outer_order = f"ORDER BY word_similarity(LOWER(${name_param_idx}), LOWER(card_name)) DESC"
-            elif oracle_param_idx:
-                outer_order = (
-                    f"ORDER BY ts_rank_cd(search_vector, "
-                    f"websearch_to_tsquery('english', ${oracle_param_idx})) DESC"
+            inner_col, outer_col, _ = keyset
+            # Price keeps NULLS LAST in both directions; other columns use the
+            # Postgres default (NULLS LAST for ASC, NULLS FIRST for DESC).
+            nulls = " NULLS LAST" if sort_by == "price" else ""
+            order_clause = f"ORDER BY {inner_col} {safe_sort_order}{nulls}, v.card_version_id {safe_sort_order}"
+            outer_order = f"ORDER BY {outer_col} {safe_sort_order}{nulls}, card_version_id {safe_sort_order}"
+
+        outer_where = ""
+        if after is not None:
+            inner_col, outer_col, sql_type = keyset
+            desc = safe_sort_order == "DESC"
+            nulls_last = sort_by == "price" or not desc
+            key = after.get("key")
+            # A NULL key is not bound — the predicate only tests IS NULL.
+            key_idx = None
+            if key is not None:
+                values.append(str(key))
+                key_idx = counter
+                counter += 1
+            values.append(UUID(str(after["id"])))
+            id_idx = counter
+            counter += 1
+            if collapse:
+                outer_where = "WHERE " + self._keyset_predicate(
+                    outer_col, "card_version_id", desc, nulls_last, key, key_idx, id_idx, sql_type
                 )
             else:
-                _set_cols = {"released_at"}
-                _price_cols = {"price"}
-                _view_cols = {"card_name", "cmc", "rarity_name", "set_name", "set_code"}
-                safe_sort_order = "DESC" if (sort_order or "").upper() == "DESC" else "ASC"
-                if sort_by in _set_cols:
-                    outer_order = f"ORDER BY released_at {safe_sort_order}"
-                elif sort_by in _price_cols:
-                    outer_order = f"ORDER BY sort_price {safe_sort_order} NULLS LAST"
-                else:
-                    safe_sort_by = sort_by if sort_by in _view_cols else "card_name"
-                    outer_order = f"ORDER BY {safe_sort_by} {safe_sort_order}"
+                conditions.append(self._keyset_predicate(
+                    inner_col, "v.card_version_id", desc, nulls_last, key, key_idx, id_idx, sql_type
+                ))
+
+        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
 
         # search_vector is only needed in collapsed outer ORDER BY when oracle_text is used.
         sv_col = ", v.search_vector" if (collapse and oracle_param_idx) else ""
@@ -718,6 +1010,7 @@ class CardReferenceRepository(AbstractRepository[Any]):
                              cardinality(v.promo_types) ASC NULLS LAST,
                              v.collector_number ASC NULLS LAST
                 ) _collapsed
+                {outer_where}
                 {outer_order}
                 LIMIT ${counter} OFFSET ${counter + 1}
             """
@@ -730,16 +1023,36 @@ class CardReferenceRepository(AbstractRepository[Any]):
                 {order_clause}
                 LIMIT ${counter} OFFSET ${counter + 1}
             """
-        values.extend([limit, offset])
-        cards = await self.execute_query(query, tuple(values))
+        values.extend([limit, 0 if after is not None else offset])
+        rows = await self.execute_query(query, tuple(values))
+
+        next_after = None
+        if keyset is not None and rows and len(rows) == limit:
+            last = rows[-1]
+            next_after = {"key": last[keyset[1]], "id": str(last["card_version_id"])}
 
-        card_ids = [row["card_version_id"] for row in cards]
+        card_ids = [row["card_version_id"] for row in rows]
         price_data = await self._fetch_prices_for_cards(card_ids)
         cards = [
             {**dict(row), **price_data.get(str(row["card_version_id"]), self._PRICE_DEFAULTS)}
-            for row in cards
+            for row in rows
         ]
 
+        result: dict[str, Any] = {"cards": cards, "next_after": next_after}
+        if with_facets:
+            result.update(await self._search_counts_and_facets(f, collapse))
+        return result
+
+    async def _search_counts_and_facets(self, f: "CardReferenceRepository._SearchFilters", collapse: bool) -> dict[str, Any]:
+        """total_count plus promo-type and rarity facets for one filter set (independent of page/sort)."""
+        from_clause = self._SEARCH_FROM
+        where_clause = "WHERE " + " AND ".join(f.conditions) if f.conditions else ""
+        facet_where_clause = (
+            "WHERE " + " AND ".join(f.conditions[:f.facet_cond_stop])
+            if f.facet_cond_stop else ""
+        )
+        rarity_facet_where = "WHERE " + " AND ".join(f.rf_conditions) if f.rf_conditions else ""
+
         if collapse:
             count_query = f"""
                 SELECT COUNT(*) AS total_count FROM (
@@ -754,8 +1067,7 @@ class CardReferenceRepository(AbstractRepository[Any]):
                 {from_clause}
                 {where_clause}
             """
-        count_values = values[:-2]
-        count_result = await self.execute_query(count_query, tuple(count_values))
+        count_result = await self.execute_query(count_query, tuple(f.values))
         total_count = count_result[0]["total_count"] if count_result else 0
 
         # Facet query uses facet_where_clause (excludes promo_type predicate) so
@@ -768,7 +1080,7 @@ class CardReferenceRepository(AbstractRepository[Any]):
             CROSS JOIN LATERAL unnest(v.promo_types) AS t(pt)
             {facet_where_clause}
         """
-        facet_result = await self.execute_query(facet_query, tuple(values[:facet_val_stop]))
+        facet_result = await self.execute_query(facet_query, tuple(f.values[:f.facet_val_stop]))
         promo_type_facets = (
             (facet_result[0]["promo_type_facets"] or []) if facet_result else []
         )
@@ -782,15 +1094,15 @@ class CardReferenceRepository(AbstractRepository[Any]):
             JOIN card_catalog.sets s ON s.set_id = v.set_id
             {rarity_facet_where}
         """
-        rarity_result = await self.execute_query(rarity_facet_query, tuple(rf_values))
+        rarity_result = await self.execute_query(rarity_facet_query, tuple(f.rf_values))
         rarity_facets = (rarity_result[0]["rarity_facets"] or []) if rarity_result else []
 
         return {
-            "cards": cards,
             "total_count": total_count,
             "promo_type_facets": promo_type_facets,
             "rarity_facets": rarity_facets,
         }
+
     async def get_versions_in_set(self, unique_card_id: UUID, set_code: str) -> list[dict]:
         """All card_version rows for one (unique_card_id, set_code) pair — for the versions table."""
         sql = """
@@ -950,6 +1262,46 @@ class CardReferenceRepository(AbstractRepository[Any]):
             inserted=bool(row["inserted"]),
         )
 
+    async def register_external_identifiers(
+        self,
+        identifier_name: str,
+        rows: list[tuple[UUID | str, str]],
+    ) -> int:
+        """Bulk form of ``register_external_identifier``: one statement for many
+        (card_version_id, value) pairs. Returns the number of rows inserted.
+
+        Same ON CONFLICT semantics as the single-row variant. Pairs whose
+        card_version no longer exists are dropped by the join, and an unknown
+        ``identifier_name`` inserts nothing."""
+        if not rows:
+            return 0
+        query = """
+            WITH ref AS (
+                SELECT card_identifier_ref_id
+                FROM card_catalog.card_identifier_ref
+                WHERE identifier_name = $1
+            ),
+            ins AS (
+                INSERT INTO card_catalog.card_external_identifier (
+                    card_version_id, card_identifier_ref_id, value
+                )
+                SELECT cv.card_version_id, ref.card_identifier_ref_id, d.value
+                FROM unnest($2::uuid[], $3::text[]) AS d(card_version_id, value)
+                JOIN card_catalog.card_version AS cv
+                  ON cv.card_version_id = d.card_version_id
+                CROSS JOIN ref
+                ON CONFLICT (card_version_id, card_identifier_ref_id) DO NOTHING
+                RETURNING 1
+            )
+            SELECT count(*) AS inserted FROM ins
+        """
+        result = await self.execute_query(query, (
+            identifier_name,
+            [str(cv) for cv, _ in rows],
+            [str(value) for _, value in rows],
+        ))
+        return int(result[0]["inserted"]) if result else 0
+
     async def copy_migrations(self, buffer):
         """
         Bulk-load Scryfall migration records into ``card_catalog.scryfall_migration``
@@ -9,11 +9,18 @@ lifetime, and the string is returned to the caller.
 
 Refresh token rotation: eBay occasionally issues a new refresh token alongside
 the access token. When that happens the encrypted row is upserted immediately
-so the old token is never presented again.
-
-FOR UPDATE on the Postgres fetch serialises concurrent refresh attempts on the
-same (user_id, app_id) row. Full race-free serialisation requires the caller
-to hold an explicit transaction; that upgrade is a follow-up task.
+so the old token is never presented again. The refresh runs on its own pooled
+connection and transaction, not the caller's: the caller may roll back, and
+the rotated token must be committed before the access token is cached.
+
+Refreshes are single-flight per cache key (see redis_cache.single_flight):
+concurrent misses wait for one refresh and then read the token it cached, in
+this process or any other. A burst of requests after expiry therefore costs
+one OAuth call.
+
+renew_token lets the beat-driven renewer (integrations.ebay.renew_access_tokens)
+refresh a token shortly before its cache entry lapses, so request paths
+normally find a warm token.
 """
 from __future__ import annotations
 
@@ -24,7 +31,7 @@ from typing import Optional
 from uuid import UUID
 
 from automana.core.repositories.app_integration.ebay.auth_repository import EbayAuthRepository
-from automana.core.utils.redis_cache import get_redis_client
+from automana.core.utils.redis_cache import get_redis_client, single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,20 @@ _KEY = "ebay:access_token:{user_id}:{app_code}"
 _APP_KEY = "ebay:app_token:{app_code}"
 _MARGIN = 60  # seconds — expire cache slightly before eBay does
 _BROWSE_SCOPE = "https://api.ebay.com/oauth/api_scope"
+# Upper bound on one refresh (DB reads + OAuth round-trip); waiters in other
+# processes give up on the lock after this long and refresh themselves.
+_REFRESH_LOCK_TTL = 30.0
+# The renewer refreshes tokens whose cache entry expires within this window.
+_RENEW_BEFORE = 900
+
+
+async def _cached_access_token(cache_key: str, renew_before: int = 0) -> Optional[str]:
+    """Cached token, or None when absent (or due within ``renew_before`` seconds)."""
+    _redis = await get_redis_client()
+    if renew_before and await _redis.ttl(cache_key) <= renew_before:
+        return None
+    cached = await _redis.get(cache_key)
+    return json.loads(cached)["access_token"] if cached else None
 
 
 async def resolve_token(
@@ -49,12 +70,86 @@ async def resolve_token(
 
     cache_key = _KEY.format(user_id=user_id, app_code=app_code)
 
-    _redis = await get_redis_client()
-    cached = await _redis.get(cache_key)
+    cached = await _cached_access_token(cache_key)
     if cached:
         logger.info("ebay_token_cache_hit", extra={"app_code": app_code, "user_id": str(user_id)})
-        return json.loads(cached)["access_token"]
+        return cached
 
+    return await single_flight(
+        cache_key,
+        lambda: _refresh_user_token(auth_repository, user_id, app_code, cache_key),
+        lock_ttl_seconds=_REFRESH_LOCK_TTL,
+    )
+
+
+async def renew_token(
+    auth_repository: EbayAuthRepository,
+    user_id: UUID,
+    app_code: str,
+    renew_before: int = _RENEW_BEFORE,
+) -> bool:
+    """Refresh the cached token if it lapses within ``renew_before`` seconds.
+
+    Returns True when a refresh ran, False when the cached token was fresh.
+    """
+    cache_key = _KEY.format(user_id=user_id, app_code=app_code)
+    if await _cached_access_token(cache_key, renew_before):
+        return False
+    await single_flight(
+        cache_key,
+        lambda: _refresh_user_token(auth_repository, user_id, app_code, cache_key, renew_before),
+        lock_ttl_seconds=_REFRESH_LOCK_TTL,
+    )
+    return True
+
+
+async def _refresh_user_token(
+    auth_repository: EbayAuthRepository,
+    user_id: UUID,
+    app_code: str,
+    cache_key: str,
+    renew_before: int = 0,
+) -> str:
+    # Cache-aside: a waiter released by another process's lock finds its token.
+    cached = await _cached_access_token(cache_key, renew_before)
+    if cached:
+        return cached
+
+    # Import deferred to avoid circular dependency at module load time.
+    from automana.core.framework.service_manager import ServiceManager
+
+    connections = ServiceManager.connection_source()
+    if connections is None:
+        result = await _exchange_refresh_token(auth_repository, user_id, app_code)
+    else:
+        async with connections() as connection, connection.transaction():
+            result = await _exchange_refresh_token(
+                type(auth_repository)(connection, auth_repository.executor), user_id, app_code
+            )
+
+    access_token = result["access_token"]
+    expires_in = result.get("expires_in", 7200)
+    _redis = await get_redis_client()
+    await _redis.setex(
+        cache_key,
+        max(expires_in - _MARGIN, _MARGIN),
+        json.dumps({"access_token": access_token}),
+    )
+    logger.info("ebay_token_cache_populated", extra={"app_code": app_code, "user_id": str(user_id)})
+
+    return access_token
+
+
+async def _exchange_refresh_token(
+    auth_repository: EbayAuthRepository,
+    user_id: UUID,
+    app_code: str,
+) -> dict:
+    """Exchange the stored refresh token at eBay and persist a rotated one.
+
+    Within a transaction the refresh token row stays locked (FOR UPDATE)
+    until it ends, so two processes never exchange the same token.
+    """
     record = await auth_repository.fetch_refresh_token(user_id=user_id, app_code=app_code)
     if not record:
         logger.error(
@@ -103,16 +198,7 @@ async def resolve_token(
             extra={"app_code": app_code, "user_id": str(user_id)},
         )
 
-    expires_in = result.get("expires_in", 7200)
-    _redis = await get_redis_client()
-    await _redis.setex(
-        cache_key,
-        max(expires_in - _MARGIN, _MARGIN),
-        json.dumps({"access_token": access_token}),
-    )
-    logger.info("ebay_token_cache_populated", extra={"app_code": app_code, "user_id": str(user_id)})
-
-    return access_token
+    return result
 
 
 async def resolve_app_token(app_settings: dict) -> str:
@@ -124,11 +210,23 @@ async def resolve_app_token(app_settings: dict) -> str:
     app_id = app_settings["app_id"]
     cache_key = _APP_KEY.format(app_code=app_id)
 
-    _redis = await get_redis_client()
-    cached = await _redis.get(cache_key)
+    cached = await _cached_access_token(cache_key)
     if cached:
         logger.info("ebay_app_token_cache_hit", extra={"app_id": app_id})
-        return json.loads(cached)["access_token"]
+        return cached
+
+    return await single_flight(
+        cache_key,
+        lambda: _refresh_app_token(app_settings, cache_key),
+        lock_ttl_seconds=_REFRESH_LOCK_TTL,
+    )
+
+
+async def _refresh_app_token(app_settings: dict, cache_key: str) -> str:
+    app_id = app_settings["app_id"]
+    cached = await _cached_access_token(cache_key)
+    if cached:
+        return cached
 
     from automana.core.repositories.app_integration.ebay.ApiAuth_repository import (
         EbayAuthAPIRepository,
@@ -147,6 +245,7 @@ async def resolve_app_token(app_settings: dict) -> str:
         raise ValueError(f"eBay client credentials returned no access_token for app_id={app_id!r}")
 
     expires_in = result.get("expires_in", 7200)
+    _redis = await get_redis_client()
     await _redis.setex(
         cache_key,
         max(expires_in - _MARGIN, _MARGIN),
@@ -16,6 +16,7 @@ from automana.core.repositories.app_integration.ebay.ApiAuth_repository import E
 from automana.core.repositories.app_integration.ebay.app_repository import EbayAppRepository
 from automana.core.repositories.app_integration.ebay.auth_repository import EbayAuthRepository
 from automana.core.framework.registry import ServiceRegistry
+from automana.core.services.app_integration.ebay._auth_context import _RENEW_BEFORE, renew_token
 from automana.core.utils.redis_cache import get_redis_client
 
 logger = logging.getLogger(__name__)
@@ -239,6 +240,39 @@ async def exchange_refresh_token(
     )
 
 
+@ServiceRegistry.register(
+    "integrations.ebay.renew_access_tokens",
+    db_repositories=["auth"],
+    runs_in_transaction=False,
+)
+async def renew_access_tokens(
+    auth_repository: EbayAuthRepository,
+    renew_before: int = _RENEW_BEFORE,
+) -> dict:
+    """Beat-driven: refresh cached access tokens that lapse within ``renew_before`` seconds.
+
+    Keeps request paths (listings, market price, sales sync) off the OAuth
+    round-trip. Refreshes share the single-flight used by resolve_token, so a
+    request racing the renewer does not trigger a second exchange.
+    """
+    users = await auth_repository.get_active_app_code_users()
+    renewed = failed = 0
+    for row in users:
+        user_id, app_code = UUID(str(row["user_id"])), row["app_code"]
+        try:
+            if await renew_token(auth_repository, user_id, app_code, renew_before):
+                renewed += 1
+        except Exception:
+            failed += 1
+            logger.exception(
+                "ebay_token_renew_failed",
+                extra={"user_id": str(user_id), "app_code": app_code},
+            )
+    result = {"renewed": renewed, "fresh": len(users) - renewed - failed, "failed": failed}
+    logger.info("ebay_token_renew_complete", extra=result)
+    return result
+
+
 @ServiceRegistry.register(
     "integrations.ebay.list_user_apps",
     db_repositories=["auth"],
@@ -18,7 +18,7 @@ from automana.core.repositories.app_integration.ebay.app_repository import EbayA
 from automana.core.repositories.app_integration.ebay.ApiSelling_repository import EbaySellingRepository
 from automana.core.framework.registry import ServiceRegistry
 from automana.core.services.app_integration.ebay._auth_context import resolve_token
-from automana.core.utils.redis_cache import get_from_cache, set_to_cache, invalidate_cache_pattern
+from automana.core.utils.redis_cache import get_from_cache, get_l1_cache, set_to_cache, invalidate_cache_pattern
 
 _SOLD_ORDERS_TTL = 300
 
@@ -55,6 +55,7 @@ async def get_order_history(
     token = await resolve_token(auth_repository, user_id=user_id, app_code=app_code)
 
     cache_key = f"ebay:sold_orders:{user_id}:{app_code}:{limit}:{offset}"
+    epoch = get_l1_cache().epoch
     cached = await get_from_cache(cache_key)
     if cached is not None:
         logger.info("ebay_sold_orders_cache_hit", extra={"cache_key": cache_key})
@@ -96,7 +97,7 @@ async def get_order_history(
     result = listings_model.PaginatedOrders.from_parts(
         items=items, total=total, offset=offset, limit=limit,
     )
-    await set_to_cache(cache_key, result.model_dump(), expiry_seconds=_SOLD_ORDERS_TTL)
+    await set_to_cache(cache_key, result.model_dump(), expiry_seconds=_SOLD_ORDERS_TTL, epoch=epoch)
     return result
 
 
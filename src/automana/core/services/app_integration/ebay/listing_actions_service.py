@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 from uuid import UUID
@@ -8,6 +9,11 @@ from automana.core.framework.registry import ServiceRegistry
 
 logger = logging.getLogger(__name__)
 
+# eBay calls in flight per drain run; several drains may run side by side.
+_DRAIN_CONCURRENCY = 8
+# A claimed action not resolved within this many seconds is claimed again.
+_CLAIM_LEASE_SECONDS = 900
+
 
 @ServiceRegistry.register(
     path="integrations.ebay.actions.stage",
@@ -45,40 +51,59 @@ async def get_pending_action(
     return await listing_actions_repository.get_pending_for_item(item_id)
 
 
+async def _execute_action(row: dict) -> None:
+    # NOTE: actual eBay API call would go here in a future task
+    # For now, log the intended action
+    logger.info(
+        "action_processed",
+        extra={
+            "action_id": str(row["id"]),
+            "item_id": row["item_id"],
+            "action_type": row["action_type"],
+            "suggested_price": row.get("suggested_price"),
+        },
+    )
+
+
 @ServiceRegistry.register(
     path="integrations.ebay.actions.drain",
     db_repositories=["listing_actions"],
-    runs_in_transaction=False,  # each action commits independently
+    runs_in_transaction=False,  # the claim must commit before the eBay calls
 )
 async def drain_pending_actions(
     listing_actions_repository,
     limit: int = 50,
+    concurrency: int = _DRAIN_CONCURRENCY,
+    lease_seconds: float = _CLAIM_LEASE_SECONDS,
 ) -> dict:
-    rows = await listing_actions_repository.get_pending(limit=limit)
-    processed = 0
-    failed = 0
-    for row in rows:
-        action_id = row["id"]
-        try:
-            await listing_actions_repository.mark_processing(action_id)
-            # NOTE: actual eBay API call would go here in a future task
-            # For now, log the intended action and mark done
-            logger.info(
-                "action_processed",
-                extra={
-                    "action_id": str(action_id),
-                    "item_id": row["item_id"],
-                    "action_type": row["action_type"],
-                    "suggested_price": row.get("suggested_price"),
-                },
-            )
-            await listing_actions_repository.mark_done(action_id)
-            processed += 1
-        except Exception as exc:
-            await listing_actions_repository.mark_failed(action_id, str(exc))
-            logger.warning(
-                "action_failed",
-                extra={"action_id": str(action_id), "error": str(exc)},
-            )
-            failed += 1
-    return {"processed": processed, "failed": failed}
+    """Claim up to ``limit`` pending actions, execute them concurrently, record outcomes.
+
+    The claim uses FOR UPDATE SKIP LOCKED, so overlapping drains take disjoint
+    rows. It also takes back 'processing' rows claimed more than
+    ``lease_seconds`` ago, so a drain that died mid-batch does not strand them.
+    Done and failed outcomes are written back in one statement at the end.
+    """
+    rows = await listing_actions_repository.claim_pending(limit=limit, lease_seconds=lease_seconds)
+    if not rows:
+        return {"processed": 0, "failed": 0}
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(row: dict) -> Optional[str]:
+        async with semaphore:
+            try:
+                await _execute_action(row)
+                return None
+            except Exception as exc:
+                logger.warning(
+                    "action_failed",
+                    extra={"action_id": str(row["id"]), "error": str(exc)},
+                )
+                return str(exc)
+
+    errors = await asyncio.gather(*(_run(row) for row in rows))
+    await listing_actions_repository.record_outcomes(
+        [(row["id"], row["claimed_at"], error) for row, error in zip(rows, errors)]
+    )
+    failed = sum(error is not None for error in errors)
+    return {"processed": len(rows) - failed, "failed": failed}
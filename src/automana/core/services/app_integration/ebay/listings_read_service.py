@@ -32,7 +32,7 @@ from automana.core.repositories.app_integration.ebay.sales_repository import (
 )
 from automana.core.framework.registry import ServiceRegistry
 from automana.core.services.app_integration.ebay._auth_context import resolve_token
-from automana.core.utils.redis_cache import get_from_cache, set_to_cache
+from automana.core.utils.redis_cache import get_from_cache, get_l1_cache, set_to_cache
 
 _ACTIVE_LISTINGS_TTL = 60
 
@@ -138,6 +138,7 @@ async def get_active_listings(
     page_number = (offset // limit) + 1 if limit else 1
 
     cache_key = f"ebay:active_listings:{user_id}:{app_code}:{limit}:{page_number}"
+    epoch = get_l1_cache().epoch
     cached = await get_from_cache(cache_key)
     if cached is not None:
         logger.info("ebay_active_listings_cache_hit", extra={"cache_key": cache_key})
@@ -208,5 +209,5 @@ async def get_active_listings(
         offset=offset,
         limit=limit,
     )
-    await set_to_cache(cache_key, result.model_dump(), expiry_seconds=_ACTIVE_LISTINGS_TTL)
+    await set_to_cache(cache_key, result.model_dump(), expiry_seconds=_ACTIVE_LISTINGS_TTL, epoch=epoch)
     return result
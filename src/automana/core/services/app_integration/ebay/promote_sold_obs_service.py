@@ -2,7 +2,10 @@
 
 Reads both staging tables (own-sales and external-scrape), aggregates by
 (source_product_id, date, finish_id, condition_id, language_id), upserts
-into pricing.price_observation, then marks staging rows as promoted.
+into pricing.price_observation and marks the staging rows as promoted.
+
+Each batch of groups is one statement (unnest upsert + staging update), so
+the job issues O(batches) statements and a batch is promoted all-or-nothing.
 """
 from __future__ import annotations
 
@@ -79,14 +82,12 @@ async def promote_sold_obs(
 
     own_promoted = await _promote_channel(
         staging_rows=await ebay_sales_repository.get_unpromoted(),
-        mark_fn=lambda ids: ebay_sales_repository.mark_promoted(ids),
-        upsert_fn=ebay_sales_repository.upsert_price_observation,
+        promote_fn=ebay_sales_repository.promote_batch,
         fx_map=None,  # own-sales are always USD
     )
     scrape_promoted = await _promote_channel(
         staging_rows=await ebay_scrape_repository.get_unpromoted(),
-        mark_fn=lambda ids: ebay_scrape_repository.mark_promoted(ids),
-        upsert_fn=ebay_sales_repository.upsert_price_observation,
+        promote_fn=ebay_scrape_repository.promote_batch,
         fx_map=fx_map or None,
     )
     total = own_promoted + scrape_promoted
@@ -97,42 +98,41 @@ async def promote_sold_obs(
     return {"promoted": total}
 
 
-async def _promote_channel(staging_rows, mark_fn, upsert_fn, fx_map: dict[str, float] | None = None) -> int:
+async def _promote_channel(staging_rows, promote_fn, fx_map: dict[str, float] | None = None) -> int:
+    """Promote one channel's staging rows; ``promote_fn`` is the repository's promote_batch."""
     if not staging_rows:
         return 0
 
-    groups = _aggregate(staging_rows, fx_map=fx_map)
-    promoted_ids: list[int] = []
+    groups = list(_aggregate(staging_rows, fx_map=fx_map).items())
+    promoted = 0
 
     for batch_start in range(0, len(groups), _BATCH_SIZE):
-        batch_keys = list(groups.keys())[batch_start:batch_start + _BATCH_SIZE]
-        for key in batch_keys:
-            source_product_id, ts_date, finish_id, condition_id, language_id = key
-            bucket = groups[key]
-            avg_cents = round(bucket["total"] / bucket["count"])
-            try:
-                await upsert_fn(
-                    ts_date=ts_date,
-                    source_product_id=source_product_id,
-                    price_type_id=_SELL_PRICE_TYPE_ID,
-                    finish_id=finish_id,
-                    condition_id=condition_id,
-                    language_id=language_id,
-                    data_provider_id=_EBAY_DATA_PROVIDER_ID,
-                    sold_avg_cents=avg_cents,
-                    sold_count=bucket["count"],
-                )
-                promoted_ids.extend(bucket["ids"])
-            except Exception:
-                logger.exception(
-                    "ebay_promote_upsert_failed",
-                    extra={"source_product_id": source_product_id, "ts_date": str(ts_date)},
-                )
-
-    if promoted_ids:
+        batch = groups[batch_start:batch_start + _BATCH_SIZE]
+        rows: list[dict] = []
+        ids: list[int] = []
+        for (source_product_id, ts_date, finish_id, condition_id, language_id), bucket in batch:
+            rows.append({
+                "ts_date": ts_date,
+                "source_product_id": source_product_id,
+                "finish_id": finish_id,
+                "condition_id": condition_id,
+                "language_id": language_id,
+                "sold_avg_cents": round(bucket["total"] / bucket["count"]),
+                "sold_count": bucket["count"],
+            })
+            ids.extend(bucket["ids"])
         try:
-            await mark_fn(promoted_ids)
+            promoted += await promote_fn(
+                rows,
+                ids,
+                price_type_id=_SELL_PRICE_TYPE_ID,
+                data_provider_id=_EBAY_DATA_PROVIDER_ID,
+            )
         except Exception:
-            logger.exception("ebay_promote_mark_failed", extra={"count": len(promoted_ids)})
+            # Nothing in the batch was written; its rows stay unpromoted for the next run.
+            logger.exception(
+                "ebay_promote_batch_failed",
+                extra={"groups": len(rows), "staging_rows": len(ids)},
+            )
 
-    return len(promoted_ids)
+    return promoted
@@ -3,9 +3,15 @@
 Two registered services:
 - track_active_listing: called from router after listing creation (best-effort)
 - sync_own_sales: nightly service iterating all active sellers
+
+The nightly sync pages through each seller's full order history, fetching
+several sellers, and several pages per seller, concurrently. Persistence is batched: each batch of line items
+costs a fixed handful of queries (variants, title matches, source products,
+order statuses, order lines) whatever its size.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -35,6 +41,12 @@ logger = logging.getLogger(__name__)
 
 _EBAY_SOURCE_ID = 5
 _SCORE_THRESHOLD = 0.7
+# Orders per getOrders page, and per persisted batch.
+_PAGE_SIZE = 200
+_ORDER_BATCH_SIZE = 200
+_SELLER_CONCURRENCY = 4
+# getOrders pages in flight per seller once the first page gave the total.
+_PAGE_CONCURRENCY = 4
 
 
 def _price_to_cents(value: Any) -> Optional[int]:
@@ -53,18 +65,8 @@ def _parse_sold_at(date_str: Optional[str]) -> datetime:
     return datetime.now(timezone.utc)
 
 
-async def _resolve_card_version(
-    item_id: Optional[str],
-    title: str,
-    ebay_sales_repository: EbaySalesRepository,
-    card_repository: CardReferenceRepository,
-) -> Optional[UUID]:
-    if item_id:
-        cv = await ebay_sales_repository.get_card_version_by_item(item_id)
-        if cv:
-            return cv
-
-    candidates = await card_repository.suggest(query=title, limit=10)
+def _best_candidate(title: str, candidates: list[dict]) -> Optional[UUID]:
+    """Highest-scoring suggest() candidate for a listing title, if above threshold."""
     best_cv: Optional[UUID] = None
     best_score = _SCORE_THRESHOLD
     for c in candidates:
@@ -128,35 +130,82 @@ async def sync_own_sales(
     card_repository: CardReferenceRepository,
     selling_repository: EbaySellingRepository,
     days_back: int = 90,
+    concurrency: int = _SELLER_CONCURRENCY,
     **kwargs: Any,
 ) -> dict:
     """Fetch all sellers' eBay order history and upsert into staging tables."""
     active_users = await auth_repository.get_active_app_code_users()
     if not active_users:
         logger.info("ebay_sync_own_sales_no_active_users")
-        return {"synced_orders": 0}
+        return {"synced_orders": 0, "synced_sellers": 0}
 
-    total_orders = 0
-    for row in active_users:
+    # Order pages are fetched concurrently; the repositories share one DB
+    # connection, so every DB round-trip on it is serialised behind this lock.
+    db_lock = asyncio.Lock()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(row) -> Optional[int]:
         user_id: UUID = UUID(str(row["user_id"]))
         app_code: str = row["app_code"]
-        try:
-            await _sync_for_user(
-                user_id=user_id,
-                app_code=app_code,
-                auth_repository=auth_repository,
-                app_repository=app_repository,
-                ebay_sales_repository=ebay_sales_repository,
-                card_repository=card_repository,
-                selling_repository=selling_repository,
-            )
-            total_orders += 1
-        except Exception:
-            logger.exception(
-                "ebay_sync_own_sales_user_failed",
-                extra={"user_id": str(user_id), "app_code": app_code},
-            )
-    return {"synced_orders": total_orders}
+        async with semaphore:
+            try:
+                return await _sync_for_user(
+                    user_id=user_id,
+                    app_code=app_code,
+                    auth_repository=auth_repository,
+                    app_repository=app_repository,
+                    ebay_sales_repository=ebay_sales_repository,
+                    card_repository=card_repository,
+                    selling_repository=selling_repository,
+                    db_lock=db_lock,
+                )
+            except Exception:
+                logger.exception(
+                    "ebay_sync_own_sales_user_failed",
+                    extra={"user_id": str(user_id), "app_code": app_code},
+                )
+                return None
+
+    results = await asyncio.gather(*(_one(row) for row in active_users))
+    synced = [n for n in results if n is not None]
+    return {"synced_orders": sum(synced), "synced_sellers": len(synced)}
+
+
+async def _fetch_all_orders(
+    selling_repository: EbaySellingRepository,
+    token: str,
+    environment: Optional[str],
+) -> list[dict]:
+    """Every order in the getOrders window, following limit/offset pagination.
+
+    The first page carries ``total``; the remaining pages are then fetched
+    concurrently, at most _PAGE_CONCURRENCY at a time. Without a total, pages
+    are followed one by one until a short page.
+    """
+    semaphore = asyncio.Semaphore(_PAGE_CONCURRENCY)
+
+    async def _page(offset: int) -> tuple[list, Optional[int]]:
+        async with semaphore:
+            raw = await selling_repository.get_history({
+                "token": token,
+                "limit": _PAGE_SIZE,
+                "offset": offset,
+                "environment": environment,
+            })
+        return raw.get("orders") or [], raw.get("total")
+
+    page, total = await _page(0)
+    pages = [page]
+    if total is not None:
+        rest = range(len(page), int(total), len(page)) if page else ()
+        pages += [p for p, _ in await asyncio.gather(*(_page(offset) for offset in rest))]
+    else:
+        offset = len(page)
+        while len(page) >= _PAGE_SIZE:
+            page, _ = await _page(offset)
+            pages.append(page)
+            offset += len(page)
+    return [o for p in pages for o in p if isinstance(o, dict)]
 
 
 async def _sync_for_user(
@@ -167,57 +216,38 @@ async def _sync_for_user(
     ebay_sales_repository: EbaySalesRepository,
     card_repository: CardReferenceRepository,
     selling_repository: EbaySellingRepository,
-) -> None:
+    db_lock: asyncio.Lock,
+) -> int:
+    """Sync one seller's orders; returns the number of orders persisted."""
+    # Outside the lock: a cache miss makes an OAuth call, and the refresh runs
+    # on its own pooled connection (see _auth_context).
     token = await resolve_token(auth_repository, user_id=user_id, app_code=app_code)
-    env = await auth_repository.get_environment(app_code=app_code)
-    if env:
-        selling_repository.environment = env.lower()
-
-    payload = {"token": token, "limit": 50, "offset": 0}
-    raw = await selling_repository.get_history(payload)
-    raw_orders = raw.get("orders") or []
+    async with db_lock:
+        env = await auth_repository.get_environment(app_code=app_code)
 
-    for order_data in raw_orders:
-        if not isinstance(order_data, dict):
-            continue
-        order = FulfillmentResponse.model_validate(order_data)
-        if not order.orderId:
-            continue
+    raw_orders = await _fetch_all_orders(selling_repository, token, env.lower() if env else None)
 
-        try:
-            await app_repository.upsert_order_status(
-                order_id=order.orderId,
-                app_code=app_code,
-                local_status="sold",
-            )
-        except Exception:
-            logger.warning(
-                "ebay_sync_upsert_status_failed",
-                extra={"order_id": order.orderId, "app_code": app_code},
-            )
-
-        for line in (order.lineItems or []):
-            await _process_line_item(
-                order=order,
-                line=line,
+    orders = [FulfillmentResponse.model_validate(o) for o in raw_orders]
+    orders = [o for o in orders if o.orderId]
+    for start in range(0, len(orders), _ORDER_BATCH_SIZE):
+        async with db_lock:
+            await _persist_orders(
+                orders[start:start + _ORDER_BATCH_SIZE],
                 app_code=app_code,
+                app_repository=app_repository,
                 ebay_sales_repository=ebay_sales_repository,
                 card_repository=card_repository,
             )
+    logger.info(
+        "ebay_sync_own_sales_user_done",
+        extra={"user_id": str(user_id), "app_code": app_code, "orders": len(orders)},
+    )
+    return len(orders)
 
 
-async def _process_line_item(
-    order: FulfillmentResponse,
-    line: LineItemType,
-    app_code: str,
-    ebay_sales_repository: EbaySalesRepository,
-    card_repository: CardReferenceRepository,
-) -> None:
+def _line_record(order: FulfillmentResponse, line: LineItemType, app_code: str) -> Optional[dict]:
+    """Plain upsert row for one line item (source_product/variant fields filled later)."""
     item_id = line.legacyItemId
-    title = line.title or ""
-    sold_at = _parse_sold_at(order.creationDate)
-    buyer = order.buyer.username if order.buyer else None
-
     price_val = line.lineItemCost.text if line.lineItemCost else None
     price_cents = _price_to_cents(price_val)
     if price_cents is None:
@@ -225,62 +255,93 @@ async def _process_line_item(
             "ebay_sync_line_item_no_price",
             extra={"order_id": order.orderId, "item_id": item_id},
         )
-        return
-
+        return None
     currency = (
         line.lineItemCost.currencyID if line.lineItemCost else "USD"
     ) or "USD"
+    return {
+        "order_id": order.orderId,
+        "app_code": app_code,
+        "item_id": item_id or "",
+        "title": line.title or "",
+        "quantity": line.quantity or 1,
+        "sold_price_cents": price_cents,
+        "currency": currency,
+        "sold_at": _parse_sold_at(order.creationDate),
+        "buyer_username": order.buyer.username if order.buyer else None,
+    }
+
+
+async def _persist_orders(
+    orders: list[FulfillmentResponse],
+    app_code: str,
+    app_repository: EbayAppRepository,
+    ebay_sales_repository: EbaySalesRepository,
+    card_repository: CardReferenceRepository,
+) -> None:
+    """Upsert a batch of orders and their line items with set-based queries."""
+    try:
+        await app_repository.upsert_order_statuses(
+            [o.orderId for o in orders], app_code=app_code, local_status="sold"
+        )
+    except Exception:
+        logger.warning(
+            "ebay_sync_upsert_status_failed",
+            extra={"orders": len(orders), "app_code": app_code},
+        )
 
-    card_version_id = await _resolve_card_version(
-        item_id=item_id,
-        title=title,
-        ebay_sales_repository=ebay_sales_repository,
-        card_repository=card_repository,
-    )
-
-    # Resolve condition/finish/language from the active listing record if available.
-    # Falls back to safe defaults for listings predating migration_37.
-    variant = None
-    if item_id:
-        variant = await ebay_sales_repository.get_listing_variant(item_id)
-
-    finish_id    = variant["finish_id"]      if variant and variant.get("finish_id")    else 1
-    condition_id = variant["condition_id"]   if variant and variant.get("condition_id") else None
-    language_id  = variant["language_id"]    if variant and variant.get("language_id")  else 1
-    sale_marketplace_id = variant["marketplace_id"] if variant else None
-
-    source_product_id: Optional[int] = None
-    if card_version_id:
-        try:
-            source_product_id = await ebay_sales_repository.ensure_source_product(
-                card_version_id, _EBAY_SOURCE_ID
-            )
-        except Exception:
-            logger.exception(
-                "ebay_sync_ensure_source_product_failed",
-                extra={"card_version_id": str(card_version_id)},
-            )
-            return
+    lines = [
+        rec
+        for order in orders
+        for line in (order.lineItems or [])
+        if (rec := _line_record(order, line, app_code)) is not None
+    ]
+    if not lines:
+        return
 
+    # Condition/finish/language (and the card_version) come from the active
+    # listing record when we created it; listings predating migration_37 fall
+    # back to safe defaults and a title match.
+    variants = await ebay_sales_repository.get_listing_variants(
+        sorted({r["item_id"] for r in lines if r["item_id"]})
+    )
+    unmatched_titles = sorted({
+        r["title"] for r in lines
+        if not (variants.get(r["item_id"]) or {}).get("card_version_id")
+    })
+    suggestions = await card_repository.suggest_many(unmatched_titles, limit=10) if unmatched_titles else {}
+    title_cv = {t: _best_candidate(t, suggestions.get(t, [])) for t in unmatched_titles}
+
+    for r in lines:
+        variant = variants.get(r["item_id"])
+        cv = (variant or {}).get("card_version_id")
+        r["card_version_id"] = UUID(str(cv)) if cv else title_cv.get(r["title"])
+        r["finish_id"] = variant["finish_id"] if variant and variant.get("finish_id") else 1
+        r["condition_id"] = variant["condition_id"] if variant and variant.get("condition_id") else None
+        r["language_id"] = variant["language_id"] if variant and variant.get("language_id") else 1
+        r["marketplace_id"] = variant["marketplace_id"] if variant else None
+
+    card_versions = sorted({r["card_version_id"] for r in lines if r["card_version_id"]}, key=str)
     try:
-        await ebay_sales_repository.upsert_order_source_product(
-            order_id=order.orderId,
-            app_code=app_code,
-            item_id=item_id or "",
-            title=title,
-            source_product_id=source_product_id,
-            quantity=line.quantity or 1,
-            sold_price_cents=price_cents,
-            currency=currency,
-            finish_id=finish_id,
-            condition_id=condition_id,
-            language_id=language_id,
-            sold_at=sold_at,
-            buyer_username=buyer,
-            marketplace_id=sale_marketplace_id,
+        source_products = await ebay_sales_repository.ensure_source_products(
+            card_versions, _EBAY_SOURCE_ID
         )
+    except Exception:
+        logger.exception(
+            "ebay_sync_ensure_source_product_failed",
+            extra={"card_versions": len(card_versions)},
+        )
+        # Same as the per-line path: a line whose source product can't be
+        # ensured is skipped rather than stored unlinked.
+        lines = [r for r in lines if not r["card_version_id"]]
+        source_products = {}
+
+    for r in lines:
+        r["source_product_id"] = source_products.get(r.pop("card_version_id"))
+    try:
+        await ebay_sales_repository.upsert_order_source_products(lines)
     except Exception:
         logger.exception(
             "ebay_sync_upsert_order_source_product_failed",
-            extra={"order_id": order.orderId, "item_id": item_id},
+            extra={"lines": len(lines), "app_code": app_code},
         )
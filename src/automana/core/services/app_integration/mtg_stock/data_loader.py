@@ -1,52 +1,170 @@
-﻿import json, logging, os
+﻿import asyncio, atexit, json, logging, multiprocessing, os
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import  List
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import pyarrow as pa, pyarrow.parquet as pq
 from automana.core.repositories.app_integration.mtg_stock.ApiMtgStock_repository import ApiMtgStockRepository
+from automana.core.config.settings import get_settings
 from automana.core.framework.registry import ServiceRegistry
 from automana.core.repositories.ops.ops_repository import OpsRepository
 from automana.core.models.pipelines.mtg_stock import MTGStockBatchStep
+from automana.core.storage.mtgstock_archive import (
+    MtgStockArchive,
+    archive_enabled,
+    info_from_details,
+    migrate_legacy_folders,
+)
 from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
 #utils
-def prices_to_parquet(print_id: int, raw_json: bytes, out_path: Path):
+_PRICE_SERIES = ("low", "avg", "foil", "market", "market_foil")
+_PRICE_TABLE_SCHEMA = pa.schema(
+    [("print_id", pa.int64()), ("date", pa.date32())]
+    + [(f"price_{name}", pa.float64()) for name in _PRICE_SERIES]
+)
+_MS_PER_DAY = 86_400_000
+
+
+def prices_to_table(print_id: int, raw_json: bytes) -> pa.Table:
+    """Decode one print's price payload into a (print_id, date, price_*) table.
+
+    The payload holds one ``[[ts_ms, price], ...]`` array per series. All
+    points are concatenated, bucketed by UTC day, and scattered into a single
+    day x series grid in one pass. A later point for the same day and series
+    wins.
+    """
     obj = json.loads(raw_json)
-    # obj has arrays like {"low": [[ts, price], ...], "avg": [...], "high": [...], "foil": [...]?}
-    def series(name):
-        arr = obj.get(name) or []
-        if not arr: return pd.DataFrame(columns=["date", name])
-        df = pd.DataFrame(arr, columns=["ts_ms", name])
-        df["date"] = pd.to_datetime(df["ts_ms"], unit="ms", utc=True).dt.date
-        return df[["date", name]]
-
-    df = series("low").merge(series("avg"), on="date", how="outer") \
-                      .merge(series("foil"), on="date", how="outer") \
-                      .merge(series("market"), on="date", how="outer") \
-                      .merge(series("market_foil"), on="date", how="outer")
-
-    if df.empty:
-        df = pd.DataFrame(columns=["date","price_low","price_avg","price_foil","price_market", "price_market_foil"])
-    else:
-        df = df.rename(columns={"low":"price_low","avg":"price_avg","foil":"price_foil", "market":"price_market", "market_foil":"price_market_foil"})
-        df = df.sort_values("date").drop_duplicates("date", keep="last")
-    df.insert(0, "print_id", print_id)
-    table = pa.Table.from_pandas(df, preserve_index=False)
+    points = [
+        (col, arr)
+        for col, name in enumerate(_PRICE_SERIES)
+        if len(arr := np.asarray(obj.get(name) or [], dtype="float64").reshape(-1, 2))
+    ]
+    if not points:
+        return _PRICE_TABLE_SCHEMA.empty_table()
+    days = np.concatenate([arr[:, 0] // _MS_PER_DAY for _, arr in points]).astype("int32")
+    cols = np.concatenate([np.full(len(arr), col) for col, arr in points])
+    values = np.concatenate([arr[:, 1] for _, arr in points])
+
+    unique_days, row = np.unique(days, return_inverse=True)
+    grid = np.full((len(unique_days), len(_PRICE_SERIES)), np.nan)
+    grid[row, cols] = values
+    return pa.table(
+        [
+            pa.array(np.full(len(unique_days), print_id, dtype="int64")),
+            pa.array(unique_days, type=pa.date32()),
+            *[pa.array(grid[:, i], from_pandas=True) for i in range(len(_PRICE_SERIES))],
+        ],
+        schema=_PRICE_TABLE_SCHEMA,
+    )
+
+
+def prices_to_frame(print_id: int, raw_json: bytes) -> pd.DataFrame:
+    return prices_to_table(print_id, raw_json).to_pandas()
+
+
+def prices_to_parquet(print_id: int, raw_json: bytes, out_path: Path):
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    pq.write_table(table, out_path)
+    pq.write_table(prices_to_table(print_id, raw_json), out_path)
+
+
+_convert_pool: Executor | None = None
+_convert_pool_ready = False
+
+
+def _convert_executor() -> Executor | None:
+    """Process pool for decoding/writing fetched batches, created on first use.
+
+    Decoding price payloads is pure CPU, so in a thread it still contends with
+    the event loop for the GIL between network batches. Sized by
+    MTGSTOCK_CONVERT_PROCESSES. Returns None (thread pool) when disabled, or
+    when multiprocessing is unavailable, e.g. inside a daemonic Celery prefork
+    child. Uses ``spawn`` so children never inherit the event loop's sockets.
+    """
+    global _convert_pool, _convert_pool_ready
+    if _convert_pool_ready:
+        return _convert_pool
+    _convert_pool_ready = True
+    processes = get_settings().mtgstock_convert_processes
+    if processes <= 0:
+        return None
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        pool.submit(prices_to_table, 0, b"{}").result()
+    except (AssertionError, OSError, RuntimeError) as exc:
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.warning("mtgstock_convert_pool_unavailable", extra={"error": str(exc)})
+        return None
+    _convert_pool = pool
+    atexit.register(shutdown_convert_executor)
+    return pool
+
+
+def shutdown_convert_executor() -> None:
+    """Stop the convert pool's worker processes; the next run starts a new one.
+
+    Called at worker shutdown, and at interpreter exit for CLI runs."""
+    global _convert_pool, _convert_pool_ready
+    pool, _convert_pool, _convert_pool_ready = _convert_pool, None, False
+    if pool is not None:
+        atexit.unregister(shutdown_convert_executor)
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 async def write_batch(
         result: list,
         destination_folder: str,
-        market:str = "tcg"
+        market:str = "tcg",
+        executor: Executor | None = None,
     ):
+    """Decode and persist one fetched batch off the event loop.
+
+    Runs in ``executor`` (see ``_convert_executor``) or the default thread pool.
+    Writer errors come back as strings, because a spawned child has no logging
+    config."""
+    writer = _write_batch_to_archive if archive_enabled(destination_folder) else _write_batch_to_folders
+    loop = asyncio.get_running_loop()
+    try:
+        errors = await loop.run_in_executor(executor, writer, result, str(destination_folder), market)
+    except Exception as e:
+        errors = [f"Error writing batch: {e}"]
+    for error in errors:
+        logger.error(error)
+
+
+class _PendingWrite:
+    """At most one batch write in flight, so the next fetch overlaps it.
+
+    ``submit`` waits for the previous write before starting the next one, which
+    keeps archive appends in batch order. Call ``wait`` before reporting success.
+    """
+
+    def __init__(self, destination_folder: str, market: str, executor: Executor | None):
+        self._destination_folder = Path(destination_folder)
+        self._market = market
+        self._executor = executor
+        self._task: asyncio.Future | None = None
+
+    async def submit(self, result: list) -> None:
+        await self.wait()
+        self._task = asyncio.ensure_future(
+            write_batch(result, self._destination_folder, market=self._market, executor=self._executor)
+        )
+
+    async def wait(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+
+
+def _write_batch_to_folders(result: list, destination_folder: str, market: str = "tcg") -> list[str]:
+    """Legacy layout: one folder per print with info.json + prices.<market>.parquet."""
     try:
         for item in result:
-            pdir = destination_folder / str(item.get('card_id'))
-            pdir = Path(pdir)
+            pdir = Path(destination_folder) / str(item.get('card_id'))
             pdir.mkdir(parents=True, exist_ok=True)
             data = item.get('data', None)
             details = data.get('details', None) if data else None
@@ -60,11 +178,37 @@ async def write_batch(
                 # parquet file; no prior `write_bytes(prices)` needed.
                 prices_to_parquet(item.get('card_id'), prices, price_path)
     except Exception as e:
-        logger.error(f"Error writing batch: {e}")
+        return [f"Error writing batch: {e}"]
+    return []
+
+
+def _write_batch_to_archive(result: list, destination_folder: str, market: str = "tcg") -> list[str]:
+    """Append one fetched batch to the consolidated archive as two part files."""
+    errors: list[str] = []
+    info_rows, price_tables = [], []
+    for item in result:
+        data = item.get('data') or {}
+        try:
+            if data.get('details'):
+                info_rows.append(info_from_details(item.get('card_id'), json.loads(data['details'])))
+            if data.get('prices'):
+                price_tables.append(prices_to_table(item.get('card_id'), data['prices']))
+        except Exception as e:
+            errors.append(f"Error decoding print {item.get('card_id')}: {e}")
+    archive = MtgStockArchive(destination_folder)
+    try:
+        archive.append_info(info_rows)
+        if price_tables:
+            archive.append_prices(market, pa.concat_tables(price_tables).to_pandas())
+    except Exception as e:
+        errors.append(f"Error writing batch: {e}")
+    return errors
 
 def get_existing_ids(
         destination_folder: str
     )-> List[int]:
+    if archive_enabled(destination_folder):
+        return MtgStockArchive(destination_folder).print_ids()
     file_name = "existing_ids.json"
     base_path = Path(destination_folder)
     list_path = base_path / file_name
@@ -147,6 +291,7 @@ async def run_mtgstock_pipeline(
     processed = 0
     errored = 0
     step = 1
+    writes = _PendingWrite(destination_folder, market, await asyncio.to_thread(_convert_executor))
     #first, download all new prices for prints with existing data
     existing_ids = get_existing_ids(destination_folder)
     logger.info(f"Found {len(existing_ids)} existing print IDs to update prices for.")
@@ -170,12 +315,14 @@ async def run_mtgstock_pipeline(
                                       card_ids=batch_ids, market=market)
             logger.info(f"Updating prices for print IDs {batch_ids[0]} to {batch_ids[-1]}, {batch_result.get('items_ok', 0)} succeeded, {batch_result.get('items_failed', 0)} failed")
             cleaned_data = [d for d in batch_result.get("data", []) if "error" not in d]
-            await write_batch(cleaned_data, Path(destination_folder), market=market)
+            await writes.submit(cleaned_data)
             start_index =  end
+        await writes.wait()
     except Exception as e:
         # Prior version referenced an undefined `end_index` here and masked the
         # real exception with a NameError. `end` is the local batch bound.
         logger.error(f"Error updating prices: {e}")
+        await writes.wait()
         if existing_ids and start_index < total_prints:
             processed, errored, step = await end_of_batch_process(
                 ops_repository,
@@ -213,7 +360,7 @@ async def run_mtgstock_pipeline(
                 card_ids=batch_ids, market=market,
             )
             cleaned_data = [d for d in batch_result.get("data", []) if "error" not in d]
-            await write_batch(cleaned_data, Path(destination_folder), market=market)
+            await writes.submit(cleaned_data)
             processed, errored, step = await end_of_batch_process(
                 ops_repository,
                 ingestion_run_id,
@@ -225,6 +372,7 @@ async def run_mtgstock_pipeline(
                 errored,
                 batch_result,
             )
+        await writes.wait()
         if ops_repository and ingestion_run_id is not None:
             await ops_repository.update_run(
                 ingestion_run_id,
@@ -233,6 +381,7 @@ async def run_mtgstock_pipeline(
                 notes=f"Processed {processed} items with {errored} errors.",
             )
     except Exception as e:
+        await writes.wait()
         if ops_repository and ingestion_run_id is not None:
             await ops_repository.update_run(
                 ingestion_run_id,
@@ -260,6 +409,7 @@ async def run_mtgstock_pipeline_selected_lists(
     processed = 0
     errored = 0
     step = 1
+    writes = _PendingWrite(destination_folder, market, await asyncio.to_thread(_convert_executor))
 
     start_index =0
     total_prints = len(ids_list)
@@ -286,7 +436,7 @@ async def run_mtgstock_pipeline_selected_lists(
             #remove the errored ones before writing and processing results
             cleaned_data = [d for d in batch_result_data.get("data", []) if "error" not in d]
 
-            await write_batch(cleaned_data, Path(destination_folder), market=market)
+            await writes.submit(cleaned_data)
             processed, errored, step = await end_of_batch_process(
                 ops_repository=ops_repository,
                 ingestion_run_id=ingestion_run_id,
@@ -303,6 +453,7 @@ async def run_mtgstock_pipeline_selected_lists(
             start_index = end_index
             pbar.set_postfix_str(f"done ok={processed} err={errored}")
 
+        await writes.wait()
         if ops_repository and ingestion_run_id is not None:
             await ops_repository.update_run(
                 ingestion_run_id,
@@ -317,6 +468,7 @@ async def run_mtgstock_pipeline_selected_lists(
         pbar.set_postfix_str(f"FAILED ok={processed} err={errored}")
         pbar.close()
         logger.error(f"Error updating prices: {e}")
+        await writes.wait()
         if ops_repository and ingestion_run_id is not None:
             await ops_repository.update_run(
                 ingestion_run_id,
@@ -388,8 +540,12 @@ async def discover_and_fetch_new_ids(
         market: str = "tcg",
 ) -> dict:
     """Probe for print IDs beyond the current local maximum and download them."""
+    use_archive = archive_enabled(destination_folder)
     ids_path = Path(destination_folder) / "existing_ids.json"
-    existing_ids: List[int] = sorted(json.loads(ids_path.read_text())) if ids_path.exists() else []
+    if use_archive:
+        existing_ids: List[int] = MtgStockArchive(destination_folder).print_ids()
+    else:
+        existing_ids = sorted(json.loads(ids_path.read_text())) if ids_path.exists() else []
     max_known = max(existing_ids) if existing_ids else 0
 
     last_id = await get_last_print_id(mtg_stock_repository, max_known)
@@ -409,25 +565,47 @@ async def discover_and_fetch_new_ids(
             ingestion_run_id, status="running", current_step="discover_new_ids"
         )
 
+    writes = _PendingWrite(destination_folder, market, await asyncio.to_thread(_convert_executor))
     processed = 0
-    for start in range(0, len(new_ids), batch_size):
-        batch_ids = new_ids[start : start + batch_size]
-        batch_result = await mtg_stock_repository.fetch_card_data_batches(batch_ids, market=market)
-        cleaned = [d for d in batch_result.get("data", []) if "error" not in d]
-        await write_batch(cleaned, Path(destination_folder), market=market)
-        processed += len(cleaned)
-        logger.info(
-            "discover_new_ids batch complete",
-            extra={"batch_start": start, "fetched": len(cleaned)},
-        )
+    try:
+        for start in range(0, len(new_ids), batch_size):
+            batch_ids = new_ids[start : start + batch_size]
+            batch_result = await mtg_stock_repository.fetch_card_data_batches(batch_ids, market=market)
+            cleaned = [d for d in batch_result.get("data", []) if "error" not in d]
+            await writes.submit(cleaned)
+            processed += len(cleaned)
+            logger.info(
+                "discover_new_ids batch complete",
+                extra={"batch_start": start, "fetched": len(cleaned)},
+            )
+    finally:
+        await writes.wait()
 
-    all_ids = sorted(set(existing_ids) | set(new_ids))
-    ids_path.write_text(json.dumps(all_ids))
-    logger.info("existing_ids.json updated", extra={"total_ids": len(all_ids)})
+    if not use_archive:
+        # The archive manifest is updated by write_batch itself.
+        all_ids = sorted(set(existing_ids) | set(new_ids))
+        ids_path.write_text(json.dumps(all_ids))
+        logger.info("existing_ids.json updated", extra={"total_ids": len(all_ids)})
 
     return {"new_ids_count": len(new_ids), "processed": processed}
 
 
+@ServiceRegistry.register("mtg_stock.data_loader.migrate_to_archive")
+async def migrate_to_archive(
+        destination_folder: str,
+        batch_size: int = 2000,
+        remove_legacy: bool = False,
+) -> dict:
+    """One-off move of the per-print folders under destination_folder into the
+    consolidated parquet archive. Re-runnable; legacy folders are only deleted
+    with remove_legacy=True. Until it has run, loaders keep the legacy layout."""
+    stats = await asyncio.to_thread(
+        migrate_legacy_folders, destination_folder, batch_size=batch_size, remove_legacy=remove_legacy
+    )
+    logger.info("mtgstock archive migration complete", extra=stats)
+    return stats
+
+
 
 
 
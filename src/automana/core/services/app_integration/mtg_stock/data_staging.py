@@ -8,6 +8,7 @@ from automana.core.services.ops.pipeline_services import track_step
 from tqdm import tqdm
 from automana.core.models.pipelines.mtg_stock import MTGStockBatchStep
 from automana.core.repositories.ops.ops_repository import OpsRepository
+from automana.core.storage.mtgstock_archive import ARCHIVE_DIRNAME, MtgStockArchive
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,50 @@ async def process_info_file(path):
             # adjust key
     }
 
+
+def _archive_chunk(archive: MtgStockArchive, print_ids: list[int], market: str, watermarks: dict):
+    """Archive counterpart of process_info_file + process_prices_file for a whole chunk.
+
+    One predicate-pushdown read per dataset instead of two file opens per
+    print; the watermark filter runs vectorised over the chunk. Returns
+    (price frames, ids_master_dict, prints with nothing newer than their watermark).
+    """
+    # The chunk's oldest watermark bounds every print in it, so it can be
+    # pushed into the read; the exact per-print cut follows in pandas.
+    marks = [watermarks.get(pid) for pid in print_ids]
+    floor = min(marks) if marks and None not in marks else None
+    prices = archive.read_prices(market, print_ids, since=floor).rename(columns={"date": "ts_date"})
+    info = archive.read_info(print_ids)
+    if watermarks and not prices.empty:
+        since = pd.to_datetime(prices["print_id"].map(watermarks))
+        prices = prices[since.isna() | (prices["ts_date"] > since)]
+    skipped = len(set(print_ids) - set(prices["print_id"].unique()))
+
+    ids_master_dict = {
+        int(row.print_id): {
+            "card_name": row.card_name,
+            "set_abbr": row.set_abbr,
+            "collector_number": row.collector_number,
+            "scryfallId": row.scryfall_id,
+            "multiverse_ids": json.loads(row.multiverse_ids) if row.multiverse_ids else None,
+            "tcg_id": row.tcg_id,
+            "cardtrader_id": row.cardtrader_id,
+        }
+        for row in info.itertuples(index=False)
+    }
+    if prices.empty:
+        return [], ids_master_dict, skipped
+
+    prices = prices.merge(info.drop(columns=["multiverse_ids"]), on="print_id", how="left")
+    prices["ts_date"] = pd.to_datetime(prices["ts_date"]).dt.date
+    prices["game_code"] = "mtg"
+    prices["source_code"] = _MARKET_SOURCE.get(market, market)
+    prices["scraped_at"] = pd.Timestamp.now()
+    columns = ["ts_date", "game_code", "print_id", "price_low", "price_avg", "price_foil",
+               "price_market", "price_market_foil", "source_code", "scraped_at",
+               "card_name", "set_abbr", "collector_number", "scryfall_id", "tcg_id", "cardtrader_id"]
+    return [prices[columns]], ids_master_dict, skipped
+
 _MARKET_SOURCE = {
     "tcg": "tcg",
     "cardmarket": "cardmarket",
@@ -38,10 +83,16 @@ _MARKET_SOURCE = {
 }
 
 
-async def process_prices_file(path, id_dict, market: str = "tcg"):
-    df = await asyncio.to_thread(pd.read_parquet, path)
-    # asyncpg.copy_to_table(..., header=True) maps by column NAME, so the
-    # DataFrame columns must match pricing.raw_mtg_stock_price exactly.
+async def process_prices_file(path, id_dict, market: str = "tcg", since=None):
+    """Price rows for one legacy print folder; ``since`` keeps only ``date > since``.
+
+    The ``since`` predicate is pushed into the parquet read (row-group
+    statistics), so an up-to-date print costs a footer read, not a full scan.
+    """
+    filters = [("date", ">", since)] if since is not None else None
+    df = await asyncio.to_thread(pd.read_parquet, path, filters=filters)
+    # copy_prices_mtgstock COPYs by column NAME, so the DataFrame
+    # columns must match pricing.raw_mtg_stock_price exactly.
     # The parquet file writes a `date` column; the DB column is `ts_date`.
     df = df.rename(columns={"date": "ts_date"})
     df["print_id"] = id_dict.get("mtgstock", None)
@@ -65,6 +116,7 @@ async def process_prices_file(path, id_dict, market: str = "tcg"):
     db_repositories = ["price", "ops"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def bulk_load(price_repository: PriceRepository,
                     ops_repository: OpsRepository,
@@ -75,14 +127,35 @@ async def bulk_load(price_repository: PriceRepository,
                     start_id: int | None = None,
                     end_id: int | None = None,
                     ids_filter: list[int] | None = None,
-                    concurrency: int = 20):
-    """TODO: include scryfall_id, card_name, set_abbr, collector_number in the
+                    concurrency: int = 20,
+                    full_reload: bool = False):
+    """Land MTGStock price history in pricing.raw_mtg_stock_price.
+
+    Delta-only by default: each print only contributes rows newer than its
+    watermark in ops.mtgstock_print_watermark, so the raw table (and the
+    window from_raw_to_staging pivots, which is min/max of raw ts_date) holds
+    just the new observations. `full_reload=True` ignores the watermarks for a
+    complete backfill. Watermarks advance in `advance_watermarks` once the
+    run's rows are promoted.
+
+    Reads the consolidated parquet archive (``<root_folder>/_archive``) when
+    present, otherwise the legacy one-folder-per-print tree.
+
+    TODO: include scryfall_id, card_name, set_abbr, collector_number in the
     staging table to simplify dim/fact loads and avoid re-calling Scryfall API
     in the dimension load step."""
     step_name = "bulk_load"
     batch_number = 1
+    rows_loaded = 0
+    prints_up_to_date = 0
 
-    folders = os.listdir(root_folder)
+    archive = MtgStockArchive(root_folder)
+    if archive.exists():
+        folders = [str(i) for i in archive.print_ids(market)]
+    else:
+        # A migration in progress leaves _archive/ beside the print folders.
+        archive = None
+        folders = [f for f in os.listdir(root_folder) if f != ARCHIVE_DIRNAME]
     if start_id is not None or end_id is not None:
         if start_id is not None and end_id is not None and start_id > end_id:
             logger.warning(
@@ -103,6 +176,14 @@ async def bulk_load(price_repository: PriceRepository,
     deleted = await price_repository.clear_raw_prices()
     logger.info("bulk_load: cleared stale rows from raw_mtg_stock_price", extra={"deleted": deleted})
 
+    watermarks: dict = {}
+    if not full_reload:
+        watermarks = await price_repository.fetch_mtgstock_watermarks(_MARKET_SOURCE.get(market, market))
+    logger.info(
+        "bulk_load: loaded print watermarks",
+        extra={"watermarks": len(watermarks), "full_reload": full_reload},
+    )
+
     sem = asyncio.Semaphore(concurrency)
 
     async def _process_folder(folder: str):
@@ -111,7 +192,10 @@ async def bulk_load(price_repository: PriceRepository,
                 pdir = os.path.join(root_folder, folder)
                 id_dict = await process_info_file(os.path.join(pdir, "info.json"))
                 price_df = await process_prices_file(
-                    os.path.join(pdir, f"prices.{market}.parquet"), id_dict, market=market
+                    os.path.join(pdir, f"prices.{market}.parquet"),
+                    id_dict,
+                    market=market,
+                    since=watermarks.get(id_dict.get("mtgstock")),
                 )
                 price_df["card_name"] = id_dict.get("card_name")
                 price_df["set_abbr"] = id_dict.get("set_abbr")
@@ -131,25 +215,37 @@ async def bulk_load(price_repository: PriceRepository,
                 folder_errors = 0
                 ids_master_dict: dict = {}
 
-                tasks = [_process_folder(f) for f in chunk]
-                for coro in asyncio.as_completed(tasks):
-                    folder_name, price_df, id_dict, error = await coro
-                    if error is not None:
-                        folder_errors += 1
-                        logger.warning(
-                            "Error processing folder",
-                            extra={
-                                "folder": folder_name,
-                                "error": str(error),
-                                "error_type": type(error).__name__,
-                            },
-                        )
-                    else:
-                        price_rows.append(price_df)
-                        ids_master_dict[id_dict["mtgstock"]] = {
-                            k: v for k, v in id_dict.items() if k != "mtgstock"
-                        }
-                    pbar.update(1)
+                if archive is not None:
+                    price_rows, ids_master_dict, skipped = await asyncio.to_thread(
+                        _archive_chunk, archive, [int(f) for f in chunk], market, watermarks
+                    )
+                    prints_up_to_date += skipped
+                    prints_ok = len(chunk) - skipped
+                    pbar.update(len(chunk))
+                else:
+                    tasks = [_process_folder(f) for f in chunk]
+                    for coro in asyncio.as_completed(tasks):
+                        folder_name, price_df, id_dict, error = await coro
+                        if error is not None:
+                            folder_errors += 1
+                            logger.warning(
+                                "Error processing folder",
+                                extra={
+                                    "folder": folder_name,
+                                    "error": str(error),
+                                    "error_type": type(error).__name__,
+                                },
+                            )
+                        else:
+                            if price_df.empty:
+                                prints_up_to_date += 1
+                            else:
+                                price_rows.append(price_df)
+                            ids_master_dict[id_dict["mtgstock"]] = {
+                                k: v for k, v in id_dict.items() if k != "mtgstock"
+                            }
+                        pbar.update(1)
+                    prints_ok = len(price_rows)
 
                 chunk_end_idx = chunk_start_idx + len(chunk)
 
@@ -161,6 +257,7 @@ async def bulk_load(price_repository: PriceRepository,
                             ingestion_run_id=ingestion_run_id, current_step=step_name, status="running"
                         )
                     await price_repository.copy_prices_mtgstock(big_price_df)
+                    rows_loaded += len(big_price_df)
                     if ingestion_run_id is not None:
                         await ops_repository.update_ids_master_dict(
                             ingestion_run_id=ingestion_run_id, ids_master_dict=ids_master_dict
@@ -173,7 +270,7 @@ async def bulk_load(price_repository: PriceRepository,
                         range_start=chunk_start_idx,
                         range_end=chunk_end_idx,
                         total_in_batch=len(big_price_df),
-                        items_ok=len(price_rows),   # folder count; items_failed also counts folders
+                        items_ok=prints_ok,   # print count; items_failed also counts folders
                         items_failed=folder_errors,
                         status="success" if folder_errors == 0 else "partial",
                         bytes_processed=int(big_price_df.memory_usage(deep=True).sum()),
@@ -188,6 +285,12 @@ async def bulk_load(price_repository: PriceRepository,
 
                 chunk_start_idx = chunk_end_idx
 
+    logger.info(
+        "bulk_load complete",
+        extra={"rows_loaded": rows_loaded, "prints_up_to_date": prints_up_to_date},
+    )
+    return {"raw_rows_loaded": rows_loaded, "prints_up_to_date": prints_up_to_date}
+
 @ServiceRegistry.register(
     path="mtg_stock.data_staging.from_raw_to_staging",
     db_repositories = ["price", "ops"],
@@ -196,6 +299,7 @@ async def bulk_load(price_repository: PriceRepository,
     # the service must run on a non-atomic connection.
     runs_in_transaction=False,
     command_timeout=86400,  # 24h — 456M raw rows across 14 years; generous ceiling
+    pool="bulk",
 )
 async def from_raw_to_staging(price_repository: PriceRepository
                               , ops_repository: OpsRepository
@@ -217,6 +321,7 @@ async def from_raw_to_staging(price_repository: PriceRepository
     # leave the ops audit blank. Same reasoning as the siblings above.
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def retry_rejects(price_repository: PriceRepository,
                         ops_repository: OpsRepository,
@@ -251,6 +356,7 @@ async def retry_rejects(price_repository: PriceRepository,
     # reason as from_raw_to_staging above — must run outside an atomic block.
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def from_staging_to_prices(price_repository: PriceRepository
                                  , ops_repository: OpsRepository
@@ -263,3 +369,23 @@ async def from_staging_to_prices(price_repository: PriceRepository
     async with track_step(ops_repository, ingestion_run_id, "staging_to_prices"):
         await price_repository.call_load_prices_from_staging()
 
+
+@ServiceRegistry.register(
+    path="mtg_stock.data_staging.advance_watermarks",
+    db_repositories = ["price", "ops"],
+    runs_in_transaction=False,
+)
+async def advance_watermarks(price_repository: PriceRepository
+                             , ops_repository: OpsRepository
+                             , ingestion_run_id: int = None):
+    """Move each print's watermark up to the newest date this run landed.
+
+    Runs after from_staging_to_prices, while raw_mtg_stock_price still holds
+    this run's rows (it is only cleared by the next bulk_load). If an earlier
+    step fails the chain stops here, so the next run re-emits the same window."""
+    advanced = 0
+    async with track_step(ops_repository, ingestion_run_id, "advance_watermarks"):
+        advanced = await price_repository.advance_mtgstock_watermarks()
+        logger.info("advance_watermarks: watermarks advanced", extra={"prints": advanced})
+    return {"watermarks_advanced": advanced}
+
@@ -9,12 +9,28 @@ from automana.core.repositories.app_integration.mtg_stock.identifier_repository
 )
 from automana.core.repositories.ops.ops_repository import OpsRepository
 from automana.core.services.ops.pipeline_services import track_step
+from automana.core.storage.mtgstock_archive import MtgStockArchive
 
 logger = logging.getLogger(__name__)
 
 _SEM = asyncio.Semaphore(50)
 
 
+def _read_archive_infos(archive: MtgStockArchive, print_ids: list[int]) -> list[dict | None]:
+    """Batch info lookup from the archive, shaped like the info.json payloads."""
+    info = archive.read_info(print_ids)
+    by_id = {
+        int(row.print_id): {
+            "scryfallId": row.scryfall_id,
+            "tcg_id": row.tcg_id,
+            "card_set": {"abbreviation": row.set_abbr},
+            "collector_number": row.collector_number or "",
+        }
+        for row in info.itertuples(index=False)
+    }
+    return [by_id.get(pid) for pid in print_ids]
+
+
 @ServiceRegistry.register(
     "mtg_stock.identifier.build_mapping",
     db_repositories=["mtg_stock_identifier", "ops"],
@@ -26,9 +42,14 @@ async def build_mtgstock_id_mapping(
     batch_size: int = 500,
     ops_repository: OpsRepository | None = None,
 ) -> dict:
-    """Resolve print_id → card_version_id from info.json files and upsert into card_external_identifier."""
-    ids_path = Path(destination_folder) / "existing_ids.json"
-    all_ids: list[int] = json.loads(ids_path.read_text())
+    """Resolve print_id → card_version_id from print info (archive, or legacy info.json files) and upsert into card_external_identifier."""
+    archive = MtgStockArchive(destination_folder)
+    if archive.exists():
+        all_ids: list[int] = archive.print_ids()
+    else:
+        archive = None
+        ids_path = Path(destination_folder) / "existing_ids.json"
+        all_ids = json.loads(ids_path.read_text())
 
     existing = await mtg_stock_identifier_repository.get_existing_mapped_print_ids()
     unmapped = [i for i in all_ids if i not in existing]
@@ -53,7 +74,10 @@ async def build_mtgstock_id_mapping(
     async with track_step(ops_repository, ingestion_run_id, "build_mtgstock_id_mapping"):
         for batch_start in range(0, len(unmapped), batch_size):
             batch_ids = unmapped[batch_start: batch_start + batch_size]
-            info_results = await asyncio.gather(*[_read_info(pid) for pid in batch_ids])
+            if archive is not None:
+                info_results = await asyncio.to_thread(_read_archive_infos, archive, batch_ids)
+            else:
+                info_results = await asyncio.gather(*[_read_info(pid) for pid in batch_ids])
 
             id_data = [
                 {
@@ -7,10 +7,14 @@ this file that couldn't be named in one sentence — that's by design.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import date
 from typing import Any
 
+from automana.core.config.settings import get_settings
 from automana.core.framework.registry import ServiceRegistry
 from automana.core.repositories.app_integration.mtgjson.Apimtgjson_repository import ApimtgjsonRepository
 from automana.core.repositories.app_integration.mtgjson.mtgjson_repository import MtgjsonRepository
@@ -31,6 +35,11 @@ logger = logging.getLogger(__name__)
 # flat and to give asyncpg a chance to interleave with other work.
 _COPY_BATCH_SIZE = 10_000
 
+# Pipelined mode: cards per parsed chunk handed to the parse pool, and how many
+# batches may wait per COPY writer before the parser blocks (backpressure).
+_PARSE_CHUNK_SIZE = 500
+_WRITER_QUEUE_DEPTH = 2
+
 
 @ServiceRegistry.register(
     "mtgjson.data.download.last90",
@@ -48,13 +57,22 @@ async def download_mtgjson_data_last_90(
 
     Not wired into the active daily chain — kept as a registered entry point
     for manual catch-ups or future weekly pipelines.
+
+    Also emits ``copy_writers``/``parse_processes`` from settings so the
+    following ``stream_to_staging`` step runs in pipelined mode: the 90-day
+    file is ~90x the daily one and would otherwise be single-core bound.
     """
     async with track_step(ops_repository, ingestion_run_id, "download_90day_prices", error_code="download_90day_failed"):
         logger.info("Starting MTGJson 90-day price download")
         dest_path = storage_service.build_timestamped_path("AllPrices.json.xz")
         await mtgjson_repository.fetch_all_prices_stream(dest_path)
         logger.info("Streamed MTGJson 90-day data to disk", extra={"file": str(dest_path)})
-    return {"file_path_prices": str(dest_path)}
+    settings = get_settings()
+    return {
+        "file_path_prices": str(dest_path),
+        "copy_writers": settings.mtgjson_copy_writers,
+        "parse_processes": settings.mtgjson_parse_processes,
+    }
 
 
 @ServiceRegistry.register(
@@ -256,6 +274,149 @@ def _iter_sealed_rows(sealed_uuid: str, entry: Any) -> list[tuple]:
     return rows
 
 
+def _card_rows_for_chunk(cards: list[tuple[str, Any]]) -> list[tuple]:
+    """Flatten a chunk of ``(uuid, card)`` pairs; module-level so a process pool can pickle it."""
+    rows: list[tuple] = []
+    for card_uuid, card in cards:
+        rows.extend(_iter_card_rows(card_uuid, card))
+    return rows
+
+
+def _make_parse_executor(processes: int) -> Executor | None:
+    """Start the card-parsing process pool, or return None to parse inline.
+
+    Uses ``spawn`` because the stream already runs a decoder thread and asyncpg
+    sockets that a forked child must not inherit. Under a daemonic parent (a
+    Celery prefork child) multiprocessing refuses to start children; we then
+    degrade to inline parsing rather than failing the load.
+    """
+    if processes <= 0:
+        return None
+    executor = ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        executor.submit(_card_rows_for_chunk, []).result()
+    except (AssertionError, OSError, RuntimeError) as exc:
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("mtgjson_parse_pool_unavailable", extra={"error": str(exc)})
+        return None
+    return executor
+
+
+async def _copy_writer(queue: asyncio.Queue, counts: dict[str, int], errors: list[Exception]) -> None:
+    """Drain ``(kind, records)`` batches into staging on its own pooled connection.
+
+    Each batch goes through ``staging.mtgjson.copy_staging_rows`` so it gets a
+    connection from the bulk pool and commits on its own. After the first
+    failure the writer keeps draining without copying, so the parser never
+    blocks on a full queue; the parser re-raises the error.
+    """
+    from automana.core.framework.service_manager import ServiceManager
+
+    while True:
+        item = await queue.get()
+        try:
+            if item is None:
+                return
+            if errors:
+                continue
+            kind, records = item
+            copied = await ServiceManager.execute_service(
+                "staging.mtgjson.copy_staging_rows", records=records, sealed=(kind == "sealed")
+            )
+            # Add after the await: `counts[kind] += await ...` reads the old
+            # total first and loses updates from the other writers.
+            counts[kind] += copied
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            queue.task_done()
+
+
+async def _stream_pipelined(
+    storage_service: StorageService,
+    file_path_prices: str,
+    sealed_uuids: set[str],
+    copy_writers: int,
+    parse_processes: int,
+) -> tuple[int, int, int]:
+    """Parse and COPY concurrently: chunks fan out to a parse pool and N COPY writers.
+
+    Returns ``(cards_seen, card_rows, sealed_rows)``.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=copy_writers * _WRITER_QUEUE_DEPTH)
+    counts = {"card": 0, "sealed": 0}
+    errors: list[Exception] = []
+    writers = [asyncio.create_task(_copy_writer(queue, counts, errors)) for _ in range(copy_writers)]
+    executor = await loop.run_in_executor(None, _make_parse_executor, parse_processes)
+    max_in_flight = max(1, parse_processes) * 2
+    parsing: set[asyncio.Future] = set()
+    card_rows: list[tuple] = []
+    sealed_rows: list[tuple] = []
+    cards_seen = 0
+
+    async def _emit(kind: str, rows: list[tuple], final: bool = False) -> list[tuple]:
+        while len(rows) >= _COPY_BATCH_SIZE or (final and rows):
+            await queue.put((kind, rows[:_COPY_BATCH_SIZE]))
+            rows = rows[_COPY_BATCH_SIZE:]
+            if errors:
+                raise errors[0]
+        return rows
+
+    async def _collect(wait_for_all: bool) -> None:
+        nonlocal parsing, card_rows
+        if not parsing:
+            return
+        done, parsing = await asyncio.wait(
+            parsing,
+            return_when=asyncio.ALL_COMPLETED if wait_for_all else asyncio.FIRST_COMPLETED,
+        )
+        for future in done:
+            card_rows.extend(future.result())
+        card_rows = await _emit("card", card_rows)
+
+    try:
+        async for chunk in storage_service.iter_xz_json_kvitem_chunks(
+            file_path_prices, prefix="data", chunk_size=_PARSE_CHUNK_SIZE
+        ):
+            cards_seen += len(chunk)
+            cards: list[tuple[str, Any]] = []
+            for uuid_key, entry in chunk:
+                if uuid_key in sealed_uuids:
+                    sealed_rows.extend(_iter_sealed_rows(uuid_key, entry))
+                else:
+                    cards.append((uuid_key, entry))
+            sealed_rows = await _emit("sealed", sealed_rows)
+
+            if executor is None:
+                card_rows.extend(_card_rows_for_chunk(cards))
+                card_rows = await _emit("card", card_rows)
+            else:
+                parsing.add(loop.run_in_executor(executor, _card_rows_for_chunk, cards))
+                if len(parsing) >= max_in_flight:
+                    await _collect(wait_for_all=False)
+
+        await _collect(wait_for_all=True)
+        await _emit("card", card_rows, final=True)
+        await _emit("sealed", sealed_rows, final=True)
+        for _ in writers:
+            await queue.put(None)
+        await asyncio.gather(*writers)
+        if errors:
+            raise errors[0]
+    finally:
+        for writer in writers:
+            writer.cancel()
+        for future in parsing:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return cards_seen, counts["card"], counts["sealed"]
+
+
 @ServiceRegistry.register(
     "staging.mtgjson.stream_to_staging",
     db_repositories=["mtgjson", "sealed_pricing", "ops"],
@@ -268,6 +429,8 @@ async def stream_to_staging(
     storage_service: StorageService,
     file_path_prices: str,
     ingestion_run_id: int = None,
+    copy_writers: int = 1,
+    parse_processes: int = 0,
 ) -> dict:
     """Stream an MTGJson `.xz` payload into card and sealed staging tables.
 
@@ -284,6 +447,15 @@ async def stream_to_staging(
     parsing happens in a background thread and flows through a bounded queue
     (see ``StorageService.iter_xz_json_kvitems``). Rows are COPY-ed into
     Postgres in batches of ``_COPY_BATCH_SIZE``.
+
+    With the defaults (one writer, no parse processes) everything is COPY-ed
+    serially on this service's connection, inside its transaction. With
+    ``copy_writers > 1`` or ``parse_processes > 0`` (the 90-day backfill, see
+    ``mtgjson.data.download.last90``) the stream is pipelined: card chunks are
+    flattened in a process pool while ``copy_writers`` tasks COPY batches on
+    their own bulk-pool connections. Those batches commit independently, so a
+    failed pipelined run can leave partial staging rows behind; the advisory
+    lock is still held here for the whole stream.
     """
     async with track_step(ops_repository, ingestion_run_id, "stream_to_staging", error_code="stream_to_staging_failed"):
         logger.info("Streaming MTGJson payload to staging", extra={"file": file_path_prices})
@@ -297,6 +469,27 @@ async def stream_to_staging(
         sealed_uuids: set[str] = await sealed_pricing_repository.fetch_all_sealed_uuids()
         logger.info("Sealed UUID set loaded", extra={"count": len(sealed_uuids)})
 
+        if copy_writers > 1 or parse_processes > 0:
+            cards_seen, total_rows, sealed_rows = await _stream_pipelined(
+                storage_service,
+                file_path_prices,
+                sealed_uuids,
+                copy_writers=max(1, copy_writers),
+                parse_processes=parse_processes,
+            )
+            logger.info(
+                "MTGJson streaming complete",
+                extra={
+                    "cards": cards_seen,
+                    "rows_staged": total_rows,
+                    "sealed_rows_staged": sealed_rows,
+                    "file": file_path_prices,
+                    "copy_writers": copy_writers,
+                    "parse_processes": parse_processes,
+                },
+            )
+            return {"rows_staged": total_rows, "cards_seen": cards_seen, "sealed_rows_staged": sealed_rows}
+
         batch: list[tuple] = []
         sealed_batch: list[tuple] = []
         total_rows = 0
@@ -335,6 +528,23 @@ async def stream_to_staging(
     return {"rows_staged": total_rows, "cards_seen": cards_seen, "sealed_rows_staged": sealed_rows}
 
 
+@ServiceRegistry.register(
+    "staging.mtgjson.copy_staging_rows",
+    db_repositories=["mtgjson", "sealed_pricing"],
+    pool="bulk",
+)
+async def copy_staging_rows(
+    mtgjson_repository: MtgjsonRepository,
+    sealed_pricing_repository: SealedPricingRepository,
+    records: list[tuple],
+    sealed: bool = False,
+) -> int:
+    """COPY one batch into the card (or sealed) staging table; a writer unit for pipelined streaming."""
+    if sealed:
+        return await sealed_pricing_repository.copy_sealed_staging_batch(records)
+    return await mtgjson_repository.copy_staging_batch(records)
+
+
 @ServiceRegistry.register(
     "staging.mtgjson.promote_to_price_observation",
     db_repositories=["mtgjson", "ops"],
@@ -345,6 +555,7 @@ async def stream_to_staging(
     # A fresh 90-day staging load runs for up to several hours (normalisation
     # passes + per-batch upserts across millions of rows). 4h safety net.
     command_timeout=14400,
+    pool="bulk",
 )
 async def promote_to_price_observation(
     mtgjson_repository: MtgjsonRepository,
@@ -13,6 +13,7 @@ identifier on the card (the durable card_version <-> PC link).
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -30,11 +31,22 @@ logger = logging.getLogger(__name__)
 # Only confident matches earn the durable card_version <-> pricecharting_id link.
 _REGISTER_CERTAINTY_THRESHOLD = 70
 
+# Sets whose catalog/sales JSON is read ahead while the current set is matched.
+_PREFETCH_SETS = 4
 
-async def _load_tcgplayer_ids(storage_service: StorageService, uid: str) -> dict[str, tuple[str, int]]:
-    """{pc_product_id: (tcgplayer_id, vote_count)} from a set's sales file, if scraped."""
+
+async def _load_tcgplayer_ids(
+    storage_service: StorageService, uid: str, sales_files: set[str] | None = None,
+) -> dict[str, tuple[str, int]]:
+    """{pc_product_id: (tcgplayer_id, vote_count)} from a set's sales file, if scraped.
+
+    ``sales_files`` is a prefetched listing of ``sales/``; without it the file
+    is probed individually."""
     sales_key = f"sales/{uid}.json"
-    if not await storage_service.file_exists(sales_key):
+    if sales_files is not None:
+        if f"{uid}.json" not in sales_files:
+            return {}
+    elif not await storage_service.file_exists(sales_key):
         return {}
     sales = await storage_service.load_json(sales_key)
     out: dict[str, tuple[str, int]] = {}
@@ -45,6 +57,16 @@ async def _load_tcgplayer_ids(storage_service: StorageService, uid: str) -> dict
     return out
 
 
+async def _load_set_files(
+    storage_service: StorageService, uid: str, sales_files: set[str],
+) -> tuple[list[dict], dict[str, tuple[str, int]]]:
+    """(single products, tcgplayer ids) for one set."""
+    catalog = await storage_service.load_json(f"products/{uid}.json")
+    singles = [p for p in catalog.get("products", []) if p["product_type"] == "single"]
+    tcg = await _load_tcgplayer_ids(storage_service, uid, sales_files) if singles else {}
+    return singles, tcg
+
+
 @ServiceRegistry.register(
     path="pricecharting.build_match_catalog",
     db_repositories=["set", "card", "pricecharting_map"],
@@ -60,7 +82,9 @@ async def build_match_catalog(
     """Resolve PriceCharting products to card_versions and persist the matches.
 
     Requires ``pricecharting.scrape_catalog`` (sets.json + products/{uid}.json).
-    Issues one DB query per set (not per product) for card_version candidates.
+    Issues one DB query per set (not per product) for card_version candidates;
+    the per-set JSON is read ahead of the DB work, and pricecharting_id
+    identifiers are registered in one bulk statement at the end.
     """
     if not await storage_service.file_exists("sets.json"):
         logger.warning("pricecharting_match_no_sets_file")
@@ -69,86 +93,95 @@ async def build_match_catalog(
 
     existing = await pricecharting_map_repository.fetch_all_map()
     db_sets = await set_repository.fetch_sets_for_matching()
-    set_index = pc_matching.build_set_code_index([dict(r) for r in db_sets])
+    set_matcher = pc_matching.SetMatcher.from_db_sets([dict(r) for r in db_sets])
     pc_sets = (await storage_service.load_json("sets.json")).get("sets", [])
+    product_files = set(await storage_service.list_files("products", "*.json"))
+    sales_files = set(await storage_service.list_files("sales", "*.json"))
 
     # Resolve the tcgplayer_id ref_id once — it's constant across all sets.
     tcgplayer_ref_id = await card_repository.get_tcgplayer_ref_id()
 
     upserts: list[dict] = []
+    registrations: list[tuple[str, str]] = []
     new_matched = new_unmatched = skipped_existing = skipped_sets = identifiers_registered = 0
 
+    matched_sets: list[tuple[str, str, str]] = []
     for set_info in pc_sets:
         uid = set_info["uid"]
-        set_code, set_method = pc_matching.match_set_code(set_info["name"], set_index)
-        if not set_code:
-            skipped_sets += 1
-            continue
-
-        catalog_key = f"products/{uid}.json"
-        if not await storage_service.file_exists(catalog_key):
+        set_code, set_method = set_matcher.match(set_info["name"])
+        if not set_code or f"{uid}.json" not in product_files:
             skipped_sets += 1
             continue
-
-        singles = [
-            p for p in (await storage_service.load_json(catalog_key)).get("products", [])
-            if p["product_type"] == "single"
-        ]
-        if not singles:
-            continue
-
-        tcg = await _load_tcgplayer_ids(storage_service, uid)
-
-        # One query fetches all card_versions for the set; products look up by name.
-        set_versions = await card_repository.get_all_card_versions_for_set(
-            set_code, tcgplayer_ref_id
-        )
-
-        for product in singles:
-            pid = product["product_id"]
-            prior = existing.get(pid)
-            if prior and (prior.get("card_version_id") is not None or prior.get("verified")):
-                skipped_existing += 1
+        matched_sets.append((uid, set_code, set_method))
+
+    # JSON reads run in executor threads, so keep a few sets in flight while
+    # the (single-connection) card_version queries run in order.
+    loads: dict[int, asyncio.Task] = {}
+    try:
+        for i, (uid, set_code, set_method) in enumerate(matched_sets):
+            for j in range(i, min(i + _PREFETCH_SETS, len(matched_sets))):
+                if j not in loads:
+                    loads[j] = asyncio.create_task(
+                        _load_set_files(storage_service, matched_sets[j][0], sales_files)
+                    )
+            singles, tcg = await loads.pop(i)
+            if not singles:
                 continue
 
-            card_name = pc_matching.clean_card_name(product["title"])
-            candidates = set_versions.get(card_name.lower(), [])
-            tcg_id, tcg_votes = tcg.get(pid, (None, 0))
-            match = pc_matching.resolve_card_match(
-                candidates, product["title"], tcg_id,
-                set_method=set_method, tcg_votes=tcg_votes,
+            # One query fetches all card_versions for the set; products look up by name.
+            set_versions = await card_repository.get_all_card_versions_for_set(
+                set_code, tcgplayer_ref_id
             )
 
-            if not match:
-                upserts.append({"pc_product_id": pid, "card_version_id": None,
-                                "set_code": set_code, "finish_id": None,
-                                "match_method": "none", "certainty": 0, "tcg_vote_count": tcg_votes})
-                new_unmatched += 1
-                continue
-
-            upserts.append({
-                "pc_product_id": pid,
-                "card_version_id": match["card_version_id"],
-                "set_code": set_code,
-                "finish_id": match["finish_id"],
-                "match_method": match["match_method"],
-                "certainty": match["certainty"],
-                "tcg_vote_count": tcg_votes,
-            })
-            new_matched += 1
-
-            if match["certainty"] >= _REGISTER_CERTAINTY_THRESHOLD:
-                try:
-                    reg = await card_repository.register_external_identifier(
-                        match["card_version_id"], "pricecharting_id", pid
-                    )
-                    if reg.inserted:
-                        identifiers_registered += 1
-                except Exception:
-                    logger.exception(
-                        "pricecharting_identifier_register_failed",
-                        extra={"product_id": pid, "card_version_id": match["card_version_id"]},
-                    )
+            for product in singles:
+                pid = product["product_id"]
+                prior = existing.get(pid)
+                if prior and (prior.get("card_version_id") is not None or prior.get("verified")):
+                    skipped_existing += 1
+                    continue
+
+                card_name = pc_matching.clean_card_name(product["title"])
+                candidates = set_versions.get(card_name.lower(), [])
+                tcg_id, tcg_votes = tcg.get(pid, (None, 0))
+                match = pc_matching.resolve_card_match(
+                    candidates, product["title"], tcg_id,
+                    set_method=set_method, tcg_votes=tcg_votes,
+                )
+
+                if not match:
+                    upserts.append({"pc_product_id": pid, "card_version_id": None,
+                                    "set_code": set_code, "finish_id": None,
+                                    "match_method": "none", "certainty": 0, "tcg_vote_count": tcg_votes})
+                    new_unmatched += 1
+                    continue
+
+                upserts.append({
+                    "pc_product_id": pid,
+                    "card_version_id": match["card_version_id"],
+                    "set_code": set_code,
+                    "finish_id": match["finish_id"],
+                    "match_method": match["match_method"],
+                    "certainty": match["certainty"],
+                    "tcg_vote_count": tcg_votes,
+                })
+                new_matched += 1
+
+                if match["certainty"] >= _REGISTER_CERTAINTY_THRESHOLD:
+                    registrations.append((match["card_version_id"], pid))
+    finally:
+        for task in loads.values():
+            task.cancel()
+
+    if registrations:
+        try:
+            identifiers_registered = await card_repository.register_external_identifiers(
+                "pricecharting_id", registrations
+            )
+        except Exception:
+            logger.exception(
+                "pricecharting_identifier_register_failed",
+                extra={"registrations": len(registrations)},
+            )
 
     submitted = await pricecharting_map_repository.upsert_map(upserts)
 
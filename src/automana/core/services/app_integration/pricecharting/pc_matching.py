@@ -4,7 +4,7 @@ These functions are deliberately side-effect free (no DB, no I/O) so they can be
 unit-tested in isolation. They are the algorithmic core lifted from the notebook
 prototype:
 
-  * set name  -> DB set_code            (4-pass matcher + manual overrides)
+  * set name  -> DB set_code            (indexed SetMatcher + manual overrides)
   * PC product -> card_version_id        (treatment scoring + tiebreakers)
   * PC title  -> finish_id               (bracket-tag parsing)
 
@@ -68,49 +68,141 @@ def build_set_code_index(db_sets: list[dict]) -> dict[str, str]:
     return {normalize_set_name(r["set_name"]): r["set_code"] for r in db_sets}
 
 
-def match_set_code(pc_name: str, db_index: dict[str, str]) -> tuple[str | None, str | None]:
-    """Map a PriceCharting set name to a DB set_code. Returns (set_code, method)
-    or (None, None). Methods, in priority order: override, exact, suffix,
-    prefix, fuzzy."""
-    db_norms = list(db_index.keys())
-    pc = normalize_set_name(pc_name)
-    pc = re.sub(r"^magic\s+", "", pc)
-
-    # Pass 0: manual override
-    if pc in NAME_OVERRIDES:
-        return NAME_OVERRIDES[pc], "override"
-
-    # Pass 1: exact normalised name
-    if pc in db_index:
-        return db_index[pc], "exact"
-
-    # Pass 1b: duel decks — PC drops the "Duel Decks[ Anthology]:" prefix.
-    # "elves vs goblins" -> "duel decks elves vs goblins";
-    # "anthology elves vs goblins" -> "duel decks anthology elves vs goblins".
-    if " vs " in pc:
-        if pc.startswith("anthology "):
-            cand = "duel decks anthology " + pc[len("anthology "):]
-        else:
-            cand = "duel decks " + pc
-        if cand in db_index:
-            return db_index[cand], "duel_deck"
-
-    # Pass 2: DB name is a suffix of PC name (>= 3 words) — Commander precons
-    for dn in db_norms:
-        if len(dn.split()) >= 3 and pc.endswith(" " + dn):
-            return db_index[dn], "suffix"
-
-    # Pass 3: PC name is a strict prefix of a DB name (>= 6 chars); shortest wins
-    prefix_hits = [dn for dn in db_norms if len(pc) >= 6 and dn.startswith(pc + " ")]
-    if prefix_hits:
-        return db_index[min(prefix_hits, key=len)], "prefix"
-
-    # Pass 4: fuzzy (ratio >= 0.82)
-    close = difflib.get_close_matches(pc, db_norms, n=1, cutoff=0.82)
-    if close:
-        return db_index[close[0]], "fuzzy"
-
-    return None, None
+_FUZZY_CUTOFF = 0.82
+
+
+def _trigrams(s: str) -> set[str]:
+    padded = f"  {s} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SetMatcher:
+    """Reusable index over a ``build_set_code_index`` result.
+
+    Built once per catalog run so each lookup costs a handful of dict probes
+    instead of scanning every DB set name:
+
+      * suffix pass  -> {word-tuple: (order, code)} probed with each PC suffix
+      * prefix pass  -> {word-prefix: shortest DB name}
+      * fuzzy pass   -> trigram index; only the ``max_fuzzy_candidates`` names
+                        sharing the most trigrams (and long enough to reach the
+                        cutoff) are scored with difflib.
+
+    Ties resolve exactly as the original linear scans did (first DB name for
+    suffix, shortest for prefix, highest ratio then name for fuzzy).
+    """
+
+    def __init__(self, db_index: dict[str, str], max_fuzzy_candidates: int = 32):
+        self.db_index = db_index
+        self.max_fuzzy_candidates = max_fuzzy_candidates
+        self._names = list(db_index.keys())
+        self._suffixes: dict[tuple[str, ...], int] = {}
+        self._prefixes: dict[str, str] = {}
+        self._grams: dict[str, list[int]] = {}
+
+        for order, dn in enumerate(self._names):
+            words = tuple(dn.split())
+            if len(words) >= 3:
+                self._suffixes.setdefault(words, order)
+            for j in range(1, len(words)):
+                key = " ".join(words[:j])
+                best = self._prefixes.get(key)
+                if best is None or len(dn) < len(best):
+                    self._prefixes[key] = dn
+            for gram in _trigrams(dn):
+                self._grams.setdefault(gram, []).append(order)
+
+    @classmethod
+    def from_db_sets(cls, db_sets: list[dict], **kwargs) -> "SetMatcher":
+        return cls(build_set_code_index(db_sets), **kwargs)
+
+    def match(self, pc_name: str) -> tuple[str | None, str | None]:
+        """Map a PriceCharting set name to a DB set_code. Returns (set_code,
+        method) or (None, None). Methods, in priority order: override, exact,
+        duel_deck, suffix, prefix, fuzzy."""
+        db_index = self.db_index
+        pc = normalize_set_name(pc_name)
+        pc = re.sub(r"^magic\s+", "", pc)
+
+        # Pass 0: manual override
+        if pc in NAME_OVERRIDES:
+            return NAME_OVERRIDES[pc], "override"
+
+        # Pass 1: exact normalised name
+        if pc in db_index:
+            return db_index[pc], "exact"
+
+        # Pass 1b: duel decks — PC drops the "Duel Decks[ Anthology]:" prefix.
+        # "elves vs goblins" -> "duel decks elves vs goblins";
+        # "anthology elves vs goblins" -> "duel decks anthology elves vs goblins".
+        if " vs " in pc:
+            if pc.startswith("anthology "):
+                cand = "duel decks anthology " + pc[len("anthology "):]
+            else:
+                cand = "duel decks " + pc
+            if cand in db_index:
+                return db_index[cand], "duel_deck"
+
+        # Pass 2: DB name is a suffix of PC name (>= 3 words) — Commander precons
+        words = tuple(pc.split())
+        suffix_hits = [
+            self._suffixes[words[-k:]]
+            for k in range(3, len(words))
+            if words[-k:] in self._suffixes
+        ]
+        if suffix_hits:
+            return db_index[self._names[min(suffix_hits)]], "suffix"
+
+        # Pass 3: PC name is a strict prefix of a DB name (>= 6 chars); shortest wins
+        if len(pc) >= 6 and pc in self._prefixes:
+            return db_index[self._prefixes[pc]], "prefix"
+
+        # Pass 4: fuzzy (ratio >= 0.82) over the best trigram candidates
+        close = self._fuzzy(pc)
+        if close is not None:
+            return db_index[close], "fuzzy"
+
+        return None, None
+
+    def _fuzzy(self, pc: str) -> str | None:
+        overlap: dict[int, int] = {}
+        for gram in _trigrams(pc):
+            for order in self._grams.get(gram, ()):
+                overlap[order] = overlap.get(order, 0) + 1
+        la = len(pc)
+        candidates = [
+            order for order in overlap
+            # upper bound of SequenceMatcher.ratio() from lengths alone
+            if 2 * min(la, len(self._names[order])) >= _FUZZY_CUTOFF * (la + len(self._names[order]))
+        ]
+        candidates.sort(key=lambda order: (-overlap[order], order))
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(pc)
+        best: tuple[float, str] | None = None
+        for order in candidates[: self.max_fuzzy_candidates]:
+            dn = self._names[order]
+            matcher.set_seq1(dn)
+            if (
+                matcher.real_quick_ratio() >= _FUZZY_CUTOFF
+                and matcher.quick_ratio() >= _FUZZY_CUTOFF
+                and matcher.ratio() >= _FUZZY_CUTOFF
+            ):
+                scored = (matcher.ratio(), dn)
+                if best is None or scored > best:
+                    best = scored
+        return best[1] if best else None
+
+
+def match_set_code(
+    pc_name: str, db_index: dict[str, str] | SetMatcher,
+) -> tuple[str | None, str | None]:
+    """Map a PriceCharting set name to a DB set_code (see ``SetMatcher.match``).
+
+    Accepts a prebuilt ``SetMatcher``; passing a plain index builds a
+    throwaway one, so loops over many sets should build the matcher once."""
+    matcher = db_index if isinstance(db_index, SetMatcher) else SetMatcher(db_index)
+    return matcher.match(pc_name)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
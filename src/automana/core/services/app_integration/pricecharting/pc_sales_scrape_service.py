@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import multiprocessing
 import re
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import date
+from pathlib import Path
 from typing import Any
 from urllib.parse import unquote
 
@@ -15,6 +19,7 @@ from automana.core.repositories.app_integration.pricecharting.pc_api_repository
     PricechartingApiRepository,
 )
 from automana.core.storage import StorageService
+from automana.core.utils.rate_limits import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -142,6 +147,94 @@ def _parse_sales_page(html: str, product_id: str) -> dict:
     }
 
 
+def _make_parse_executor(processes: int) -> Executor | None:
+    """Start the HTML-parsing process pool, or return None to parse in a thread.
+
+    BeautifulSoup parsing is pure-Python CPU, so with several fetches in
+    flight it would otherwise serialise on the event loop's GIL. Uses
+    ``spawn`` so children never inherit the open HTTP client. Under a daemonic
+    parent (a Celery prefork child) multiprocessing refuses to start children;
+    we then degrade to a thread rather than failing the scrape.
+    """
+    if processes <= 0:
+        return None
+    executor = ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        executor.submit(_parse_sales_page, "", "").result()
+    except (AssertionError, OSError, RuntimeError) as exc:
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("pricecharting_sales_parse_pool_unavailable", extra={"error": str(exc)})
+        return None
+    return executor
+
+
+def _load_checkpoint(path: Path) -> dict[str, dict]:
+    """Products already scraped for a set, read from its append-only checkpoint log.
+
+    A crash can leave a torn last line; it is skipped and that product is
+    simply scraped again.
+    """
+    done: dict[str, dict] = {}
+    if not path.exists():
+        return done
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                parsed = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[parsed["product_id"]] = parsed
+    return done
+
+
+async def _scrape_products(
+    pricecharting_repository: PricechartingApiRepository,
+    products: list[dict],
+    done: dict[str, dict],
+    checkpoint_path: Path,
+    limiter: AsyncTokenBucket,
+    executor: Executor | None,
+    concurrency: int,
+    uid: str,
+) -> tuple[int, int]:
+    """Fetch and parse ``products`` with ``concurrency`` workers sharing ``limiter``.
+
+    Each parsed page is added to ``done`` and appended to the checkpoint log
+    as soon as it lands. Returns (scraped, errors).
+    """
+    loop = asyncio.get_running_loop()
+    pending = iter(products)
+    scraped = errors = 0
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(checkpoint_path, "a", encoding="utf-8") as log:
+        async def _worker() -> None:
+            nonlocal scraped, errors
+            # Workers pull from one shared iterator; safe on a single event loop.
+            for product in pending:
+                product_id = product["product_id"]
+                try:
+                    await limiter.acquire()
+                    html = await pricecharting_repository.fetch_sales_html(product["url"])
+                    parsed = await loop.run_in_executor(executor, _parse_sales_page, html, product_id)
+                except Exception:
+                    errors += 1
+                    logger.exception(
+                        "pricecharting_sales_card_failed",
+                        extra={"uid": uid, "product_id": product_id},
+                    )
+                    continue
+                done[product_id] = parsed
+                log.write(json.dumps(parsed) + "\n")
+                log.flush()
+                scraped += 1
+
+        await asyncio.gather(*(_worker() for _ in range(max(1, concurrency))))
+    return scraped, errors
+
+
 @ServiceRegistry.register(
     path="pricecharting.scrape_sales",
     api_repositories=["pricecharting"],
@@ -152,6 +245,8 @@ async def scrape_sales(
     storage_service: StorageService,
     force_refresh: bool = False,
     inter_card_delay: float = 0.5,
+    concurrency: int = 4,
+    parse_processes: int = 2,
     **kwargs: Any,
 ) -> dict:
     """Scrape sold-listing pages for all single products in the cached catalog.
@@ -159,63 +254,79 @@ async def scrape_sales(
     Requires pricecharting.scrape_catalog to have run first (sets.json +
     products/{uid}.json must exist). Sales are cached per set to
     sales/{uid}.json and skipped on subsequent runs unless force_refresh=True.
+
+    Up to ``concurrency`` pages are in flight at once, and request starts are
+    capped by one token bucket at 1 / ``inter_card_delay`` per second. The
+    spacing does not include response time: the old fetch-then-sleep loop ran
+    at 1 / (latency + ``inter_card_delay``), so with ``concurrency`` > 1 the
+    request rate is higher than it was, up to the cap. Raise
+    ``inter_card_delay`` to lower the cap.
+    Every scraped product is appended to sales/{uid}.partial.jsonl, and a
+    rerun after a crash resumes from there. force_refresh discards it.
     """
     if not await storage_service.file_exists("sets.json"):
         logger.warning("pricecharting_sales_no_sets_file")
-        return {"sets_processed": 0, "cards_scraped": 0, "cards_cached": 0, "errors": 0}
+        return {"sets_processed": 0, "cards_scraped": 0, "cards_cached": 0, "cards_resumed": 0, "errors": 0}
 
     sets_data = await storage_service.load_json("sets.json")
     pc_sets: list[dict] = sets_data.get("sets", [])
 
-    sets_processed = cards_scraped = cards_cached = errors = 0
+    sets_processed = cards_scraped = cards_cached = cards_resumed = errors = 0
+    limiter = AsyncTokenBucket(rate_per_sec=1 / inter_card_delay if inter_card_delay > 0 else 1000, capacity=1)
+    executor = await asyncio.to_thread(_make_parse_executor, parse_processes)
+
+    try:
+        async with pricecharting_repository:
+            for set_info in pc_sets:
+                uid = set_info["uid"]
+                sales_key = f"sales/{uid}.json"
+                checkpoint_key = f"sales/{uid}.partial.jsonl"
+
+                if await storage_service.file_exists(sales_key) and not force_refresh:
+                    cards_cached += 1
+                    sets_processed += 1
+                    continue
+
+                catalog_key = f"products/{uid}.json"
+                if not await storage_service.file_exists(catalog_key):
+                    logger.warning(
+                        "pricecharting_sales_missing_catalog",
+                        extra={"uid": uid, "name": set_info["name"]},
+                    )
+                    continue
 
-    async with pricecharting_repository:
-        for set_info in pc_sets:
-            uid = set_info["uid"]
-            sales_key = f"sales/{uid}.json"
+                catalog = await storage_service.load_json(catalog_key)
+                singles = [p for p in catalog.get("products", []) if p["product_type"] == "single"]
 
-            if await storage_service.file_exists(sales_key) and not force_refresh:
-                cards_cached += 1
-                sets_processed += 1
-                continue
+                checkpoint_path = storage_service.build_path(checkpoint_key)
+                if force_refresh:
+                    await storage_service.delete_file(checkpoint_key)
+                set_sales = await asyncio.to_thread(_load_checkpoint, checkpoint_path)
+                cards_resumed += len(set_sales)
+                todo = [p for p in singles if p["product_id"] not in set_sales]
 
-            catalog_key = f"products/{uid}.json"
-            if not await storage_service.file_exists(catalog_key):
-                logger.warning(
-                    "pricecharting_sales_missing_catalog",
-                    extra={"uid": uid, "name": set_info["name"]},
+                scraped, set_errors = await _scrape_products(
+                    pricecharting_repository, todo, set_sales, checkpoint_path,
+                    limiter, executor, concurrency, uid,
                 )
-                continue
-
-            catalog = await storage_service.load_json(catalog_key)
-            singles = [p for p in catalog.get("products", []) if p["product_type"] == "single"]
-
-            set_sales: dict[str, dict] = {}
-            for product in singles:
-                product_id = product["product_id"]
-                try:
-                    html = await pricecharting_repository.fetch_sales_html(product["url"])
-                    set_sales[product_id] = _parse_sales_page(html, product_id)
-                    cards_scraped += 1
-                except Exception:
-                    errors += 1
-                    logger.exception(
-                        "pricecharting_sales_card_failed",
-                        extra={"uid": uid, "product_id": product_id},
-                    )
-                await asyncio.sleep(inter_card_delay)
-
-            await storage_service.save_json(sales_key, {
-                "scraped_at": date.today().isoformat(),
-                "uid": uid,
-                "name": set_info["name"],
-                "products": set_sales,
-            })
-            sets_processed += 1
-            logger.info(
-                "pricecharting_sales_set_complete",
-                extra={"uid": uid, "singles": len(singles), "errors": errors},
-            )
+                cards_scraped += scraped
+                errors += set_errors
+
+                await storage_service.save_json(sales_key, {
+                    "scraped_at": date.today().isoformat(),
+                    "uid": uid,
+                    "name": set_info["name"],
+                    "products": set_sales,
+                })
+                await storage_service.delete_file(checkpoint_key)
+                sets_processed += 1
+                logger.info(
+                    "pricecharting_sales_set_complete",
+                    extra={"uid": uid, "singles": len(singles), "errors": errors},
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     logger.info(
         "pricecharting_sales_complete",
@@ -223,6 +334,7 @@ async def scrape_sales(
             "sets_processed": sets_processed,
             "cards_scraped": cards_scraped,
             "cards_cached": cards_cached,
+            "cards_resumed": cards_resumed,
             "errors": errors,
         },
     )
@@ -230,5 +342,6 @@ async def scrape_sales(
         "sets_processed": sets_processed,
         "cards_scraped": cards_scraped,
         "cards_cached": cards_cached,
+        "cards_resumed": cards_resumed,
         "errors": errors,
     }
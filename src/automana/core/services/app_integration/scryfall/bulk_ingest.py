@@ -0,0 +1,92 @@
+import logging
+from datetime import date
+
+from automana.core.framework.registry import ServiceRegistry
+from automana.core.repositories.card_catalog.card_repository import CardReferenceRepository
+from automana.core.repositories.ops.ops_repository import OpsRepository
+from automana.core.services.app_integration.scryfall.price_loader import ScryfallPriceRouter
+from automana.core.services.card_catalog.card_service import EnhancedCardImportService, ProcessingConfig
+from automana.core.services.ops.pipeline_services import track_step
+from automana.core.storage import StorageService
+
+logger = logging.getLogger(__name__)
+
+# Staged card batches merged per checkpoint; bounds the price rows the router
+# holds while waiting for their card versions (40 x 500 cards).
+COPY_MERGE_EVERY = 40
+
+
+@ServiceRegistry.register(
+    "staging.scryfall.ingest_cards_bulk",
+    db_repositories=["card", "pricing", "ops"],
+    storage_services=["scryfall", "errors"],
+)
+async def ingest_cards_bulk(
+    card_repository: CardReferenceRepository,
+    pricing_repository,   # PricingTierRepository (injected by name "pricing")
+    ops_repository: OpsRepository = None,
+    storage_service: StorageService = None,
+    errors_storage_service: StorageService = None,
+    file_name: str = None,
+    ingestion_run_id: int = None,
+    resume_from_batch: int = 0,
+    loader_mode: str = "copy",
+) -> dict:
+    """Single streaming pass over the Scryfall cards bulk file.
+
+    Replaces the `card_catalog.card.process_large_json` →
+    `staging.scryfall.load_prices_from_bulk` pair in the daily chain: each card
+    is decoded once and fanned out to the card upsert batches and to the
+    price / purchase-URI router. The router is only flushed once the card
+    batches it refers to have been written, so prices always resolve against
+    card versions from earlier in the same pass. Both original services stay
+    registered for ad-hoc reloads.
+
+    Cards go through the COPY loader by default: batches are staged and merged
+    every ``COPY_MERGE_EVERY`` batches, and the router is flushed after each
+    merge. A failure drops the batches staged since the last merge; rerun with
+    the ``resume_from_batch`` reported in the error.
+    """
+    if not file_name:
+        logger.info(
+            "No bulk card changes — skipping ingest",
+            extra={"ingestion_run_id": ingestion_run_id},
+        )
+        return {"status": "success", "prices_loaded": 0}
+
+    router = ScryfallPriceRouter(
+        pricing_repository,
+        card_repository,
+        ts_date=date.today(),
+        ingestion_run_id=ingestion_run_id,
+    )
+    service = EnhancedCardImportService(
+        card_repository,
+        config=ProcessingConfig(loader_mode=loader_mode, copy_merge_every=COPY_MERGE_EVERY),
+        storage_service=storage_service,
+        errors_storage_service=errors_storage_service,
+        sinks=[router],
+    )
+
+    async with track_step(ops_repository, ingestion_run_id, "ingest_cards_bulk", error_code="processing_failed"):
+        stats = await service.process_large_cards_json(
+            file_name=file_name,
+            resume_from_batch=resume_from_batch,
+            ops_repository=ops_repository,
+            ingestion_run_id=ingestion_run_id,
+        )
+
+    logger.info(
+        "Scryfall bulk ingest complete",
+        extra={
+            "ingestion_run_id": ingestion_run_id,
+            "prices_loaded": router.prices_loaded,
+            "purchase_uris_updated": router.uris_updated,
+            **stats.to_dict(),
+        },
+    )
+    return {
+        **stats.to_dict(),
+        "prices_loaded": router.prices_loaded,
+        "purchase_uris_updated": router.uris_updated,
+    }
@@ -2,6 +2,7 @@ import ijson
 import json
 import logging
 from datetime import date, timezone
+from typing import Optional
 
 from automana.core.framework.registry import ServiceRegistry
 from automana.core.services.ops.pipeline_services import track_step
@@ -21,6 +22,98 @@ PRICE_KEY_MAP = {
 BATCH_SIZE = 500
 
 
+def extract_price_rows(card: dict) -> list[dict]:
+    """Map one Scryfall card object to ``upsert_scryfall_price_batch`` rows.
+
+    Cards without an ``id`` and unparseable/null prices yield no rows.
+    """
+    scryfall_id = card.get("id")
+    if not scryfall_id:
+        return []
+
+    rows: list[dict] = []
+    prices = card.get("prices") or {}
+    for key, (source_code, finish_code) in PRICE_KEY_MAP.items():
+        raw = prices.get(key)
+        if raw is None:
+            continue
+        try:
+            price_cents = round(float(raw) * 100)
+        except (ValueError, TypeError):
+            continue
+        rows.append(
+            {
+                "scryfall_id": scryfall_id,
+                "source_code": source_code,
+                "finish_code": finish_code,
+                "price_cents": price_cents,
+            }
+        )
+    return rows
+
+
+def extract_purchase_uris(card: dict) -> Optional[dict]:
+    """Return the ``update_purchase_uris_batch`` row for a card, if any."""
+    scryfall_id = card.get("id")
+    purchase_uris = card.get("purchase_uris")
+    if not scryfall_id or not purchase_uris:
+        return None
+    return {"scryfall_id": scryfall_id, "purchase_uris": purchase_uris}
+
+
+class ScryfallPriceRouter:
+    """Accumulates price and purchase-URI rows from card objects and flushes
+    them to the pricing / card repositories.
+
+    Used standalone by ``load_scryfall_prices`` and as a sink of the
+    single-pass bulk ingest (``staging.scryfall.ingest_cards_bulk``), where it
+    is flushed right after each card batch so every routed scryfall_id already
+    has its ``card_version`` row.
+    """
+
+    def __init__(
+        self,
+        pricing_repository,
+        card_repository,
+        ts_date: date,
+        ingestion_run_id: Optional[int] = None,
+    ):
+        self.pricing_repository = pricing_repository
+        self.card_repository = card_repository
+        self.ts_date = ts_date
+        self.ingestion_run_id = ingestion_run_id
+        self.price_batch: list[dict] = []
+        self.uri_batch: list[dict] = []
+        self.prices_loaded = 0
+        self.uris_updated = 0
+
+    @property
+    def pending(self) -> int:
+        return max(len(self.price_batch), len(self.uri_batch))
+
+    def route(self, card: dict) -> None:
+        self.price_batch.extend(extract_price_rows(card))
+        uri_row = extract_purchase_uris(card)
+        if uri_row:
+            self.uri_batch.append(uri_row)
+
+    async def flush(self) -> None:
+        if self.price_batch:
+            n = await self.pricing_repository.upsert_scryfall_price_batch(
+                self.price_batch, ts_date=self.ts_date
+            )
+            self.prices_loaded += n
+            logger.info(
+                "Price batch upserted",
+                extra={"batch_size": len(self.price_batch), "upserted": n, "ingestion_run_id": self.ingestion_run_id},
+            )
+            self.price_batch = []
+
+        if self.uri_batch:
+            self.uris_updated += await self.card_repository.update_purchase_uris_batch(self.uri_batch)
+            self.uri_batch = []
+
+
 @ServiceRegistry.register(
     "staging.scryfall.load_prices_from_bulk",
     db_repositories=["pricing", "card", "ops"],
@@ -43,75 +136,22 @@ async def load_scryfall_prices(
         )
         return {"prices_loaded": 0}
 
-    total_count = 0
-    ts_date = date.today()
+    router = ScryfallPriceRouter(
+        pricing_repository,
+        card_repository,
+        ts_date=date.today(),
+        ingestion_run_id=ingestion_run_id,
+    )
 
     async with track_step(ops_repository, ingestion_run_id, "load_prices_from_bulk"):
-        price_batch: list[dict] = []
-        uri_batch: list[dict] = []
-
         async with storage_service.open_stream(file_name, "rb") as f:
             for card in ijson.items(f, "item"):
-                scryfall_id = card.get("id")
-                if not scryfall_id:
-                    continue
-
-                prices = card.get("prices") or {}
-                for key, (source_code, finish_code) in PRICE_KEY_MAP.items():
-                    raw = prices.get(key)
-                    if raw is None:
-                        continue
-                    try:
-                        price_cents = round(float(raw) * 100)
-                    except (ValueError, TypeError):
-                        continue
-                    price_batch.append(
-                        {
-                            "scryfall_id": scryfall_id,
-                            "source_code": source_code,
-                            "finish_code": finish_code,
-                            "price_cents": price_cents,
-                        }
-                    )
-
-                purchase_uris = card.get("purchase_uris")
-                if purchase_uris:
-                    uri_batch.append(
-                        {
-                            "scryfall_id": scryfall_id,
-                            "purchase_uris": purchase_uris,
-                        }
-                    )
-
-                # Flush batches when either hits BATCH_SIZE
-                if len(price_batch) >= BATCH_SIZE:
-                    n = await pricing_repository.upsert_scryfall_price_batch(
-                        price_batch, ts_date=ts_date
-                    )
-                    total_count += n
-                    logger.info(
-                        "Price batch upserted",
-                        extra={"batch_size": len(price_batch), "upserted": n, "ingestion_run_id": ingestion_run_id},
-                    )
-                    price_batch = []
-
-                if len(uri_batch) >= BATCH_SIZE:
-                    await card_repository.update_purchase_uris_batch(uri_batch)
-                    uri_batch = []
-
-        # Flush remaining rows
-        if price_batch:
-            n = await pricing_repository.upsert_scryfall_price_batch(
-                price_batch, ts_date=ts_date
-            )
-            total_count += n
-            logger.info(
-                "Price batch upserted (final)",
-                extra={"batch_size": len(price_batch), "upserted": n, "ingestion_run_id": ingestion_run_id},
-            )
+                router.route(card)
+                if router.pending >= BATCH_SIZE:
+                    await router.flush()
+        await router.flush()
 
-        if uri_batch:
-            await card_repository.update_purchase_uris_batch(uri_batch)
+    total_count = router.prices_loaded
 
     logger.info(
         "Scryfall price load complete",
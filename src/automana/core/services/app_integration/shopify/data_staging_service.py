@@ -1,16 +1,19 @@
-import glob
+import asyncio
+import hashlib
 import ijson
-import json
 import logging
 import os
-import tempfile
-from collections import defaultdict
+import re
 from datetime import datetime
+from html import unescape
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 from zoneinfo import ZoneInfo
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from bs4 import BeautifulSoup
 
@@ -37,44 +40,39 @@ async def get_market_id(market_repository, code: str) -> int:
 AUS_TZ = ZoneInfo("Australia/Brisbane")
 
 
-def _to_utc(x):
-    if x is None or x == "":
-        return pd.NaT
-    return pd.to_datetime(x, utc=True, errors="coerce")
-
-
 def _current_local_date():
     return pd.Timestamp(datetime.now(AUS_TZ).date())
 
 
-def _df_from_item(item: dict) -> pd.DataFrame:
-    variants = item.get("variants", []) or []
-    if not variants:
-        return pd.DataFrame(columns=["product_id", "date", "price", "variation", "scraped_at"])
-
-    rows = []
-    for v in variants:
-        rows.append({
-            "product_id": item.get("id"),
-            "date": _to_utc(v.get("updated_at")),
-            "variation": v.get("title"),
-            "price": float(v["price"]) if v.get("price") is not None else None,
-            "scraped_at": _current_local_date(),
-        })
-
-    df = pd.DataFrame(rows, columns=["product_id", "date", "variation", "price", "scraped_at"])
-    df["product_id"] = df["product_id"].astype("int64")
-    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
-    df["scraped_at"] = pd.to_datetime(df["scraped_at"], utc=True)
-    df["price"] = pd.to_numeric(df["price"], errors="coerce").astype("float64")
-    df["variation"] = df["variation"].astype("category")
-    return df[["product_id", "date", "variation", "price", "scraped_at"]]
-
-
-def _row_group_offsets(n_rows: int, group_size: int) -> list[int]:
-    if group_size <= 0 or n_rows <= group_size:
-        return [0]
-    return list(range(0, n_rows, group_size))
+# Row layout of the price parquet (and of pricing.shopify_staging_raw).
+PRICE_SCHEMA = pa.schema([
+    ("product_id", pa.int64()),
+    ("date", pa.timestamp("ns", tz="UTC")),
+    ("variation", pa.string()),
+    ("price", pa.float64()),
+    ("scraped_at", pa.timestamp("ns", tz="UTC")),
+    ("card_id", pa.string()),
+    ("tcg_id", pa.string()),
+])
+
+INFO_SCHEMA = pa.schema([
+    ("product_id", pa.int64()),
+    ("shop_id", pa.int64()),
+    ("title", pa.string()),
+    ("handle", pa.string()),
+    ("vendor", pa.string()),
+    ("product_type", pa.string()),
+    ("card_id", pa.string()),
+    ("tcg_id", pa.string()),
+    ("card_type", pa.string()),
+    ("tags", pa.list_(pa.string())),
+    ("published_at", pa.string()),
+    ("created_at", pa.string()),
+    ("updated_at", pa.string()),
+])
+
+PRICES_DIR = "prices"
+INFO_FILE = "info.parquet"
 
 
 def _dedupe_batch(df: pd.DataFrame) -> pd.DataFrame:
@@ -94,26 +92,8 @@ def _dedupe_batch(df: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
-def _append_product_file(parquet_path: str, df_batch: pd.DataFrame, group_size: int = 50000) -> None:
-    if df_batch.empty:
-        return
-    from fastparquet import write  # optional dep — not installed in API process
-    path = Path(parquet_path)
-    offsets = _row_group_offsets(len(df_batch), group_size)
-    write(
-        str(path),
-        df_batch,
-        compression="zstd",
-        object_encoding="utf8",
-        append=path.exists(),
-        file_scheme="simple",
-        row_group_offsets=offsets,
-        stats=True,
-    )
-
-
 async def get_total_items_in_json(path_to_json: str) -> int:
-    with open(path_to_json, "r", encoding="utf-8") as f:
+    with open(path_to_json, "rb") as f:
         parser = ijson.parse(f)
         for prefix, event, value in parser:
             if (prefix, event) == ("items", "start_array"):
@@ -126,7 +106,7 @@ async def get_total_items_in_json(path_to_json: str) -> int:
     return 0
 
 
-MAX_ROWS_PER_PRODUCT_BEFORE_FLUSH = 100_000
+FLUSH_ROWS = 100_000
 ROW_GROUP_TARGET = 50_000
 
 
@@ -136,44 +116,208 @@ async def parse_html_description(html: str) -> str:
 
 
 async def get_card_id_from_html(html: str) -> Optional[str]:
-    if not html:
-        return None
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-        catalog_div = soup.find("div", class_="catalogMetaData")
-        if catalog_div:
-            return catalog_div.get("data-cardid")
-        return None
-    except Exception as e:
-        logger.warning("card_id_extraction_failed", extra={"error": str(e)})
-        return None
+    return (await extract_all_metadata_from_html(html)).get("card_id")
 
 
-async def extract_all_metadata_from_html(html: str) -> Dict[str, Optional[str]]:
+# The storefront theme renders one <div class="catalogMetaData" data-...> tag per
+# product; a regex over the opening tag replaces a full BeautifulSoup parse.
+_META_DIV_RE = re.compile(
+    r"""<div\b(?=[^>]*\bclass\s*=\s*["'][^"']*\bcatalogMetaData\b)[^>]*>""", re.I
+)
+_DATA_ATTR_RE = re.compile(r"""\s(data-[\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""", re.I)
+_META_ATTRS = {
+    "card_id": "data-cardid",
+    "tcg_id": "data-tcgid",
+    "card_type": "data-cardtype",
+    "last_updated": "data-lastupdated",
+}
+
+
+def parse_catalog_metadata(html: str) -> Dict[str, Optional[str]]:
+    """card_id / tcg_id / card_type / last_updated from a product's body_html."""
     if not html:
         return {}
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-        catalog_div = soup.find("div", class_="catalogMetaData")
-        if catalog_div:
-            return {
-                "card_id": catalog_div.get("data-cardid"),
-                "tcg_id": catalog_div.get("data-tcgid"),
-                "card_type": catalog_div.get("data-cardtype"),
-                "last_updated": catalog_div.get("data-lastupdated"),
-            }
+    tag = _META_DIV_RE.search(html)
+    if tag is None:
         return {}
+    attrs: dict[str, str] = {}
+    for name, dq, sq, bare in _DATA_ATTR_RE.findall(tag.group(0)):
+        attrs.setdefault(name.lower(), unescape(dq or sq or bare))
+    return {key: attrs.get(attr) for key, attr in _META_ATTRS.items()}
+
+
+async def extract_all_metadata_from_html(html: str) -> Dict[str, Optional[str]]:
+    try:
+        return parse_catalog_metadata(html)
     except Exception as e:
         logger.warning("metadata_extraction_failed", extra={"error": str(e)})
         return {}
 
 
+class _PriceColumns:
+    """Variant rows accumulated as plain column lists; converted once per flush."""
+
+    def __init__(self) -> None:
+        self.product_id: list[int] = []
+        self.updated_at: list = []
+        self.variation: list = []
+        self.price: list = []
+        self.collection_tier: list[int] = []
+        self.card_id: list = []
+        self.tcg_id: list = []
+
+    def __len__(self) -> int:
+        return len(self.product_id)
+
+    def add_item(self, pid: int, variants: list[dict], tier: int, meta: dict) -> None:
+        card_id, tcg_id = meta.get("card_id"), meta.get("tcg_id")
+        for v in variants:
+            self.product_id.append(pid)
+            self.updated_at.append(v.get("updated_at") or None)
+            self.variation.append(v.get("title"))
+            self.price.append(v.get("price"))
+            self.collection_tier.append(tier)
+            self.card_id.append(card_id)
+            self.tcg_id.append(tcg_id)
+
+    def to_table(self, scraped_at: pd.Timestamp) -> pa.Table:
+        n = len(self)
+        dates = pd.to_datetime(
+            pd.Series(self.updated_at, dtype=object), utc=True, errors="coerce", format="ISO8601"
+        ).dt.normalize()
+        prices = pd.to_numeric(pd.Series(self.price, dtype=object), errors="coerce").astype("float64")
+        return pa.table({
+            "product_id": pa.array(self.product_id, pa.int64()),
+            "date": pa.array(dates, PRICE_SCHEMA.field("date").type),
+            "variation": pa.array(self.variation, pa.string()),
+            "price": pa.array(prices, pa.float64()),
+            "scraped_at": pa.array(
+                [scraped_at.tz_localize("UTC")] * n if n else [], PRICE_SCHEMA.field("scraped_at").type
+            ),
+            "card_id": pa.array(self.card_id, pa.string()),
+            "tcg_id": pa.array(self.tcg_id, pa.string()),
+            "collection_tier": pa.array(self.collection_tier, pa.int8()),
+        })
+
+
+def _info_row(pid: int, market_id: int, item: dict, meta: dict) -> dict:
+    def _opt_str(value):
+        return None if value is None else str(value)
+
+    tags = item.get("tags")
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+    return {
+        "product_id": pid,
+        "shop_id": market_id,
+        "title": item.get("title"),
+        "handle": item.get("handle"),
+        "vendor": item.get("vendor"),
+        "product_type": item.get("product_type"),
+        "card_id": meta.get("card_id"),
+        "tcg_id": meta.get("tcg_id"),
+        "card_type": meta.get("card_type"),
+        "tags": [str(t) for t in tags] if tags else None,
+        "published_at": _opt_str(item.get("published_at")),
+        "created_at": _opt_str(item.get("created_at")),
+        "updated_at": _opt_str(item.get("updated_at")),
+    }
+
+
+def _write_parquet_atomic(path: Path, table: pa.Table) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    pq.write_table(table, tmp, compression="zstd", row_group_size=ROW_GROUP_TARGET)
+    os.replace(tmp, path)
+
+
+class _PricePartWriter:
+    """Streams a run's deduped price rows into one part, one flush at a time.
+
+    Rows go to a temp file; ``close`` moves it over any earlier part for the
+    same day, so a run that fails part-way leaves the previous part in place.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._writer: Optional[pq.ParquetWriter] = None
+        self.rows = 0
+        # (product_id, date, variation) of every row written so far.
+        self._written: set[tuple] = set()
+
+    def write(self, columns: _PriceColumns, scraped_at: pd.Timestamp) -> None:
+        """Dedupe one flush and append the rows no earlier flush has written.
+
+        Files are read in-stock collection first, so a key that was already
+        written has the winning tier and later copies are dropped.
+        """
+        df = _dedupe_batch(columns.to_table(scraped_at).to_pandas())
+        keys = zip(
+            df["product_id"].tolist(), df["date"].array.asi8.tolist(), df["variation"].tolist()
+        )
+        fresh = []
+        for key in keys:
+            fresh.append(key not in self._written)
+            self._written.add(key)
+        df = df[fresh]
+        if df.empty:
+            return
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self._tmp, PRICE_SCHEMA, compression="zstd")
+        self._writer.write_table(
+            pa.Table.from_pandas(df, schema=PRICE_SCHEMA, preserve_index=False),
+            row_group_size=ROW_GROUP_TARGET,
+        )
+        self.rows += len(df)
+
+    def close(self) -> int:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._tmp, self.path)
+        return self.rows
+
+
+def _file_collection_tier(json_file: Path) -> int:
+    """Dedup priority of a fetched collection file: 1 for the in-stock collection.
+
+    _collection_handle is written first in the payload by fetch_all_markets so
+    ijson finds it before scanning the (large) items array. When absent (old
+    JSON files), defaults to "" → collection_tier=0 (safe fallback).
+    """
+    with open(json_file, "rb") as fh:
+        handle = next(ijson.items(fh, "_collection_handle"), "")
+    return 1 if "in-stock" in handle or "instock" in handle else 0
+
+
+def _merge_info(path: Path, rows: list[dict]) -> int:
+    """Upsert product info rows by product_id into the market's info table."""
+    table = pa.Table.from_pylist(rows, schema=INFO_SCHEMA)
+    if path.exists():
+        old = pq.read_table(path).cast(INFO_SCHEMA)
+        keep = pc.invert(pc.is_in(old["product_id"], value_set=table["product_id"]))
+        table = pa.concat_tables([old.filter(keep), table])
+    _write_parquet_atomic(path, table.sort_by("product_id"))
+    return table.num_rows
+
+
+def read_product_info(storage_service: StorageService, rel_output: str) -> list[dict]:
+    """Rows of a market's info table (written by ``process_json_dir_to_parquet``)."""
+    path = storage_service.backend.resolve_path(f"{rel_output}/{INFO_FILE}")
+    if not path.exists():
+        return []
+    return pq.read_table(path).to_pylist()
+
+
 @ServiceRegistry.register(
     path="shopify.data.process_to_parquet",
     db_repositories=["market"],
     storage_services=["shopify"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def process_json_dir_to_parquet(
     market_repository: MarketRepository,
@@ -182,12 +326,22 @@ async def process_json_dir_to_parquet(
     market_code: str,
     output_path: str,
 ):
+    """Convert a market's fetched product JSON into parquet.
+
+    Writes ``prices/part-<scrape date>.parquet`` (one deduped part per run, so a
+    same-day re-run replaces it) and upserts ``info.parquet`` (one row per
+    product, latest wins) under the market's output directory. Price rows are
+    deduped and written every FLUSH_ROWS rows; only the keys already written
+    are kept across flushes.
+    """
     market_id = await get_market_id(market_repository, market_code)
     if market_id == -1:
         raise ValueError(f"Market ID not found for market code: {market_code}")
 
     storage_base = storage_service.backend.base_path
-    json_files = sorted(storage_base.glob(f"{market_id}_*/**/*products.json"))
+    # In-stock collection files first: their rows win the cross-flush dedupe.
+    tiers = {f: _file_collection_tier(f) for f in sorted(storage_base.glob(f"{market_id}_*/**/*products.json"))}
+    json_files = sorted(tiers, key=lambda f: -tiers[f])
     total_files = len(json_files)
     total_files_size = sum(f.stat().st_size for f in json_files)
     logger.info(
@@ -201,21 +355,14 @@ async def process_json_dir_to_parquet(
     except ValueError:
         rel_output = f"parquet/{market_id}"
 
-    buffers: dict[int, list[pd.DataFrame]] = defaultdict(list)
-    buffered_rows_count: dict[int, int] = defaultdict(int)
-
-    def _flush_product(pid: int):
-        frames = buffers.get(pid, [])
-        if not frames:
-            return
-        df_batch = pd.concat(frames, ignore_index=True)
-        df_batch = _dedupe_batch(df_batch)
-        # fastparquet requires a filesystem path; resolve_path bridges the storage abstraction
-        parquet_path = storage_service.backend.resolve_path(f"{rel_output}/{pid}/data.parquet")
-        parquet_path.parent.mkdir(parents=True, exist_ok=True)
-        _append_product_file(str(parquet_path), df_batch, group_size=ROW_GROUP_TARGET)
-        buffers[pid].clear()
-        buffered_rows_count[pid] = 0
+    scraped_at = _current_local_date()
+    columns = _PriceColumns()
+    prices = _PricePartWriter(storage_service.backend.resolve_path(
+        f"{rel_output}/{PRICES_DIR}/part-{scraped_at.date().isoformat()}.parquet"
+    ))
+    info_rows: dict[int, dict] = {}
+    # Same product body shows up once per collection it belongs to.
+    meta_memo: dict[bytes, dict] = {}
 
     for file_index, json_file in enumerate(json_files, 1):
         file_size_mb = json_file.stat().st_size / (1024 * 1024)
@@ -234,54 +381,32 @@ async def process_json_dir_to_parquet(
             logger.info("parquet_process_file_empty", extra={"file": json_file.name})
             continue
 
-        # Read collection handle embedded in JSON metadata to derive dedup priority.
-        # _collection_handle is written first in the payload by fetch_all_markets so
-        # ijson finds it before scanning the (large) items array.
-        # When absent (old JSON files), defaults to "" → collection_tier=0 (safe fallback).
-        _collection_handle = ""
-        with open(json_file, "rb") as _fh:
-            _collection_handle = next(ijson.items(_fh, "_collection_handle"), "")
-        _collection_tier = 1 if "in-stock" in _collection_handle or "instock" in _collection_handle else 0
+        _collection_tier = tiers[json_file]
 
         items_processed = 0
         with open(json_file, "rb") as f:
             try:
-                for item in ijson.items(f, "items.item"):
+                for item in ijson.items(f, "items.item", use_float=True):
                     if not isinstance(item, dict):
                         continue
 
-                    pid = int(item["id"])
-                    df_item = _df_from_item(item)
-                    if df_item.empty:
+                    variants = item.get("variants") or []
+                    if not variants:
                         continue
+                    pid = int(item["id"])
 
-                    df_item["collection_tier"] = _collection_tier
-                    meta_data = await extract_all_metadata_from_html(item.get("body_html", ""))
-                    df_item["card_id"] = meta_data.get("card_id")
-                    df_item["tcg_id"] = meta_data.get("tcg_id")
-                    buffers[pid].append(df_item)
-                    buffered_rows_count[pid] += len(df_item)
-
-                    info_rel = f"{rel_output}/{pid}/info.json"
-                    if not await storage_service.file_exists(info_rel):
-                        await storage_service.save_json(info_rel, {
-                            "product_id": pid,
-                            "shop_id": market_id,
-                            "title": item.get("title"),
-                            "handle": item.get("handle"),
-                            "vendor": item.get("vendor"),
-                            "product_type": item.get("product_type"),
-                            "card_id": meta_data.get("card_id"),
-                            "tcg_id": meta_data.get("tcg_id"),
-                            "card_type": meta_data.get("card_type"),
-                            "tags": item.get("tags"),
-                            "published_at": str(item.get("published_at")),
-                            "created_at": str(item.get("created_at")),
-                            "updated_at": str(item.get("updated_at")),
-                        })
-
-                    if buffered_rows_count[pid] >= MAX_ROWS_PER_PRODUCT_BEFORE_FLUSH:
-                        _flush_product(pid)
+                    body = item.get("body_html") or ""
+                    key = hashlib.blake2b(body.encode(), digest_size=16).digest()
+                    meta_data = meta_memo.get(key)
+                    if meta_data is None:
+                        meta_data = meta_memo[key] = await extract_all_metadata_from_html(body)
+
+                    columns.add_item(pid, variants, _collection_tier, meta_data)
+                    info_rows[pid] = _info_row(pid, market_id, item, meta_data)
+
+                    if len(columns) >= FLUSH_ROWS:
+                        await asyncio.to_thread(prices.write, columns, scraped_at)
+                        columns = _PriceColumns()
 
                     items_processed += 1
                     if items_processed % 1000 == 0:
@@ -294,10 +419,59 @@ async def process_json_dir_to_parquet(
 
         logger.info("parquet_process_file_complete", extra={"file": json_file.name, "items_processed": items_processed})
 
-    for pid in list(buffers.keys()):
-        _flush_product(pid)
+    if len(columns):
+        await asyncio.to_thread(prices.write, columns, scraped_at)
+    price_rows = await asyncio.to_thread(prices.close)
+    if info_rows:
+        info_path = storage_service.backend.resolve_path(f"{rel_output}/{INFO_FILE}")
+        await asyncio.to_thread(_merge_info, info_path, list(info_rows.values()))
+
+    logger.info(
+        "parquet_process_complete",
+        extra={"total_files": total_files, "products": len(info_rows), "price_rows": price_rows},
+    )
 
-    logger.info("parquet_process_complete", extra={"total_files": total_files})
+
+def _price_files(base_dir: Path) -> list[Path]:
+    """Run parts under ``prices/`` plus legacy per-product ``{pid}/data.parquet`` files.
+
+    Only the footer of each file is read here; unreadable files are logged and
+    skipped so one corrupt product doesn't fail the whole scan.
+    """
+    files = sorted((base_dir / PRICES_DIR).glob("part-*.parquet"))
+    for prod_dir in sorted(d for d in base_dir.iterdir() if d.is_dir() and d.name != PRICES_DIR):
+        parquet_file_path = prod_dir / "data.parquet"
+        if parquet_file_path.exists():
+            files.append(parquet_file_path)
+        else:
+            logger.warning("missing_parquet", extra={"dir": str(prod_dir)})
+    readable = []
+    for path in files:
+        try:
+            pq.read_schema(path)
+        except Exception as e:
+            logger.error("parquet_read_failed", extra={"file": str(path), "error": str(e)})
+            continue
+        readable.append(path)
+    return readable
+
+
+def _coalesced_batches(dataset: ds.Dataset, batch_size: int) -> Iterator[pa.Table]:
+    """Tables of ~``batch_size`` rows; small per-product files are merged so each
+    COPY carries a full batch. At most one batch plus the scanner's readahead is
+    held in memory."""
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in dataset.to_batches(batch_size=batch_size, batch_readahead=2, fragment_readahead=2):
+        if batch.num_rows == 0:
+            continue
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= batch_size:
+            yield pa.Table.from_batches(pending, schema=PRICE_SCHEMA)
+            pending, pending_rows = [], 0
+    if pending:
+        yield pa.Table.from_batches(pending, schema=PRICE_SCHEMA)
 
 
 @ServiceRegistry.register(
@@ -306,6 +480,7 @@ async def process_json_dir_to_parquet(
     storage_services=["shopify"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def stage_data_from_parquet(
     product_repository: ProductRepository,
@@ -320,76 +495,38 @@ async def stage_data_from_parquet(
         rel_base = parquet_base_path
 
     base_dir = storage_service.backend.resolve_path(rel_base)
-    product_dirs = [d for d in base_dir.iterdir() if d.is_dir()] if base_dir.exists() else []
-
-    total_products = len(product_dirs)
-    if total_products == 0:
-        logger.warning("no_product_dirs", extra={"path": parquet_base_path})
-        return
-
-    parquet_files = []
-    for prod_dir in product_dirs:
-        parquet_file_path = prod_dir / "data.parquet"
-        if parquet_file_path.exists():
-            parquet_files.append(parquet_file_path)
-        else:
-            logger.warning("missing_parquet", extra={"dir": str(prod_dir)})
-
+    parquet_files = await asyncio.to_thread(_price_files, base_dir) if base_dir.exists() else []
     if not parquet_files:
         logger.warning("no_parquet_files", extra={"path": parquet_base_path})
         return
 
-    logger.info("staging_start", extra={"total_products": total_products, "path": parquet_base_path})
-
-    schema = pq.ParquetFile(parquet_files[0]).schema_arrow
+    logger.info("staging_start", extra={"total_files": len(parquet_files), "path": parquet_base_path})
 
-    # Temp merge file lives under the storage root so cleanup goes through storage
-    tmp_rel = "_tmp/merge.parquet"
-    temp_parquet_path = storage_service.backend.resolve_path(tmp_rel)
-    temp_parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    # The dataset projects every file onto PRICE_SCHEMA (legacy files have a
+    # dictionary-encoded variation and may lack card_id/tcg_id) and streams it.
+    dataset = ds.dataset([str(p) for p in parquet_files], format="parquet", schema=PRICE_SCHEMA)
+    batches = _coalesced_batches(dataset, batch_size)
 
-    try:
-        logger.info("concatenating_parquet_files")
-        with pq.ParquetWriter(str(temp_parquet_path), schema=schema) as writer:
-            for i, parquet_file_path in enumerate(parquet_files, 1):
-                logger.info(
-                    "parquet_concat_file",
-                    extra={"file_index": i, "total_files": len(parquet_files), "file": parquet_file_path.name},
-                )
-                try:
-                    table = pq.read_table(parquet_file_path, schema=schema)
-                    writer.write_table(table)
-                except Exception as e:
-                    logger.error("parquet_read_failed", extra={"file": str(parquet_file_path), "error": str(e)})
-
-        logger.info("reading_concatenated_parquet")
-        combined_table = pq.read_table(str(temp_parquet_path))
-        df = combined_table.to_pandas()
-
-
-        total_rows = len(df)
-        if total_rows == 0:
-            logger.warning("no_rows_to_stage")
-            return
-
-        logger.info("staging_rows", extra={"total_rows": total_rows})
-        total_batches = (total_rows + batch_size - 1) // batch_size
-
-        for batch_num, i in enumerate(range(0, total_rows, batch_size), 1):
-            end_idx = min(i + batch_size, total_rows)
-            batch_df = df.iloc[i:end_idx]
-            logger.info(
-                "staging_batch",
-                extra={"batch": batch_num, "total_batches": total_batches, "rows_start": i + 1, "rows_end": end_idx},
-            )
-            try:
-                await product_repository.bulk_copy_prices(batch_df)
-            except Exception as e:
-                logger.error("batch_insert_failed", extra={"batch": batch_num, "error": str(e)})
-                raise
-
-        logger.info("staging_complete", extra={"total_rows": total_rows, "total_batches": total_batches})
-
-    finally:
-        await storage_service.delete_file(tmp_rel)
+    total_rows = batch_num = 0
+    while True:
+        # Parquet decoding blocks, so each batch is pulled in a worker thread.
+        table = await asyncio.to_thread(next, batches, None)
+        if table is None:
+            break
+        batch_num += 1
+        logger.info(
+            "staging_batch",
+            extra={"batch": batch_num, "rows_start": total_rows + 1, "rows_end": total_rows + table.num_rows},
+        )
+        try:
+            await product_repository.bulk_copy_prices(table)
+        except Exception as e:
+            logger.error("batch_insert_failed", extra={"batch": batch_num, "error": str(e)})
+            raise
+        total_rows += table.num_rows
+
+    if total_rows == 0:
+        logger.warning("no_rows_to_stage")
+        return
 
+    logger.info("staging_complete", extra={"total_rows": total_rows, "total_batches": batch_num})
@@ -84,6 +84,7 @@ def _build_obs_dataframe(
     api_repositories=["shopify_api"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def fetch_collections(
     shopify_pipeline_repository: ShopifyPipelineRepository,
@@ -131,6 +132,7 @@ async def fetch_collections(
     api_repositories=["shopify_api"],
     runs_in_transaction=False,
     command_timeout=7200,
+    pool="bulk",
 )
 async def classify_collections(
     shopify_pipeline_repository: ShopifyPipelineRepository,
@@ -212,6 +214,7 @@ async def classify_collections(
     storage_services=["shopify"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def fetch_all_markets(
     shopify_pipeline_repository: ShopifyPipelineRepository,
@@ -296,6 +299,7 @@ async def fetch_all_markets(
     storage_services=["shopify"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def process_to_parquet(
     market_repository: MarketRepository,
@@ -320,6 +324,7 @@ async def process_to_parquet(
         async with track_step(ops_repository, ingestion_run_id, f"process_to_parquet_{market_id}"):
             from automana.core.services.app_integration.shopify.data_staging_service import (
                 process_json_dir_to_parquet,
+                read_product_info,
             )
             await process_json_dir_to_parquet(
                 market_repository=market_repository,
@@ -328,23 +333,22 @@ async def process_to_parquet(
                 market_code=source_code,
                 output_path=parquet_dir,
             )
-            # Read info.json files written by the staging service via the storage layer
+            # Product info is one table per market, written by the staging service
             storage_base = storage_service.backend.base_path
             try:
                 rel_parquet = str(Path(parquet_dir).relative_to(storage_base))
             except ValueError:
                 rel_parquet = parquet_dir
-            info_paths = sorted(storage_service.backend.resolve_path(rel_parquet).glob("*/info.json"))
-            handle_rows = []
-            for info_path in info_paths:
-                rel_info = str(info_path.relative_to(storage_base))
-                info = await storage_service.load_json(rel_info)
-                handle_rows.append({
+            info_rows = await asyncio.to_thread(read_product_info, storage_service, rel_parquet)
+            handle_rows = [
+                {
                     "product_id": str(info["product_id"]),
                     "market_id": market_id,
                     "handle": info.get("handle"),
                     "title": info.get("title"),
-                })
+                }
+                for info in info_rows
+            ]
             if handle_rows:
                 await shopify_pipeline_repository.upsert_product_handles(handle_rows)
 
@@ -358,6 +362,7 @@ async def process_to_parquet(
     storage_services=["shopify"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def stage_raw(
     product_repository: ProductRepository,
@@ -404,6 +409,7 @@ async def stage_raw(
     db_repositories=["shopify_pipeline", "ops"],
     runs_in_transaction=False,
     command_timeout=3600,
+    pool="bulk",
 )
 async def promote_observations(
     shopify_pipeline_repository: ShopifyPipelineRepository,
@@ -1,10 +1,12 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, timezone, date, timedelta
 from dataclasses import dataclass, field
-from typing import  Optional, List, Dict, Any, Callable
+from typing import  Optional, List, Dict, Any, Callable, Protocol
 from pathlib import Path
+import base64
+from decimal import Decimal
 import hashlib
-import ijson, asyncio, logging, json
+import asyncio, logging, json
 from automana.core.repositories.ops.ops_repository import OpsRepository
 from automana.core.services.ops.pipeline_services import track_step
 from automana.core.models.card_catalog import card as card_schemas
@@ -15,7 +17,15 @@ from automana.core.exceptions.service_layer_exceptions.card_catalogue import car
 from automana.core.framework.registry import ServiceRegistry
 from automana.core.models.pipelines.mtg_stock import  MTGStockBatchStep
 from automana.core.storage import StorageService
-from automana.core.utils.redis_cache import get_from_cache, set_to_cache, invalidate_cache_pattern
+from automana.core.utils.redis_cache import (
+    get_from_cache,
+    get_l1_cache,
+    invalidate_namespace,
+    namespaced_key,
+    set_to_cache,
+    single_flight,
+    unlink_stale_generations,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +35,7 @@ class CardSearchResult:
     total_count: int
     promo_type_facets: List[str] = field(default_factory=list)
     rarity_facets: List[str] = field(default_factory=list)
+    next_cursor: Optional[str] = None
 
 @dataclass
 class ProcessingStats:
@@ -69,6 +80,11 @@ class ProcessingConfig:
     skip_validation_errors: bool = True
     progress_callback: Optional[Callable[[ProcessingStats], None]] = None
     save_failed_cards: bool = True
+    # "jsonb": one insert_batch_card_versions call per batch.
+    # "copy":  binary COPY into the load stage tables, set-based merge.
+    loader_mode: str = "jsonb"
+    # copy mode only: merge every N staged batches (0 = once per file).
+    copy_merge_every: int = 0
     
 @ServiceRegistry.register(
     "card_catalog.card.create",
@@ -132,9 +148,77 @@ async def get_catalog_stats(
         "last_updated": last_updated,
     }
 
+# Search pages, facets and suggestions share one generation-versioned cache namespace
+SEARCH_CACHE_NAMESPACE = "card_search"
+_SEARCH_PAGE_KEYS = ("limit", "offset", "cursor", "sort_by", "sort_order")
+_INT4_MIN, _INT4_MAX = -2**31, 2**31 - 1
+# Postgres numeric: up to 131072 digits before the point, 16383 after.
+_NUMERIC_MAX_ADJUSTED, _NUMERIC_MIN_EXPONENT = 131071, -16383
+
+
+def _parse_int4_key(text: str) -> int:
+    value = int(text)
+    if not _INT4_MIN <= value <= _INT4_MAX:
+        raise ValueError(f"{text!r} is out of integer range")
+    return value
+
+
+def _parse_numeric_key(text: str) -> Decimal:
+    value = Decimal(text)
+    if not value.is_finite():
+        raise ValueError(f"{text!r} is not a finite number")
+    if value.adjusted() > _NUMERIC_MAX_ADJUSTED or value.as_tuple().exponent < _NUMERIC_MIN_EXPONENT:
+        raise ValueError(f"{text!r} is out of numeric range")
+    return value
+
+
+# Keyset values are bound as text and cast in SQL (cmc ::integer, price
+# ::numeric); check them here, range included, so a tampered cursor is a 400
+# rather than a cast error.
+_CURSOR_KEY_PARSERS: dict[str, Callable[[str], Any]] = {
+    "cmc": _parse_int4_key,
+    "price": _parse_numeric_key,
+    "released_at": date.fromisoformat,
+}
+
+
+def _encode_search_cursor(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_search_cursor(cursor: str, sort_by: str, sort_order: str, filter_hash: str) -> dict:
+    """Decode an opaque search cursor; it is only valid for the query it was issued for."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise card_exception.InvalidSearchCursorError("Malformed search cursor") from e
+    if not isinstance(payload, dict) or (payload.get("s"), payload.get("o"), payload.get("f")) != (
+        sort_by, sort_order, filter_hash[:16]
+    ):
+        raise card_exception.InvalidSearchCursorError("Search cursor does not match this query")
+    if "id" in payload:
+        try:
+            UUID(str(payload["id"]))
+            key = payload.get("k")
+            if key is not None:
+                if isinstance(key, (dict, list, bool)):
+                    raise ValueError(key)
+                _CURSOR_KEY_PARSERS.get(sort_by, str)(str(key))
+        except (ValueError, TypeError, ArithmeticError) as e:
+            raise card_exception.InvalidSearchCursorError("Malformed search cursor") from e
+    else:
+        off = payload.get("off")
+        if not isinstance(off, int) or isinstance(off, bool) or off < 0:
+            raise card_exception.InvalidSearchCursorError("Malformed search cursor")
+    return payload
+
+
 @ServiceRegistry.register(
     "card_catalog.card.search",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def search_cards(card_repository: CardReferenceRepository
                    , name: Optional[str] = None
@@ -160,104 +244,170 @@ async def search_cards(card_repository: CardReferenceRepository
                    # Pagination
                    , limit: int = 100
                    , offset: int = 0
+                   , cursor: Optional[str] = None
                    , sort_by: str = "name"
                    , sort_order: str = "asc"
                    ) -> CardSearchResult:
+    """Search cards with cursor pagination.
+
+    `cursor` (the `next_cursor` of a previous page) takes precedence over
+    `offset`. Column sorts page by keyset; relevance-ranked searches (name /
+    oracle_text) get offset-backed cursors. The count and facets depend only
+    on the filters, so they are cached once per filter set and shared by
+    every page of it.
+    """
     logger.info("Searching cards", extra={"card_name": name, "colors": colors, "rarity": rarity, "card_id": str(card_id) if card_id else None, "set_name": set_name, "mana_cost": mana_cost, "digital": digital})
+    params = {
+        "name": name,
+        "colors": colors,
+        "rarity": rarity,
+        "card_id": str(card_id) if card_id else None,
+        "unique_card_id": str(unique_card_id) if unique_card_id else None,
+        "artist": artist,
+        "released_after": str(released_after) if released_after else None,
+        "released_before": str(released_before) if released_before else None,
+        "set_name": set_name,
+        "set_code": set_code,
+        "mana_cost": mana_cost,
+        "digital": digital,
+        "card_type": card_type,
+        "oracle_text": oracle_text,
+        "format": format,
+        "layout": layout,
+        "promo_type": promo_type,
+        "finish": finish,
+        "frame_effects": frame_effects,
+        "collapse": collapse,
+        "limit": limit,
+        "offset": offset,
+        "cursor": cursor,
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+    }
+    filter_hash = hashlib.sha256(
+        json.dumps(
+            {k: v for k, v in params.items() if k not in _SEARCH_PAGE_KEYS},
+            sort_keys=True, default=str,
+        ).encode()
+    ).hexdigest()
+    decoded = _decode_search_cursor(cursor, sort_by, sort_order, filter_hash) if cursor else None
     try:
-        params = {
-            "name": name,
-            "colors": colors,
-            "rarity": rarity,
-            "card_id": str(card_id) if card_id else None,
-            "unique_card_id": str(unique_card_id) if unique_card_id else None,
-            "artist": artist,
-            "released_after": str(released_after) if released_after else None,
-            "released_before": str(released_before) if released_before else None,
-            "set_name": set_name,
-            "set_code": set_code,
-            "mana_cost": mana_cost,
-            "digital": digital,
-            "card_type": card_type,
-            "oracle_text": oracle_text,
-            "format": format,
-            "layout": layout,
-            "promo_type": promo_type,
-            "finish": finish,
-            "frame_effects": frame_effects,
-            "collapse": collapse,
-            "limit": limit,
-            "offset": offset,
-            "sort_by": sort_by,
-            "sort_order": sort_order,
-        }
         params_hash = hashlib.sha256(
             json.dumps(params, sort_keys=True, default=str).encode()
         ).hexdigest()
-        cache_key = f"card_search:full:{params_hash}"
+        cache_key = await namespaced_key(SEARCH_CACHE_NAMESPACE, f"page:{params_hash}")
+        facets_key = await namespaced_key(SEARCH_CACHE_NAMESPACE, f"facets:{filter_hash}")
 
-        cached = await get_from_cache(cache_key)
-        if cached is not None:
+        async def _from_cache() -> Optional[CardSearchResult]:
+            cached = await get_from_cache(cache_key)
+            cached_facets = await get_from_cache(facets_key) if cached is not None else None
+            if cached is None or cached_facets is None:
+                return None
             return CardSearchResult(
                 cards=[BaseCard.model_validate(c) for c in cached["cards"]],
-                total_count=cached["total_count"],
-                promo_type_facets=cached.get("promo_type_facets", []),
-                rarity_facets=cached.get("rarity_facets", []),
+                total_count=cached_facets["total_count"],
+                promo_type_facets=cached_facets.get("promo_type_facets", []),
+                rarity_facets=cached_facets.get("rarity_facets", []),
+                next_cursor=cached.get("next_cursor"),
             )
 
-        if card_id:
-            logger.info("Fetching card by ID", extra={"card_id": str(card_id)})
-            card = await card_repository.get(card_id)
-            if not card:
-                return CardSearchResult(cards=[], total_count=0)
-            result = CardSearchResult(cards=[BaseCard.model_validate(card)], total_count=1)
-        else:
-            raw = await card_repository.search(name=name,
-                                               colors=colors,
-                                               rarity=rarity,
-                                               set_name=set_name,
-                                               set_code=set_code,
-                                               mana_cost=mana_cost,
-                                               digital=digital,
-                                               released_after=released_after,
-                                               released_before=released_before,
-                                               oracle_text=oracle_text,
-                                               artist=artist,
-                                               unique_card_id=unique_card_id,
-                                               format=format,
-                                               layout=layout,
-                                               collapse=collapse,
-                                               limit=limit,
-                                               offset=offset,
-                                               sort_by=sort_by,
-                                               card_type=card_type,
-                                               sort_order=sort_order,
-                                               promo_type=promo_type,
-                                               finish=finish,
-                                               frame_effects=frame_effects)
-            cards = raw.get("cards", [])
-            total_count = raw.get("total_count", 0)
-            promo_type_facets = raw.get("promo_type_facets", [])
-            rarity_facets = raw.get("rarity_facets", [])
-            result = CardSearchResult(
-                cards=[BaseCard.model_validate(card) for card in cards],
-                total_count=total_count,
-                promo_type_facets=promo_type_facets,
-                rarity_facets=rarity_facets,
+        async def _load() -> CardSearchResult:
+            # Re-check: another request may have filled the cache while this
+            # one waited for the single-flight slot.
+            epoch = get_l1_cache().epoch
+            cached_result = await _from_cache()
+            if cached_result is not None:
+                return cached_result
+
+            if card_id:
+                logger.info("Fetching card by ID", extra={"card_id": str(card_id)})
+                card = await card_repository.get(card_id)
+                if not card:
+                    return CardSearchResult(cards=[], total_count=0)
+                result = CardSearchResult(cards=[BaseCard.model_validate(card)], total_count=1)
+            else:
+                cached_facets = await get_from_cache(facets_key)
+                after = None
+                page_offset = offset
+                if decoded is not None:
+                    if "id" in decoded:
+                        after = {"key": decoded.get("k"), "id": decoded["id"]}
+                    else:
+                        page_offset = decoded["off"]
+                raw = await card_repository.search(name=name,
+                                                   colors=colors,
+                                                   rarity=rarity,
+                                                   set_name=set_name,
+                                                   set_code=set_code,
+                                                   mana_cost=mana_cost,
+                                                   digital=digital,
+                                                   released_after=released_after,
+                                                   released_before=released_before,
+                                                   oracle_text=oracle_text,
+                                                   artist=artist,
+                                                   unique_card_id=unique_card_id,
+                                                   format=format,
+                                                   layout=layout,
+                                                   collapse=collapse,
+                                                   limit=limit,
+                                                   offset=page_offset,
+                                                   after=after,
+                                                   with_facets=cached_facets is None,
+                                                   sort_by=sort_by,
+                                                   card_type=card_type,
+                                                   sort_order=sort_order,
+                                                   promo_type=promo_type,
+                                                   finish=finish,
+                                                   frame_effects=frame_effects)
+                cards = raw.get("cards", [])
+                if cached_facets is None:
+                    cached_facets = {
+                        "total_count": raw.get("total_count", 0),
+                        "promo_type_facets": raw.get("promo_type_facets", []),
+                        "rarity_facets": raw.get("rarity_facets", []),
+                    }
+                    await set_to_cache(facets_key, cached_facets, expiry_seconds=3600, epoch=epoch)
+
+                cursor_base = {"s": sort_by, "o": sort_order, "f": filter_hash[:16]}
+                next_cursor = None
+                if raw.get("next_after"):
+                    next_cursor = _encode_search_cursor(
+                        {**cursor_base, "k": raw["next_after"]["key"], "id": raw["next_after"]["id"]}
+                    )
+                elif not after and len(cards) == limit:
+                    next_cursor = _encode_search_cursor({**cursor_base, "off": page_offset + limit})
+
+                result = CardSearchResult(
+                    cards=[BaseCard.model_validate(card) for card in cards],
+                    total_count=cached_facets["total_count"],
+                    promo_type_facets=cached_facets.get("promo_type_facets", []),
+                    rarity_facets=cached_facets.get("rarity_facets", []),
+                    next_cursor=next_cursor,
+                )
+
+            cache_data = {
+                "cards": [c.model_dump() for c in result.cards],
+                "next_cursor": result.next_cursor,
+            }
+            await set_to_cache(
+                cache_key,
+                json.loads(BaseCard.to_json_safe(cache_data)),
+                expiry_seconds=3600,
+                epoch=epoch,
             )
+            if card_id:
+                await set_to_cache(
+                    facets_key,
+                    {"total_count": result.total_count, "promo_type_facets": [], "rarity_facets": []},
+                    expiry_seconds=3600,
+                    epoch=epoch,
+                )
+            return result
 
-        cache_data = {
-            "cards": [c.model_dump() for c in result.cards],
-            "total_count": result.total_count,
-            "promo_type_facets": result.promo_type_facets,
-            "rarity_facets": result.rarity_facets,
-        }
-        await set_to_cache(
-            cache_key,
-            json.loads(BaseCard.to_json_safe(cache_data)),
-            expiry_seconds=3600,
-        )
-        return result
+        cached_result = await _from_cache()
+        if cached_result is not None:
+            return cached_result
+        return await single_flight(cache_key, _load)
 
     except Exception as e:
         raise card_exception.CardRetrievalError(f"Failed to retrieve cards: {str(e)}")
@@ -265,7 +415,8 @@ async def search_cards(card_repository: CardReferenceRepository
 
 @ServiceRegistry.register(
     "card_catalog.card.suggest",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def suggest_cards(
     card_repository: CardReferenceRepository,
@@ -273,20 +424,22 @@ async def suggest_cards(
     limit: int = 10,
     **kwargs,
 ) -> CardSuggestionResponse:
-    cache_key = f"card_search:suggest:{query.lower()}:{limit}"
+    cache_key = await namespaced_key(SEARCH_CACHE_NAMESPACE, f"suggest:{query.lower()}:{limit}")
+    epoch = get_l1_cache().epoch
     cached = await get_from_cache(cache_key)
     if cached is not None:
         return CardSuggestionResponse(suggestions=[CardSuggestion(**s) for s in cached])
 
     rows = await card_repository.suggest(query=query, limit=limit)
     suggestions = [CardSuggestion(**r) for r in rows]
-    await set_to_cache(cache_key, [s.model_dump(mode="json") for s in suggestions], expiry_seconds=600)
+    await set_to_cache(cache_key, [s.model_dump(mode="json") for s in suggestions], expiry_seconds=600, epoch=epoch)
     return CardSuggestionResponse(suggestions=suggestions)
 
 
 @ServiceRegistry.register(
     "card_catalog.card.get_versions_in_set",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def get_versions_in_set(
     card_repository: CardReferenceRepository,
@@ -298,7 +451,8 @@ async def get_versions_in_set(
 
 @ServiceRegistry.register(
     "card_catalog.card.get_other_sets",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def get_other_sets(
     card_repository: CardReferenceRepository,
@@ -309,7 +463,8 @@ async def get_other_sets(
 
 @ServiceRegistry.register(
     "card_catalog.card.get_price_history",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def get_card_price_history(
     card_repository: CardReferenceRepository,
@@ -338,6 +493,7 @@ async def get_card_price_history(
         CardRetrievalError: On repository-level failures
     """
     cache_key = f"price_history:{card_id}:{finish}:{days_back}:{aggregation}:{currency}"
+    epoch = get_l1_cache().epoch
     cached_result = await get_from_cache(cache_key)
     if cached_result is not None:
         logger.debug("price_cache_hit", extra={"card_id": str(card_id), "finish": finish})
@@ -365,7 +521,7 @@ async def get_card_price_history(
                 days_back=days_back
             )
         )
-        await set_to_cache(cache_key, response.model_dump(mode="json"), expiry_seconds=86400)  # 24 hour TTL
+        await set_to_cache(cache_key, response.model_dump(mode="json"), expiry_seconds=86400, epoch=epoch)  # 24 hour TTL
         return response
     except Exception as e:
         raise card_exception.CardRetrievalError(f"Failed to retrieve price history: {str(e)}")
@@ -375,10 +531,17 @@ async def get_card_price_history(
     "card_catalog.card_search.invalidate",
     db_repositories=[]
 )
-async def invalidate_search_cache(**kwargs) -> dict:
-    keys_deleted = await invalidate_cache_pattern("card_search:*")
-    logger.info("Invalidated card search cache", extra={"keys_deleted": keys_deleted})
-    return {"keys_deleted": keys_deleted}
+async def invalidate_search_cache(unlink_orphans: bool = False, **kwargs) -> dict:
+    """Invalidate every cached search page, facet set and suggestion.
+
+    Bumps the `card_search` generation, which is O(1) however many entries
+    are cached; the old entries expire through their TTL. `unlink_orphans`
+    additionally UNLINKs them now to reclaim Redis memory early.
+    """
+    generation = await invalidate_namespace(SEARCH_CACHE_NAMESPACE)
+    keys_unlinked = await unlink_stale_generations(SEARCH_CACHE_NAMESPACE) if unlink_orphans else 0
+    logger.info("Invalidated card search cache", extra={"generation": generation, "keys_unlinked": keys_unlinked})
+    return {"generation": generation, "keys_unlinked": keys_unlinked}
 
 
 @ServiceRegistry.register(
@@ -387,16 +550,27 @@ async def invalidate_search_cache(**kwargs) -> dict:
 )
 async def refresh_card_search_views(
     card_repository: CardReferenceRepository,
+    force_full: bool = False,
+    full_threshold: int = 10000,
     **kwargs,
 ) -> dict:
-    await card_repository.connection.execute("CALL card_catalog.refresh_card_search_views()")
-    logger.info("Refreshed card search materialized views")
-    return {"refreshed": True}
+    """Bring the card search tables up to date with the cards touched since the last refresh.
+
+    Only the dirty cards are recomputed unless more than `full_threshold` are
+    dirty or `force_full=True`, in which case the whole catalog is re-synced (still
+    rewriting only rows whose content changed).
+    """
+    result = await card_repository.refresh_search_tables(
+        full_threshold=full_threshold, force_full=force_full
+    )
+    logger.info("Refreshed card search tables", extra=result)
+    return {"refreshed": True, **result}
 
 
 @ServiceRegistry.register(
     "card_catalog.card.get",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def get(card_repository: CardReferenceRepository,
                card_id: UUID,
@@ -480,7 +654,8 @@ async def register_external_identifier(
 
 @ServiceRegistry.register(
     "card_catalog.card.get_versions_in_set",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def get_versions_in_set(
     card_repository: CardReferenceRepository,
@@ -493,7 +668,8 @@ async def get_versions_in_set(
 
 @ServiceRegistry.register(
     "card_catalog.card.get_other_sets",
-    db_repositories=["card"]
+    db_repositories=["card"],
+    read_only=True,
 )
 async def get_other_sets(
     card_repository: CardReferenceRepository,
@@ -517,6 +693,7 @@ async def process_large_cards_json(
     validate_file_first: bool = True,
     storage_service: StorageService = None,
     errors_storage_service: StorageService = None,
+    loader_mode: str = "jsonb",
 ) -> dict:
     """Process large JSON file with enhanced error handling and monitoring
     
@@ -525,8 +702,15 @@ async def process_large_cards_json(
         file_path: Path to JSON file (local or cloud)
         resume_from_batch: Batch number to resume from (for recovery)
         validate_file_first: Whether to validate JSON structure first
+        loader_mode: "jsonb" (per-batch insert_batch_card_versions) or
+            "copy" (binary COPY into stage tables, one set-based merge per file)
     """
-    service = EnhancedCardImportService(card_repository, storage_service=storage_service, errors_storage_service=errors_storage_service)
+    service = EnhancedCardImportService(
+        card_repository,
+        config=ProcessingConfig(loader_mode=loader_mode),
+        storage_service=storage_service,
+        errors_storage_service=errors_storage_service,
+    )
     if not file_name:
         logger.info("No bulk card changes — skipping processing", extra={"ingestion_run_id": ingestion_run_id})
         return {"status": "success"}
@@ -541,16 +725,32 @@ async def process_large_cards_json(
     return result.to_dict()
 
 
+class CardStreamSink(Protocol):
+    """Secondary consumer of the raw card objects parsed by EnhancedCardImportService.
+
+    ``route`` is called for every parsed card (before language filtering);
+    ``flush`` is awaited after each card batch has been written and once at
+    end of file.
+    """
+
+    def route(self, card_json: Dict[str, Any]) -> None: ...
+
+    async def flush(self) -> None: ...
+
+
 class EnhancedCardImportService:
     """Enhanced card import service with better error handling and monitoring"""
     
-    def __init__(self, card_repository: CardReferenceRepository, config: ProcessingConfig = None, storage_service: StorageService = None, errors_storage_service: StorageService = None):
+    def __init__(self, card_repository: CardReferenceRepository, config: ProcessingConfig = None, storage_service: StorageService = None, errors_storage_service: StorageService = None, sinks: Optional[List["CardStreamSink"]] = None):
         self.card_repository = card_repository
+        self.sinks: List[CardStreamSink] = list(sinks or [])
         self.config = config or ProcessingConfig()
         self.stats = ProcessingStats()
         self.failed_cards: List[Dict[str, Any]] = []
         self.storage_service = storage_service
         self.errors_storage_service = errors_storage_service
+        self.load_id: Optional[UUID] = None
+        self._staged_batches = 0
 
     async def process_large_cards_json(
         self, 
@@ -590,8 +790,9 @@ class EnhancedCardImportService:
             
         except Exception as e:
             self.stats.end_time = datetime.now(timezone.utc)
-            logger.error("Card file processing failed", extra={"file_path": file_name, "error": str(e)})
-            raise card_exception.CardInsertError(f"File processing failed: {str(e)}")
+            resume_at = resume_from_batch + self.stats.batches_processed
+            logger.error("Card file processing failed", extra={"file_path": file_name, "error": str(e), "resume_from_batch": resume_at})
+            raise card_exception.CardInsertError(f"File processing failed (resume_from_batch={resume_at}): {str(e)}")
 
     async def _validate_file(self, file_name: str) -> bool:
         """Validate file exists and is accessible"""
@@ -621,32 +822,40 @@ class EnhancedCardImportService:
                                    , resume_from_batch: int = 0
                                    , ops_repository: OpsRepository = None
                                    , ingestion_run_id: int = None ):
-        """Process file using streaming with enhanced error handling"""
+        """Process file using streaming with enhanced error handling.
+
+        JSON decoding runs in a background thread (``StorageService.iter_json_items``)
+        feeding a bounded queue, so ijson parses ahead while batches are being
+        written. Every parsed card is also handed to ``self.sinks`` (e.g. the
+        Scryfall price router); sinks are flushed after each card batch so the
+        rows they write can resolve against card versions that were just upserted.
+
+        In ``copy`` loader mode batches are only staged; they are merged every
+        ``copy_merge_every`` batches and at end of file, and sinks are flushed
+        after each merge instead. On failure the unmerged staged batches are
+        discarded, so a rerun must resume from the logged ``resume_from_batch``
+        (batches written so far), not from the batch that failed.
+        """
         batch = []
         batch_count = 0
+        if self._copy_mode:
+            self.load_id = uuid4()
+            self._staged_batches = 0
         
         try:
             logger.info("Opening file for streaming", extra={"file_path": file_name})
-            async with self.storage_service.open_stream(file_name, "rb") as f:
-                cards_iter = ijson.items(f, "item")
+            _IMPORT_LANGUAGES = {"en", "ja"}
 
-                _IMPORT_LANGUAGES = {"en", "ja"}
-
-                for card_json in cards_iter:
+            async for chunk in self.storage_service.iter_json_items(file_name, "item"):
+                for card_json in chunk:
                     try:
+                        for sink in self.sinks:
+                            sink.route(card_json)
+
                         # Skip non-EN/JA cards (all_cards dataset includes all languages)
                         if card_json.get("lang", "en") not in _IMPORT_LANGUAGES:
                             continue
 
-                        # Skip batches if resuming
-                        if batch_count < resume_from_batch:
-                            if len(batch) >= self.config.batch_size:
-                                batch = []
-                                batch_count += 1
-                                logger.info("Skipped batch — resuming", extra={"batch": batch_count, "resume_from": resume_from_batch})
-                
-                            continue
-                        
                         # Explode finishes so each finish variant (nonfoil / foil / etched)
                         # becomes its own card_version row.  Promo treatments (surgefoil,
                         # ripplefoil, etc.) are stored in promo_card via the stored
@@ -655,14 +864,26 @@ class EnhancedCardImportService:
                         if card:
                             for finish in (card.finishes or ["nonfoil"]):
                                 batch.append(card.model_copy(update={"finishes": [finish]}))
-                            self.stats.total_cards += 1
-                        
+                            if batch_count >= resume_from_batch:
+                                self.stats.total_cards += 1
+
+                        # Skip batches if resuming. They are built exactly as on the
+                        # original run so batch numbers line up.
+                        if batch_count < resume_from_batch:
+                            if len(batch) >= self.config.batch_size:
+                                batch = []
+                                batch_count += 1
+                                await self._flush_sinks()
+                                logger.info("Skipped batch — resuming", extra={"batch": batch_count, "resume_from": resume_from_batch})
+                            continue
+
                         # Process batch when full
                         if len(batch) >= self.config.batch_size:
 
                             await self._process_batch(batch, batch_count + 1, ops_repository=ops_repository, ingestion_run_id=ingestion_run_id)
                             batch = []
                             batch_count += 1
+                            await self._checkpoint()
                             await self._save_failed_cards()
                             # Progress callback,  test with one bacth
                             if self.config.progress_callback:
@@ -682,13 +903,77 @@ class EnhancedCardImportService:
                         if not self.config.skip_validation_errors:
                             raise
                 
-                # Process remaining cards
-                if batch:
-                    await self._process_batch(batch, batch_count + 1, ops_repository=ops_repository, ingestion_run_id=ingestion_run_id)
-                await self._save_failed_cards()    
+            # Process remaining cards
+            if batch:
+                await self._process_batch(batch, batch_count + 1, ops_repository=ops_repository, ingestion_run_id=ingestion_run_id)
+            await self._checkpoint(final=True)
+            await self._save_failed_cards()    
         except Exception as e:
-            logger.error("Stream processing error", extra={"error": str(e)})
+            logger.error("Stream processing error", extra={
+                "error": str(e),
+                "batches_processed": self.stats.batches_processed,
+                "resume_from_batch": resume_from_batch + self.stats.batches_processed,
+            })
             raise
+        finally:
+            if self._copy_mode and self._staged_batches:
+                await self._clear_stage()
+
+    @property
+    def _copy_mode(self) -> bool:
+        return self.config.loader_mode == "copy"
+
+    async def _flush_sinks(self):
+        """Flush every sink's pending rows (no-op when no sinks are attached)"""
+        for sink in self.sinks:
+            await sink.flush()
+
+    async def _checkpoint(self, final: bool = False):
+        """Make written batches visible, then flush sinks.
+
+        In copy mode staged batches are merged first — every ``copy_merge_every``
+        batches, or only at end of file when that is 0.
+        """
+        if self._copy_mode:
+            merge_every = self.config.copy_merge_every
+            if not final and (merge_every <= 0 or self._staged_batches < merge_every):
+                return
+            await self._merge_staged()
+        await self._flush_sinks()
+
+    async def _merge_staged(self):
+        """Merge the staged load and record one result per staged batch"""
+        if not self._staged_batches:
+            return
+        logger.info("Merging staged card batches", extra={"load_id": str(self.load_id), "batches": self._staged_batches})
+        results = await self.card_repository.merge_staged_cards(self.load_id)
+        for batch_number, result in results:
+            self._record_batch_result(batch_number, result)
+        await self._clear_stage()
+
+    async def _clear_stage(self):
+        try:
+            await self.card_repository.clear_card_stage(self.load_id)
+        except Exception as e:
+            logger.warning("Failed to clear card stage", extra={"load_id": str(self.load_id), "error": str(e)})
+        self._staged_batches = 0
+
+    def _record_batch_result(self, batch_number: int, result: CardReferenceRepository.BatchInsertResponse):
+        """Fold one batch's insert result into the running stats"""
+        self.stats.successful_inserts += result.successful_inserts
+        self.stats.failed_inserts += result.failed_inserts
+        self.stats.batches_processed += 1
+
+        logger.info("Batch completed", extra={"batch_number": batch_number, "inserted": result.successful_inserts, "total": result.total_processed})
+
+        # Log and queue any partial insert errors for error storage
+        if result.errors:
+            for error in result.errors[:3]:
+                logger.warning("Batch insert error", extra={"batch_number": batch_number, "error": error})
+            self.failed_cards.extend([
+                {"batch": batch_number, "error": err}
+                for err in result.errors
+            ])
 
     async def _process_batch(self, batch: List[card_schemas.CreateCard]
                              , batch_number: int
@@ -701,6 +986,16 @@ class EnhancedCardImportService:
             try:
                 logger.info("Processing batch", extra={"batch_number": batch_number, "size": len(batch), "attempt": retry_count + 1})
 
+                if self._copy_mode:
+                    if retry_count:
+                        # A failed attempt may have staged the card rows but not the faces.
+                        await self.card_repository.clear_card_stage(self.load_id, batch_number)
+                    await self.card_repository.stage_card_batch(
+                        self.load_id, batch_number, card_schemas.CreateCards(items=batch).model_dump_for_db()
+                    )
+                    self._staged_batches += 1
+                    return None
+
                 cards_obj = card_schemas.CreateCards(items=batch)
 
                 result = await self.card_repository.add_many(cards_obj.prepare_for_db())
@@ -720,22 +1015,7 @@ class EnhancedCardImportService:
                        batch_step.to_tuple()
                     )
                 '''
-                # Update statistics
-                self.stats.successful_inserts += result.successful_inserts
-                self.stats.failed_inserts += result.failed_inserts
-                self.stats.batches_processed += 1
-
-                logger.info("Batch completed", extra={"batch_number": batch_number, "inserted": result.successful_inserts, "total": len(batch)})
-
-                # Log and queue any partial insert errors for error storage
-                if result.errors:
-                    for error in result.errors[:3]:
-                        logger.warning("Batch insert error", extra={"batch_number": batch_number, "error": error})
-                    self.failed_cards.extend([
-                        {"batch": batch_number, "error": err}
-                        for err in result.errors
-                    ])
-                
+                self._record_batch_result(batch_number, result)
                 return result
                 
             except Exception as e:
@@ -3,19 +3,36 @@
 Mirrors the original `mtgstock_report.py` private helpers verbatim, then
 generalizes the kwargs injection so every runner can declare its own
 repository set without copy-pasting the dispatch loop.
+
+Two modes. By default metrics run one after another on the connection
+shared by the injected repositories. When the caller passes `connections`
+(see ServiceManager.connection_source), each metric runs on its own pooled
+connection, at most `concurrency` at a time, with the DB repositories
+rebound to that connection. Either way `metric_timeout` sets a per-metric
+statement_timeout (the connection's previous value is restored afterwards),
+and each row records `duration_ms` in its details.
 """
 from __future__ import annotations
 
+import asyncio
 import importlib
 import inspect
 import logging
-from typing import Any
+import time
+from typing import Any, AsyncContextManager, Callable, Optional
 
 from automana.core.metrics import MetricConfig, MetricRegistry, MetricResult, Severity
+from automana.core.repositories.abstract_repositories.AbstractDBRepository import AbstractRepository
 from automana.core.services.ops.integrity_checks import _build_report
 
 logger = logging.getLogger(__name__)
 
+# Defaults for the report services that opt into concurrent runs.
+DEFAULT_CONCURRENCY = 4
+DEFAULT_METRIC_TIMEOUT = 300.0  # seconds
+
+ConnectionSource = Callable[[], AsyncContextManager[Any]]
+
 
 def _normalize_names(metrics: str | list[str] | None) -> list[str] | None:
     """Accept either a comma-separated CLI string or a list; return list or None."""
@@ -53,6 +70,78 @@ def _result_to_row(config: MetricConfig, result: MetricResult) -> dict[str, Any]
     }
 
 
+def _error_row(config: MetricConfig, exc: BaseException) -> dict[str, Any]:
+    return {
+        "check_name": config.path,
+        "severity": Severity.ERROR.value,
+        "row_count": None,
+        "details": {
+            "exception": f"{type(exc).__name__}: {exc}",
+            "description": config.description,
+            "category": config.category,
+        },
+    }
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def _shared_connection(candidate_kwargs: dict[str, Any]) -> Any:
+    for val in candidate_kwargs.values():
+        if hasattr(val, "connection"):
+            return val.connection
+    return None
+
+
+def _rebind(value: Any, connection: Any) -> Any:
+    """Same repository class on ``connection``; non-repositories pass through."""
+    if isinstance(value, AbstractRepository):
+        return type(value)(connection, value.executor)
+    return value
+
+
+async def _run_one(
+    config: MetricConfig,
+    candidate_kwargs: dict[str, Any],
+    connection: Any,
+    metric_timeout: Optional[float],
+) -> dict[str, Any]:
+    """Run one metric and build its report row; a failure becomes an ERROR row."""
+    started = time.perf_counter()
+    previous_timeout: Optional[str] = None
+    try:
+        if connection is not None and metric_timeout:
+            # The shared connection may carry the ServiceManager's own
+            # statement_timeout; put that back rather than the server default.
+            previous_timeout = await connection.fetchval("SHOW statement_timeout")
+            await connection.execute(f"SET statement_timeout = {int(metric_timeout * 1000)}")
+        result = await _invoke_metric(config, candidate_kwargs)
+        row = _result_to_row(config, result)
+    except Exception as exc:  # noqa: BLE001 — one bad metric must not take the report down
+        logger.exception("metric_invocation_failed", extra={"metric": config.path})
+        # A timed-out or errored query can leave the PostgreSQL session in an
+        # aborted-transaction state (InFailedSQLTransactionError). In the
+        # sequential mode all repos share this connection, so one ROLLBACK
+        # clears it for the rest.
+        if connection is not None:
+            try:
+                await connection.execute("ROLLBACK")
+            except Exception:  # noqa: BLE001
+                pass
+        row = _error_row(config, exc)
+    finally:
+        if previous_timeout is not None:
+            try:
+                await connection.execute(
+                    "SELECT set_config('statement_timeout', $1, false)", previous_timeout
+                )
+            except Exception:  # noqa: BLE001
+                pass
+    row["details"]["duration_ms"] = _elapsed_ms(started)
+    return row
+
+
 async def run_metric_report(
     *,
     check_set: str,
@@ -61,6 +150,9 @@ async def run_metric_report(
     category: str | None,
     repositories: dict[str, Any],
     extra_kwargs: dict[str, Any] | None = None,
+    connections: ConnectionSource | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    metric_timeout: float | None = None,
 ) -> dict:
     """Run every metric matching prefix + filters and return the standard envelope.
 
@@ -68,6 +160,9 @@ async def run_metric_report(
     (e.g. {"price_repository": ..., "ops_repository": ...}). `extra_kwargs`
     folds in non-repository values like `ingestion_run_id`. Per metric, only
     the kwargs whose names match the function signature are passed.
+
+    With `connections`, metrics run concurrently (up to `concurrency`), each
+    on its own pooled connection; rows keep the registry's order.
     """
     names = _normalize_names(metrics)
     selected = MetricRegistry.select(names=names, category=category, prefix=prefix)
@@ -79,33 +174,26 @@ async def run_metric_report(
         )
 
     candidate_kwargs: dict[str, Any] = {**repositories, **(extra_kwargs or {})}
-    rows: list[dict[str, Any]] = []
-    for config in selected:
-        try:
-            result = await _invoke_metric(config, candidate_kwargs)
-        except Exception as exc:  # noqa: BLE001 — one bad metric must not take the report down
-            logger.exception("metric_invocation_failed", extra={"metric": config.path})
-            # A timed-out or errored query can leave the PostgreSQL session in an
-            # aborted-transaction state (InFailedSQLTransactionError).  All repos
-            # share a single connection, so one ROLLBACK clears it for the rest.
-            for val in candidate_kwargs.values():
-                if hasattr(val, "connection"):
-                    try:
-                        await val.connection.execute("ROLLBACK")
-                    except Exception:  # noqa: BLE001
-                        pass
-                    break
-            rows.append({
-                "check_name": config.path,
-                "severity": Severity.ERROR.value,
-                "row_count": None,
-                "details": {
-                    "exception": f"{type(exc).__name__}: {exc}",
-                    "description": config.description,
-                    "category": config.category,
-                },
-            })
-            continue
-        rows.append(_result_to_row(config, result))
 
+    if connections is None:
+        shared = _shared_connection(candidate_kwargs)
+        rows = [await _run_one(config, candidate_kwargs, shared, metric_timeout) for config in selected]
+        return _build_report(check_set, rows)
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _pooled(config: MetricConfig) -> dict[str, Any]:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                async with connections() as connection:
+                    scoped = {k: _rebind(v, connection) for k, v in candidate_kwargs.items()}
+                    return await _run_one(config, scoped, connection, metric_timeout)
+            except Exception as exc:  # noqa: BLE001 — e.g. pool exhausted / connection lost
+                logger.exception("metric_connection_failed", extra={"metric": config.path})
+                row = _error_row(config, exc)
+                row["details"]["duration_ms"] = _elapsed_ms(started)
+                return row
+
+    rows = list(await asyncio.gather(*(_pooled(config) for config in selected)))
     return _build_report(check_set, rows)
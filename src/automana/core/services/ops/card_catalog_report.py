@@ -7,7 +7,12 @@ import automana.core.metrics.card_catalog  # noqa: F401  — register card_catal
 from automana.core.repositories.card_catalog.card_repository import CardReferenceRepository
 from automana.core.repositories.ops.ops_repository import OpsRepository
 from automana.core.framework.registry import ServiceRegistry
-from automana.core.services.ops._metric_runner import run_metric_report
+from automana.core.framework.service_manager import ServiceManager
+from automana.core.services.ops._metric_runner import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_METRIC_TIMEOUT,
+    run_metric_report,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +27,17 @@ async def card_catalog_report(
     ops_repository: OpsRepository,
     metrics: str | list[str] | None = None,
     category: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    metric_timeout: float | None = DEFAULT_METRIC_TIMEOUT,
 ) -> dict:
     """Run the card_catalog sanity report.
 
     Args:
         metrics:  comma-separated string (CLI) or list of metric paths.
         category: filter by category — ``health``, ``volume``, ``timing``, ``status``.
+        concurrency: metrics run at once, each on its own pooled connection;
+            1 runs them in order on the service's connection.
+        metric_timeout: per-metric statement_timeout in seconds (None keeps the role's).
     """
     return await run_metric_report(
         check_set="card_catalog_report",
@@ -38,4 +48,7 @@ async def card_catalog_report(
             "card_repository": card_repository,
             "ops_repository": ops_repository,
         },
+        connections=ServiceManager.connection_source() if concurrency > 1 else None,
+        concurrency=concurrency,
+        metric_timeout=metric_timeout,
     )
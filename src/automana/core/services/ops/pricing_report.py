@@ -7,7 +7,12 @@ import automana.core.metrics.pricing  # noqa: F401  — register pricing.* metri
 from automana.core.repositories.app_integration.mtg_stock.price_repository import PriceRepository
 from automana.core.repositories.ops.ops_repository import OpsRepository
 from automana.core.framework.registry import ServiceRegistry
-from automana.core.services.ops._metric_runner import run_metric_report
+from automana.core.framework.service_manager import ServiceManager
+from automana.core.services.ops._metric_runner import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_METRIC_TIMEOUT,
+    run_metric_report,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +27,17 @@ async def pricing_report(
     ops_repository: OpsRepository,
     metrics: str | list[str] | None = None,
     category: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    metric_timeout: float | None = DEFAULT_METRIC_TIMEOUT,
 ) -> dict:
     """Run the pricing data-quality report.
 
     Args:
         metrics:  comma-separated string (CLI) or list of metric paths.
         category: filter by category — ``health``, ``volume``, ``timing``, ``status``.
+        concurrency: metrics run at once, each on its own pooled connection;
+            1 runs them in order on the service's connection.
+        metric_timeout: per-metric statement_timeout in seconds (None keeps the role's).
     """
     return await run_metric_report(
         check_set="pricing_report",
@@ -38,4 +48,7 @@ async def pricing_report(
             "price_repository": price_repository,
             "ops_repository": ops_repository,
         },
+        connections=ServiceManager.connection_source() if concurrency > 1 else None,
+        concurrency=concurrency,
+        metric_timeout=metric_timeout,
     )
@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 @ServiceRegistry.register(
     "pricing.card.get_prices",
     db_repositories=["pricing", "card"],
+    read_only=True,
 )
 async def get_card_prices(
     pricing_repository,
@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
     db_repositories=["pricing"],
     runs_in_transaction=False,
     command_timeout=14400,
+    pool="bulk",
 )
 async def refresh_daily_prices(
     pricing_repository: PricingTierRepository,
@@ -71,6 +72,7 @@ async def archive_to_weekly(
     # ~10k card versions) routinely exceeds the pool's 60s default. 3600s matches
     # the ceiling used by other daily aggregation services in this module.
     command_timeout=3600,
+    pool="bulk",
 )
 async def refresh_card_price_spark(
     pricing_repository: PricingTierRepository,
@@ -101,6 +101,7 @@ async def bootstrap_sealed_catalog_from_set(
     db_repositories=["sealed_pricing"],
     runs_in_transaction=False,
     command_timeout=14400,
+    pool="bulk",
 )
 async def promote_sealed_staging(
     sealed_pricing_repository: SealedPricingRepository,
@@ -134,6 +135,7 @@ async def cleanup_sealed_staging(
 @ServiceRegistry.register(
     "pricing.sealed.get_prices_by_set",
     db_repositories=["sealed_pricing"],
+    read_only=True,
 )
 async def get_sealed_prices_by_set(
     sealed_pricing_repository: SealedPricingRepository,
@@ -146,6 +148,7 @@ async def get_sealed_prices_by_set(
 @ServiceRegistry.register(
     "pricing.sealed.get_price_history",
     db_repositories=["sealed_pricing"],
+    read_only=True,
 )
 async def get_sealed_price_history(
     sealed_pricing_repository: SealedPricingRepository,
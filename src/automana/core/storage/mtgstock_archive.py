@@ -0,0 +1,467 @@
+"""Consolidated, columnar archive for MTGStock print data.
+
+Replaces the one-folder-per-print layout (``<root>/<print_id>/info.json`` +
+``prices.<market>.parquet``) with two hive-partitioned parquet datasets and a
+small JSON manifest under ``<root>/_archive``::
+
+    _archive/
+        manifest.json
+        prices/market=<market>/bucket=<n>/part-*.parquet
+        info/bucket=<n>/part-*.parquet
+
+``bucket`` is ``print_id // bucket_size``. A reader asking for a set of print
+IDs only opens the buckets that can hold them (partition pruning), and
+``print_id``/``date`` predicates are pushed down to parquet row-group stats.
+
+Writes only ever add part files. Re-fetching a print appends a newer copy and
+readers keep the latest ``fetched_at`` per key. A bucket is compacted back
+into one part once it collects ``max_parts_per_bucket`` parts. The manifest
+lists the print IDs present per market as ``[lo, hi]`` ranges, so "which IDs
+do we have" never touches the data files.
+
+A root that still holds legacy folders only switches to the archive once
+``migrate_legacy_folders`` has marked it ``complete``. Until then the manifest
+also records the migration's progress, so an interrupted run resumes instead
+of starting over, and readers keep using the legacy folders.
+"""
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIRNAME = "_archive"
+MANIFEST_NAME = "manifest.json"
+LEGACY_IDS_FILE = "existing_ids.json"
+
+PRICE_COLUMNS = ["price_low", "price_avg", "price_foil", "price_market", "price_market_foil"]
+INFO_COLUMNS = [
+    "card_name",
+    "set_abbr",
+    "collector_number",
+    "scryfall_id",
+    "tcg_id",
+    "cardtrader_id",
+    "multiverse_ids",
+]
+
+_FETCHED_AT = pa.timestamp("us", tz="UTC")
+PRICE_SCHEMA = pa.schema(
+    [("print_id", pa.int64()), ("date", pa.date32())]
+    + [(c, pa.float64()) for c in PRICE_COLUMNS]
+    + [("fetched_at", _FETCHED_AT)]
+)
+INFO_SCHEMA = pa.schema(
+    [("print_id", pa.int64())]
+    + [(c, pa.string()) for c in INFO_COLUMNS]
+    + [("fetched_at", _FETCHED_AT)]
+)
+
+
+def info_from_details(print_id: int, details: dict) -> dict:
+    """Flatten an MTGStock print-details payload into an info-table row."""
+    card_set = details.get("card_set") or {}
+
+    def _text(value: Any) -> str | None:
+        return None if value is None or value == "" else str(value)
+
+    multiverse = details.get("multiverse_ids")
+    return {
+        "print_id": int(print_id),
+        "card_name": _text(details.get("name")),
+        "set_abbr": _text(card_set.get("abbreviation")),
+        "collector_number": _text(details.get("collector_number")),
+        "scryfall_id": _text(details.get("scryfallId")),
+        "tcg_id": _text(details.get("tcg_id")),
+        "cardtrader_id": _text(details.get("cardtrader_id")),
+        "multiverse_ids": json.dumps(multiverse) if multiverse is not None else None,
+    }
+
+
+def _to_ranges(ids: Iterable[int]) -> list[list[int]]:
+    ranges: list[list[int]] = []
+    for i in sorted(set(ids)):
+        if ranges and i == ranges[-1][1] + 1:
+            ranges[-1][1] = i
+        else:
+            ranges.append([i, i])
+    return ranges
+
+
+def _from_ranges(ranges: Iterable[Iterable[int]]) -> set[int]:
+    ids: set[int] = set()
+    for lo, hi in ranges:
+        ids.update(range(lo, hi + 1))
+    return ids
+
+
+def _has_legacy_folders(root: Path) -> bool:
+    if (root / LEGACY_IDS_FILE).exists():
+        return True
+    if not root.exists():
+        return False
+    with os.scandir(root) as it:
+        return any(entry.name.isdigit() and entry.is_dir() for entry in it)
+
+
+def archive_enabled(root: str | Path) -> bool:
+    """Whether readers and writers should use the archive under ``root``.
+
+    True once the archive is complete (see ``MtgStockArchive.exists``), and for
+    a fresh root. A root that still holds un-migrated per-print folders keeps
+    the legacy layout until ``migrate_legacy_folders`` has finished, so a
+    partial migration never hides half the history.
+    """
+    root = Path(root)
+    return MtgStockArchive(root).exists() or not _has_legacy_folders(root)
+
+
+class MtgStockArchive:
+    """Append-only partitioned parquet store for MTGStock prices and print info."""
+
+    def __init__(self, root: str | Path, bucket_size: int = 1000, max_parts_per_bucket: int = 16):
+        self.root = Path(root)
+        self.path = self.root / ARCHIVE_DIRNAME
+        self.bucket_size = bucket_size
+        self.max_parts_per_bucket = max_parts_per_bucket
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.path / MANIFEST_NAME
+
+    def exists(self) -> bool:
+        """Whether the archive holds the full history and should be read.
+
+        A manifest alone is not enough: a migration writes it after its first
+        batch. The archive counts once the migration marked it ``complete``,
+        or when no legacy folders are left beside it (a fresh root).
+        """
+        if not self.manifest_path.exists():
+            return False
+        return bool(self.read_manifest().get("complete")) or not _has_legacy_folders(self.root)
+
+    def read_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {"version": 1, "bucket_size": self.bucket_size, "info": [], "prices": {}}
+        manifest = json.loads(self.manifest_path.read_text())
+        # The bucket layout on disk wins over the constructor default.
+        self.bucket_size = manifest.get("bucket_size", self.bucket_size)
+        return manifest
+
+    @contextmanager
+    def _locked_manifest(self) -> Iterator[dict]:
+        """Read-modify-write the manifest under an exclusive file lock."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / "manifest.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                manifest = self.read_manifest()
+                yield manifest
+                tmp = self.manifest_path.with_suffix(".json.tmp")
+                tmp.write_text(json.dumps(manifest))
+                os.replace(tmp, self.manifest_path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def print_ids(self, market: str | None = None) -> list[int]:
+        """Print IDs with price data for ``market``; all known IDs when None."""
+        manifest = self.read_manifest()
+        if market is not None:
+            return sorted(_from_ranges(manifest["prices"].get(market, [])))
+        ids = _from_ranges(manifest["info"])
+        for ranges in manifest["prices"].values():
+            ids |= _from_ranges(ranges)
+        return sorted(ids)
+
+    def markets(self) -> list[str]:
+        return sorted(self.read_manifest()["prices"])
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _prices_dir(self, market: str) -> Path:
+        return self.path / "prices" / f"market={market}"
+
+    def _info_dir(self) -> Path:
+        return self.path / "info"
+
+    def _append(
+        self,
+        dataset_dir: Path,
+        df: pd.DataFrame,
+        schema: pa.Schema,
+        fetched_at: datetime | None,
+        update_manifest: Callable[[dict, list[int]], None],
+        keys: list[str],
+    ) -> int:
+        if df.empty:
+            return 0
+        self.read_manifest()
+        df = df.copy()
+        if "fetched_at" not in df.columns:
+            df["fetched_at"] = pd.Timestamp(fetched_at or datetime.now(timezone.utc))
+        df["fetched_at"] = pd.to_datetime(df["fetched_at"], utc=True).dt.floor("us")
+        buckets = df["print_id"] // self.bucket_size
+        for bucket, part in df.groupby(buckets):
+            bucket_dir = dataset_dir / f"bucket={int(bucket)}"
+            bucket_dir.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(part[schema.names], schema=schema, preserve_index=False)
+            pq.write_table(table, bucket_dir / f"part-{uuid.uuid4().hex}.parquet")
+            if len(list(bucket_dir.glob("part-*.parquet"))) >= self.max_parts_per_bucket:
+                self._compact_bucket(bucket_dir, schema, keys)
+        with self._locked_manifest() as manifest:
+            update_manifest(manifest, df["print_id"].unique().tolist())
+        return len(df)
+
+    def append_prices(self, market: str, df: pd.DataFrame, fetched_at: datetime | None = None) -> int:
+        """Append price rows (``print_id``, ``date`` and the price columns) for one market."""
+        def _update(manifest: dict, ids: list[int]) -> None:
+            known = _from_ranges(manifest["prices"].get(market, []))
+            manifest["prices"][market] = _to_ranges(known | set(ids))
+
+        return self._append(
+            self._prices_dir(market), df, PRICE_SCHEMA, fetched_at, _update, ["print_id", "date"]
+        )
+
+    def append_info(self, rows: list[dict], fetched_at: datetime | None = None) -> int:
+        """Append print-info rows shaped like ``info_from_details`` output.
+
+        A row may carry its own ``fetched_at``; otherwise ``fetched_at`` or now is used.
+        """
+        def _update(manifest: dict, ids: list[int]) -> None:
+            manifest["info"] = _to_ranges(_from_ranges(manifest["info"]) | set(ids))
+
+        columns = ["print_id", *INFO_COLUMNS]
+        if rows and "fetched_at" in rows[0]:
+            columns.append("fetched_at")
+        df = pd.DataFrame(rows, columns=columns)
+        return self._append(self._info_dir(), df, INFO_SCHEMA, fetched_at, _update, ["print_id"])
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _read(
+        self,
+        dataset_dir: Path,
+        schema: pa.Schema,
+        keys: list[str],
+        print_ids: Iterable[int] | None,
+        extra_filter: ds.Expression | None = None,
+    ) -> pd.DataFrame:
+        self.read_manifest()
+        if not dataset_dir.exists():
+            return pd.DataFrame(columns=[n for n in schema.names if n != "fetched_at"])
+        dataset = ds.dataset(
+            dataset_dir,
+            schema=schema.append(pa.field("bucket", pa.int32())),
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([("bucket", pa.int32())]), flavor="hive"),
+        )
+        predicate = extra_filter
+        if print_ids is not None:
+            ids = sorted(set(int(i) for i in print_ids))
+            if not ids:
+                return pd.DataFrame(columns=[n for n in schema.names if n != "fetched_at"])
+            buckets = sorted({i // self.bucket_size for i in ids})
+            by_id = ds.field("bucket").isin(buckets) & ds.field("print_id").isin(ids)
+            predicate = by_id if predicate is None else predicate & by_id
+        table = dataset.to_table(columns=schema.names, filter=predicate)
+        df = table.to_pandas(date_as_object=False)
+        if df.empty:
+            return df.drop(columns=["fetched_at"])
+        df = df.sort_values("fetched_at", kind="stable").drop_duplicates(keys, keep="last")
+        return df.drop(columns=["fetched_at"]).sort_values(keys).reset_index(drop=True)
+
+    def read_prices(
+        self,
+        market: str,
+        print_ids: Iterable[int] | None = None,
+        since: date | None = None,
+    ) -> pd.DataFrame:
+        """Latest price rows for ``market``, optionally limited to ``print_ids`` and ``date > since``."""
+        extra = None
+        if since is not None:
+            extra = ds.field("date") > pa.scalar(since, type=pa.date32())
+        return self._read(self._prices_dir(market), PRICE_SCHEMA, ["print_id", "date"], print_ids, extra)
+
+    def read_info(self, print_ids: Iterable[int] | None = None) -> pd.DataFrame:
+        """Latest info row per print; missing fields come back as None."""
+        df = self._read(self._info_dir(), INFO_SCHEMA, ["print_id"], print_ids)
+        for col in INFO_COLUMNS:
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+        return df
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _compact_bucket(bucket_dir: Path, schema: pa.Schema, keys: list[str]) -> None:
+        parts = sorted(bucket_dir.glob("part-*.parquet"))
+        if len(parts) <= 1:
+            return
+        table = pa.concat_tables(pq.read_table(p, schema=schema) for p in parts)
+        df = table.to_pandas(date_as_object=False)
+        df = df.sort_values("fetched_at", kind="stable").drop_duplicates(keys, keep="last")
+        df = df.sort_values(keys)
+        # Write the merged part before dropping the old ones: a concurrent
+        # reader sees duplicates for a moment (deduped on read), never a gap.
+        pq.write_table(
+            pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+            bucket_dir / f"part-{uuid.uuid4().hex}.parquet",
+        )
+        for p in parts:
+            p.unlink()
+
+    def compact(self) -> int:
+        """Merge every multi-part bucket into one part. Returns buckets compacted."""
+        self.read_manifest()
+        compacted = 0
+        targets = [(self._info_dir(), INFO_SCHEMA, ["print_id"])]
+        targets += [
+            (self._prices_dir(m), PRICE_SCHEMA, ["print_id", "date"]) for m in self.markets()
+        ]
+        for dataset_dir, schema, keys in targets:
+            if not dataset_dir.exists():
+                continue
+            for bucket_dir in sorted(dataset_dir.glob("bucket=*")):
+                if len(list(bucket_dir.glob("part-*.parquet"))) > 1:
+                    self._compact_bucket(bucket_dir, schema, keys)
+                    compacted += 1
+        return compacted
+
+
+def _latest_mtime(pdir: Path) -> float:
+    return max((p.stat().st_mtime for p in pdir.iterdir()), default=0.0)
+
+
+def _read_legacy_folder(pdir: Path, print_id: int) -> tuple[dict | None, dict[str, pd.DataFrame]]:
+    """Info row and per-market price frames of one legacy folder; raises on a bad file."""
+    info_row = None
+    info_path = pdir / "info.json"
+    if info_path.exists():
+        info_row = info_from_details(print_id, json.loads(info_path.read_text()))
+        info_row["fetched_at"] = pd.Timestamp(info_path.stat().st_mtime, unit="s", tz="UTC")
+    frames: dict[str, pd.DataFrame] = {}
+    for price_path in pdir.glob("prices.*.parquet"):
+        market = price_path.name.split(".")[1]
+        df = pd.read_parquet(price_path)
+        df["print_id"] = print_id
+        df["date"] = pd.to_datetime(df["date"]).dt.date
+        for col in PRICE_COLUMNS:
+            if col not in df.columns:
+                df[col] = None
+        df["fetched_at"] = pd.Timestamp(price_path.stat().st_mtime, unit="s", tz="UTC")
+        frames[market] = df
+    return info_row, frames
+
+
+def migrate_legacy_folders(
+    root: str | Path,
+    batch_size: int = 2000,
+    remove_legacy: bool = False,
+) -> dict:
+    """Convert ``<root>/<print_id>/`` folders into the archive, resumably.
+
+    Every ``prices.<market>.parquet`` goes to that market's dataset and every
+    ``info.json`` to the info table. The legacy files' mtimes become
+    ``fetched_at``, so anything the archive already holds from newer fetches
+    still wins.
+
+    Progress is checkpointed in the manifest after each batch: a re-run skips
+    folders already migrated unless the legacy loader has rewritten them since.
+    The archive is marked ``complete`` (and only then read and written by the
+    loaders) when a run finishes with no folder errors. A folder that failed
+    stays on disk for the next run; with ``remove_legacy`` only migrated,
+    unchanged folders are deleted, after their batch has been written.
+    """
+    root = Path(root)
+    archive = MtgStockArchive(root)
+    with os.scandir(root) as it:
+        folders = sorted(int(e.name) for e in it if e.name.isdigit() and e.is_dir())
+
+    with archive._locked_manifest() as manifest:
+        state = manifest.setdefault("migration", {"started_at": time.time(), "done": []})
+    started_at = state["started_at"]
+    done = _from_ranges(state["done"])
+
+    stats = {"prints": 0, "skipped": 0, "price_rows": 0, "info_rows": 0, "errors": 0, "removed": 0}
+    for start in range(0, len(folders), batch_size):
+        batch = folders[start:start + batch_size]
+        info_rows: list[dict] = []
+        price_frames: dict[str, list[pd.DataFrame]] = {}
+        # print_id -> newest file mtime when read; removal re-checks it.
+        migrated: dict[int, float] = {}
+        for print_id in batch:
+            pdir = root / str(print_id)
+            try:
+                mtime = _latest_mtime(pdir)
+                if print_id in done and mtime <= started_at:
+                    stats["skipped"] += 1
+                    migrated[print_id] = mtime
+                    continue
+                info_row, frames = _read_legacy_folder(pdir, print_id)
+            except Exception as exc:
+                stats["errors"] += 1
+                logger.warning(
+                    "mtgstock_archive_migrate_folder_failed",
+                    extra={"print_id": print_id, "error": str(exc)},
+                )
+                continue
+            if info_row is not None:
+                info_rows.append(info_row)
+            for market, df in frames.items():
+                price_frames.setdefault(market, []).append(df)
+            migrated[print_id] = mtime
+            stats["prints"] += 1
+
+        stats["info_rows"] += archive.append_info(info_rows)
+        for market, frames in price_frames.items():
+            stats["price_rows"] += archive.append_prices(market, pd.concat(frames, ignore_index=True))
+        with archive._locked_manifest() as manifest:
+            progress = manifest.setdefault("migration", {"started_at": started_at, "done": []})
+            progress["done"] = _to_ranges(_from_ranges(progress["done"]) | set(migrated))
+
+        if remove_legacy:
+            for print_id, mtime in migrated.items():
+                pdir = root / str(print_id)
+                # A folder the legacy loader rewrote after we read it is kept
+                # so the next run picks the new data up.
+                if _latest_mtime(pdir) == mtime:
+                    shutil.rmtree(pdir, ignore_errors=True)
+                    stats["removed"] += 1
+        logger.info(
+            "mtgstock_archive_migrate_batch",
+            extra={"batch_start": batch[0], "batch_end": batch[-1], **stats},
+        )
+
+    stats["complete"] = stats["errors"] == 0
+    with archive._locked_manifest() as manifest:
+        if stats["complete"]:
+            manifest["complete"] = True
+            manifest.pop("migration", None)
+    if not stats["complete"]:
+        logger.warning("mtgstock_archive_migration_incomplete", extra=stats)
+    stats["buckets_compacted"] = archive.compact()
+    return stats
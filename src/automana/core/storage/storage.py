@@ -229,6 +229,9 @@ class StorageService:
     async def list_directory(self, pattern: str = "*") -> list[str]:
         return await self.backend.list_files("", pattern)
 
+    async def list_files(self, directory: str, pattern: str = "*") -> list[str]:
+        return await self.backend.list_files(directory, pattern)
+
     async def get_file_size(self, filename: str) -> int:
         return await self.backend.get_file_size(filename)
 
@@ -301,6 +304,161 @@ class StorageService:
         finally:
             thread.join(timeout=5)
 
+    async def iter_xz_json_kvitem_chunks(
+        self,
+        absolute_path: str,
+        prefix: str,
+        chunk_size: int = 256,
+        queue_maxsize: int = 8,
+    ) -> AsyncIterator[list[tuple[str, Any]]]:
+        """Stream lists of ``(key, value)`` pairs from a JSON map inside an ``.xz`` file.
+
+        Chunked sibling of ``iter_xz_json_kvitems``: one executor hop per
+        ``chunk_size`` entries instead of per entry, and each chunk is a
+        ready-made unit of work to hand to a process pool. Memory stays bounded
+        by ``queue_maxsize`` × ``chunk_size`` values.
+
+        Parameters
+        ----------
+        absolute_path:
+            Resolved path to the ``.xz`` file on disk.
+        prefix:
+            ijson key-path to the target map (e.g. ``"data"``).
+        chunk_size:
+            Maximum number of pairs per yielded list.
+        queue_maxsize:
+            Upper bound on how many chunks may sit in the bridge queue before
+            the producer thread blocks (backpressure).
+        """
+        sentinel: object = object()
+        bridge: _queue.Queue = _queue.Queue(maxsize=queue_maxsize)
+        stop = threading.Event()
+        err: list[Exception | None] = [None]
+
+        def _put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    bridge.put(item, timeout=0.5)
+                    return True
+                except _queue.Full:
+                    continue
+            return False
+
+        def _producer() -> None:
+            try:
+                with lzma.open(absolute_path, "rb") as fh:
+                    chunk: list[tuple[str, Any]] = []
+                    for kv in ijson.kvitems(fh, prefix):
+                        chunk.append(kv)
+                        if len(chunk) >= chunk_size:
+                            if not _put(chunk):
+                                return
+                            chunk = []
+                    if chunk:
+                        _put(chunk)
+            except Exception as exc:
+                err[0] = exc
+            finally:
+                _put(sentinel)
+
+        thread = threading.Thread(
+            target=_producer, name="storage-xz-json-kvitem-chunks", daemon=True
+        )
+        thread.start()
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                item = await loop.run_in_executor(None, bridge.get)
+                if item is sentinel:
+                    break
+                yield item
+            if err[0] is not None:
+                raise err[0]
+        finally:
+            stop.set()
+            thread.join(timeout=5)
+
+    async def iter_json_items(
+        self,
+        filename: str,
+        prefix: str = "item",
+        chunk_size: int = 256,
+        queue_maxsize: int = 8,
+    ) -> AsyncIterator[list[Any]]:
+        """Stream chunks of items parsed from a JSON array in a background thread.
+
+        Same producer/bridge design as ``iter_xz_json_kvitems``, but for plain
+        (uncompressed) files resolved through the backend and yielding lists of
+        up to ``chunk_size`` items. Chunking keeps the per-item executor hop off
+        the hot path; the bounded bridge lets ijson decode the next chunks while
+        the consumer is awaiting the database.
+
+        Parameters
+        ----------
+        filename:
+            Path relative to the storage root (e.g. ``"cards_20260101.json"``).
+        prefix:
+            ijson item prefix. ``"item"`` for a top-level array such as the
+            Scryfall card bulk files.
+        chunk_size:
+            Maximum number of items per yielded list.
+        queue_maxsize:
+            Upper bound on how many chunks may sit in the bridge queue before
+            the producer thread blocks (backpressure).
+        """
+        full_path = self.backend.resolve_path(filename)
+        sentinel: object = object()
+        bridge: _queue.Queue = _queue.Queue(maxsize=queue_maxsize)
+        stop = threading.Event()
+        err: list[Exception | None] = [None]
+
+        def _put(item: Any) -> bool:
+            # Poll so a consumer that bailed out early (exception, cancel) can
+            # release the producer instead of leaving it parked on a full queue.
+            while not stop.is_set():
+                try:
+                    bridge.put(item, timeout=0.5)
+                    return True
+                except _queue.Full:
+                    continue
+            return False
+
+        def _producer() -> None:
+            try:
+                with open(full_path, "rb") as fh:
+                    chunk: list[Any] = []
+                    for item in ijson.items(fh, prefix):
+                        chunk.append(item)
+                        if len(chunk) >= chunk_size:
+                            if not _put(chunk):
+                                return
+                            chunk = []
+                    if chunk:
+                        _put(chunk)
+            except Exception as exc:
+                err[0] = exc
+            finally:
+                _put(sentinel)
+
+        thread = threading.Thread(
+            target=_producer, name="storage-json-items", daemon=True
+        )
+        thread.start()
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                item = await loop.run_in_executor(None, bridge.get)
+                if item is sentinel:
+                    break
+                yield item
+            if err[0] is not None:
+                raise err[0]
+        finally:
+            stop.set()
+            thread.join(timeout=5)
+
 
 def get_storage_service(base_path: str = "storage") -> StorageService:
     return StorageService(LocalStorageBackend(base_path=base_path))
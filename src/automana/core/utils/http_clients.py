@@ -0,0 +1,111 @@
+"""Process-wide registry of pooled ``httpx.AsyncClient`` instances.
+
+API repositories are built per service call (see ServiceManager), so a
+client owned by the repository instance died with it and every outbound
+call paid DNS + TCP + TLS again. Clients here are keyed by
+(base_url, http2, limits) and live until ``close_http_clients()`` runs at
+API / worker shutdown, so connections are kept alive across calls.
+
+An AsyncClient's pool is bound to the event loop it was first used on. A
+client requested from a different loop (e.g. a CLI ``asyncio.run``) is
+replaced rather than shared, and the old one is closed on its own loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+from automana.core.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_LimitsKey = tuple[Optional[int], Optional[int], Optional[float]]
+
+_clients: dict[tuple[str, bool, _LimitsKey], tuple[Optional[asyncio.AbstractEventLoop], httpx.AsyncClient]] = {}
+
+
+def default_limits() -> httpx.Limits:
+    """Connection limits from settings (HTTP_MAX_CONNECTIONS etc.)."""
+    settings = get_settings()
+    return httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _close_on_owner(owner: Optional[asyncio.AbstractEventLoop], client: httpx.AsyncClient) -> None:
+    """Close a client that belongs to another event loop.
+
+    ``aclose`` is queued on the owning loop, which runs it the next time it
+    runs. A closed loop cannot close its connections any more; the client is
+    then only dropped, and its sockets close when it is garbage collected.
+    """
+    if client.is_closed or owner is None or owner.is_closed():
+        return
+    future = asyncio.run_coroutine_threadsafe(client.aclose(), owner)
+    future.add_done_callback(_log_close_failure)
+
+
+def _log_close_failure(future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("http_client_close_failed", exc_info=future.exception())
+
+
+def get_http_client(
+    base_url: str,
+    *,
+    http2: bool = True,
+    limits: Optional[httpx.Limits] = None,
+    timeout: float = 30.0,
+) -> httpx.AsyncClient:
+    """Shared client for ``base_url``; created on first use.
+
+    ``timeout`` only seeds a new client: callers pass per-request timeouts.
+    """
+    limits = limits or default_limits()
+    key = (
+        base_url,
+        http2,
+        (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry),
+    )
+    loop = _current_loop()
+    entry = _clients.get(key)
+    if entry is not None:
+        owner, client = entry
+        if not client.is_closed and (owner is None or owner is loop):
+            if owner is None and loop is not None:
+                _clients[key] = (loop, client)
+            return client
+        _close_on_owner(owner, client)
+
+    client = httpx.AsyncClient(http2=http2, timeout=timeout, limits=limits)
+    _clients[key] = (loop, client)
+    logger.info("http_client_created", extra={"base_url": base_url, "http2": http2})
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client; those of other loops are closed on their own loop."""
+    loop = _current_loop()
+    entries = list(_clients.values())
+    _clients.clear()
+    for owner, client in entries:
+        if owner is not None and owner is not loop:
+            # Closing from here would fail: the pool belongs to that loop.
+            _close_on_owner(owner, client)
+            continue
+        try:
+            await client.aclose()
+        except Exception:
+            logger.exception("http_client_close_failed")
@@ -1,5 +1,10 @@
+import asyncio
+import fnmatch
 import logging
-from typing import Any, Optional
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import orjson
 from redis.asyncio import Redis
@@ -9,6 +14,12 @@ from automana.core.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Patterns passed to invalidate_cache_pattern are published here so every
+# process drops matching L1 entries, not just the one that invalidated.
+INVALIDATION_CHANNEL = "cache:invalidate"
+
 _redis_client: Optional[Redis] = None
 
 
@@ -21,16 +32,93 @@ async def get_redis_client() -> Redis:
     return _redis_client
 
 
+class L1Cache:
+    """Bounded per-process LRU of serialized cache values with a short TTL.
+
+    Values are kept as the orjson bytes stored in Redis, so a hit costs one
+    `orjson.loads` and callers can never mutate a shared object. `epoch` is
+    bumped on every invalidation; a Redis read that started before an
+    invalidation must not repopulate L1 with what it fetched.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.epoch = 0
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None, epoch: Optional[int] = None) -> None:
+        if self.max_entries <= 0 or (epoch is not None and epoch != self.epoch):
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        self.epoch += 1
+        doomed = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+        for k in doomed:
+            del self._entries[k]
+        return len(doomed)
+
+    def clear(self) -> None:
+        self.epoch += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_l1: Optional[L1Cache] = None
+
+
+def get_l1_cache() -> L1Cache:
+    global _l1
+    if _l1 is None:
+        settings = get_settings()
+        _l1 = L1Cache(settings.cache_l1_max_entries, settings.cache_l1_ttl_seconds)
+    return _l1
+
+
+def disable_l1_cache() -> None:
+    """Turn off L1 (and the cached namespace generations) in this process.
+
+    For processes that cannot keep listen_for_invalidations() running, such as
+    Celery workers, whose event loop only runs while a task does.
+    """
+    global _l1
+    _l1 = L1Cache(0, get_settings().cache_l1_ttl_seconds)
+    _generations.clear()
+
+
 async def get_from_cache(cache_key: str) -> Optional[Any]:
     """
-    Retrieve value from cache. Returns None on cache miss or error.
+    Retrieve value from cache (L1, then Redis). Returns None on cache miss or error.
     Errors are logged but not raised (graceful degradation).
     """
+    l1 = get_l1_cache()
     try:
-        redis_client = await get_redis_client()
-        cached_bytes = await redis_client.get(cache_key)
+        cached_bytes = l1.get(cache_key)
         if cached_bytes is None:
-            return None
+            epoch = l1.epoch
+            redis_client = await get_redis_client()
+            cached_bytes = await redis_client.get(cache_key)
+            if cached_bytes is None:
+                return None
+            l1.set(cache_key, cached_bytes, epoch=epoch)
         return orjson.loads(cached_bytes)
     except RedisError as e:
         logger.warning("cache_read_error", extra={"cache_key": cache_key, "error": str(e)})
@@ -40,15 +128,23 @@ async def get_from_cache(cache_key: str) -> Optional[Any]:
         return None
 
 
-async def set_to_cache(cache_key: str, value: Any, expiry_seconds: int = 3600) -> bool:
+async def set_to_cache(cache_key: str, value: Any, expiry_seconds: int = 3600, epoch: Optional[int] = None) -> bool:
     """
-    Store value in cache with TTL. Returns True on success, False on error.
-    Errors are logged but not raised (no-op on failure).
+    Store value in cache with TTL (Redis, plus L1 capped at its own TTL).
+    Returns True on success, False on error. Errors are logged but not raised (no-op on failure).
+
+    `epoch` is `get_l1_cache().epoch` read before `value` was computed; if an
+    invalidation arrived since, the value is possibly stale and is kept out of
+    L1. Without it only invalidations during the Redis write are caught.
     """
+    l1 = get_l1_cache()
+    if epoch is None:
+        epoch = l1.epoch
     try:
         redis_client = await get_redis_client()
         serialized = orjson.dumps(value)
         await redis_client.setex(cache_key, expiry_seconds, serialized)
+        l1.set(cache_key, serialized, ttl_seconds=expiry_seconds, epoch=epoch)
         return True
     except RedisError as e:
         logger.warning("cache_write_error", extra={"cache_key": cache_key, "error": str(e)})
@@ -58,19 +154,245 @@ async def set_to_cache(cache_key: str, value: Any, expiry_seconds: int = 3600) -
         return False
 
 
+async def delete_from_cache(cache_key: str) -> bool:
+    """
+    Delete a single key from both tiers and every process's L1.
+    Returns True if the key existed in Redis.
+    """
+    get_l1_cache().invalidate_pattern(cache_key)
+    try:
+        redis_client = await get_redis_client()
+        deleted = await redis_client.delete(cache_key)
+        await redis_client.publish(INVALIDATION_CHANNEL, cache_key)
+        return bool(deleted)
+    except RedisError as e:
+        logger.warning("cache_delete_error", extra={"cache_key": cache_key, "error": str(e)})
+        return False
+
+
 async def invalidate_cache_pattern(pattern: str) -> int:
     """
     Delete all keys matching pattern. Returns count of deleted keys.
     Used for cache invalidation (e.g., "card_search:*").
+
+    Clears this process's L1 immediately and publishes the pattern on
+    INVALIDATION_CHANNEL so every other process clears its L1 too.
     """
+    get_l1_cache().invalidate_pattern(pattern)
     try:
         redis_client = await get_redis_client()
-        cursor = 0
         deleted_count = 0
         async for key in redis_client.scan_iter(match=pattern):
             await redis_client.delete(key)
             deleted_count += 1
+        await redis_client.publish(INVALIDATION_CHANNEL, pattern)
         return deleted_count
     except RedisError as e:
         logger.warning("cache_invalidation_error", extra={"pattern": pattern, "error": str(e)})
         return 0
+
+
+# ---------------------------------------------------------------------------
+# Generation-versioned namespaces
+# ---------------------------------------------------------------------------
+#
+# Keys built with namespaced_key() embed the namespace's current generation
+# ("card_search:g7:page:<hash>"). invalidate_namespace() bumps the generation
+# with a single INCR, so every older key becomes unreachable at once and ages
+# out through its TTL; unlink_stale_generations() can reclaim them early.
+
+# Process-local copy of each namespace's generation: namespace -> (expires_at, gen)
+_generations: dict[str, tuple[float, int]] = {}
+
+
+def _generation_key(namespace: str) -> str:
+    return f"cache_gen:{namespace}"
+
+
+def _forget_generations(pattern: str) -> None:
+    for namespace in [ns for ns in _generations if fnmatch.fnmatchcase(f"{ns}:", pattern)]:
+        del _generations[namespace]
+
+
+async def get_namespace_generation(namespace: str) -> int:
+    """Current generation of `namespace` (0 if never invalidated).
+
+    Cached in-process for CACHE_L1_TTL_SECONDS; invalidations published by
+    other processes drop the cached value immediately.
+    """
+    cached = _generations.get(namespace)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    l1 = get_l1_cache()
+    epoch = l1.epoch
+    try:
+        redis_client = await get_redis_client()
+        raw = await redis_client.get(_generation_key(namespace))
+    except RedisError as e:
+        logger.warning("cache_generation_read_error", extra={"namespace": namespace, "error": str(e)})
+        return cached[1] if cached is not None else 0
+    generation = int(raw) if raw else 0
+    if epoch == l1.epoch and l1.max_entries > 0:
+        _generations[namespace] = (time.monotonic() + l1.ttl_seconds, generation)
+    return generation
+
+
+async def namespaced_key(namespace: str, key: str) -> str:
+    """Build a cache key scoped to the current generation of `namespace`."""
+    generation = await get_namespace_generation(namespace)
+    return f"{namespace}:g{generation}:{key}"
+
+
+async def invalidate_namespace(namespace: str) -> int:
+    """
+    Invalidate every key built with namespaced_key(namespace, ...) in O(1).
+    Returns the new generation, or 0 if Redis is unavailable.
+    """
+    pattern = f"{namespace}:*"
+    get_l1_cache().invalidate_pattern(pattern)
+    _generations.pop(namespace, None)
+    try:
+        redis_client = await get_redis_client()
+        generation = await redis_client.incr(_generation_key(namespace))
+        await redis_client.publish(INVALIDATION_CHANNEL, pattern)
+        return generation
+    except RedisError as e:
+        logger.warning("cache_invalidation_error", extra={"namespace": namespace, "error": str(e)})
+        return 0
+
+
+async def unlink_stale_generations(namespace: str, batch_size: int = 500) -> int:
+    """
+    UNLINK keys of `namespace` left behind by earlier generations.
+    Optional: stale keys also expire through their own TTL. Returns the count unlinked.
+    """
+    try:
+        redis_client = await get_redis_client()
+        raw = await redis_client.get(_generation_key(namespace))
+        current = f"{namespace}:g{int(raw) if raw else 0}:".encode()
+        unlinked = 0
+        batch = []
+        async for key in redis_client.scan_iter(match=f"{namespace}:g*", count=batch_size):
+            if isinstance(key, str):
+                key = key.encode()
+            if key.startswith(current):
+                continue
+            batch.append(key)
+            if len(batch) >= batch_size:
+                unlinked += await redis_client.unlink(*batch)
+                batch = []
+        if batch:
+            unlinked += await redis_client.unlink(*batch)
+        return unlinked
+    except RedisError as e:
+        logger.warning("cache_unlink_error", extra={"namespace": namespace, "error": str(e)})
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Single-flight
+# ---------------------------------------------------------------------------
+
+_inflight: dict[str, asyncio.Event] = {}
+
+_LOCK_POLL_SECONDS = 0.05
+
+
+async def _run_single_flight(cache_key: str, load: Callable[[], Awaitable[T]], lock_ttl_seconds: float) -> T:
+    token = uuid.uuid4().hex
+    lock_key = f"lock:{cache_key}"
+    redis_client = None
+    acquired = False
+    try:
+        redis_client = await get_redis_client()
+        acquired = bool(await redis_client.set(lock_key, token, nx=True, px=int(lock_ttl_seconds * 1000)))
+        if not acquired:
+            # Another process is computing this key; wait for it (bounded by the
+            # lock TTL) so `load` finds its result in the cache.
+            deadline = time.monotonic() + lock_ttl_seconds
+            while time.monotonic() < deadline and await redis_client.exists(lock_key):
+                await asyncio.sleep(_LOCK_POLL_SECONDS)
+    except RedisError as e:
+        logger.warning("cache_lock_error", extra={"cache_key": cache_key, "error": str(e)})
+    try:
+        return await load()
+    finally:
+        if acquired:
+            try:
+                if await redis_client.get(lock_key) == token.encode():
+                    await redis_client.delete(lock_key)
+            except RedisError as e:
+                logger.warning("cache_lock_error", extra={"cache_key": cache_key, "error": str(e)})
+
+
+async def single_flight(cache_key: str, load: Callable[[], Awaitable[T]], lock_ttl_seconds: float = 10.0) -> T:
+    """Coalesce concurrent cache misses for `cache_key` into one computation.
+
+    Only the wait is shared, never the work: one caller per process takes a
+    short Redis lock (`lock:{cache_key}`) and runs its `load`; every other
+    caller, in this process or another, waits for it to finish (bounded by the
+    lock TTL) and then runs its *own* `load`. `load` must be cache-aside —
+    check the cache first, compute and store on a miss — so those callers are
+    served from the cache. Each `load` therefore only ever touches its own
+    caller's connection, and a cancelled caller takes nobody else's work down
+    with it.
+    """
+    running = _inflight.get(cache_key)
+    if running is not None:
+        try:
+            await asyncio.wait_for(running.wait(), lock_ttl_seconds)
+        except asyncio.TimeoutError:
+            pass
+        return await load()
+
+    done = asyncio.Event()
+    _inflight[cache_key] = done
+    try:
+        return await _run_single_flight(cache_key, load, lock_ttl_seconds)
+    finally:
+        done.set()
+        if _inflight.get(cache_key) is done:
+            del _inflight[cache_key]
+
+
+# ---------------------------------------------------------------------------
+# Invalidation fan-out
+# ---------------------------------------------------------------------------
+
+async def listen_for_invalidations(reconnect_delay: float = 1.0) -> None:
+    """Clear matching L1 entries for every pattern published on INVALIDATION_CHANNEL.
+
+    Runs until cancelled. L1 is cleared whenever the subscription is
+    (re)established, since invalidations may have been missed while it was down.
+    """
+    while True:
+        pubsub = None
+        try:
+            redis_client = await get_redis_client()
+            pubsub = redis_client.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            get_l1_cache().clear()
+            _generations.clear()
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                pattern = message["data"]
+                if isinstance(pattern, bytes):
+                    pattern = pattern.decode()
+                get_l1_cache().invalidate_pattern(pattern)
+                _forget_generations(pattern)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("cache_invalidation_listener_error", extra={"error": str(e)})
+            await asyncio.sleep(reconnect_delay)
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+def start_invalidation_listener() -> "asyncio.Task[None]":
+    return asyncio.create_task(listen_for_invalidations(), name="cache-invalidation-listener")
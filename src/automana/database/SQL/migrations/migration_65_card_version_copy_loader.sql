@@ -0,0 +1,667 @@
+-- migration_65_card_version_copy_loader.sql
+--
+-- COPY-based loader for the Scryfall card catalog.
+--
+-- `CardReferenceRepository.add_many` serialises every 500-card batch into one
+-- JSONB argument for `card_catalog.insert_batch_card_versions`, which re-parses
+-- it server-side and then calls `insert_full_card_version` once per card (~40
+-- statements per card). A full reload is ~100k+ versions x finishes.
+--
+-- The COPY loader instead:
+--   1. binary-COPYs prepared card rows and face rows (asyncpg
+--      `copy_records_to_table`) into the two UNLOGGED stage tables below,
+--      tagged with a per-file `load_id` and the service's batch number;
+--   2. calls `card_catalog.merge_card_version_stage(load_id)` once, which
+--      merges the whole load with set-based SQL
+--      (`merge_card_version_stage_set`);
+--   3. deletes the load's stage rows (`clear_card_version_stage`).
+--
+-- Error capture: if the whole-load merge raises, the merge is retried batch by
+-- batch; rows still unresolved afterwards fall back to
+-- `insert_full_card_version` one at a time, recording per-card error details
+-- exactly like `insert_batch_card_versions`. The function returns one row per
+-- batch with the same counters, so the service still builds one
+-- `BatchInsertResponse` per batch.
+--
+-- Finishes are a column (text[]) rather than a third stage table: the import
+-- service already explodes finishes into one row per (printing, finish).
+-- Illustrations live on the card row (card-level) and the face rows.
+
+BEGIN;
+
+CREATE UNLOGGED TABLE IF NOT EXISTS card_catalog.card_version_load_stage (
+    load_id              UUID     NOT NULL,
+    batch_seq            INT      NOT NULL,
+    row_index            INT      NOT NULL,
+    card_name            TEXT     NOT NULL,
+    cmc                  INT,
+    mana_cost            TEXT,
+    reserved             BOOLEAN,
+    oracle_text          TEXT,
+    set_name             TEXT,
+    collector_number     TEXT,
+    rarity_name          TEXT,
+    border_color         TEXT,
+    frame_year           TEXT,
+    layout_name          TEXT,
+    is_promo             BOOLEAN,
+    is_digital           BOOLEAN,
+    keywords             TEXT[]   NOT NULL DEFAULT '{}',
+    colors               TEXT[]   NOT NULL DEFAULT '{}',
+    artist               TEXT[]   NOT NULL DEFAULT '{}',
+    artist_ids           UUID[]   NOT NULL DEFAULT '{}',
+    legalities           JSONB,
+    illustration_id      UUID,
+    types                TEXT[]   NOT NULL DEFAULT '{}',
+    supertypes           TEXT[]   NOT NULL DEFAULT '{}',
+    subtypes             TEXT[]   NOT NULL DEFAULT '{}',
+    games                TEXT[]   NOT NULL DEFAULT '{}',
+    oversized            BOOLEAN,
+    booster              BOOLEAN,
+    full_art             BOOLEAN,
+    textless             BOOLEAN,
+    power                TEXT,
+    toughness            TEXT,
+    loyalty              TEXT,
+    defense              TEXT,
+    promo_types          TEXT[]   NOT NULL DEFAULT '{}',
+    variation            BOOLEAN,
+    image_uris           JSONB,
+    finishes             TEXT[]   NOT NULL DEFAULT '{nonfoil}',
+    frame_effects        TEXT[]   NOT NULL DEFAULT '{}',
+    lang                 TEXT     NOT NULL DEFAULT 'en',
+    scryfall_id          UUID,
+    oracle_id            UUID,
+    multiverse_ids       INT[]    NOT NULL DEFAULT '{}',
+    tcgplayer_id         INT,
+    tcgplayer_etched_id  INT,
+    cardmarket_id        INT,
+    card_back_id         UUID,
+    -- Written back by the merge.
+    card_version_id      UUID,
+    error_details        JSONB,
+    PRIMARY KEY (load_id, batch_seq, row_index)
+);
+
+CREATE UNLOGGED TABLE IF NOT EXISTS card_catalog.card_face_load_stage (
+    load_id          UUID    NOT NULL,
+    batch_seq        INT     NOT NULL,
+    row_index        INT     NOT NULL,
+    face_position    INT     NOT NULL,   -- position in the card_faces array
+    face_index       INT,
+    name             TEXT,
+    mana_cost        TEXT,
+    type_line        TEXT,
+    oracle_text      TEXT,
+    power            TEXT,
+    toughness        TEXT,
+    flavor_text      TEXT,
+    artist           TEXT,
+    artist_id        UUID,
+    illustration_id  UUID,
+    image_uris       JSONB,
+    supertypes       TEXT[]  NOT NULL DEFAULT '{}',
+    types            TEXT[]  NOT NULL DEFAULT '{}',
+    subtypes         TEXT[]  NOT NULL DEFAULT '{}',
+    PRIMARY KEY (load_id, batch_seq, row_index, face_position)
+);
+
+GRANT SELECT, INSERT, UPDATE, DELETE
+    ON card_catalog.card_version_load_stage, card_catalog.card_face_load_stage
+    TO app_celery, app_rw, app_admin;
+
+-- ---------------------------------------------------------------------------
+-- Set-based merge of one load (p_batch_seq NULL) or one batch of it.
+-- Mirrors insert_full_card_version statement by statement; returns the number
+-- of stage rows resolved to a card_version_id.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION card_catalog.merge_card_version_stage_set(
+    p_load_id   UUID,
+    p_batch_seq INT DEFAULT NULL
+)
+RETURNS INT AS $$
+DECLARE
+    v_resolved INT;
+BEGIN
+    DROP TABLE IF EXISTS _cv_stage;
+    CREATE TEMP TABLE _cv_stage ON COMMIT DROP AS
+    SELECT s.*
+    FROM card_catalog.card_version_load_stage s
+    WHERE s.load_id = p_load_id
+      AND (p_batch_seq IS NULL OR s.batch_seq = p_batch_seq);
+
+    DROP TABLE IF EXISTS _cf_stage;
+    CREATE TEMP TABLE _cf_stage ON COMMIT DROP AS
+    SELECT f.*
+    FROM card_catalog.card_face_load_stage f
+    WHERE f.load_id = p_load_id
+      AND (p_batch_seq IS NULL OR f.batch_seq = p_batch_seq);
+
+    -- Reference rows (first occurrence wins, as with row-by-row inserts)
+    INSERT INTO card_catalog.unique_cards_ref (card_name, cmc, mana_cost, reserved)
+    SELECT DISTINCT ON (s.card_name) s.card_name, s.cmc, s.mana_cost, s.reserved
+    FROM _cv_stage s
+    ORDER BY s.card_name, s.batch_seq, s.row_index
+    ON CONFLICT (card_name) DO NOTHING;
+
+    INSERT INTO card_catalog.rarities_ref (rarity_name)
+    SELECT DISTINCT s.rarity_name FROM _cv_stage s WHERE s.rarity_name IS NOT NULL
+    ON CONFLICT (rarity_name) DO NOTHING;
+
+    INSERT INTO card_catalog.border_color_ref (border_color_name)
+    SELECT DISTINCT s.border_color FROM _cv_stage s WHERE s.border_color IS NOT NULL
+    ON CONFLICT (border_color_name) DO NOTHING;
+
+    INSERT INTO card_catalog.frames_ref (frame_year)
+    SELECT DISTINCT s.frame_year FROM _cv_stage s WHERE s.frame_year IS NOT NULL
+    ON CONFLICT (frame_year) DO NOTHING;
+
+    INSERT INTO card_catalog.layouts_ref (layout_name)
+    SELECT DISTINCT s.layout_name FROM _cv_stage s WHERE s.layout_name IS NOT NULL
+    ON CONFLICT (layout_name) DO NOTHING;
+
+    -- Resolved working set
+    DROP TABLE IF EXISTS _cv_work;
+    CREATE TEMP TABLE _cv_work ON COMMIT DROP AS
+    SELECT
+        u.unique_card_id,
+        COALESCE(st.set_id, '00000000-0000-0000-0000-000000000002'::uuid) AS set_id,
+        r.rarity_id,
+        b.border_color_id,
+        fr.frame_id,
+        l.layout_id,
+        s.*,
+        EXISTS (
+            SELECT 1 FROM _cf_stage f
+            WHERE f.batch_seq = s.batch_seq AND f.row_index = s.row_index
+        ) AS has_faces
+    FROM _cv_stage s
+    JOIN card_catalog.unique_cards_ref u ON u.card_name = s.card_name
+    LEFT JOIN card_catalog.sets st ON st.set_name = s.set_name
+    LEFT JOIN card_catalog.rarities_ref r ON r.rarity_name = s.rarity_name
+    LEFT JOIN card_catalog.border_color_ref b ON b.border_color_name = s.border_color
+    LEFT JOIN card_catalog.frames_ref fr ON fr.frame_year = s.frame_year
+    LEFT JOIN card_catalog.layouts_ref l ON l.layout_name = s.layout_name;
+
+    -- The stage copy of card_version_id is empty; replace it with cv_id so the
+    -- resolved id below is unambiguous.
+    ALTER TABLE _cv_work DROP COLUMN card_version_id;
+    ALTER TABLE _cv_work ADD COLUMN cv_id UUID;
+
+    INSERT INTO card_catalog.card_version (
+        unique_card_id, oracle_text, set_id,
+        collector_number, rarity_id, border_color_id,
+        frame_id, layout_id, is_promo, is_digital,
+        is_oversized, full_art, textless, booster,
+        variation, frame_effects, lang, card_back_id
+    )
+    SELECT DISTINCT ON (w.unique_card_id, w.set_id, w.collector_number, w.lang)
+        w.unique_card_id, w.oracle_text, w.set_id,
+        w.collector_number, w.rarity_id, w.border_color_id,
+        w.frame_id, w.layout_id, w.is_promo, w.is_digital,
+        w.oversized, w.full_art, w.textless, w.booster,
+        w.variation, COALESCE(w.frame_effects, '{}'), w.lang, w.card_back_id
+    FROM _cv_work w
+    WHERE w.collector_number IS NOT NULL   -- NULL keys never conflict; left to the row path
+    ORDER BY w.unique_card_id, w.set_id, w.collector_number, w.lang, w.batch_seq, w.row_index
+    ON CONFLICT (unique_card_id, set_id, collector_number, lang) DO NOTHING;
+
+    UPDATE _cv_work w
+    SET cv_id = cv.card_version_id
+    FROM card_catalog.card_version cv
+    WHERE cv.unique_card_id = w.unique_card_id
+      AND cv.set_id = w.set_id
+      AND cv.collector_number = w.collector_number
+      AND cv.lang = w.lang;
+
+    -- External identifiers
+    INSERT INTO card_catalog.card_external_identifier (card_identifier_ref_id, card_version_id, value)
+    SELECT r.card_identifier_ref_id, n.cv_id, n.value
+    FROM (
+        SELECT w.cv_id, 'scryfall_id' AS name, w.scryfall_id::text AS value FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'oracle_id', w.oracle_id::text FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'multiverse_id', m::text FROM _cv_work w, unnest(w.multiverse_ids) AS m
+        UNION ALL SELECT w.cv_id, 'tcgplayer_id', w.tcgplayer_id::text FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'tcgplayer_etched_id', w.tcgplayer_etched_id::text FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'cardmarket_id', w.cardmarket_id::text FROM _cv_work w
+    ) AS n
+    JOIN card_catalog.card_identifier_ref r ON r.identifier_name = n.name
+    WHERE n.value IS NOT NULL AND n.cv_id IS NOT NULL
+    ON CONFLICT (card_version_id, card_identifier_ref_id) DO NOTHING;
+
+    -- Stats
+    INSERT INTO card_catalog.card_version_stats (card_version_id, stat_id, stat_value)
+    SELECT w.cv_id, sr.stat_id, v.stat_value
+    FROM _cv_work w
+    CROSS JOIN LATERAL (
+        VALUES ('power', w.power), ('toughness', w.toughness),
+               ('loyalty', w.loyalty), ('defense', w.defense)
+    ) AS v(stat_name, stat_value)
+    JOIN card_catalog.card_stats_ref sr ON sr.stat_name = v.stat_name
+    WHERE v.stat_value IS NOT NULL AND w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Promo types
+    INSERT INTO card_catalog.promo_types_ref (promo_type_desc)
+    SELECT DISTINCT pt FROM _cv_work w, unnest(w.promo_types) AS pt
+    ON CONFLICT (promo_type_desc) DO NOTHING;
+
+    INSERT INTO card_catalog.promo_card (promo_id, card_version_id)
+    SELECT p.promo_id, w.cv_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.promo_types) AS pt(descr)
+    JOIN card_catalog.promo_types_ref p ON p.promo_type_desc = pt.descr
+    WHERE w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Finishes
+    INSERT INTO card_catalog.card_version_finish (card_version_id, finish_id)
+    SELECT w.cv_id, cf.finish_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(COALESCE(w.finishes, ARRAY['nonfoil'])) AS fc(code)
+    JOIN card_catalog.card_finished cf ON UPPER(cf.code) = UPPER(fc.code)
+    WHERE w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Type line: card-level for single-faced, face-level for multi-faced
+    INSERT INTO card_catalog.card_types (unique_card_id, type_name, type_category)
+    SELECT DISTINCT ON (t.unique_card_id, t.type_name)
+        t.unique_card_id, t.type_name, t.type_category
+    FROM (
+        SELECT w.unique_card_id, x AS type_name, 'supertype' AS type_category, w.batch_seq, w.row_index, 0 AS face_position, 1 AS ord
+        FROM _cv_work w, unnest(w.supertypes) AS x WHERE NOT w.has_faces
+        UNION ALL
+        SELECT w.unique_card_id, x, 'type', w.batch_seq, w.row_index, 0, 2
+        FROM _cv_work w, unnest(w.types) AS x WHERE NOT w.has_faces
+        UNION ALL
+        SELECT w.unique_card_id, x, 'subtype', w.batch_seq, w.row_index, 0, 3
+        FROM _cv_work w, unnest(w.subtypes) AS x WHERE NOT w.has_faces
+        UNION ALL
+        SELECT w.unique_card_id, x, 'supertype', w.batch_seq, w.row_index, f.face_position, 1
+        FROM _cv_work w
+        JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index,
+        unnest(f.supertypes) AS x
+        UNION ALL
+        SELECT w.unique_card_id, x, 'type', w.batch_seq, w.row_index, f.face_position, 2
+        FROM _cv_work w
+        JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index,
+        unnest(f.types) AS x
+        UNION ALL
+        SELECT w.unique_card_id, x, 'subtype', w.batch_seq, w.row_index, f.face_position, 3
+        FROM _cv_work w
+        JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index,
+        unnest(f.subtypes) AS x
+    ) AS t
+    ORDER BY t.unique_card_id, t.type_name, t.batch_seq, t.row_index, t.face_position, t.ord
+    ON CONFLICT (unique_card_id, type_name) DO NOTHING;
+
+    -- Single-faced: artist → illustration → per-version image_uris
+    -- artists_ref is unique on both id and name: insert in file order so the
+    -- first sighting wins, as it does row by row.
+    INSERT INTO card_catalog.artists_ref (artist_id, artist_name)
+    SELECT a.artist_id, a.artist_name
+    FROM (
+        SELECT DISTINCT ON (w.artist_ids[1])
+            w.artist_ids[1] AS artist_id, w.artist[1] AS artist_name, w.batch_seq, w.row_index
+        FROM _cv_work w
+        WHERE NOT w.has_faces AND w.artist_ids[1] IS NOT NULL AND w.artist[1] IS NOT NULL
+        ORDER BY w.artist_ids[1], w.batch_seq, w.row_index
+    ) AS a
+    ORDER BY a.batch_seq, a.row_index
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.artists_ref (artist_name)
+    SELECT DISTINCT w.artist[1]
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.artist_ids[1] IS NULL AND w.artist[1] IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.illustrations (illustration_id)
+    SELECT DISTINCT w.illustration_id
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.illustration_id IS NOT NULL
+    ON CONFLICT (illustration_id) DO NOTHING;
+
+    INSERT INTO card_catalog.illustration_artist (illustration_id, artist_id)
+    SELECT DISTINCT
+        w.illustration_id,
+        COALESCE(
+            (SELECT a.artist_id FROM card_catalog.artists_ref a WHERE a.artist_id = w.artist_ids[1]),
+            (SELECT a.artist_id FROM card_catalog.artists_ref a WHERE a.artist_name = w.artist[1]),
+            '00000000-0000-0000-0000-000000000001'::uuid
+        )
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.illustration_id IS NOT NULL
+    ON CONFLICT (illustration_id, artist_id) DO NOTHING;
+
+    INSERT INTO card_catalog.card_version_illustration (card_version_id, illustration_id, image_uris)
+    SELECT DISTINCT ON (w.cv_id) w.cv_id, w.illustration_id, w.image_uris
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.cv_id IS NOT NULL AND w.illustration_id IS NOT NULL
+    ORDER BY w.cv_id, w.batch_seq, w.row_index
+    ON CONFLICT (card_version_id) DO NOTHING;
+
+    -- Multi-faced: flag, version illustration (top-level or front face), faces
+    UPDATE card_catalog.card_version cv
+    SET is_multifaced = true
+    FROM _cv_work w
+    WHERE w.has_faces AND cv.card_version_id = w.cv_id
+      AND cv.is_multifaced IS DISTINCT FROM true;
+
+    DROP TABLE IF EXISTS _cv_mf_ill;
+    CREATE TEMP TABLE _cv_mf_ill ON COMMIT DROP AS
+    SELECT
+        w.cv_id,
+        w.batch_seq,
+        w.row_index,
+        COALESCE(w.illustration_id, f0.illustration_id) AS illustration_id,
+        CASE WHEN jsonb_typeof(w.image_uris) = 'object' AND w.image_uris <> '{}'::jsonb
+             THEN w.image_uris
+             ELSE f0.image_uris
+        END AS image_uris
+    FROM _cv_work w
+    LEFT JOIN _cf_stage f0
+           ON f0.batch_seq = w.batch_seq AND f0.row_index = w.row_index AND f0.face_position = 0
+    WHERE w.has_faces AND w.cv_id IS NOT NULL;
+
+    INSERT INTO card_catalog.illustrations (illustration_id)
+    SELECT DISTINCT m.illustration_id FROM _cv_mf_ill m WHERE m.illustration_id IS NOT NULL
+    ON CONFLICT (illustration_id) DO NOTHING;
+
+    INSERT INTO card_catalog.card_version_illustration (card_version_id, illustration_id, image_uris)
+    SELECT DISTINCT ON (m.cv_id) m.cv_id, m.illustration_id, m.image_uris
+    FROM _cv_mf_ill m
+    WHERE m.illustration_id IS NOT NULL
+    ORDER BY m.cv_id, m.batch_seq, m.row_index
+    ON CONFLICT (card_version_id) DO NOTHING;
+
+    INSERT INTO card_catalog.card_faces (
+        card_version_id, face_index, name, mana_cost,
+        type_line, oracle_text, power, toughness, flavor_text
+    )
+    SELECT DISTINCT ON (w.cv_id, f.face_index)
+        w.cv_id, f.face_index, f.name, f.mana_cost,
+        f.type_line, f.oracle_text, f.power, f.toughness, f.flavor_text
+    FROM _cv_work w
+    JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index
+    WHERE w.cv_id IS NOT NULL
+    ORDER BY w.cv_id, f.face_index, w.batch_seq, w.row_index, f.face_position
+    ON CONFLICT DO NOTHING;
+
+    DROP TABLE IF EXISTS _cf_ill;
+    CREATE TEMP TABLE _cf_ill ON COMMIT DROP AS
+    SELECT
+        cfa.card_faces_id,
+        f.illustration_id,
+        f.artist_id,
+        f.artist,
+        f.image_uris,
+        w.batch_seq,
+        w.row_index
+    FROM _cv_work w
+    JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index
+    JOIN card_catalog.card_faces cfa
+      ON cfa.card_version_id = w.cv_id AND cfa.face_index = f.face_index
+    WHERE f.illustration_id IS NOT NULL;
+
+    INSERT INTO card_catalog.artists_ref (artist_id, artist_name)
+    SELECT a.artist_id, a.artist
+    FROM (
+        SELECT DISTINCT ON (i.artist_id) i.artist_id, i.artist, i.batch_seq, i.row_index
+        FROM _cf_ill i
+        WHERE i.artist_id IS NOT NULL
+        ORDER BY i.artist_id, i.batch_seq, i.row_index
+    ) AS a
+    ORDER BY a.batch_seq, a.row_index
+    ON CONFLICT DO NOTHING;
+
+    -- Face illustrations overwrite image_uris (last occurrence wins, as with
+    -- sequential upserts).
+    INSERT INTO card_catalog.illustrations (illustration_id, image_uris)
+    SELECT DISTINCT ON (i.illustration_id) i.illustration_id, i.image_uris
+    FROM _cf_ill i
+    ORDER BY i.illustration_id, i.batch_seq DESC, i.row_index DESC
+    ON CONFLICT (illustration_id) DO UPDATE
+        SET image_uris = EXCLUDED.image_uris,
+            updated_at = now()
+    WHERE card_catalog.illustrations.image_uris IS DISTINCT FROM EXCLUDED.image_uris;
+
+    INSERT INTO card_catalog.illustration_artist (illustration_id, artist_id)
+    SELECT DISTINCT i.illustration_id, i.artist_id
+    FROM _cf_ill i
+    WHERE i.artist_id IS NOT NULL
+      AND EXISTS (SELECT 1 FROM card_catalog.artists_ref a WHERE a.artist_id = i.artist_id)
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.face_illustration (face_id, illustration_id)
+    SELECT DISTINCT i.card_faces_id, i.illustration_id
+    FROM _cf_ill i
+    ON CONFLICT DO NOTHING;
+
+    -- Games
+    INSERT INTO card_catalog.games_ref (game_description)
+    SELECT DISTINCT g FROM _cv_work w, unnest(w.games) AS g
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.games_card_version (card_version_id, game_id)
+    SELECT DISTINCT w.cv_id, gr.game_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.games) AS g(descr)
+    JOIN card_catalog.games_ref gr ON gr.game_description = g.descr
+    WHERE w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Colors
+    INSERT INTO card_catalog.colors_ref (color_name)
+    SELECT DISTINCT c FROM _cv_work w, unnest(w.colors) AS c
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.card_color_identity (unique_card_id, color_id)
+    SELECT DISTINCT w.unique_card_id, cr.color_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.colors) AS c(name)
+    JOIN card_catalog.colors_ref cr ON cr.color_name = c.name
+    ON CONFLICT DO NOTHING;
+
+    -- Keywords
+    INSERT INTO card_catalog.keywords_ref (keyword_name)
+    SELECT DISTINCT k FROM _cv_work w, unnest(w.keywords) AS k
+    ON CONFLICT (keyword_name) DO NOTHING;
+
+    INSERT INTO card_catalog.card_keyword (unique_card_id, keyword_id)
+    SELECT DISTINCT w.unique_card_id, kr.keyword_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.keywords) AS k(name)
+    JOIN card_catalog.keywords_ref kr ON kr.keyword_name = k.name
+    ON CONFLICT (unique_card_id, keyword_id) DO NOTHING;
+
+    -- Legalities
+    DROP TABLE IF EXISTS _cv_legal;
+    CREATE TEMP TABLE _cv_legal ON COMMIT DROP AS
+    SELECT w.unique_card_id, l.key AS format_name, l.value AS legal_status, w.batch_seq, w.row_index
+    FROM _cv_work w
+    CROSS JOIN LATERAL jsonb_each_text(COALESCE(w.legalities, '{}'::jsonb)) AS l
+    WHERE l.value <> 'not_legal';
+
+    INSERT INTO card_catalog.legal_status_ref (legal_status)
+    SELECT DISTINCT lg.legal_status FROM _cv_legal lg
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.formats_ref (format_name)
+    SELECT DISTINCT lg.format_name FROM _cv_legal lg
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.legalities (unique_card_id, format_id, legality_id)
+    SELECT DISTINCT ON (lg.unique_card_id, fmt.format_id)
+        lg.unique_card_id, fmt.format_id, ls.legality_id
+    FROM _cv_legal lg
+    JOIN card_catalog.formats_ref fmt ON fmt.format_name = lg.format_name
+    JOIN card_catalog.legal_status_ref ls ON ls.legal_status = lg.legal_status
+    ORDER BY lg.unique_card_id, fmt.format_id, lg.batch_seq, lg.row_index
+    ON CONFLICT DO NOTHING;
+
+    -- Write resolved ids back to the stage
+    UPDATE card_catalog.card_version_load_stage s
+    SET card_version_id = w.cv_id,
+        error_details   = NULL
+    FROM _cv_work w
+    WHERE s.load_id = p_load_id
+      AND s.batch_seq = w.batch_seq
+      AND s.row_index = w.row_index;
+
+    SELECT COUNT(*) INTO v_resolved FROM _cv_work w WHERE w.cv_id IS NOT NULL;
+    RETURN v_resolved;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ---------------------------------------------------------------------------
+-- Merge a staged load; returns one row per batch with the same counters as
+-- insert_batch_card_versions.
+--
+-- Whole load first; if that raises, batch by batch. Whatever the set merge
+-- could not resolve (a failing batch, or a row the set path cannot key, e.g.
+-- a NULL collector_number) goes through insert_full_card_version one card at
+-- a time so each failure is reported with its own error details.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION card_catalog.merge_card_version_stage(
+    p_load_id UUID
+)
+RETURNS TABLE (
+    batch_seq INT,
+    total_processed INT,
+    successful_inserts INT,
+    failed_inserts INT,
+    skipped_inserts INT,
+    inserted_card_ids UUID[],
+    error_details JSONB
+) AS $$
+#variable_conflict use_column
+DECLARE
+    v_batch INT;
+    v_row RECORD;
+    v_result UUID;
+BEGIN
+    BEGIN
+        PERFORM card_catalog.merge_card_version_stage_set(p_load_id, NULL);
+    EXCEPTION WHEN OTHERS THEN
+        RAISE NOTICE 'merge_card_version_stage: whole-load merge failed (%), retrying per batch', SQLERRM;
+
+        FOR v_batch IN
+            SELECT DISTINCT s.batch_seq
+            FROM card_catalog.card_version_load_stage s
+            WHERE s.load_id = p_load_id
+            ORDER BY s.batch_seq
+        LOOP
+            BEGIN
+                PERFORM card_catalog.merge_card_version_stage_set(p_load_id, v_batch);
+            EXCEPTION WHEN OTHERS THEN
+                RAISE NOTICE 'merge_card_version_stage: batch % failed (%), falling back to row-by-row', v_batch, SQLERRM;
+            END;
+        END LOOP;
+    END;
+
+    FOR v_row IN
+        SELECT s.*,
+               (
+                   SELECT jsonb_agg(
+                              jsonb_build_object(
+                                  'face_index', f.face_index,
+                                  'name', f.name,
+                                  'mana_cost', f.mana_cost,
+                                  'type_line', f.type_line,
+                                  'oracle_text', f.oracle_text,
+                                  'power', f.power,
+                                  'toughness', f.toughness,
+                                  'flavor_text', f.flavor_text,
+                                  'artist', f.artist,
+                                  'artist_id', f.artist_id,
+                                  'illustration_id', f.illustration_id,
+                                  'image_uris', f.image_uris,
+                                  'supertypes', to_jsonb(f.supertypes),
+                                  'types', to_jsonb(f.types),
+                                  'subtypes', to_jsonb(f.subtypes)
+                              ) ORDER BY f.face_position)
+                   FROM card_catalog.card_face_load_stage f
+                   WHERE f.load_id = s.load_id
+                     AND f.batch_seq = s.batch_seq
+                     AND f.row_index = s.row_index
+               ) AS card_faces
+        FROM card_catalog.card_version_load_stage s
+        WHERE s.load_id = p_load_id
+          AND s.card_version_id IS NULL
+          AND s.error_details IS NULL
+        ORDER BY s.batch_seq, s.row_index
+    LOOP
+        BEGIN
+            SELECT card_catalog.insert_full_card_version(
+                v_row.card_name, v_row.cmc, v_row.mana_cost, v_row.reserved,
+                v_row.oracle_text, v_row.set_name, v_row.collector_number,
+                v_row.rarity_name, v_row.border_color, v_row.frame_year,
+                v_row.layout_name, v_row.is_promo, v_row.is_digital,
+                to_jsonb(v_row.keywords), to_jsonb(v_row.colors),
+                to_jsonb(v_row.artist), to_jsonb(v_row.artist_ids),
+                v_row.legalities, v_row.illustration_id,
+                to_jsonb(v_row.types), to_jsonb(v_row.supertypes),
+                to_jsonb(v_row.subtypes), to_jsonb(v_row.games),
+                v_row.oversized, v_row.booster, v_row.full_art, v_row.textless,
+                v_row.power, v_row.toughness, v_row.loyalty, v_row.defense,
+                to_jsonb(v_row.promo_types), v_row.variation,
+                COALESCE(v_row.card_faces, '[]'::jsonb), v_row.image_uris,
+                v_row.finishes, v_row.frame_effects, v_row.lang,
+                v_row.scryfall_id, v_row.oracle_id, to_jsonb(v_row.multiverse_ids),
+                v_row.tcgplayer_id, v_row.tcgplayer_etched_id,
+                v_row.cardmarket_id, v_row.card_back_id
+            ) INTO v_result;
+
+            UPDATE card_catalog.card_version_load_stage s
+            SET card_version_id = v_result
+            WHERE s.load_id = p_load_id
+              AND s.batch_seq = v_row.batch_seq
+              AND s.row_index = v_row.row_index;
+        EXCEPTION WHEN OTHERS THEN
+            UPDATE card_catalog.card_version_load_stage s
+            SET error_details = jsonb_build_object(
+                    'card_name', v_row.card_name,
+                    'error_code', SQLSTATE,
+                    'error_message', SQLERRM,
+                    'card_index', v_row.row_index + 1
+                )
+            WHERE s.load_id = p_load_id
+              AND s.batch_seq = v_row.batch_seq
+              AND s.row_index = v_row.row_index;
+        END;
+    END LOOP;
+
+    RETURN QUERY
+    SELECT
+        s.batch_seq,
+        COUNT(*)::INT,
+        COUNT(s.card_version_id)::INT,
+        (COUNT(*) - COUNT(s.card_version_id))::INT,
+        0,
+        COALESCE(array_agg(s.card_version_id) FILTER (WHERE s.card_version_id IS NOT NULL), ARRAY[]::UUID[]),
+        COALESCE(jsonb_agg(s.error_details) FILTER (WHERE s.error_details IS NOT NULL), '[]'::jsonb)
+    FROM card_catalog.card_version_load_stage s
+    WHERE s.load_id = p_load_id
+    GROUP BY s.batch_seq
+    ORDER BY s.batch_seq;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop a load's stage rows (or one batch of it, before a COPY retry).
+CREATE OR REPLACE FUNCTION card_catalog.clear_card_version_stage(
+    p_load_id   UUID,
+    p_batch_seq INT DEFAULT NULL
+)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM card_catalog.card_face_load_stage
+    WHERE load_id = p_load_id
+      AND (p_batch_seq IS NULL OR batch_seq = p_batch_seq);
+    DELETE FROM card_catalog.card_version_load_stage
+    WHERE load_id = p_load_id
+      AND (p_batch_seq IS NULL OR batch_seq = p_batch_seq);
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
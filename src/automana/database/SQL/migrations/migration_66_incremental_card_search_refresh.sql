@@ -0,0 +1,754 @@
+-- migration_66_incremental_card_search_refresh.sql
+--
+-- Incremental refresh for the card search views.
+--
+-- `card_catalog.refresh_card_search_views()` used to run a full
+-- `REFRESH MATERIALIZED VIEW CONCURRENTLY` of `v_card_versions_complete` and
+-- `v_card_name_suggest` after every Scryfall and MTGJson run, even when only a
+-- handful of printings changed. CONCURRENTLY rebuilds the whole result, diffs
+-- it against the old one and rewrites every changed row — long, I/O heavy and
+-- a steady source of bloat.
+--
+-- This migration:
+--   1. Keeps the view *names* but turns both into plain tables with the same
+--      columns and indexes, so every reader is unchanged.
+--   2. Moves the definitions into regular views (`*_source`) written with
+--      per-row LATERAL aggregates, so a filter on unique_card_id pushes down
+--      into every aggregate instead of aggregating the whole catalog.
+--   3. Tracks touched cards in `card_catalog.card_search_dirty` with
+--      statement-level AFTER triggers (transition tables) on card_version,
+--      unique_cards_ref and the link tables the view aggregates. Only rows that actually change are
+--      recorded — `ON CONFLICT DO NOTHING` re-imports and purchase_uris
+--      updates mark nothing.
+--   4. Replaces the refresh with `card_catalog.refresh_card_search_tables()`:
+--      claims the dirty ids, upserts only rows whose content differs and
+--      deletes rows that left the source. Above `p_full_threshold` dirty cards
+--      (or with p_force_full) the same upsert/delete runs over the whole
+--      source — still writing only changed rows.
+--
+-- Dirty tracking is keyed by unique_card_id: card-level data (types, colors,
+-- keywords, legalities) is shared by every printing, and the Japanese-print
+-- filter hides a `ja` row once its `en` sibling (same card) exists.
+
+BEGIN;
+
+-- ---------------------------------------------------------------------------
+-- 1. Source views
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE VIEW card_catalog.v_card_versions_complete_source AS
+SELECT
+    -- Primary IDs
+    cv.card_version_id,
+    cv.unique_card_id,
+    ucr.card_name,
+
+    -- Set information
+    s.set_id,
+    s.set_name,
+    s.set_code,
+    cv.collector_number,
+
+    -- Card basics
+    ucr.cmc,
+    ucr.mana_cost,
+    cv.oracle_text,
+    ucr.reserved,
+
+    -- Type information
+    COALESCE(cta.types, ARRAY[]::text[]) AS types,
+    COALESCE(cta.subtypes, ARRAY[]::text[]) AS subtypes,
+    COALESCE(cta.supertypes, ARRAY[]::text[]) AS supertypes,
+
+    -- Type line (constructed)
+    CASE
+        WHEN array_length(COALESCE(cta.supertypes, ARRAY[]::text[]), 1) > 0
+        THEN array_to_string(cta.supertypes, ' ') || ' '
+        ELSE ''
+    END ||
+    CASE
+        WHEN array_length(COALESCE(cta.types, ARRAY[]::text[]), 1) > 0
+        THEN array_to_string(cta.types, ' ')
+        ELSE ''
+    END ||
+    CASE
+        WHEN array_length(COALESCE(cta.subtypes, ARRAY[]::text[]), 1) > 0
+        THEN ' — ' || array_to_string(cta.subtypes, ' ')
+        ELSE ''
+    END AS type_line,
+
+    -- Colors and identity
+    COALESCE(ca.color_identity, ARRAY[]::text[]) AS color_identity,
+    COALESCE(ka.keywords, ARRAY[]::text[]) AS keywords,
+
+    -- Stats
+    csa.power,
+    csa.toughness,
+    csa.loyalty,
+    csa.defense,
+
+    -- Rarity and visual
+    rr.rarity_name,
+    bcr.border_color_name,
+    fr.frame_year,
+    lr.layout_name,
+
+    -- Treatment and language
+    cv.frame_effects,
+    cv.lang,
+
+    -- Flags
+    cv.is_promo,
+    cv.is_digital,
+    cv.is_oversized,
+    cv.full_art,
+    cv.textless,
+    cv.booster,
+    cv.variation,
+    cv.is_multifaced,
+
+    -- Artist and illustration
+    COALESCE(ia.illustrations, '[]'::jsonb) AS illustrations,
+
+    -- Aggregated data
+    COALESCE(la.legalities, '{}'::jsonb) AS legalities,
+    COALESCE(ga.games, ARRAY[]::text[]) AS games,
+    COALESCE(pta.promo_types, ARRAY[]::text[]) AS promo_types,
+    COALESCE(cfa.card_faces, '[]'::jsonb) AS card_faces,
+
+    -- Face count for quick reference
+    CASE
+        WHEN cv.is_multifaced THEN jsonb_array_length(COALESCE(cfa.card_faces, '[]'::jsonb))
+        ELSE 1
+    END AS face_count,
+
+    -- Search helpers
+    to_tsvector('english',
+        ucr.card_name || ' ' ||
+        COALESCE(cv.oracle_text, '') || ' ' ||
+        COALESCE(array_to_string(cta.types, ' '), '') || ' ' ||
+        COALESCE(array_to_string(cta.subtypes, ' '), '') || ' ' ||
+        COALESCE(array_to_string(ka.keywords, ' '), '')
+    ) AS search_vector
+
+FROM card_catalog.card_version cv
+JOIN card_catalog.unique_cards_ref ucr ON cv.unique_card_id = ucr.unique_card_id
+JOIN card_catalog.sets s ON cv.set_id = s.set_id
+JOIN card_catalog.rarities_ref rr ON cv.rarity_id = rr.rarity_id
+JOIN card_catalog.border_color_ref bcr ON cv.border_color_id = bcr.border_color_id
+JOIN card_catalog.frames_ref fr ON cv.frame_id = fr.frame_id
+JOIN card_catalog.layouts_ref lr ON cv.layout_id = lr.layout_id
+
+-- Card types aggregated
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'type') AS types,
+        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'subtype') AS subtypes,
+        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'supertype') AS supertypes
+    FROM card_catalog.card_types ct
+    WHERE ct.unique_card_id = cv.unique_card_id
+) cta ON true
+-- Colors aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(cr.color_name ORDER BY cr.color_name) AS color_identity
+    FROM card_catalog.card_color_identity cci
+    JOIN card_catalog.colors_ref cr ON cci.color_id = cr.color_id
+    WHERE cci.unique_card_id = cv.unique_card_id
+) ca ON true
+-- Keywords aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(kr.keyword_name ORDER BY kr.keyword_name) AS keywords
+    FROM card_catalog.card_keyword ck
+    JOIN card_catalog.keywords_ref kr ON ck.keyword_id = kr.keyword_id
+    WHERE ck.unique_card_id = cv.unique_card_id
+) ka ON true
+-- Legalities aggregated
+LEFT JOIN LATERAL (
+    SELECT jsonb_object_agg(fmt.format_name, lsr.legal_status) AS legalities
+    FROM card_catalog.legalities l
+    JOIN card_catalog.formats_ref fmt ON l.format_id = fmt.format_id
+    JOIN card_catalog.legal_status_ref lsr ON l.legality_id = lsr.legality_id
+    WHERE l.unique_card_id = cv.unique_card_id
+) la ON true
+-- Games aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(gr.game_description ORDER BY gr.game_description) AS games
+    FROM card_catalog.games_card_version gcv
+    JOIN card_catalog.games_ref gr ON gcv.game_id = gr.game_id
+    WHERE gcv.card_version_id = cv.card_version_id
+) ga ON true
+-- Promo types aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(ptr.promo_type_desc ORDER BY ptr.promo_type_desc) AS promo_types
+    FROM card_catalog.promo_card pc
+    JOIN card_catalog.promo_types_ref ptr ON pc.promo_id = ptr.promo_id
+    WHERE pc.card_version_id = cv.card_version_id
+) pta ON true
+-- Card stats pivoted
+LEFT JOIN LATERAL (
+    SELECT
+        MAX(CASE WHEN csr.stat_name = 'power' THEN cvs.stat_value END) AS power,
+        MAX(CASE WHEN csr.stat_name = 'toughness' THEN cvs.stat_value END) AS toughness,
+        MAX(CASE WHEN csr.stat_name = 'loyalty' THEN cvs.stat_value END) AS loyalty,
+        MAX(CASE WHEN csr.stat_name = 'defense' THEN cvs.stat_value END) AS defense
+    FROM card_catalog.card_version_stats cvs
+    JOIN card_catalog.card_stats_ref csr ON cvs.stat_id = csr.stat_id
+    WHERE cvs.card_version_id = cv.card_version_id
+) csa ON true
+-- Illustrations with artists
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object(
+            'illustration_id', cvi.illustration_id,
+            'image_uris', cvi.image_uris,
+            'added_on', i.added_on,
+            'artist_id', ar.artist_id,
+            'artist_name', ar.artist_name
+        )
+        ORDER BY i.added_on NULLS LAST, cvi.illustration_id
+    ) AS illustrations
+    FROM card_catalog.card_version_illustration cvi
+    JOIN card_catalog.illustrations i ON cvi.illustration_id = i.illustration_id
+    LEFT JOIN card_catalog.illustration_artist iart ON i.illustration_id = iart.illustration_id
+    LEFT JOIN card_catalog.artists_ref ar ON iart.artist_id = ar.artist_id
+    WHERE cvi.card_version_id = cv.card_version_id
+) ia ON true
+-- Card faces aggregated
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object(
+            'face_index', cf.face_index,
+            'name', cf.name,
+            'mana_cost', cf.mana_cost,
+            'type_line', cf.type_line,
+            'oracle_text', cf.oracle_text,
+            'power', cf.power,
+            'toughness', cf.toughness,
+            'flavor_text', cf.flavor_text
+        ) ORDER BY cf.face_index
+    ) AS card_faces
+    FROM card_catalog.card_faces cf
+    WHERE cf.card_version_id = cv.card_version_id
+) cfa ON true
+WHERE cv.lang = 'en'
+   OR NOT EXISTS (
+       SELECT 1 FROM card_catalog.card_version en_cv
+       WHERE en_cv.set_id = cv.set_id
+         AND en_cv.collector_number = cv.collector_number
+         AND en_cv.lang = 'en'
+   );
+
+CREATE OR REPLACE VIEW card_catalog.v_card_name_suggest_source AS
+SELECT
+    cv.card_version_id,
+    uc.card_name,
+    s.set_code,
+    r.rarity_name,
+    cv.unique_card_id
+FROM card_catalog.card_version cv
+JOIN card_catalog.unique_cards_ref uc ON cv.unique_card_id = uc.unique_card_id
+JOIN card_catalog.sets s ON cv.set_id = s.set_id
+JOIN card_catalog.rarities_ref r ON cv.rarity_id = r.rarity_id;
+
+-- ---------------------------------------------------------------------------
+-- 2. Materialized views -> tables (current contents carried over as-is)
+-- ---------------------------------------------------------------------------
+DROP VIEW IF EXISTS card_catalog.v_cards_by_name;
+DROP VIEW IF EXISTS card_catalog.v_cards_latest_version;
+DROP VIEW IF EXISTS card_catalog.v_set_statistics;
+
+CREATE TABLE card_catalog.v_card_versions_complete_tbl AS
+SELECT * FROM card_catalog.v_card_versions_complete;
+
+CREATE TABLE card_catalog.v_card_name_suggest_tbl AS
+SELECT sg.card_version_id, sg.card_name, sg.set_code, sg.rarity_name, cv.unique_card_id
+FROM card_catalog.v_card_name_suggest sg
+JOIN card_catalog.card_version cv ON cv.card_version_id = sg.card_version_id;
+
+DROP MATERIALIZED VIEW card_catalog.v_card_versions_complete;
+DROP MATERIALIZED VIEW card_catalog.v_card_name_suggest;
+
+ALTER TABLE card_catalog.v_card_versions_complete_tbl RENAME TO v_card_versions_complete;
+ALTER TABLE card_catalog.v_card_name_suggest_tbl RENAME TO v_card_name_suggest;
+
+ALTER TABLE card_catalog.v_card_versions_complete
+    ALTER COLUMN materialized_at SET DEFAULT now(),
+    ADD CONSTRAINT idx_v_card_versions_complete_pk PRIMARY KEY (card_version_id);
+ALTER TABLE card_catalog.v_card_name_suggest
+    ADD CONSTRAINT idx_v_card_name_suggest_pk PRIMARY KEY (card_version_id);
+
+CREATE INDEX idx_v_card_versions_complete_unique_card ON card_catalog.v_card_versions_complete (unique_card_id);
+CREATE INDEX idx_v_card_versions_complete_name ON card_catalog.v_card_versions_complete (card_name);
+CREATE INDEX idx_v_card_versions_complete_set ON card_catalog.v_card_versions_complete (set_name, collector_number);
+CREATE INDEX idx_v_card_versions_complete_cmc ON card_catalog.v_card_versions_complete (cmc);
+CREATE INDEX idx_v_card_versions_complete_colors ON card_catalog.v_card_versions_complete USING GIN (color_identity);
+CREATE INDEX idx_v_card_versions_complete_types ON card_catalog.v_card_versions_complete USING GIN (types);
+CREATE INDEX idx_v_card_versions_complete_promo_types ON card_catalog.v_card_versions_complete USING GIN (promo_types);
+CREATE INDEX idx_v_card_versions_complete_rarity ON card_catalog.v_card_versions_complete (rarity_name);
+CREATE INDEX idx_v_card_versions_complete_search ON card_catalog.v_card_versions_complete USING GIN (search_vector);
+CREATE INDEX idx_v_card_versions_complete_legalities ON card_catalog.v_card_versions_complete USING GIN (legalities);
+CREATE INDEX gin_trgm_idx_v_card_versions_name
+    ON card_catalog.v_card_versions_complete
+    USING GIN (card_name gin_trgm_ops);
+
+CREATE INDEX idx_v_card_name_suggest_unique_card ON card_catalog.v_card_name_suggest (unique_card_id);
+CREATE INDEX gin_trgm_idx_v_card_name_suggest
+    ON card_catalog.v_card_name_suggest
+    USING GIN (card_name gin_trgm_ops);
+
+GRANT SELECT ON card_catalog.v_card_versions_complete, card_catalog.v_card_versions_complete_source
+    TO app_admin, app_rw, app_ro, agent_reader;
+GRANT SELECT ON card_catalog.v_card_name_suggest, card_catalog.v_card_name_suggest_source
+    TO app_admin, app_rw, app_ro, agent_reader;
+
+-- Helper views dropped above (they depended on the materialized view)
+CREATE OR REPLACE VIEW card_catalog.v_cards_by_name AS
+SELECT
+    card_name,
+    COUNT(*) AS version_count,
+    array_agg(DISTINCT set_name ORDER BY set_name) AS available_sets,
+    MIN(cmc) AS min_cmc,
+    MAX(cmc) AS max_cmc,
+    array_agg(DISTINCT rarity_name ORDER BY rarity_name) AS rarities
+FROM card_catalog.v_card_versions_complete
+GROUP BY card_name;
+
+CREATE OR REPLACE VIEW card_catalog.v_cards_latest_version AS
+SELECT DISTINCT ON (card_name)
+    card_version_id,
+    card_name,
+    set_name,
+    collector_number,
+    cmc,
+    mana_cost,
+    oracle_text,
+    type_line,
+    rarity_name,
+    power,
+    toughness,
+    loyalty
+FROM card_catalog.v_card_versions_complete
+ORDER BY card_name, materialized_at DESC;
+
+CREATE OR REPLACE VIEW card_catalog.v_set_statistics AS
+SELECT
+    set_name,
+    set_code,
+    COUNT(*) AS total_cards,
+    COUNT(*) FILTER (WHERE rarity_name = 'common') AS common_count,
+    COUNT(*) FILTER (WHERE rarity_name = 'uncommon') AS uncommon_count,
+    COUNT(*) FILTER (WHERE rarity_name = 'rare') AS rare_count,
+    COUNT(*) FILTER (WHERE rarity_name = 'mythic') AS mythic_count,
+    array_agg(DISTINCT color_identity) FILTER (WHERE array_length(color_identity, 1) > 0) AS color_combinations,
+    AVG(cmc) AS avg_cmc,
+    MIN(cmc) AS min_cmc,
+    MAX(cmc) AS max_cmc
+FROM card_catalog.v_card_versions_complete
+GROUP BY set_name, set_code;
+
+-- ---------------------------------------------------------------------------
+-- 3. Change tracking
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS card_catalog.card_search_dirty (
+    unique_card_id UUID PRIMARY KEY,
+    marked_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON card_catalog.card_search_dirty
+    TO app_celery, app_rw, app_admin;
+
+-- Link tables keyed by unique_card_id (card_types, card_color_identity,
+-- card_keyword, legalities). One trigger per event: transition tables are only
+-- allowed on single-event triggers.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_unique_card()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT o.unique_card_id FROM old_rows o
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT n.unique_card_id FROM new_rows n
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Link tables keyed by card_version_id (games, promos, stats, faces,
+-- per-version illustrations).
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_card_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM old_rows o
+        JOIN card_catalog.card_version cv ON cv.card_version_id = o.card_version_id
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM new_rows n
+        JOIN card_catalog.card_version cv ON cv.card_version_id = n.card_version_id
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Artist links feed the illustrations JSON of every printing using the
+-- illustration. An update can move a link, so both of its sides are marked.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_illustration()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM new_rows n
+        JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = n.illustration_id
+        JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM old_rows o
+        JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = o.illustration_id
+        JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM (
+            SELECT n.illustration_id FROM new_rows n
+            UNION
+            SELECT o.illustration_id FROM old_rows o
+        ) AS x
+        JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = x.illustration_id
+        JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Artist renames reach every printing whose illustration credits the artist.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_artist()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+    SELECT DISTINCT cv.unique_card_id
+    FROM new_rows n
+    JOIN old_rows o ON o.artist_id = n.artist_id
+    JOIN card_catalog.illustration_artist ia ON ia.artist_id = n.artist_id
+    JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = ia.illustration_id
+    JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+    WHERE n.artist_name IS DISTINCT FROM o.artist_name
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- card_version itself. Updates only count when a column the search views
+-- read changes, so the daily purchase_uris refresh marks nothing.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_card_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT n.unique_card_id FROM new_rows n
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT o.unique_card_id FROM old_rows o
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT x.unique_card_id
+        FROM (
+            SELECT n.unique_card_id
+            FROM new_rows n
+            JOIN old_rows o ON o.card_version_id = n.card_version_id
+            WHERE (n.unique_card_id, n.oracle_text, n.set_id, n.collector_number,
+                   n.rarity_id, n.border_color_id, n.frame_id, n.layout_id,
+                   n.is_promo, n.is_digital, n.is_oversized, n.full_art,
+                   n.textless, n.booster, n.variation, n.is_multifaced,
+                   n.frame_effects, n.lang)
+                  IS DISTINCT FROM
+                  (o.unique_card_id, o.oracle_text, o.set_id, o.collector_number,
+                   o.rarity_id, o.border_color_id, o.frame_id, o.layout_id,
+                   o.is_promo, o.is_digital, o.is_oversized, o.full_art,
+                   o.textless, o.booster, o.variation, o.is_multifaced,
+                   o.frame_effects, o.lang)
+            UNION
+            SELECT o.unique_card_id
+            FROM new_rows n
+            JOIN old_rows o ON o.card_version_id = n.card_version_id
+            WHERE o.unique_card_id IS DISTINCT FROM n.unique_card_id
+        ) AS x
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Card-level fields (name, cmc, mana cost, reserved) live on unique_cards_ref
+-- and are copied into every printing's row, so an edit there dirties the card.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_unique_card_ref()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+    SELECT n.unique_card_id
+    FROM new_rows n
+    JOIN old_rows o ON o.unique_card_id = n.unique_card_id
+    WHERE (n.card_name, n.cmc, n.mana_cost, n.reserved)
+          IS DISTINCT FROM
+          (o.card_name, o.cmc, o.mana_cost, o.reserved)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Set renames / code changes touch every printing in the set.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_set()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+    SELECT DISTINCT cv.unique_card_id
+    FROM new_rows n
+    JOIN old_rows o ON o.set_id = n.set_id
+    JOIN card_catalog.card_version cv ON cv.set_id = n.set_id
+    WHERE (n.set_name, n.set_code) IS DISTINCT FROM (o.set_name, o.set_code)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+    v_func  TEXT;
+BEGIN
+    FOR v_table, v_func IN
+        VALUES
+            ('card_types',                'card_search_mark_by_unique_card'),
+            ('card_color_identity',       'card_search_mark_by_unique_card'),
+            ('card_keyword',              'card_search_mark_by_unique_card'),
+            ('legalities',                'card_search_mark_by_unique_card'),
+            ('games_card_version',        'card_search_mark_by_card_version'),
+            ('promo_card',                'card_search_mark_by_card_version'),
+            ('card_version_stats',        'card_search_mark_by_card_version'),
+            ('card_faces',                'card_search_mark_by_card_version'),
+            ('card_version_illustration', 'card_search_mark_by_card_version'),
+            ('card_version',              'card_search_mark_card_version')
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_search_ins ON card_catalog.%I', v_table, v_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_search_upd ON card_catalog.%I', v_table, v_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_search_del ON card_catalog.%I', v_table, v_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_search_ins AFTER INSERT ON card_catalog.%I '
+            'REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.%I()',
+            v_table, v_table, v_func);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_search_upd AFTER UPDATE ON card_catalog.%I '
+            'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.%I()',
+            v_table, v_table, v_func);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_search_del AFTER DELETE ON card_catalog.%I '
+            'REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.%I()',
+            v_table, v_table, v_func);
+    END LOOP;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_illustration_artist_search_ins ON card_catalog.illustration_artist;
+CREATE TRIGGER trg_illustration_artist_search_ins
+AFTER INSERT ON card_catalog.illustration_artist
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_illustration();
+
+DROP TRIGGER IF EXISTS trg_illustration_artist_search_upd ON card_catalog.illustration_artist;
+CREATE TRIGGER trg_illustration_artist_search_upd
+AFTER UPDATE ON card_catalog.illustration_artist
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_illustration();
+
+DROP TRIGGER IF EXISTS trg_illustration_artist_search_del ON card_catalog.illustration_artist;
+CREATE TRIGGER trg_illustration_artist_search_del
+AFTER DELETE ON card_catalog.illustration_artist
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_illustration();
+
+DROP TRIGGER IF EXISTS trg_artists_ref_search_upd ON card_catalog.artists_ref;
+CREATE TRIGGER trg_artists_ref_search_upd
+AFTER UPDATE ON card_catalog.artists_ref
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_artist();
+
+DROP TRIGGER IF EXISTS trg_sets_search_upd ON card_catalog.sets;
+CREATE TRIGGER trg_sets_search_upd
+AFTER UPDATE ON card_catalog.sets
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_set();
+
+DROP TRIGGER IF EXISTS trg_unique_cards_ref_search_upd ON card_catalog.unique_cards_ref;
+CREATE TRIGGER trg_unique_cards_ref_search_upd
+AFTER UPDATE ON card_catalog.unique_cards_ref
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_unique_card_ref();
+
+-- ---------------------------------------------------------------------------
+-- 4. Refresh
+-- ---------------------------------------------------------------------------
+
+-- Upsert one search table from its source view; with p_incremental only the
+-- cards claimed into _card_search_claim are considered. Rows whose content is
+-- unchanged are not rewritten. Columns come from the target's catalog entry,
+-- so adding a column means adding it to both the table and the source view.
+CREATE OR REPLACE FUNCTION card_catalog.sync_card_search_table(
+    p_target      TEXT,
+    p_source      TEXT,
+    p_incremental BOOLEAN,
+    OUT rows_upserted BIGINT,
+    OUT rows_deleted  BIGINT
+) AS $$
+DECLARE
+    v_cols    TEXT;
+    v_set     TEXT;
+    v_old     TEXT;
+    v_new     TEXT;
+    v_has_ts  BOOLEAN;
+    v_filter  TEXT := '';
+    v_tfilter TEXT := '';
+BEGIN
+    SELECT
+        string_agg(quote_ident(a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname <> 'materialized_at'),
+        string_agg(format('%1$I = EXCLUDED.%1$I', a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname NOT IN ('card_version_id', 'materialized_at')),
+        string_agg(format('t.%I', a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname NOT IN ('card_version_id', 'materialized_at')),
+        string_agg(format('EXCLUDED.%I', a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname NOT IN ('card_version_id', 'materialized_at')),
+        bool_or(a.attname = 'materialized_at')
+    INTO v_cols, v_set, v_old, v_new, v_has_ts
+    FROM pg_attribute a
+    WHERE a.attrelid = p_target::regclass
+      AND a.attnum > 0
+      AND NOT a.attisdropped;
+
+    IF v_has_ts THEN
+        v_set := v_set || ', materialized_at = now()';
+    END IF;
+
+    IF p_incremental THEN
+        v_filter  := ' WHERE s.unique_card_id IN (SELECT unique_card_id FROM _card_search_claim)';
+        v_tfilter := ' t.unique_card_id IN (SELECT unique_card_id FROM _card_search_claim) AND';
+    END IF;
+
+    EXECUTE format(
+        'INSERT INTO %1$s AS t (%2$s) SELECT %3$s FROM %4$s s%5$s '
+        'ON CONFLICT (card_version_id) DO UPDATE SET %6$s '
+        'WHERE ROW(%7$s) IS DISTINCT FROM ROW(%8$s)',
+        p_target, v_cols,
+        (SELECT string_agg('s.' || c, ', ') FROM unnest(string_to_array(v_cols, ', ')) AS c),
+        p_source, v_filter, v_set, v_old, v_new
+    );
+    GET DIAGNOSTICS rows_upserted = ROW_COUNT;
+
+    EXECUTE format(
+        'DELETE FROM %1$s t WHERE%2$s NOT EXISTS '
+        '(SELECT 1 FROM %3$s s WHERE s.card_version_id = t.card_version_id)',
+        p_target, v_tfilter, p_source
+    );
+    GET DIAGNOSTICS rows_deleted = ROW_COUNT;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Claim the dirty cards and bring both search tables up to date. Falls back to
+-- a whole-source sync when more than p_full_threshold cards are dirty.
+CREATE OR REPLACE FUNCTION card_catalog.refresh_card_search_tables(
+    p_full_threshold INT DEFAULT 10000,
+    p_force_full     BOOLEAN DEFAULT false
+)
+RETURNS TABLE (
+    mode              TEXT,
+    dirty_cards       INT,
+    versions_upserted BIGINT,
+    versions_deleted  BIGINT,
+    suggest_upserted  BIGINT,
+    suggest_deleted   BIGINT
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = card_catalog, pg_catalog
+AS $$
+#variable_conflict use_column
+DECLARE
+    v_dirty INT;
+    v_incremental BOOLEAN;
+    v_versions RECORD;
+    v_suggest RECORD;
+BEGIN
+    DROP TABLE IF EXISTS _card_search_claim;
+    CREATE TEMP TABLE _card_search_claim (unique_card_id UUID PRIMARY KEY) ON COMMIT DROP;
+
+    -- Marks written by concurrent ingests after this point wait for the next run.
+    WITH claimed AS (
+        DELETE FROM card_catalog.card_search_dirty
+        RETURNING unique_card_id
+    )
+    INSERT INTO _card_search_claim (unique_card_id)
+    SELECT DISTINCT unique_card_id FROM claimed;
+    GET DIAGNOSTICS v_dirty = ROW_COUNT;
+
+    v_incremental := NOT p_force_full AND v_dirty <= p_full_threshold;
+
+    IF v_incremental AND v_dirty = 0 THEN
+        RETURN QUERY SELECT 'noop'::TEXT, 0, 0::BIGINT, 0::BIGINT, 0::BIGINT, 0::BIGINT;
+        RETURN;
+    END IF;
+
+    SELECT * INTO v_versions FROM card_catalog.sync_card_search_table(
+        'card_catalog.v_card_versions_complete',
+        'card_catalog.v_card_versions_complete_source',
+        v_incremental
+    );
+    SELECT * INTO v_suggest FROM card_catalog.sync_card_search_table(
+        'card_catalog.v_card_name_suggest',
+        'card_catalog.v_card_name_suggest_source',
+        v_incremental
+    );
+
+    RETURN QUERY SELECT
+        CASE WHEN v_incremental THEN 'incremental' ELSE 'full' END,
+        v_dirty,
+        v_versions.rows_upserted, v_versions.rows_deleted,
+        v_suggest.rows_upserted, v_suggest.rows_deleted;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION card_catalog.refresh_card_search_tables(INT, BOOLEAN) TO app_celery, app_rw, app_admin;
+
+-- Existing entry points now go through the incremental refresh.
+CREATE OR REPLACE FUNCTION card_catalog.refresh_card_versions_complete()
+RETURNS void AS $$
+BEGIN
+    PERFORM card_catalog.refresh_card_search_tables(p_force_full => true);
+    RAISE NOTICE 'Search table v_card_versions_complete refreshed at %', now();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE PROCEDURE card_catalog.refresh_card_search_views()
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = card_catalog, pg_catalog
+AS $$
+BEGIN
+    PERFORM card_catalog.refresh_card_search_tables();
+END;
+$$;
+
+GRANT EXECUTE ON PROCEDURE card_catalog.refresh_card_search_views() TO app_celery, app_rw, app_admin;
+
+COMMIT;
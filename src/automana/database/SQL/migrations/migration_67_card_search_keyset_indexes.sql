@@ -0,0 +1,16 @@
+-- migration_67_card_search_keyset_indexes.sql
+-- Card search pages by (sort key, card_version_id) instead of OFFSET. Give the
+-- default name sort and the set-browse path (set_code filter, name sort) an
+-- index that matches the full ORDER BY so each page is a short index seek.
+-- idx_v_card_versions_complete_name keeps its name; the composite still serves
+-- plain card_name lookups.
+BEGIN;
+
+DROP INDEX IF EXISTS card_catalog.idx_v_card_versions_complete_name;
+CREATE INDEX idx_v_card_versions_complete_name
+    ON card_catalog.v_card_versions_complete (card_name, card_version_id);
+
+CREATE INDEX IF NOT EXISTS idx_v_card_versions_complete_set_code_name
+    ON card_catalog.v_card_versions_complete (set_code, card_name, card_version_id);
+
+COMMIT;
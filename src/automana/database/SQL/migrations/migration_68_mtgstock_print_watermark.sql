@@ -0,0 +1,30 @@
+-- migration_68_mtgstock_print_watermark.sql
+--
+-- Per-print high-water marks for MTGStock ingestion.
+--
+-- mtg_stock.data_staging.bulk_load used to land the full 14-year history of
+-- every print in pricing.raw_mtg_stock_price on each run, and
+-- pricing.load_staging_prices_batched re-pivoted all of it (~456M rows). The
+-- procedure already derives its window from min/max(ts_date) of the raw
+-- table, so landing only rows newer than each print's watermark shrinks the
+-- whole chain to the day's new observations.
+--
+-- last_ts_date is advanced by mtg_stock.data_staging.advance_watermarks only
+-- after promotion succeeds, from the raw rows of that run. A failed run
+-- therefore re-emits the same window next time; promotion is idempotent
+-- (ON CONFLICT), so that is safe.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS ops.mtgstock_print_watermark (
+    print_id      BIGINT      NOT NULL,
+    source_code   TEXT        NOT NULL,
+    last_ts_date  DATE        NOT NULL,
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (print_id, source_code)
+);
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON ops.mtgstock_print_watermark
+    TO app_backend, app_celery;
+
+COMMIT;
@@ -0,0 +1,24 @@
+-- migration_69_listing_actions_claim_lease.sql
+--
+-- Lease for claimed listing actions.
+--
+-- integrations.ebay.actions.drain moves rows to 'processing' when it claims
+-- them and writes the outcome back once the batch has run. A drain that dies
+-- in between left its rows in 'processing' for good. claimed_at records when
+-- a row was claimed; the claim query takes back 'processing' rows whose
+-- claim is older than the lease, and the outcome write only lands while the
+-- row still carries the claimed_at its drain was given.
+--
+-- Rows already stuck in 'processing' have no claimed_at and are claimed again
+-- by the next drain.
+
+BEGIN;
+
+ALTER TABLE app_integration.listing_pending_actions
+    ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_listing_actions_processing
+    ON app_integration.listing_pending_actions (claimed_at)
+    WHERE status = 'processing';
+
+COMMIT;
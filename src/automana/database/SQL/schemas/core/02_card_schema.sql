@@ -385,175 +385,65 @@ FROM card_catalog.unique_cards_ref uc
 LEFT JOIN card_catalog.card_version cv ON uc.unique_card_id = cv.unique_card_id
 GROUP BY uc.unique_card_id, uc.card_name;
 
-CREATE MATERIALIZED VIEW card_catalog.v_card_versions_complete AS
-WITH 
--- Card types aggregated
-card_types_agg AS (
-    SELECT 
-        ct.unique_card_id,
-        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'type') AS types,
-        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'subtype') AS subtypes,
-        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'supertype') AS supertypes
-    FROM card_catalog.card_types ct
-    GROUP BY ct.unique_card_id
-),
--- Colors aggregated
-colors_agg AS (
-    SELECT 
-        cci.unique_card_id,
-        array_agg(cr.color_name ORDER BY cr.color_name) AS color_identity
-    FROM card_catalog.card_color_identity cci
-    JOIN card_catalog.colors_ref cr ON cci.color_id = cr.color_id
-    GROUP BY cci.unique_card_id
-),
--- Keywords aggregated
-keywords_agg AS (
-    SELECT 
-        ck.unique_card_id,
-        array_agg(kr.keyword_name ORDER BY kr.keyword_name) AS keywords
-    FROM card_catalog.card_keyword ck
-    JOIN card_catalog.keywords_ref kr ON ck.keyword_id = kr.keyword_id
-    GROUP BY ck.unique_card_id
-),
--- Legalities aggregated
-legalities_agg AS (
-    SELECT 
-        l.unique_card_id,
-        jsonb_object_agg(
-            fr.format_name, 
-            lsr.legal_status
-        ) AS legalities
-    FROM card_catalog.legalities l
-    JOIN card_catalog.formats_ref fr ON l.format_id = fr.format_id
-    JOIN card_catalog.legal_status_ref lsr ON l.legality_id = lsr.legality_id
-    GROUP BY l.unique_card_id
-),
--- Games aggregated
-games_agg AS (
-    SELECT 
-        gcv.card_version_id,
-        array_agg(gr.game_description ORDER BY gr.game_description) AS games
-    FROM card_catalog.games_card_version gcv
-    JOIN card_catalog.games_ref gr ON gcv.game_id = gr.game_id
-    GROUP BY gcv.card_version_id
-),
--- Promo types aggregated
-promo_types_agg AS (
-    SELECT 
-        pc.card_version_id,
-        array_agg(ptr.promo_type_desc ORDER BY ptr.promo_type_desc) AS promo_types
-    FROM card_catalog.promo_card pc
-    JOIN card_catalog.promo_types_ref ptr ON pc.promo_id = ptr.promo_id
-    GROUP BY pc.card_version_id
-),
--- Card stats pivoted
-card_stats_agg AS (
-    SELECT 
-        cvs.card_version_id,
-        MAX(CASE WHEN csr.stat_name = 'power' THEN cvs.stat_value END) AS power,
-        MAX(CASE WHEN csr.stat_name = 'toughness' THEN cvs.stat_value END) AS toughness,
-        MAX(CASE WHEN csr.stat_name = 'loyalty' THEN cvs.stat_value END) AS loyalty,
-        MAX(CASE WHEN csr.stat_name = 'defense' THEN cvs.stat_value END) AS defense
-    FROM card_catalog.card_version_stats cvs
-    JOIN card_catalog.card_stats_ref csr ON cvs.stat_id = csr.stat_id
-    GROUP BY cvs.card_version_id
-),
--- Illustrations with artists
-illustrations_agg AS (
-     SELECT
-    cvi.card_version_id,
-    jsonb_agg(
-      jsonb_build_object(
-        'illustration_id', cvi.illustration_id,
-        'image_uris', cvi.image_uris,
-        'added_on', i.added_on,
-        'artist_id', ar.artist_id,
-        'artist_name', ar.artist_name
-      )
-      ORDER BY i.added_on NULLS LAST, cvi.illustration_id
-    ) AS illustrations
-  FROM card_catalog.card_version_illustration cvi
-  JOIN card_catalog.illustrations i ON cvi.illustration_id = i.illustration_id
-  LEFT JOIN card_catalog.illustration_artist ia ON i.illustration_id = ia.illustration_id
-  LEFT JOIN card_catalog.artists_ref ar ON ia.artist_id = ar.artist_id
-  GROUP BY cvi.card_version_id
-),
--- Card faces aggregated
-card_faces_agg AS (
-    SELECT 
-        cf.card_version_id,
-        jsonb_agg(
-            jsonb_build_object(
-                'face_index', cf.face_index,
-                'name', cf.name,
-                'mana_cost', cf.mana_cost,
-                'type_line', cf.type_line,
-                'oracle_text', cf.oracle_text,
-                'power', cf.power,
-                'toughness', cf.toughness,
-                'flavor_text', cf.flavor_text
-            ) ORDER BY cf.face_index
-        ) AS card_faces
-    FROM card_catalog.card_faces cf
-    GROUP BY cf.card_version_id
-)
--- ✅ MAIN SELECT: Join everything together
-SELECT 
+-- Search definitions; filtering on unique_card_id pushes into every LATERAL
+-- aggregate, which is what makes the incremental refresh cheap.
+CREATE OR REPLACE VIEW card_catalog.v_card_versions_complete_source AS
+SELECT
     -- Primary IDs
     cv.card_version_id,
     cv.unique_card_id,
     ucr.card_name,
-    
+
     -- Set information
     s.set_id,
     s.set_name,
     s.set_code,
     cv.collector_number,
-    
+
     -- Card basics
     ucr.cmc,
     ucr.mana_cost,
     cv.oracle_text,
     ucr.reserved,
-    
+
     -- Type information
     COALESCE(cta.types, ARRAY[]::text[]) AS types,
     COALESCE(cta.subtypes, ARRAY[]::text[]) AS subtypes,
     COALESCE(cta.supertypes, ARRAY[]::text[]) AS supertypes,
-    
+
     -- Type line (constructed)
-    CASE 
-        WHEN array_length(COALESCE(cta.supertypes, ARRAY[]::text[]), 1) > 0 
+    CASE
+        WHEN array_length(COALESCE(cta.supertypes, ARRAY[]::text[]), 1) > 0
         THEN array_to_string(cta.supertypes, ' ') || ' '
         ELSE ''
     END ||
-    CASE 
-        WHEN array_length(COALESCE(cta.types, ARRAY[]::text[]), 1) > 0 
+    CASE
+        WHEN array_length(COALESCE(cta.types, ARRAY[]::text[]), 1) > 0
         THEN array_to_string(cta.types, ' ')
         ELSE ''
     END ||
-    CASE 
-        WHEN array_length(COALESCE(cta.subtypes, ARRAY[]::text[]), 1) > 0 
+    CASE
+        WHEN array_length(COALESCE(cta.subtypes, ARRAY[]::text[]), 1) > 0
         THEN ' — ' || array_to_string(cta.subtypes, ' ')
         ELSE ''
     END AS type_line,
-    
+
     -- Colors and identity
     COALESCE(ca.color_identity, ARRAY[]::text[]) AS color_identity,
     COALESCE(ka.keywords, ARRAY[]::text[]) AS keywords,
-    
+
     -- Stats
     csa.power,
     csa.toughness,
     csa.loyalty,
     csa.defense,
-    
+
     -- Rarity and visual
     rr.rarity_name,
     bcr.border_color_name,
     fr.frame_year,
     lr.layout_name,
-    
+
     -- Treatment and language
     cv.frame_effects,
     cv.lang,
@@ -567,33 +457,30 @@ SELECT
     cv.booster,
     cv.variation,
     cv.is_multifaced,
-    
+
     -- Artist and illustration
     COALESCE(ia.illustrations, '[]'::jsonb) AS illustrations,
-    
+
     -- Aggregated data
     COALESCE(la.legalities, '{}'::jsonb) AS legalities,
     COALESCE(ga.games, ARRAY[]::text[]) AS games,
     COALESCE(pta.promo_types, ARRAY[]::text[]) AS promo_types,
     COALESCE(cfa.card_faces, '[]'::jsonb) AS card_faces,
-    
+
     -- Face count for quick reference
-    CASE 
-        WHEN cv.is_multifaced THEN jsonb_array_length(COALESCE(cfa.card_faces, '[]'::jsonb))--change the reference
+    CASE
+        WHEN cv.is_multifaced THEN jsonb_array_length(COALESCE(cfa.card_faces, '[]'::jsonb))
         ELSE 1
     END AS face_count,
-    
+
     -- Search helpers
-    to_tsvector('english', 
-        ucr.card_name || ' ' || 
+    to_tsvector('english',
+        ucr.card_name || ' ' ||
         COALESCE(cv.oracle_text, '') || ' ' ||
         COALESCE(array_to_string(cta.types, ' '), '') || ' ' ||
         COALESCE(array_to_string(cta.subtypes, ' '), '') || ' ' ||
         COALESCE(array_to_string(ka.keywords, ' '), '')
-    ) AS search_vector,
-    
-    -- Timestamps
-    CURRENT_TIMESTAMP AS materialized_at
+    ) AS search_vector
 
 FROM card_catalog.card_version cv
 JOIN card_catalog.unique_cards_ref ucr ON cv.unique_card_id = ucr.unique_card_id
@@ -603,16 +490,97 @@ JOIN card_catalog.border_color_ref bcr ON cv.border_color_id = bcr.border_color_
 JOIN card_catalog.frames_ref fr ON cv.frame_id = fr.frame_id
 JOIN card_catalog.layouts_ref lr ON cv.layout_id = lr.layout_id
 
--- Join aggregated data
-LEFT JOIN card_types_agg cta ON ucr.unique_card_id = cta.unique_card_id
-LEFT JOIN colors_agg ca ON ucr.unique_card_id = ca.unique_card_id
-LEFT JOIN keywords_agg ka ON ucr.unique_card_id = ka.unique_card_id
-LEFT JOIN legalities_agg la ON ucr.unique_card_id = la.unique_card_id
-LEFT JOIN games_agg ga ON cv.card_version_id = ga.card_version_id
-LEFT JOIN promo_types_agg pta ON cv.card_version_id = pta.card_version_id
-LEFT JOIN card_stats_agg csa ON cv.card_version_id = csa.card_version_id
-LEFT JOIN illustrations_agg ia ON cv.card_version_id = ia.card_version_id
-LEFT JOIN card_faces_agg cfa ON cv.card_version_id = cfa.card_version_id
+-- Card types aggregated
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'type') AS types,
+        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'subtype') AS subtypes,
+        array_agg(ct.type_name ORDER BY ct.type_name) FILTER (WHERE ct.type_category = 'supertype') AS supertypes
+    FROM card_catalog.card_types ct
+    WHERE ct.unique_card_id = cv.unique_card_id
+) cta ON true
+-- Colors aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(cr.color_name ORDER BY cr.color_name) AS color_identity
+    FROM card_catalog.card_color_identity cci
+    JOIN card_catalog.colors_ref cr ON cci.color_id = cr.color_id
+    WHERE cci.unique_card_id = cv.unique_card_id
+) ca ON true
+-- Keywords aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(kr.keyword_name ORDER BY kr.keyword_name) AS keywords
+    FROM card_catalog.card_keyword ck
+    JOIN card_catalog.keywords_ref kr ON ck.keyword_id = kr.keyword_id
+    WHERE ck.unique_card_id = cv.unique_card_id
+) ka ON true
+-- Legalities aggregated
+LEFT JOIN LATERAL (
+    SELECT jsonb_object_agg(fmt.format_name, lsr.legal_status) AS legalities
+    FROM card_catalog.legalities l
+    JOIN card_catalog.formats_ref fmt ON l.format_id = fmt.format_id
+    JOIN card_catalog.legal_status_ref lsr ON l.legality_id = lsr.legality_id
+    WHERE l.unique_card_id = cv.unique_card_id
+) la ON true
+-- Games aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(gr.game_description ORDER BY gr.game_description) AS games
+    FROM card_catalog.games_card_version gcv
+    JOIN card_catalog.games_ref gr ON gcv.game_id = gr.game_id
+    WHERE gcv.card_version_id = cv.card_version_id
+) ga ON true
+-- Promo types aggregated
+LEFT JOIN LATERAL (
+    SELECT array_agg(ptr.promo_type_desc ORDER BY ptr.promo_type_desc) AS promo_types
+    FROM card_catalog.promo_card pc
+    JOIN card_catalog.promo_types_ref ptr ON pc.promo_id = ptr.promo_id
+    WHERE pc.card_version_id = cv.card_version_id
+) pta ON true
+-- Card stats pivoted
+LEFT JOIN LATERAL (
+    SELECT
+        MAX(CASE WHEN csr.stat_name = 'power' THEN cvs.stat_value END) AS power,
+        MAX(CASE WHEN csr.stat_name = 'toughness' THEN cvs.stat_value END) AS toughness,
+        MAX(CASE WHEN csr.stat_name = 'loyalty' THEN cvs.stat_value END) AS loyalty,
+        MAX(CASE WHEN csr.stat_name = 'defense' THEN cvs.stat_value END) AS defense
+    FROM card_catalog.card_version_stats cvs
+    JOIN card_catalog.card_stats_ref csr ON cvs.stat_id = csr.stat_id
+    WHERE cvs.card_version_id = cv.card_version_id
+) csa ON true
+-- Illustrations with artists
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object(
+            'illustration_id', cvi.illustration_id,
+            'image_uris', cvi.image_uris,
+            'added_on', i.added_on,
+            'artist_id', ar.artist_id,
+            'artist_name', ar.artist_name
+        )
+        ORDER BY i.added_on NULLS LAST, cvi.illustration_id
+    ) AS illustrations
+    FROM card_catalog.card_version_illustration cvi
+    JOIN card_catalog.illustrations i ON cvi.illustration_id = i.illustration_id
+    LEFT JOIN card_catalog.illustration_artist iart ON i.illustration_id = iart.illustration_id
+    LEFT JOIN card_catalog.artists_ref ar ON iart.artist_id = ar.artist_id
+    WHERE cvi.card_version_id = cv.card_version_id
+) ia ON true
+-- Card faces aggregated
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object(
+            'face_index', cf.face_index,
+            'name', cf.name,
+            'mana_cost', cf.mana_cost,
+            'type_line', cf.type_line,
+            'oracle_text', cf.oracle_text,
+            'power', cf.power,
+            'toughness', cf.toughness,
+            'flavor_text', cf.flavor_text
+        ) ORDER BY cf.face_index
+    ) AS card_faces
+    FROM card_catalog.card_faces cf
+    WHERE cf.card_version_id = cv.card_version_id
+) cfa ON true
 WHERE cv.lang = 'en'
    OR NOT EXISTS (
        SELECT 1 FROM card_catalog.card_version en_cv
@@ -621,44 +589,61 @@ WHERE cv.lang = 'en'
          AND en_cv.lang = 'en'
    );
 
-CREATE UNIQUE INDEX idx_v_card_versions_complete_pk ON card_catalog.v_card_versions_complete (card_version_id);
-CREATE INDEX idx_v_card_versions_complete_name ON card_catalog.v_card_versions_complete (card_name);
-CREATE INDEX idx_v_card_versions_complete_set ON card_catalog.v_card_versions_complete (set_name, collector_number);
-CREATE INDEX idx_v_card_versions_complete_cmc ON card_catalog.v_card_versions_complete (cmc);
-CREATE INDEX idx_v_card_versions_complete_colors ON card_catalog.v_card_versions_complete USING GIN (color_identity);
-CREATE INDEX idx_v_card_versions_complete_types ON card_catalog.v_card_versions_complete USING GIN (types);
-CREATE INDEX IF NOT EXISTS idx_v_card_versions_complete_promo_types
-    ON card_catalog.v_card_versions_complete USING GIN (promo_types);
-CREATE INDEX idx_v_card_versions_complete_rarity ON card_catalog.v_card_versions_complete (rarity_name);
-CREATE INDEX idx_v_card_versions_complete_search ON card_catalog.v_card_versions_complete USING GIN (search_vector);
-CREATE INDEX idx_v_card_versions_complete_legalities ON card_catalog.v_card_versions_complete USING GIN (legalities);
-
-CREATE MATERIALIZED VIEW IF NOT EXISTS card_catalog.v_card_name_suggest AS
+CREATE OR REPLACE VIEW card_catalog.v_card_name_suggest_source AS
 SELECT
     cv.card_version_id,
     uc.card_name,
     s.set_code,
-    r.rarity_name
+    r.rarity_name,
+    cv.unique_card_id
 FROM card_catalog.card_version cv
 JOIN card_catalog.unique_cards_ref uc ON cv.unique_card_id = uc.unique_card_id
 JOIN card_catalog.sets s ON cv.set_id = s.set_id
 JOIN card_catalog.rarities_ref r ON cv.rarity_id = r.rarity_id;
 
--- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
-CREATE UNIQUE INDEX idx_v_card_name_suggest_pk
-    ON card_catalog.v_card_name_suggest (card_version_id);
+-- Search tables: same shape as the source views (plus materialized_at), kept
+-- up to date by card_catalog.refresh_card_search_tables() from the cards
+-- marked in card_search_dirty. They keep the old materialized-view names so
+-- readers are unchanged.
+CREATE TABLE card_catalog.v_card_versions_complete AS
+SELECT s.*, CURRENT_TIMESTAMP AS materialized_at
+FROM card_catalog.v_card_versions_complete_source s
+WITH NO DATA;
+
+CREATE TABLE card_catalog.v_card_name_suggest AS
+SELECT s.* FROM card_catalog.v_card_name_suggest_source s
+WITH NO DATA;
+
+ALTER TABLE card_catalog.v_card_versions_complete
+    ALTER COLUMN materialized_at SET DEFAULT now(),
+    ADD CONSTRAINT idx_v_card_versions_complete_pk PRIMARY KEY (card_version_id);
+ALTER TABLE card_catalog.v_card_name_suggest
+    ADD CONSTRAINT idx_v_card_name_suggest_pk PRIMARY KEY (card_version_id);
+
+CREATE INDEX idx_v_card_versions_complete_unique_card ON card_catalog.v_card_versions_complete (unique_card_id);
+CREATE INDEX idx_v_card_versions_complete_name ON card_catalog.v_card_versions_complete (card_name, card_version_id);
+CREATE INDEX idx_v_card_versions_complete_set_code_name ON card_catalog.v_card_versions_complete (set_code, card_name, card_version_id);
+CREATE INDEX idx_v_card_versions_complete_set ON card_catalog.v_card_versions_complete (set_name, collector_number);
+CREATE INDEX idx_v_card_versions_complete_cmc ON card_catalog.v_card_versions_complete (cmc);
+CREATE INDEX idx_v_card_versions_complete_colors ON card_catalog.v_card_versions_complete USING GIN (color_identity);
+CREATE INDEX idx_v_card_versions_complete_types ON card_catalog.v_card_versions_complete USING GIN (types);
+CREATE INDEX idx_v_card_versions_complete_promo_types ON card_catalog.v_card_versions_complete USING GIN (promo_types);
+CREATE INDEX idx_v_card_versions_complete_rarity ON card_catalog.v_card_versions_complete (rarity_name);
+CREATE INDEX idx_v_card_versions_complete_search ON card_catalog.v_card_versions_complete USING GIN (search_vector);
+CREATE INDEX idx_v_card_versions_complete_legalities ON card_catalog.v_card_versions_complete USING GIN (legalities);
+CREATE INDEX gin_trgm_idx_v_card_versions_name
+    ON card_catalog.v_card_versions_complete
+    USING GIN (card_name gin_trgm_ops);
 
--- GIN trigram index for autocomplete fuzzy matching
+CREATE INDEX idx_v_card_name_suggest_unique_card ON card_catalog.v_card_name_suggest (unique_card_id);
 CREATE INDEX gin_trgm_idx_v_card_name_suggest
     ON card_catalog.v_card_name_suggest
     USING GIN (card_name gin_trgm_ops);
 
--- GIN trigram index for fuzzy name ranking in full search
-CREATE INDEX gin_trgm_idx_v_card_versions_name
-    ON card_catalog.v_card_versions_complete
-    USING GIN (card_name gin_trgm_ops);
-
-GRANT SELECT ON card_catalog.v_card_name_suggest TO app_admin, app_rw, app_ro, agent_reader;
+GRANT SELECT ON card_catalog.v_card_versions_complete, card_catalog.v_card_versions_complete_source
+    TO app_admin, app_rw, app_ro, agent_reader;
+GRANT SELECT ON card_catalog.v_card_name_suggest, card_catalog.v_card_name_suggest_source
+    TO app_admin, app_rw, app_ro, agent_reader;
 
 --STORED PROCEDURE---------------------------
 -- Drop old overload that accepted p_finish VARCHAR(20) (singular).
@@ -1302,18 +1287,1033 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- COPY-based loader (migration_65): stage tables + set-based merge used by
+-- CardReferenceRepository.stage_card_batch / merge_staged_cards.
+CREATE UNLOGGED TABLE IF NOT EXISTS card_catalog.card_version_load_stage (
+    load_id              UUID     NOT NULL,
+    batch_seq            INT      NOT NULL,
+    row_index            INT      NOT NULL,
+    card_name            TEXT     NOT NULL,
+    cmc                  INT,
+    mana_cost            TEXT,
+    reserved             BOOLEAN,
+    oracle_text          TEXT,
+    set_name             TEXT,
+    collector_number     TEXT,
+    rarity_name          TEXT,
+    border_color         TEXT,
+    frame_year           TEXT,
+    layout_name          TEXT,
+    is_promo             BOOLEAN,
+    is_digital           BOOLEAN,
+    keywords             TEXT[]   NOT NULL DEFAULT '{}',
+    colors               TEXT[]   NOT NULL DEFAULT '{}',
+    artist               TEXT[]   NOT NULL DEFAULT '{}',
+    artist_ids           UUID[]   NOT NULL DEFAULT '{}',
+    legalities           JSONB,
+    illustration_id      UUID,
+    types                TEXT[]   NOT NULL DEFAULT '{}',
+    supertypes           TEXT[]   NOT NULL DEFAULT '{}',
+    subtypes             TEXT[]   NOT NULL DEFAULT '{}',
+    games                TEXT[]   NOT NULL DEFAULT '{}',
+    oversized            BOOLEAN,
+    booster              BOOLEAN,
+    full_art             BOOLEAN,
+    textless             BOOLEAN,
+    power                TEXT,
+    toughness            TEXT,
+    loyalty              TEXT,
+    defense              TEXT,
+    promo_types          TEXT[]   NOT NULL DEFAULT '{}',
+    variation            BOOLEAN,
+    image_uris           JSONB,
+    finishes             TEXT[]   NOT NULL DEFAULT '{nonfoil}',
+    frame_effects        TEXT[]   NOT NULL DEFAULT '{}',
+    lang                 TEXT     NOT NULL DEFAULT 'en',
+    scryfall_id          UUID,
+    oracle_id            UUID,
+    multiverse_ids       INT[]    NOT NULL DEFAULT '{}',
+    tcgplayer_id         INT,
+    tcgplayer_etched_id  INT,
+    cardmarket_id        INT,
+    card_back_id         UUID,
+    -- Written back by the merge.
+    card_version_id      UUID,
+    error_details        JSONB,
+    PRIMARY KEY (load_id, batch_seq, row_index)
+);
+
+CREATE UNLOGGED TABLE IF NOT EXISTS card_catalog.card_face_load_stage (
+    load_id          UUID    NOT NULL,
+    batch_seq        INT     NOT NULL,
+    row_index        INT     NOT NULL,
+    face_position    INT     NOT NULL,   -- position in the card_faces array
+    face_index       INT,
+    name             TEXT,
+    mana_cost        TEXT,
+    type_line        TEXT,
+    oracle_text      TEXT,
+    power            TEXT,
+    toughness        TEXT,
+    flavor_text      TEXT,
+    artist           TEXT,
+    artist_id        UUID,
+    illustration_id  UUID,
+    image_uris       JSONB,
+    supertypes       TEXT[]  NOT NULL DEFAULT '{}',
+    types            TEXT[]  NOT NULL DEFAULT '{}',
+    subtypes         TEXT[]  NOT NULL DEFAULT '{}',
+    PRIMARY KEY (load_id, batch_seq, row_index, face_position)
+);
+
+GRANT SELECT, INSERT, UPDATE, DELETE
+    ON card_catalog.card_version_load_stage, card_catalog.card_face_load_stage
+    TO app_celery, app_rw, app_admin;
+
+-- ---------------------------------------------------------------------------
+-- Set-based merge of one load (p_batch_seq NULL) or one batch of it.
+-- Mirrors insert_full_card_version statement by statement; returns the number
+-- of stage rows resolved to a card_version_id.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION card_catalog.merge_card_version_stage_set(
+    p_load_id   UUID,
+    p_batch_seq INT DEFAULT NULL
+)
+RETURNS INT AS $$
+DECLARE
+    v_resolved INT;
+BEGIN
+    DROP TABLE IF EXISTS _cv_stage;
+    CREATE TEMP TABLE _cv_stage ON COMMIT DROP AS
+    SELECT s.*
+    FROM card_catalog.card_version_load_stage s
+    WHERE s.load_id = p_load_id
+      AND (p_batch_seq IS NULL OR s.batch_seq = p_batch_seq);
+
+    DROP TABLE IF EXISTS _cf_stage;
+    CREATE TEMP TABLE _cf_stage ON COMMIT DROP AS
+    SELECT f.*
+    FROM card_catalog.card_face_load_stage f
+    WHERE f.load_id = p_load_id
+      AND (p_batch_seq IS NULL OR f.batch_seq = p_batch_seq);
+
+    -- Reference rows (first occurrence wins, as with row-by-row inserts)
+    INSERT INTO card_catalog.unique_cards_ref (card_name, cmc, mana_cost, reserved)
+    SELECT DISTINCT ON (s.card_name) s.card_name, s.cmc, s.mana_cost, s.reserved
+    FROM _cv_stage s
+    ORDER BY s.card_name, s.batch_seq, s.row_index
+    ON CONFLICT (card_name) DO NOTHING;
+
+    INSERT INTO card_catalog.rarities_ref (rarity_name)
+    SELECT DISTINCT s.rarity_name FROM _cv_stage s WHERE s.rarity_name IS NOT NULL
+    ON CONFLICT (rarity_name) DO NOTHING;
+
+    INSERT INTO card_catalog.border_color_ref (border_color_name)
+    SELECT DISTINCT s.border_color FROM _cv_stage s WHERE s.border_color IS NOT NULL
+    ON CONFLICT (border_color_name) DO NOTHING;
+
+    INSERT INTO card_catalog.frames_ref (frame_year)
+    SELECT DISTINCT s.frame_year FROM _cv_stage s WHERE s.frame_year IS NOT NULL
+    ON CONFLICT (frame_year) DO NOTHING;
+
+    INSERT INTO card_catalog.layouts_ref (layout_name)
+    SELECT DISTINCT s.layout_name FROM _cv_stage s WHERE s.layout_name IS NOT NULL
+    ON CONFLICT (layout_name) DO NOTHING;
+
+    -- Resolved working set
+    DROP TABLE IF EXISTS _cv_work;
+    CREATE TEMP TABLE _cv_work ON COMMIT DROP AS
+    SELECT
+        u.unique_card_id,
+        COALESCE(st.set_id, '00000000-0000-0000-0000-000000000002'::uuid) AS set_id,
+        r.rarity_id,
+        b.border_color_id,
+        fr.frame_id,
+        l.layout_id,
+        s.*,
+        EXISTS (
+            SELECT 1 FROM _cf_stage f
+            WHERE f.batch_seq = s.batch_seq AND f.row_index = s.row_index
+        ) AS has_faces
+    FROM _cv_stage s
+    JOIN card_catalog.unique_cards_ref u ON u.card_name = s.card_name
+    LEFT JOIN card_catalog.sets st ON st.set_name = s.set_name
+    LEFT JOIN card_catalog.rarities_ref r ON r.rarity_name = s.rarity_name
+    LEFT JOIN card_catalog.border_color_ref b ON b.border_color_name = s.border_color
+    LEFT JOIN card_catalog.frames_ref fr ON fr.frame_year = s.frame_year
+    LEFT JOIN card_catalog.layouts_ref l ON l.layout_name = s.layout_name;
+
+    -- The stage copy of card_version_id is empty; replace it with cv_id so the
+    -- resolved id below is unambiguous.
+    ALTER TABLE _cv_work DROP COLUMN card_version_id;
+    ALTER TABLE _cv_work ADD COLUMN cv_id UUID;
+
+    INSERT INTO card_catalog.card_version (
+        unique_card_id, oracle_text, set_id,
+        collector_number, rarity_id, border_color_id,
+        frame_id, layout_id, is_promo, is_digital,
+        is_oversized, full_art, textless, booster,
+        variation, frame_effects, lang, card_back_id
+    )
+    SELECT DISTINCT ON (w.unique_card_id, w.set_id, w.collector_number, w.lang)
+        w.unique_card_id, w.oracle_text, w.set_id,
+        w.collector_number, w.rarity_id, w.border_color_id,
+        w.frame_id, w.layout_id, w.is_promo, w.is_digital,
+        w.oversized, w.full_art, w.textless, w.booster,
+        w.variation, COALESCE(w.frame_effects, '{}'), w.lang, w.card_back_id
+    FROM _cv_work w
+    WHERE w.collector_number IS NOT NULL   -- NULL keys never conflict; left to the row path
+    ORDER BY w.unique_card_id, w.set_id, w.collector_number, w.lang, w.batch_seq, w.row_index
+    ON CONFLICT (unique_card_id, set_id, collector_number, lang) DO NOTHING;
+
+    UPDATE _cv_work w
+    SET cv_id = cv.card_version_id
+    FROM card_catalog.card_version cv
+    WHERE cv.unique_card_id = w.unique_card_id
+      AND cv.set_id = w.set_id
+      AND cv.collector_number = w.collector_number
+      AND cv.lang = w.lang;
+
+    -- External identifiers
+    INSERT INTO card_catalog.card_external_identifier (card_identifier_ref_id, card_version_id, value)
+    SELECT r.card_identifier_ref_id, n.cv_id, n.value
+    FROM (
+        SELECT w.cv_id, 'scryfall_id' AS name, w.scryfall_id::text AS value FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'oracle_id', w.oracle_id::text FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'multiverse_id', m::text FROM _cv_work w, unnest(w.multiverse_ids) AS m
+        UNION ALL SELECT w.cv_id, 'tcgplayer_id', w.tcgplayer_id::text FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'tcgplayer_etched_id', w.tcgplayer_etched_id::text FROM _cv_work w
+        UNION ALL SELECT w.cv_id, 'cardmarket_id', w.cardmarket_id::text FROM _cv_work w
+    ) AS n
+    JOIN card_catalog.card_identifier_ref r ON r.identifier_name = n.name
+    WHERE n.value IS NOT NULL AND n.cv_id IS NOT NULL
+    ON CONFLICT (card_version_id, card_identifier_ref_id) DO NOTHING;
+
+    -- Stats
+    INSERT INTO card_catalog.card_version_stats (card_version_id, stat_id, stat_value)
+    SELECT w.cv_id, sr.stat_id, v.stat_value
+    FROM _cv_work w
+    CROSS JOIN LATERAL (
+        VALUES ('power', w.power), ('toughness', w.toughness),
+               ('loyalty', w.loyalty), ('defense', w.defense)
+    ) AS v(stat_name, stat_value)
+    JOIN card_catalog.card_stats_ref sr ON sr.stat_name = v.stat_name
+    WHERE v.stat_value IS NOT NULL AND w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Promo types
+    INSERT INTO card_catalog.promo_types_ref (promo_type_desc)
+    SELECT DISTINCT pt FROM _cv_work w, unnest(w.promo_types) AS pt
+    ON CONFLICT (promo_type_desc) DO NOTHING;
+
+    INSERT INTO card_catalog.promo_card (promo_id, card_version_id)
+    SELECT p.promo_id, w.cv_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.promo_types) AS pt(descr)
+    JOIN card_catalog.promo_types_ref p ON p.promo_type_desc = pt.descr
+    WHERE w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Finishes
+    INSERT INTO card_catalog.card_version_finish (card_version_id, finish_id)
+    SELECT w.cv_id, cf.finish_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(COALESCE(w.finishes, ARRAY['nonfoil'])) AS fc(code)
+    JOIN card_catalog.card_finished cf ON UPPER(cf.code) = UPPER(fc.code)
+    WHERE w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Type line: card-level for single-faced, face-level for multi-faced
+    INSERT INTO card_catalog.card_types (unique_card_id, type_name, type_category)
+    SELECT DISTINCT ON (t.unique_card_id, t.type_name)
+        t.unique_card_id, t.type_name, t.type_category
+    FROM (
+        SELECT w.unique_card_id, x AS type_name, 'supertype' AS type_category, w.batch_seq, w.row_index, 0 AS face_position, 1 AS ord
+        FROM _cv_work w, unnest(w.supertypes) AS x WHERE NOT w.has_faces
+        UNION ALL
+        SELECT w.unique_card_id, x, 'type', w.batch_seq, w.row_index, 0, 2
+        FROM _cv_work w, unnest(w.types) AS x WHERE NOT w.has_faces
+        UNION ALL
+        SELECT w.unique_card_id, x, 'subtype', w.batch_seq, w.row_index, 0, 3
+        FROM _cv_work w, unnest(w.subtypes) AS x WHERE NOT w.has_faces
+        UNION ALL
+        SELECT w.unique_card_id, x, 'supertype', w.batch_seq, w.row_index, f.face_position, 1
+        FROM _cv_work w
+        JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index,
+        unnest(f.supertypes) AS x
+        UNION ALL
+        SELECT w.unique_card_id, x, 'type', w.batch_seq, w.row_index, f.face_position, 2
+        FROM _cv_work w
+        JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index,
+        unnest(f.types) AS x
+        UNION ALL
+        SELECT w.unique_card_id, x, 'subtype', w.batch_seq, w.row_index, f.face_position, 3
+        FROM _cv_work w
+        JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index,
+        unnest(f.subtypes) AS x
+    ) AS t
+    ORDER BY t.unique_card_id, t.type_name, t.batch_seq, t.row_index, t.face_position, t.ord
+    ON CONFLICT (unique_card_id, type_name) DO NOTHING;
+
+    -- Single-faced: artist → illustration → per-version image_uris
+    -- artists_ref is unique on both id and name: insert in file order so the
+    -- first sighting wins, as it does row by row.
+    INSERT INTO card_catalog.artists_ref (artist_id, artist_name)
+    SELECT a.artist_id, a.artist_name
+    FROM (
+        SELECT DISTINCT ON (w.artist_ids[1])
+            w.artist_ids[1] AS artist_id, w.artist[1] AS artist_name, w.batch_seq, w.row_index
+        FROM _cv_work w
+        WHERE NOT w.has_faces AND w.artist_ids[1] IS NOT NULL AND w.artist[1] IS NOT NULL
+        ORDER BY w.artist_ids[1], w.batch_seq, w.row_index
+    ) AS a
+    ORDER BY a.batch_seq, a.row_index
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.artists_ref (artist_name)
+    SELECT DISTINCT w.artist[1]
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.artist_ids[1] IS NULL AND w.artist[1] IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.illustrations (illustration_id)
+    SELECT DISTINCT w.illustration_id
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.illustration_id IS NOT NULL
+    ON CONFLICT (illustration_id) DO NOTHING;
+
+    INSERT INTO card_catalog.illustration_artist (illustration_id, artist_id)
+    SELECT DISTINCT
+        w.illustration_id,
+        COALESCE(
+            (SELECT a.artist_id FROM card_catalog.artists_ref a WHERE a.artist_id = w.artist_ids[1]),
+            (SELECT a.artist_id FROM card_catalog.artists_ref a WHERE a.artist_name = w.artist[1]),
+            '00000000-0000-0000-0000-000000000001'::uuid
+        )
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.illustration_id IS NOT NULL
+    ON CONFLICT (illustration_id, artist_id) DO NOTHING;
+
+    INSERT INTO card_catalog.card_version_illustration (card_version_id, illustration_id, image_uris)
+    SELECT DISTINCT ON (w.cv_id) w.cv_id, w.illustration_id, w.image_uris
+    FROM _cv_work w
+    WHERE NOT w.has_faces AND w.cv_id IS NOT NULL AND w.illustration_id IS NOT NULL
+    ORDER BY w.cv_id, w.batch_seq, w.row_index
+    ON CONFLICT (card_version_id) DO NOTHING;
+
+    -- Multi-faced: flag, version illustration (top-level or front face), faces
+    UPDATE card_catalog.card_version cv
+    SET is_multifaced = true
+    FROM _cv_work w
+    WHERE w.has_faces AND cv.card_version_id = w.cv_id
+      AND cv.is_multifaced IS DISTINCT FROM true;
+
+    DROP TABLE IF EXISTS _cv_mf_ill;
+    CREATE TEMP TABLE _cv_mf_ill ON COMMIT DROP AS
+    SELECT
+        w.cv_id,
+        w.batch_seq,
+        w.row_index,
+        COALESCE(w.illustration_id, f0.illustration_id) AS illustration_id,
+        CASE WHEN jsonb_typeof(w.image_uris) = 'object' AND w.image_uris <> '{}'::jsonb
+             THEN w.image_uris
+             ELSE f0.image_uris
+        END AS image_uris
+    FROM _cv_work w
+    LEFT JOIN _cf_stage f0
+           ON f0.batch_seq = w.batch_seq AND f0.row_index = w.row_index AND f0.face_position = 0
+    WHERE w.has_faces AND w.cv_id IS NOT NULL;
+
+    INSERT INTO card_catalog.illustrations (illustration_id)
+    SELECT DISTINCT m.illustration_id FROM _cv_mf_ill m WHERE m.illustration_id IS NOT NULL
+    ON CONFLICT (illustration_id) DO NOTHING;
+
+    INSERT INTO card_catalog.card_version_illustration (card_version_id, illustration_id, image_uris)
+    SELECT DISTINCT ON (m.cv_id) m.cv_id, m.illustration_id, m.image_uris
+    FROM _cv_mf_ill m
+    WHERE m.illustration_id IS NOT NULL
+    ORDER BY m.cv_id, m.batch_seq, m.row_index
+    ON CONFLICT (card_version_id) DO NOTHING;
+
+    INSERT INTO card_catalog.card_faces (
+        card_version_id, face_index, name, mana_cost,
+        type_line, oracle_text, power, toughness, flavor_text
+    )
+    SELECT DISTINCT ON (w.cv_id, f.face_index)
+        w.cv_id, f.face_index, f.name, f.mana_cost,
+        f.type_line, f.oracle_text, f.power, f.toughness, f.flavor_text
+    FROM _cv_work w
+    JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index
+    WHERE w.cv_id IS NOT NULL
+    ORDER BY w.cv_id, f.face_index, w.batch_seq, w.row_index, f.face_position
+    ON CONFLICT DO NOTHING;
+
+    DROP TABLE IF EXISTS _cf_ill;
+    CREATE TEMP TABLE _cf_ill ON COMMIT DROP AS
+    SELECT
+        cfa.card_faces_id,
+        f.illustration_id,
+        f.artist_id,
+        f.artist,
+        f.image_uris,
+        w.batch_seq,
+        w.row_index
+    FROM _cv_work w
+    JOIN _cf_stage f ON f.batch_seq = w.batch_seq AND f.row_index = w.row_index
+    JOIN card_catalog.card_faces cfa
+      ON cfa.card_version_id = w.cv_id AND cfa.face_index = f.face_index
+    WHERE f.illustration_id IS NOT NULL;
+
+    INSERT INTO card_catalog.artists_ref (artist_id, artist_name)
+    SELECT a.artist_id, a.artist
+    FROM (
+        SELECT DISTINCT ON (i.artist_id) i.artist_id, i.artist, i.batch_seq, i.row_index
+        FROM _cf_ill i
+        WHERE i.artist_id IS NOT NULL
+        ORDER BY i.artist_id, i.batch_seq, i.row_index
+    ) AS a
+    ORDER BY a.batch_seq, a.row_index
+    ON CONFLICT DO NOTHING;
+
+    -- Face illustrations overwrite image_uris (last occurrence wins, as with
+    -- sequential upserts).
+    INSERT INTO card_catalog.illustrations (illustration_id, image_uris)
+    SELECT DISTINCT ON (i.illustration_id) i.illustration_id, i.image_uris
+    FROM _cf_ill i
+    ORDER BY i.illustration_id, i.batch_seq DESC, i.row_index DESC
+    ON CONFLICT (illustration_id) DO UPDATE
+        SET image_uris = EXCLUDED.image_uris,
+            updated_at = now()
+    WHERE card_catalog.illustrations.image_uris IS DISTINCT FROM EXCLUDED.image_uris;
+
+    INSERT INTO card_catalog.illustration_artist (illustration_id, artist_id)
+    SELECT DISTINCT i.illustration_id, i.artist_id
+    FROM _cf_ill i
+    WHERE i.artist_id IS NOT NULL
+      AND EXISTS (SELECT 1 FROM card_catalog.artists_ref a WHERE a.artist_id = i.artist_id)
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.face_illustration (face_id, illustration_id)
+    SELECT DISTINCT i.card_faces_id, i.illustration_id
+    FROM _cf_ill i
+    ON CONFLICT DO NOTHING;
+
+    -- Games
+    INSERT INTO card_catalog.games_ref (game_description)
+    SELECT DISTINCT g FROM _cv_work w, unnest(w.games) AS g
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.games_card_version (card_version_id, game_id)
+    SELECT DISTINCT w.cv_id, gr.game_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.games) AS g(descr)
+    JOIN card_catalog.games_ref gr ON gr.game_description = g.descr
+    WHERE w.cv_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Colors
+    INSERT INTO card_catalog.colors_ref (color_name)
+    SELECT DISTINCT c FROM _cv_work w, unnest(w.colors) AS c
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.card_color_identity (unique_card_id, color_id)
+    SELECT DISTINCT w.unique_card_id, cr.color_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.colors) AS c(name)
+    JOIN card_catalog.colors_ref cr ON cr.color_name = c.name
+    ON CONFLICT DO NOTHING;
+
+    -- Keywords
+    INSERT INTO card_catalog.keywords_ref (keyword_name)
+    SELECT DISTINCT k FROM _cv_work w, unnest(w.keywords) AS k
+    ON CONFLICT (keyword_name) DO NOTHING;
+
+    INSERT INTO card_catalog.card_keyword (unique_card_id, keyword_id)
+    SELECT DISTINCT w.unique_card_id, kr.keyword_id
+    FROM _cv_work w
+    CROSS JOIN LATERAL unnest(w.keywords) AS k(name)
+    JOIN card_catalog.keywords_ref kr ON kr.keyword_name = k.name
+    ON CONFLICT (unique_card_id, keyword_id) DO NOTHING;
+
+    -- Legalities
+    DROP TABLE IF EXISTS _cv_legal;
+    CREATE TEMP TABLE _cv_legal ON COMMIT DROP AS
+    SELECT w.unique_card_id, l.key AS format_name, l.value AS legal_status, w.batch_seq, w.row_index
+    FROM _cv_work w
+    CROSS JOIN LATERAL jsonb_each_text(COALESCE(w.legalities, '{}'::jsonb)) AS l
+    WHERE l.value <> 'not_legal';
+
+    INSERT INTO card_catalog.legal_status_ref (legal_status)
+    SELECT DISTINCT lg.legal_status FROM _cv_legal lg
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.formats_ref (format_name)
+    SELECT DISTINCT lg.format_name FROM _cv_legal lg
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO card_catalog.legalities (unique_card_id, format_id, legality_id)
+    SELECT DISTINCT ON (lg.unique_card_id, fmt.format_id)
+        lg.unique_card_id, fmt.format_id, ls.legality_id
+    FROM _cv_legal lg
+    JOIN card_catalog.formats_ref fmt ON fmt.format_name = lg.format_name
+    JOIN card_catalog.legal_status_ref ls ON ls.legal_status = lg.legal_status
+    ORDER BY lg.unique_card_id, fmt.format_id, lg.batch_seq, lg.row_index
+    ON CONFLICT DO NOTHING;
+
+    -- Write resolved ids back to the stage
+    UPDATE card_catalog.card_version_load_stage s
+    SET card_version_id = w.cv_id,
+        error_details   = NULL
+    FROM _cv_work w
+    WHERE s.load_id = p_load_id
+      AND s.batch_seq = w.batch_seq
+      AND s.row_index = w.row_index;
+
+    SELECT COUNT(*) INTO v_resolved FROM _cv_work w WHERE w.cv_id IS NOT NULL;
+    RETURN v_resolved;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ---------------------------------------------------------------------------
+-- Merge a staged load; returns one row per batch with the same counters as
+-- insert_batch_card_versions.
+--
+-- Whole load first; if that raises, batch by batch. Whatever the set merge
+-- could not resolve (a failing batch, or a row the set path cannot key, e.g.
+-- a NULL collector_number) goes through insert_full_card_version one card at
+-- a time so each failure is reported with its own error details.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION card_catalog.merge_card_version_stage(
+    p_load_id UUID
+)
+RETURNS TABLE (
+    batch_seq INT,
+    total_processed INT,
+    successful_inserts INT,
+    failed_inserts INT,
+    skipped_inserts INT,
+    inserted_card_ids UUID[],
+    error_details JSONB
+) AS $$
+#variable_conflict use_column
+DECLARE
+    v_batch INT;
+    v_row RECORD;
+    v_result UUID;
+BEGIN
+    BEGIN
+        PERFORM card_catalog.merge_card_version_stage_set(p_load_id, NULL);
+    EXCEPTION WHEN OTHERS THEN
+        RAISE NOTICE 'merge_card_version_stage: whole-load merge failed (%), retrying per batch', SQLERRM;
+
+        FOR v_batch IN
+            SELECT DISTINCT s.batch_seq
+            FROM card_catalog.card_version_load_stage s
+            WHERE s.load_id = p_load_id
+            ORDER BY s.batch_seq
+        LOOP
+            BEGIN
+                PERFORM card_catalog.merge_card_version_stage_set(p_load_id, v_batch);
+            EXCEPTION WHEN OTHERS THEN
+                RAISE NOTICE 'merge_card_version_stage: batch % failed (%), falling back to row-by-row', v_batch, SQLERRM;
+            END;
+        END LOOP;
+    END;
+
+    FOR v_row IN
+        SELECT s.*,
+               (
+                   SELECT jsonb_agg(
+                              jsonb_build_object(
+                                  'face_index', f.face_index,
+                                  'name', f.name,
+                                  'mana_cost', f.mana_cost,
+                                  'type_line', f.type_line,
+                                  'oracle_text', f.oracle_text,
+                                  'power', f.power,
+                                  'toughness', f.toughness,
+                                  'flavor_text', f.flavor_text,
+                                  'artist', f.artist,
+                                  'artist_id', f.artist_id,
+                                  'illustration_id', f.illustration_id,
+                                  'image_uris', f.image_uris,
+                                  'supertypes', to_jsonb(f.supertypes),
+                                  'types', to_jsonb(f.types),
+                                  'subtypes', to_jsonb(f.subtypes)
+                              ) ORDER BY f.face_position)
+                   FROM card_catalog.card_face_load_stage f
+                   WHERE f.load_id = s.load_id
+                     AND f.batch_seq = s.batch_seq
+                     AND f.row_index = s.row_index
+               ) AS card_faces
+        FROM card_catalog.card_version_load_stage s
+        WHERE s.load_id = p_load_id
+          AND s.card_version_id IS NULL
+          AND s.error_details IS NULL
+        ORDER BY s.batch_seq, s.row_index
+    LOOP
+        BEGIN
+            SELECT card_catalog.insert_full_card_version(
+                v_row.card_name, v_row.cmc, v_row.mana_cost, v_row.reserved,
+                v_row.oracle_text, v_row.set_name, v_row.collector_number,
+                v_row.rarity_name, v_row.border_color, v_row.frame_year,
+                v_row.layout_name, v_row.is_promo, v_row.is_digital,
+                to_jsonb(v_row.keywords), to_jsonb(v_row.colors),
+                to_jsonb(v_row.artist), to_jsonb(v_row.artist_ids),
+                v_row.legalities, v_row.illustration_id,
+                to_jsonb(v_row.types), to_jsonb(v_row.supertypes),
+                to_jsonb(v_row.subtypes), to_jsonb(v_row.games),
+                v_row.oversized, v_row.booster, v_row.full_art, v_row.textless,
+                v_row.power, v_row.toughness, v_row.loyalty, v_row.defense,
+                to_jsonb(v_row.promo_types), v_row.variation,
+                COALESCE(v_row.card_faces, '[]'::jsonb), v_row.image_uris,
+                v_row.finishes, v_row.frame_effects, v_row.lang,
+                v_row.scryfall_id, v_row.oracle_id, to_jsonb(v_row.multiverse_ids),
+                v_row.tcgplayer_id, v_row.tcgplayer_etched_id,
+                v_row.cardmarket_id, v_row.card_back_id
+            ) INTO v_result;
+
+            UPDATE card_catalog.card_version_load_stage s
+            SET card_version_id = v_result
+            WHERE s.load_id = p_load_id
+              AND s.batch_seq = v_row.batch_seq
+              AND s.row_index = v_row.row_index;
+        EXCEPTION WHEN OTHERS THEN
+            UPDATE card_catalog.card_version_load_stage s
+            SET error_details = jsonb_build_object(
+                    'card_name', v_row.card_name,
+                    'error_code', SQLSTATE,
+                    'error_message', SQLERRM,
+                    'card_index', v_row.row_index + 1
+                )
+            WHERE s.load_id = p_load_id
+              AND s.batch_seq = v_row.batch_seq
+              AND s.row_index = v_row.row_index;
+        END;
+    END LOOP;
+
+    RETURN QUERY
+    SELECT
+        s.batch_seq,
+        COUNT(*)::INT,
+        COUNT(s.card_version_id)::INT,
+        (COUNT(*) - COUNT(s.card_version_id))::INT,
+        0,
+        COALESCE(array_agg(s.card_version_id) FILTER (WHERE s.card_version_id IS NOT NULL), ARRAY[]::UUID[]),
+        COALESCE(jsonb_agg(s.error_details) FILTER (WHERE s.error_details IS NOT NULL), '[]'::jsonb)
+    FROM card_catalog.card_version_load_stage s
+    WHERE s.load_id = p_load_id
+    GROUP BY s.batch_seq
+    ORDER BY s.batch_seq;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop a load's stage rows (or one batch of it, before a COPY retry).
+CREATE OR REPLACE FUNCTION card_catalog.clear_card_version_stage(
+    p_load_id   UUID,
+    p_batch_seq INT DEFAULT NULL
+)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM card_catalog.card_face_load_stage
+    WHERE load_id = p_load_id
+      AND (p_batch_seq IS NULL OR batch_seq = p_batch_seq);
+    DELETE FROM card_catalog.card_version_load_stage
+    WHERE load_id = p_load_id
+      AND (p_batch_seq IS NULL OR batch_seq = p_batch_seq);
+END;
+$$ LANGUAGE plpgsql;
+
 /*
 CREATE INDEX idx_card_types_category ON card_types (type_category);
 CREATE INDEX idx_card_types_name ON card_types (type_name);
 */
 
+-- Search table change tracking + incremental refresh
+CREATE TABLE IF NOT EXISTS card_catalog.card_search_dirty (
+    unique_card_id UUID PRIMARY KEY,
+    marked_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON card_catalog.card_search_dirty
+    TO app_celery, app_rw, app_admin;
+
+-- Link tables keyed by unique_card_id (card_types, card_color_identity,
+-- card_keyword, legalities). One trigger per event: transition tables are only
+-- allowed on single-event triggers.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_unique_card()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT o.unique_card_id FROM old_rows o
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT n.unique_card_id FROM new_rows n
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Link tables keyed by card_version_id (games, promos, stats, faces,
+-- per-version illustrations).
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_card_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM old_rows o
+        JOIN card_catalog.card_version cv ON cv.card_version_id = o.card_version_id
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM new_rows n
+        JOIN card_catalog.card_version cv ON cv.card_version_id = n.card_version_id
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Artist links feed the illustrations JSON of every printing using the
+-- illustration. An update can move a link, so both of its sides are marked.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_illustration()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM new_rows n
+        JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = n.illustration_id
+        JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM old_rows o
+        JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = o.illustration_id
+        JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT cv.unique_card_id
+        FROM (
+            SELECT n.illustration_id FROM new_rows n
+            UNION
+            SELECT o.illustration_id FROM old_rows o
+        ) AS x
+        JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = x.illustration_id
+        JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Artist renames reach every printing whose illustration credits the artist.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_artist()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+    SELECT DISTINCT cv.unique_card_id
+    FROM new_rows n
+    JOIN old_rows o ON o.artist_id = n.artist_id
+    JOIN card_catalog.illustration_artist ia ON ia.artist_id = n.artist_id
+    JOIN card_catalog.card_version_illustration cvi ON cvi.illustration_id = ia.illustration_id
+    JOIN card_catalog.card_version cv ON cv.card_version_id = cvi.card_version_id
+    WHERE n.artist_name IS DISTINCT FROM o.artist_name
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- card_version itself. Updates only count when a column the search views
+-- read changes, so the daily purchase_uris refresh marks nothing.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_card_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT n.unique_card_id FROM new_rows n
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT DISTINCT o.unique_card_id FROM old_rows o
+        ON CONFLICT DO NOTHING;
+    ELSE
+        INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+        SELECT x.unique_card_id
+        FROM (
+            SELECT n.unique_card_id
+            FROM new_rows n
+            JOIN old_rows o ON o.card_version_id = n.card_version_id
+            WHERE (n.unique_card_id, n.oracle_text, n.set_id, n.collector_number,
+                   n.rarity_id, n.border_color_id, n.frame_id, n.layout_id,
+                   n.is_promo, n.is_digital, n.is_oversized, n.full_art,
+                   n.textless, n.booster, n.variation, n.is_multifaced,
+                   n.frame_effects, n.lang)
+                  IS DISTINCT FROM
+                  (o.unique_card_id, o.oracle_text, o.set_id, o.collector_number,
+                   o.rarity_id, o.border_color_id, o.frame_id, o.layout_id,
+                   o.is_promo, o.is_digital, o.is_oversized, o.full_art,
+                   o.textless, o.booster, o.variation, o.is_multifaced,
+                   o.frame_effects, o.lang)
+            UNION
+            SELECT o.unique_card_id
+            FROM new_rows n
+            JOIN old_rows o ON o.card_version_id = n.card_version_id
+            WHERE o.unique_card_id IS DISTINCT FROM n.unique_card_id
+        ) AS x
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Card-level fields (name, cmc, mana cost, reserved) live on unique_cards_ref
+-- and are copied into every printing's row, so an edit there dirties the card.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_unique_card_ref()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+    SELECT n.unique_card_id
+    FROM new_rows n
+    JOIN old_rows o ON o.unique_card_id = n.unique_card_id
+    WHERE (n.card_name, n.cmc, n.mana_cost, n.reserved)
+          IS DISTINCT FROM
+          (o.card_name, o.cmc, o.mana_cost, o.reserved)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Set renames / code changes touch every printing in the set.
+CREATE OR REPLACE FUNCTION card_catalog.card_search_mark_by_set()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO card_catalog.card_search_dirty (unique_card_id)
+    SELECT DISTINCT cv.unique_card_id
+    FROM new_rows n
+    JOIN old_rows o ON o.set_id = n.set_id
+    JOIN card_catalog.card_version cv ON cv.set_id = n.set_id
+    WHERE (n.set_name, n.set_code) IS DISTINCT FROM (o.set_name, o.set_code)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+    v_func  TEXT;
+BEGIN
+    FOR v_table, v_func IN
+        VALUES
+            ('card_types',                'card_search_mark_by_unique_card'),
+            ('card_color_identity',       'card_search_mark_by_unique_card'),
+            ('card_keyword',              'card_search_mark_by_unique_card'),
+            ('legalities',                'card_search_mark_by_unique_card'),
+            ('games_card_version',        'card_search_mark_by_card_version'),
+            ('promo_card',                'card_search_mark_by_card_version'),
+            ('card_version_stats',        'card_search_mark_by_card_version'),
+            ('card_faces',                'card_search_mark_by_card_version'),
+            ('card_version_illustration', 'card_search_mark_by_card_version'),
+            ('card_version',              'card_search_mark_card_version')
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_search_ins ON card_catalog.%I', v_table, v_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_search_upd ON card_catalog.%I', v_table, v_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_search_del ON card_catalog.%I', v_table, v_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_search_ins AFTER INSERT ON card_catalog.%I '
+            'REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.%I()',
+            v_table, v_table, v_func);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_search_upd AFTER UPDATE ON card_catalog.%I '
+            'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.%I()',
+            v_table, v_table, v_func);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_search_del AFTER DELETE ON card_catalog.%I '
+            'REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.%I()',
+            v_table, v_table, v_func);
+    END LOOP;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_illustration_artist_search_ins ON card_catalog.illustration_artist;
+CREATE TRIGGER trg_illustration_artist_search_ins
+AFTER INSERT ON card_catalog.illustration_artist
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_illustration();
+
+DROP TRIGGER IF EXISTS trg_illustration_artist_search_upd ON card_catalog.illustration_artist;
+CREATE TRIGGER trg_illustration_artist_search_upd
+AFTER UPDATE ON card_catalog.illustration_artist
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_illustration();
+
+DROP TRIGGER IF EXISTS trg_illustration_artist_search_del ON card_catalog.illustration_artist;
+CREATE TRIGGER trg_illustration_artist_search_del
+AFTER DELETE ON card_catalog.illustration_artist
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_illustration();
+
+DROP TRIGGER IF EXISTS trg_artists_ref_search_upd ON card_catalog.artists_ref;
+CREATE TRIGGER trg_artists_ref_search_upd
+AFTER UPDATE ON card_catalog.artists_ref
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_artist();
+
+DROP TRIGGER IF EXISTS trg_sets_search_upd ON card_catalog.sets;
+CREATE TRIGGER trg_sets_search_upd
+AFTER UPDATE ON card_catalog.sets
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_set();
+
+DROP TRIGGER IF EXISTS trg_unique_cards_ref_search_upd ON card_catalog.unique_cards_ref;
+CREATE TRIGGER trg_unique_cards_ref_search_upd
+AFTER UPDATE ON card_catalog.unique_cards_ref
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION card_catalog.card_search_mark_by_unique_card_ref();
+
+-- Upsert one search table from its source view; with p_incremental only the
+-- cards claimed into _card_search_claim are considered. Rows whose content is
+-- unchanged are not rewritten. Columns come from the target's catalog entry,
+-- so adding a column means adding it to both the table and the source view.
+CREATE OR REPLACE FUNCTION card_catalog.sync_card_search_table(
+    p_target      TEXT,
+    p_source      TEXT,
+    p_incremental BOOLEAN,
+    OUT rows_upserted BIGINT,
+    OUT rows_deleted  BIGINT
+) AS $$
+DECLARE
+    v_cols    TEXT;
+    v_set     TEXT;
+    v_old     TEXT;
+    v_new     TEXT;
+    v_has_ts  BOOLEAN;
+    v_filter  TEXT := '';
+    v_tfilter TEXT := '';
+BEGIN
+    SELECT
+        string_agg(quote_ident(a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname <> 'materialized_at'),
+        string_agg(format('%1$I = EXCLUDED.%1$I', a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname NOT IN ('card_version_id', 'materialized_at')),
+        string_agg(format('t.%I', a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname NOT IN ('card_version_id', 'materialized_at')),
+        string_agg(format('EXCLUDED.%I', a.attname), ', ' ORDER BY a.attnum)
+            FILTER (WHERE a.attname NOT IN ('card_version_id', 'materialized_at')),
+        bool_or(a.attname = 'materialized_at')
+    INTO v_cols, v_set, v_old, v_new, v_has_ts
+    FROM pg_attribute a
+    WHERE a.attrelid = p_target::regclass
+      AND a.attnum > 0
+      AND NOT a.attisdropped;
+
+    IF v_has_ts THEN
+        v_set := v_set || ', materialized_at = now()';
+    END IF;
+
+    IF p_incremental THEN
+        v_filter  := ' WHERE s.unique_card_id IN (SELECT unique_card_id FROM _card_search_claim)';
+        v_tfilter := ' t.unique_card_id IN (SELECT unique_card_id FROM _card_search_claim) AND';
+    END IF;
+
+    EXECUTE format(
+        'INSERT INTO %1$s AS t (%2$s) SELECT %3$s FROM %4$s s%5$s '
+        'ON CONFLICT (card_version_id) DO UPDATE SET %6$s '
+        'WHERE ROW(%7$s) IS DISTINCT FROM ROW(%8$s)',
+        p_target, v_cols,
+        (SELECT string_agg('s.' || c, ', ') FROM unnest(string_to_array(v_cols, ', ')) AS c),
+        p_source, v_filter, v_set, v_old, v_new
+    );
+    GET DIAGNOSTICS rows_upserted = ROW_COUNT;
+
+    EXECUTE format(
+        'DELETE FROM %1$s t WHERE%2$s NOT EXISTS '
+        '(SELECT 1 FROM %3$s s WHERE s.card_version_id = t.card_version_id)',
+        p_target, v_tfilter, p_source
+    );
+    GET DIAGNOSTICS rows_deleted = ROW_COUNT;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Claim the dirty cards and bring both search tables up to date. Falls back to
+-- a whole-source sync when more than p_full_threshold cards are dirty.
+CREATE OR REPLACE FUNCTION card_catalog.refresh_card_search_tables(
+    p_full_threshold INT DEFAULT 10000,
+    p_force_full     BOOLEAN DEFAULT false
+)
+RETURNS TABLE (
+    mode              TEXT,
+    dirty_cards       INT,
+    versions_upserted BIGINT,
+    versions_deleted  BIGINT,
+    suggest_upserted  BIGINT,
+    suggest_deleted   BIGINT
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = card_catalog, pg_catalog
+AS $$
+#variable_conflict use_column
+DECLARE
+    v_dirty INT;
+    v_incremental BOOLEAN;
+    v_versions RECORD;
+    v_suggest RECORD;
+BEGIN
+    DROP TABLE IF EXISTS _card_search_claim;
+    CREATE TEMP TABLE _card_search_claim (unique_card_id UUID PRIMARY KEY) ON COMMIT DROP;
+
+    -- Marks written by concurrent ingests after this point wait for the next run.
+    WITH claimed AS (
+        DELETE FROM card_catalog.card_search_dirty
+        RETURNING unique_card_id
+    )
+    INSERT INTO _card_search_claim (unique_card_id)
+    SELECT DISTINCT unique_card_id FROM claimed;
+    GET DIAGNOSTICS v_dirty = ROW_COUNT;
+
+    v_incremental := NOT p_force_full AND v_dirty <= p_full_threshold;
+
+    IF v_incremental AND v_dirty = 0 THEN
+        RETURN QUERY SELECT 'noop'::TEXT, 0, 0::BIGINT, 0::BIGINT, 0::BIGINT, 0::BIGINT;
+        RETURN;
+    END IF;
+
+    SELECT * INTO v_versions FROM card_catalog.sync_card_search_table(
+        'card_catalog.v_card_versions_complete',
+        'card_catalog.v_card_versions_complete_source',
+        v_incremental
+    );
+    SELECT * INTO v_suggest FROM card_catalog.sync_card_search_table(
+        'card_catalog.v_card_name_suggest',
+        'card_catalog.v_card_name_suggest_source',
+        v_incremental
+    );
+
+    RETURN QUERY SELECT
+        CASE WHEN v_incremental THEN 'incremental' ELSE 'full' END,
+        v_dirty,
+        v_versions.rows_upserted, v_versions.rows_deleted,
+        v_suggest.rows_upserted, v_suggest.rows_deleted;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION card_catalog.refresh_card_search_tables(INT, BOOLEAN) TO app_celery, app_rw, app_admin;
+
+-- Existing entry points now go through the incremental refresh.
 CREATE OR REPLACE FUNCTION card_catalog.refresh_card_versions_complete()
 RETURNS void AS $$
 BEGIN
-    REFRESH MATERIALIZED VIEW CONCURRENTLY card_catalog.v_card_versions_complete;
-
-    -- Log refresh
-    RAISE NOTICE 'Materialized view v_card_versions_complete refreshed at %', now();
+    PERFORM card_catalog.refresh_card_search_tables(p_force_full => true);
+    RAISE NOTICE 'Search table v_card_versions_complete refreshed at %', now();
 END;
 $$ LANGUAGE plpgsql;
 
@@ -1323,16 +2323,16 @@ SECURITY DEFINER
 SET search_path = card_catalog, pg_catalog
 AS $$
 BEGIN
-    REFRESH MATERIALIZED VIEW CONCURRENTLY card_catalog.v_card_versions_complete;
-    REFRESH MATERIALIZED VIEW CONCURRENTLY card_catalog.v_card_name_suggest;
+    PERFORM card_catalog.refresh_card_search_tables();
 END;
 $$;
 
 GRANT EXECUTE ON PROCEDURE card_catalog.refresh_card_search_views() TO app_celery, app_rw, app_admin;
 
 -- Per-row trigger removed: fired on every INSERT/UPDATE/DELETE during bulk ETL
--- (30k+ full view recomputes per pipeline run). Views refreshed once per
--- pipeline run via refresh_card_search_views().
+-- (30k+ full view recomputes per pipeline run). The statement-level
+-- card_search_mark_* triggers above only record touched cards; the search
+-- tables are synced once per pipeline run via refresh_card_search_views().
 DROP TRIGGER IF EXISTS tr_card_version_refresh ON card_catalog.card_version;
 DROP TRIGGER IF EXISTS tr_unique_cards_refresh ON card_catalog.unique_cards_ref;
 DROP FUNCTION IF EXISTS card_catalog.trigger_refresh_card_versions();
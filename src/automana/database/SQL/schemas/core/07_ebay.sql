@@ -287,12 +287,16 @@ CREATE TABLE IF NOT EXISTS app_integration.listing_pending_actions (
                     CHECK (status IN ('pending','processing','done','failed')),
     error           TEXT,
     created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+    claimed_at      TIMESTAMPTZ,  -- drain lease (migration_69)
     executed_at     TIMESTAMPTZ
 );
 
 CREATE INDEX IF NOT EXISTS idx_listing_actions_pending
     ON app_integration.listing_pending_actions (created_at)
     WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_listing_actions_processing
+    ON app_integration.listing_pending_actions (claimed_at)
+    WHERE status = 'processing';
 CREATE INDEX IF NOT EXISTS idx_listing_actions_item
     ON app_integration.listing_pending_actions (item_id);
 
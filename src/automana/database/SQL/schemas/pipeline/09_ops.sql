@@ -225,6 +225,16 @@ ON ops.ingestion_ids_mapping (ingestion_run_id);
 CREATE INDEX IF NOT EXISTS idx_ingestion_ids_mapping_scryfall
 ON ops.ingestion_ids_mapping (scryfall_id);
 
+-- Per-print high-water marks: bulk_load only lands rows newer than
+-- last_ts_date; advanced after promotion succeeds (migration_68).
+CREATE TABLE IF NOT EXISTS ops.mtgstock_print_watermark (
+    print_id      BIGINT      NOT NULL,
+    source_code   TEXT        NOT NULL,
+    last_ts_date  DATE        NOT NULL,
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (print_id, source_code)
+);
+
 INSERT INTO ops.sources (name, base_uri, kind, rate_limit_hz)
 VALUES ('mtgstocks', 'https://api.mtgstocks.com', 'http', 2.0)
 ON CONFLICT (name) DO UPDATE
@@ -50,8 +50,7 @@ KNOWN_TASKS: list[CeleryTask] = [
             "staging.scryfall.download_sets",
             "card_catalog.set.process_large_sets_json",
             "staging.scryfall.download_cards_bulk",
-            "card_catalog.card.process_large_json",
-            "staging.scryfall.load_prices_from_bulk",
+            "staging.scryfall.ingest_cards_bulk",
             "card_catalog.card_search.refresh",
             "card_catalog.card_search.invalidate",
             "staging.scryfall.download_and_load_migrations",
@@ -98,6 +97,7 @@ KNOWN_TASKS: list[CeleryTask] = [
             "mtg_stock.data_staging.from_raw_to_staging",
             "mtg_stock.data_staging.retry_rejects",
             "mtg_stock.data_staging.from_staging_to_prices",
+            "mtg_stock.data_staging.advance_watermarks",
             "ops.pipeline_services.finish_run",
         ],
     ),
@@ -51,8 +51,10 @@ async def bootstrap(db_user: str | None = None, db_password: str | None = None)
 
 
 async def teardown(pool: Any) -> None:
-    """Close the asyncpg connection pool cleanly."""
+    """Close the asyncpg connection pool and pooled HTTP clients cleanly."""
     from automana.core.db.database import close_async_pool
+    from automana.core.utils.http_clients import close_http_clients
+    await close_http_clients()
     await close_async_pool(pool)
 
 
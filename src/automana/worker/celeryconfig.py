@@ -140,6 +140,13 @@ beat_schedule = {
         "schedule": crontab(hour=6, minute=45),   # 06:45 AEST
         "kwargs": {"path": "integrations.pricing.fetch_fx_rates"},
     },
+    # eBay access tokens live ~2h; refresh any that lapse within 15 minutes so
+    # request paths never wait on the OAuth exchange. Off the :00 cluster.
+    "ebay-renew-access-tokens": {
+        "task": "run_service",
+        "schedule": crontab(minute="3-59/10"),
+        "kwargs": {"path": "integrations.ebay.renew_access_tokens"},
+    },
     # Weekly cleanup of eBay raw JSON files older than 7 days.
     "ebay-cleanup-raw-files-weekly": {
         "task": "automana.worker.tasks.ebay.ebay_cleanup_raw_files_task",
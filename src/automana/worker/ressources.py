@@ -1,7 +1,10 @@
-from automana.core.db.database import close_async_pool, init_async_pool
+from automana.core.db.database import close_async_pools, init_async_pools
 from automana.core.framework.service_manager import ServiceManager
 from automana.worker.state import CeleryAppState
 from automana.core.db.query_executor import AsyncQueryExecutor
+from automana.core.utils.http_clients import close_http_clients
+from automana.core.utils.redis_cache import disable_l1_cache
+from automana.core.services.app_integration.mtg_stock.data_loader import shutdown_convert_executor
 import asyncio
 import logging
 
@@ -21,14 +24,18 @@ def init_backend_runtime() -> None:
         return
 
     logger.info("Initialising backend runtime")
+    # Nothing drains cache invalidations between tasks, so serve straight from Redis.
+    disable_l1_cache()
     app_state.loop = asyncio.new_event_loop()
     asyncio.set_event_loop(app_state.loop)
 
     async def _init():
-        app_state.async_db_pool = await init_async_pool(app_state.settings)
+        app_state.db_pools = await init_async_pools(app_state.settings)
+        app_state.async_db_pool = app_state.db_pools["primary"]
         await ServiceManager.initialize(
             app_state.async_db_pool,
             query_executor=AsyncQueryExecutor(),
+            pools=app_state.db_pools,
         )
 
     app_state.loop.run_until_complete(_init())
@@ -43,7 +50,10 @@ def shutdown_backend_runtime() -> None:
     logger.info("Shutting down backend runtime")
     if state.loop and state.async_db_pool:
         async def _shutdown():
-            await close_async_pool(state.async_db_pool)
+            await close_http_clients()
+            await asyncio.to_thread(shutdown_convert_executor)
+            await close_async_pools(state.db_pools)
+            state.db_pools = None
             state.async_db_pool = None
         state.loop.run_until_complete(_shutdown())
 
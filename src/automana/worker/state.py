@@ -4,6 +4,7 @@ class CeleryAppState:
     def __init__(self):
         """Centralized application state for Celery"""
         self.async_db_pool = None
+        self.db_pools = None
         self.async_runner = None
         self.initialized = False
         self.settings = get_settings()
@@ -32,8 +32,9 @@ def daily_scryfall_data_pipeline(self):
         run_service.s("staging.scryfall.download_sets"),
         run_service.s("card_catalog.set.process_large_sets_json"), 
         run_service.s("staging.scryfall.download_cards_bulk"),
-        run_service.s("card_catalog.card.process_large_json"),
-        run_service.s("staging.scryfall.load_prices_from_bulk"),
+        # Single pass over the cards bulk file: card upserts, prices and
+        # purchase URIs are all fed from one ijson decode.
+        run_service.s("staging.scryfall.ingest_cards_bulk"),
         run_service.s("card_catalog.card_search.refresh"),
         run_service.s("card_catalog.card_search.invalidate"),
         # Migrations must land AFTER the card import: `new_scryfall_id` values
@@ -65,7 +66,9 @@ def mtgStock_download_pipeline(self):
     if result.get("is_active"):
         logger.warning("Duplicate pipeline skipped", extra={"run_key": run_key})
         return
-    # Chain shape: start → bulk_load → raw→stg → retry_rejects → stg→observation → finish.
+    # Chain shape: start → bulk_load → raw→stg → retry_rejects → stg→observation
+    # → advance_watermarks → finish. bulk_load is delta-only (per-print
+    # watermarks), so the chain scales with the day's new observations.
     # `retry_rejects` calls pricing.resolve_price_rejects() to re-feed any
     # previously-rejected rows that can now be resolved (e.g. via new scryfall
     # migration entries or freshly-seeded external identifiers), so they make
@@ -90,6 +93,8 @@ def mtgStock_download_pipeline(self):
                       source_name="mtgstocks"),
         run_service.s("mtg_stock.data_staging.retry_rejects"),
         run_service.s("mtg_stock.data_staging.from_staging_to_prices"),
+        # Only after promotion: the next bulk_load lands rows newer than these.
+        run_service.s("mtg_stock.data_staging.advance_watermarks"),
         run_service.s("ops.pipeline_services.finish_run", status="success" )
     )
     return wf.apply_async().id
@@ -9,7 +9,7 @@ export function cardInfiniteSearchQueryOptions(params: Omit<CardSearchParams, 'p
   const { group: _group, ...apiParams } = params
   return infiniteQueryOptions({
     queryKey: ['cards', 'search', apiParams],
-    queryFn: async ({ pageParam = 0 }) => {
+    queryFn: async ({ pageParam }) => {
       const token = useAuthStore.getState().token
       const qs = new URLSearchParams()
       if (params.q)              qs.set('q', params.q)
@@ -29,7 +29,7 @@ export function cardInfiniteSearchQueryOptions(params: Omit<CardSearchParams, 'p
       params.frame_effects?.forEach(fe => qs.append('frame_effect', fe))
       if (params.collapse !== false) qs.set('collapse', 'true')
       qs.set('limit', '20')
-      qs.set('offset', String(pageParam))
+      if (pageParam) qs.set('cursor', pageParam)
 
       const res = await fetch(`/api/catalog/mtg/card-reference/?${qs}`, {
         headers: {
@@ -47,11 +47,9 @@ export function cardInfiniteSearchQueryOptions(params: Omit<CardSearchParams, 'p
         facets: (body.facets as { promo_types?: string[]; rarities?: string[] } | null) ?? null,
       }
     },
-    initialPageParam: 0,
-    getNextPageParam: (lastPage) =>
-      lastPage.pagination?.has_next
-        ? lastPage.pagination.offset + lastPage.pagination.limit
-        : undefined,
+    initialPageParam: null as string | null,
+    // Cursor pages seek by sort key, so deep scrolling costs the same as page one.
+    getNextPageParam: (lastPage) => lastPage.pagination?.next_cursor ?? undefined,
   })
 }
 
@@ -78,6 +78,7 @@ export interface PaginationInfo {
   total_count: number
   has_next: boolean
   has_previous: boolean
+  next_cursor?: string | null
 }
 
 export interface CardSearchResponse {
@@ -82,7 +82,7 @@ async def test_staged_row_is_promoted_to_price_observation(db_pool, seeded_db):
 
     assert row is not None, (
         f"No row found in price_observation for source_product_id={source_product_id}. "
-        "Check that upsert_price_observation writes to pricing.price_observation."
+        "Check that promote_batch writes to pricing.price_observation."
     )
     assert row["sold_avg_cents"] == 1250, (
         f"Expected sold_avg_cents=1250, got {row['sold_avg_cents']}. "
@@ -101,7 +101,7 @@ async def test_staged_row_is_promoted_to_price_observation(db_pool, seeded_db):
         )
     assert flag is True, (
         "Staging row item_id='TEST-ITEM-001' was not marked promoted_to_obs=true. "
-        "Check mark_promoted in EbayScrapeSoldRepository."
+        "Check promote_batch in EbayScrapeSoldRepository."
     )
 
 
@@ -0,0 +1,139 @@
+"""Tests for automana.api.services.auth.session_cache and the joined session lookup."""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from automana.api.services.auth import session_cache
+from automana.api.services.auth.session_service import get_user_from_session
+from automana.core.exceptions import session_exceptions
+
+pytestmark = pytest.mark.unit
+
+_SESSION_ID = str(uuid4())
+_IP = "10.0.0.1"
+_UA = "pytest-agent/1.0"
+
+
+class _Settings:
+    jwt_secret_key = "test-jwt-secret-unit"
+    session_cache_ttl_seconds = 60
+
+
+def _user_row(**overrides):
+    row = {
+        "unique_id": uuid4(),
+        "username": "alice",
+        "email": "alice@example.com",
+        "fullname": "Alice",
+        "hashed_password": "$2b$12$hash",
+        "disabled": False,
+        "session_expires_at": datetime.now(timezone.utc) + timedelta(days=1),
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def cache():
+    """In-memory stand-in for the two-tier cache and namespace generations."""
+    store, generations = {}, {}
+
+    async def fake_get(key):
+        return store.get(key)
+
+    async def fake_set(key, value, **_):
+        store[key] = value
+
+    async def fake_generation(namespace):
+        return generations.get(namespace, 0)
+
+    with patch.object(session_cache, "get_settings", lambda: _Settings()), \
+         patch.object(session_cache, "get_from_cache", side_effect=fake_get), \
+         patch.object(session_cache, "set_to_cache", side_effect=fake_set), \
+         patch.object(session_cache, "get_namespace_generation", side_effect=fake_generation):
+        yield store, generations
+
+
+async def _cache_row(row):
+    await session_cache.cache_session_user(_SESSION_ID, _IP, _UA, row, row["session_expires_at"])
+
+
+class TestSessionCache:
+    async def test_round_trip_without_password_hash(self, cache):
+        store, _ = cache
+        row = _user_row()
+        await _cache_row(row)
+
+        assert "$2b$12$hash" not in str(store)
+        user = await session_cache.get_cached_session_user(_SESSION_ID, _IP, _UA)
+        assert user.unique_id == row["unique_id"]
+        assert user.username == "alice"
+
+    async def test_other_client_fingerprint_misses(self, cache):
+        await _cache_row(_user_row())
+        assert await session_cache.get_cached_session_user(_SESSION_ID, "10.0.0.2", _UA) is None
+        assert await session_cache.get_cached_session_user(_SESSION_ID, _IP, "curl/8") is None
+
+    async def test_tampered_entry_is_rejected(self, cache):
+        store, _ = cache
+        await _cache_row(_user_row())
+        entry = store[f"auth_session:{_SESSION_ID}"]
+        entry["payload"] = entry["payload"].replace("alice", "admin")
+        assert await session_cache.get_cached_session_user(_SESSION_ID, _IP, _UA) is None
+
+    async def test_user_generation_bump_orphans_entry(self, cache):
+        _, generations = cache
+        row = _user_row()
+        await _cache_row(row)
+        generations[f"auth_user:{row['unique_id']}"] = 1
+        assert await session_cache.get_cached_session_user(_SESSION_ID, _IP, _UA) is None
+
+    async def test_entry_never_outlives_session(self, cache):
+        store, _ = cache
+        row = _user_row(session_expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        await _cache_row(row)
+        assert store == {}
+
+
+class TestInvalidation:
+    async def test_invalidation_repeats_after_commit(self):
+        from automana.core.framework import post_commit
+
+        delete, bump = AsyncMock(), AsyncMock()
+        with patch.object(session_cache, "delete_from_cache", delete), \
+             patch.object(session_cache, "invalidate_namespace", bump):
+            callbacks, token = post_commit.begin()
+            try:
+                await session_cache.invalidate_session_user(_SESSION_ID)
+                await session_cache.invalidate_user_sessions("u1")
+            finally:
+                post_commit.end(token)
+            # Once before the commit...
+            delete.assert_awaited_once_with(f"auth_session:{_SESSION_ID}")
+            bump.assert_awaited_once_with("auth_user:u1")
+            # ...and again once ServiceManager runs the post-commit callbacks.
+            await post_commit.run(callbacks)
+        assert delete.await_count == 2
+        assert bump.await_count == 2
+
+
+class TestGetUserFromSession:
+    async def test_single_joined_query(self):
+        session_repository = MagicMock()
+        row = _user_row()
+        session_repository.get_session_user = AsyncMock(return_value=row)
+        user_repository = MagicMock()
+        user_repository.get_by_id = AsyncMock()
+
+        result = await get_user_from_session(session_repository, user_repository, _SESSION_ID, _IP, _UA)
+
+        assert result is row
+        session_repository.get_session_user.assert_awaited_once_with(_SESSION_ID, _IP, _UA)
+        user_repository.get_by_id.assert_not_awaited()
+
+    async def test_missing_session_raises_session_error(self):
+        session_repository = MagicMock()
+        session_repository.get_session_user = AsyncMock(return_value=None)
+        with pytest.raises(session_exceptions.SessionError):
+            await get_user_from_session(session_repository, MagicMock(), _SESSION_ID, _IP, _UA)
@@ -23,6 +23,8 @@ from automana.core.metrics.mtgstock.staging_metrics import (
     raw_rows_loaded,
 )
 
+from automana.core.metrics.registry import MetricRegistry, Severity
+
 pytestmark = pytest.mark.unit
 
 
@@ -49,6 +51,14 @@ class TestRawPrintsLoaded:
         assert result.row_count == 0
 
 
+    @pytest.mark.parametrize("path", ["mtgstock.raw_prints_loaded", "mtgstock.raw_rows_loaded"])
+    def test_quiet_delta_run_warns_but_never_errors(self, path):
+        """bulk_load is delta-only: 0 new prints/rows is a no-new-data day, not a failure."""
+        config = MetricRegistry.get(path)
+        assert MetricRegistry.evaluate(config, 0) == Severity.WARN
+        assert MetricRegistry.evaluate(config, 50_000) == Severity.OK
+
+
 # ---------------------------------------------------------------------------
 # raw_rows_loaded
 # ---------------------------------------------------------------------------
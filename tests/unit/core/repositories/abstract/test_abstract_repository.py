@@ -125,3 +125,50 @@ async def test_remove_listener_delegates():
     cb = MagicMock()
     await repo.remove_listener("my_channel", cb)
     conn.remove_listener.assert_awaited_once_with("my_channel", cb)
+
+
+@pytest.mark.asyncio
+async def test_execute_copy_dataframe_streams_csv_chunks_by_column_name():
+    import datetime
+    import pandas as pd
+
+    chunks = []
+
+    async def copy_to_table(table_name, source, **kwargs):
+        async for chunk in source:
+            chunks.append(chunk)
+
+    conn = AsyncMock()
+    conn.copy_to_table = AsyncMock(side_effect=copy_to_table)
+    repo = ConcreteRepo(connection=conn)
+    df = pd.DataFrame({
+        "ts_date": [datetime.date(2024, 1, 1), datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)],
+        "price": [4.99, None, 1.0],
+        "tcg_id": [1, "2", None],
+        "name": ['a "b", c', "", None],
+    })
+
+    copied = await repo.execute_copy_dataframe(df, "t", schema_name="s", chunk_rows=2)
+
+    assert copied == 3
+    kwargs = conn.copy_to_table.await_args.kwargs
+    assert (kwargs["schema_name"], kwargs["columns"], kwargs["format"]) == (
+        "s", ["ts_date", "price", "tcg_id", "name"], "csv"
+    )
+    assert len(chunks) == 2
+    # Exact float text, NULL unquoted, empty string quoted, mixed ids as text
+    assert b"".join(chunks).decode().splitlines() == [
+        '2024-01-01,4.99,"1","a ""b"", c"',
+        '2024-01-02,,"2",""',
+        "2024-01-03,1,,",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_copy_dataframe_skips_empty_frames():
+    import pandas as pd
+
+    conn = AsyncMock()
+    repo = ConcreteRepo(connection=conn)
+    assert await repo.execute_copy_dataframe(pd.DataFrame({"a": []}), "t", schema_name="s") == 0
+    conn.copy_to_table.assert_not_awaited()
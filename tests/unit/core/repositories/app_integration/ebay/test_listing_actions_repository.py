@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 from automana.core.repositories.app_integration.ebay.listing_actions_repository import (
@@ -38,44 +39,33 @@ async def test_insert_action_returns_uuid():
 
 
 @pytest.mark.asyncio
-async def test_get_pending_returns_rows():
+async def test_claim_pending_uses_skip_locked():
     repo = make_repo()
-    fake_rows = [
-        {'id': str(ACTION_ID), 'item_id': '111', 'user_id': str(USER_ID),
-         'app_code': 'myapp', 'action_type': 'raise', 'strategy_kind': 'max',
-         'suggested_price': 15.00, 'status': 'pending'}
-    ]
-    repo.execute_query = AsyncMock(return_value=fake_rows)
+    repo.execute_query = AsyncMock(return_value=[{'id': str(ACTION_ID), 'status': 'processing'}])
 
-    result = await repo.get_pending(limit=50)
+    result = await repo.claim_pending(limit=25, lease_seconds=60)
 
-    assert len(result) == 1
-    assert result[0]['action_type'] == 'raise'
-    repo.execute_query.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_mark_done_calls_execute_command():
-    repo = make_repo()
-    repo.execute_command = AsyncMock(return_value=None)
-
-    await repo.mark_done(action_id=ACTION_ID)
-
-    repo.execute_command.assert_awaited_once()
-    args = repo.execute_command.call_args[0]
-    assert args[1][0] == ACTION_ID
+    assert result == [{'id': str(ACTION_ID), 'status': 'processing'}]
+    sql, params = repo.execute_query.call_args[0]
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "claimed_at = now()" in sql and "status = 'processing'" in sql
+    assert params == (25, 60)
 
 
 @pytest.mark.asyncio
-async def test_mark_failed_stores_error():
+async def test_record_outcomes_sends_one_command_and_skips_empty():
     repo = make_repo()
     repo.execute_command = AsyncMock(return_value=None)
+    other = UUID("00000000-0000-0000-0000-000000000003")
+    claimed = datetime(2026, 5, 1, tzinfo=timezone.utc)
 
-    await repo.mark_failed(action_id=ACTION_ID, error="eBay timeout")
+    await repo.record_outcomes([(ACTION_ID, claimed, None), (other, claimed, "eBay timeout")])
+    await repo.record_outcomes([])
 
     repo.execute_command.assert_awaited_once()
-    args = repo.execute_command.call_args[0]
-    assert args[1] == ("eBay timeout", ACTION_ID)
+    sql, params = repo.execute_command.call_args[0]
+    assert "a.claimed_at = o.claimed_at" in sql
+    assert params == ([ACTION_ID, other], [claimed, claimed], [None, "eBay timeout"])
 
 
 @pytest.mark.asyncio
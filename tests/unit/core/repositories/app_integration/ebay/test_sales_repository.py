@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
@@ -117,17 +117,27 @@ async def test_get_unpromoted_returns_dicts(repo):
 
 
 @pytest.mark.asyncio
-async def test_mark_promoted_calls_command(repo):
-    await repo.mark_promoted([1, 2, 3])
-    repo.execute_command.assert_called_once()
-    args = repo.execute_command.call_args[0][1]
-    assert args[0] == [1, 2, 3]
+async def test_promote_batch_sends_column_arrays_in_one_query(repo):
+    repo.execute_query.return_value = [{"upserted": 2, "marked": 3}]
+    groups = [
+        {"ts_date": date(2024, 1, 15), "source_product_id": 1, "finish_id": 1, "condition_id": 1,
+         "language_id": 1, "sold_avg_cents": 400, "sold_count": 2},
+        {"ts_date": date(2024, 1, 16), "source_product_id": 2, "finish_id": 2, "condition_id": 3,
+         "language_id": 1, "sold_avg_cents": 100, "sold_count": 1},
+    ]
+    result = await repo.promote_batch(groups, [7, 8, 9], price_type_id=1, data_provider_id=4)
+    assert result == 3
+    repo.execute_query.assert_awaited_once()
+    args = repo.execute_query.call_args[0][1]
+    assert args[1] == [1, 2]
+    assert args[5] == [400, 100]
+    assert args[7:] == (1, 4, [7, 8, 9])
 
 
 @pytest.mark.asyncio
-async def test_mark_promoted_skips_empty_list(repo):
-    await repo.mark_promoted([])
-    repo.execute_command.assert_not_called()
+async def test_promote_batch_skips_empty_groups(repo):
+    assert await repo.promote_batch([], [], price_type_id=1, data_provider_id=4) == 0
+    repo.execute_query.assert_not_called()
 
 
 @pytest.mark.asyncio
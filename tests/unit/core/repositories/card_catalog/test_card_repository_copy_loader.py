@@ -0,0 +1,117 @@
+"""Tests for the COPY-based card loader methods on CardReferenceRepository.
+
+stage_card_batch flattens `CreateCard.model_dump_for_sql()` dicts into stage
+records (one per card, one per face) and binary-COPYs them; merge_staged_cards
+turns the per-batch rows returned by merge_card_version_stage into
+BatchInsertResponse objects.
+"""
+import json
+from uuid import UUID, uuid4
+
+import pytest
+from unittest.mock import AsyncMock
+
+from automana.core.models.card_catalog.card import CreateCard
+from automana.core.repositories.card_catalog.card_repository import (
+    CardReferenceRepository,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _make_repo():
+    repo = CardReferenceRepository.__new__(CardReferenceRepository)
+    repo.execute_copy_records_to_table = AsyncMock()
+    repo.execute_query = AsyncMock()
+    repo.execute_command = AsyncMock()
+    return repo
+
+
+def _card_row(records, column):
+    return records[0][CardReferenceRepository._STAGE_CARD_COLUMNS.index(column)]
+
+
+@pytest.mark.asyncio
+async def test_stage_card_batch_copies_card_rows_only_for_single_faced(scryfall_card):
+    repo = _make_repo()
+    load_id = uuid4()
+    card = CreateCard.model_validate(scryfall_card).model_dump_for_sql()
+
+    n = await repo.stage_card_batch(load_id, 3, [card])
+
+    assert n == 1
+    repo.execute_copy_records_to_table.assert_awaited_once()
+    kwargs = repo.execute_copy_records_to_table.await_args.kwargs
+    assert repo.execute_copy_records_to_table.await_args.args[0] == "card_version_load_stage"
+    assert kwargs["schema_name"] == "card_catalog"
+    records = kwargs["records"]
+    assert len(records[0]) == len(kwargs["columns"])
+    assert records[0][:3] == (load_id, 3, 0)
+    assert _card_row(records, "card_name") == "Lightning Bolt"
+    assert _card_row(records, "finishes") == ["nonfoil"]
+    assert _card_row(records, "illustration_id") == "550e8400-e29b-41d4-a716-446655440004"
+    assert json.loads(_card_row(records, "legalities")) == {"standard": "not_legal", "modern": "legal"}
+
+
+@pytest.mark.asyncio
+async def test_stage_card_batch_copies_faces_for_multi_faced(scryfall_dfc_card):
+    repo = _make_repo()
+    card = CreateCard.model_validate(scryfall_dfc_card).model_dump_for_sql()
+
+    await repo.stage_card_batch(uuid4(), 1, [card])
+
+    assert repo.execute_copy_records_to_table.await_count == 2
+    face_call = repo.execute_copy_records_to_table.await_args_list[1]
+    assert face_call.args[0] == "card_face_load_stage"
+    faces = face_call.kwargs["records"]
+    assert [f[3] for f in faces] == [0, 1]          # face_position
+    assert [f[5] for f in faces] == ["Delver of Secrets", "Insectile Aberration"]
+    assert all(len(f) == len(face_call.kwargs["columns"]) for f in faces)
+
+
+def test_stage_rows_normalises_list_illustration_id(scryfall_card):
+    card = CreateCard.model_validate(scryfall_card).model_dump_for_sql()
+    card["illustration_id"] = ["00000000-0000-0000-0000-000000000001"]
+
+    records, _ = CardReferenceRepository._stage_rows(uuid4(), 1, [card])
+
+    assert _card_row(records, "illustration_id") == "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.mark.asyncio
+async def test_merge_staged_cards_builds_one_response_per_batch():
+    repo = _make_repo()
+    card_id = UUID("550e8400-e29b-41d4-a716-446655440099")
+    repo.execute_query.return_value = [
+        {
+            "batch_seq": 1, "total_processed": 2, "successful_inserts": 2,
+            "failed_inserts": 0, "skipped_inserts": 0,
+            "inserted_card_ids": [card_id, card_id], "error_details": "[]",
+        },
+        {
+            "batch_seq": 2, "total_processed": 1, "successful_inserts": 0,
+            "failed_inserts": 1, "skipped_inserts": 0, "inserted_card_ids": [],
+            "error_details": json.dumps([{"card_name": "Broken", "error_code": "23502"}]),
+        },
+    ]
+
+    results = await repo.merge_staged_cards(uuid4())
+
+    assert [seq for seq, _ in results] == [1, 2]
+    first, second = results[0][1], results[1][1]
+    assert first.successful_inserts == 2 and first.success_rate == 100
+    assert first.inserted_card_ids == [card_id, card_id]
+    assert second.failed_inserts == 1
+    assert second.errors == [{"card_name": "Broken", "error_code": "23502"}]
+
+
+@pytest.mark.asyncio
+async def test_clear_card_stage_passes_optional_batch():
+    repo = _make_repo()
+    load_id = uuid4()
+
+    await repo.clear_card_stage(load_id)
+    await repo.clear_card_stage(load_id, 4)
+
+    assert repo.execute_command.await_args_list[0].args[1] == (load_id, None)
+    assert repo.execute_command.await_args_list[1].args[1] == (load_id, 4)
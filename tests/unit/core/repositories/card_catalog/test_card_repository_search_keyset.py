@@ -0,0 +1,87 @@
+"""Unit tests: card_repository.search() keyset pagination and facet skipping."""
+from uuid import UUID
+
+import pytest
+from unittest.mock import AsyncMock
+from automana.core.repositories.card_catalog.card_repository import CardReferenceRepository
+
+pytestmark = pytest.mark.unit
+
+_ID = "aaaaaaaa-0000-0000-0000-000000000000"
+
+
+def _row(name, card_id=_ID, cmc=1):
+    return {
+        "card_version_id": card_id,
+        "card_name": name,
+        "rarity_name": "rare",
+        "set_name": "Modern Horizons 2",
+        "set_code": "mh2",
+        "cmc": cmc,
+        "released_at": None,
+        "sort_price": None,
+    }
+
+
+def _make_repo(*results):
+    repo = CardReferenceRepository.__new__(CardReferenceRepository)
+    repo.execute_query = AsyncMock(side_effect=list(results))
+    repo._fetch_prices_for_cards = AsyncMock(return_value={})
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_full_page_returns_next_after_from_last_row():
+    repo = _make_repo([_row("Alpha"), _row("Bravo", card_id="bbbbbbbb-0000-0000-0000-000000000000")])
+    result = await repo.search(limit=2, with_facets=False)
+    assert result["next_after"] == {"key": "Bravo", "id": "bbbbbbbb-0000-0000-0000-000000000000"}
+    # with_facets=False: only the page query runs
+    assert repo.execute_query.await_count == 1
+    assert "total_count" not in result
+
+
+@pytest.mark.asyncio
+async def test_short_page_has_no_next_after():
+    repo = _make_repo([_row("Alpha")])
+    result = await repo.search(limit=2, with_facets=False)
+    assert result["next_after"] is None
+
+
+@pytest.mark.asyncio
+async def test_after_adds_seek_predicate_and_drops_offset():
+    repo = _make_repo([_row("Charlie")])
+    await repo.search(limit=2, offset=40, after={"key": "Bravo", "id": _ID}, with_facets=False)
+    sql, args = repo.execute_query.await_args.args
+    assert "(v.card_name, v.card_version_id) >" in sql
+    assert "ORDER BY v.card_name ASC, v.card_version_id ASC" in sql
+    assert args[-4:] == ("Bravo", UUID(_ID), 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_after_desc_with_null_key_seeks_within_null_block():
+    repo = _make_repo([])
+    await repo.search(sort_by="cmc", sort_order="desc", after={"key": None, "id": _ID}, with_facets=False)
+    sql, args = repo.execute_query.await_args.args
+    # DESC sorts NULLs first: remaining NULL rows, then every non-NULL row
+    assert "(v.cmc IS NULL AND v.card_version_id < $" in sql
+    assert "OR v.cmc IS NOT NULL" in sql
+    assert None not in args
+
+
+@pytest.mark.asyncio
+async def test_after_in_collapse_mode_filters_outer_query():
+    repo = _make_repo([])
+    await repo.search(collapse=True, sort_by="price", after={"key": "1.5", "id": _ID}, with_facets=False)
+    sql = repo.execute_query.await_args.args[0]
+    outer = sql.split(") _collapsed", 1)[1]
+    assert "(sort_price, card_version_id) > ($" in outer
+    assert "OR sort_price IS NULL" in outer
+
+
+@pytest.mark.asyncio
+async def test_relevance_search_has_no_keyset():
+    repo = _make_repo([_row("Bolt")])
+    result = await repo.search(name="bolt", limit=1, with_facets=False)
+    assert result["next_after"] is None
+    with pytest.raises(ValueError):
+        await repo.search(name="bolt", after={"key": "Bolt", "id": _ID}, with_facets=False)
@@ -61,17 +61,3 @@ async def test_get_unpromoted_empty(repo):
     repo.execute_query.return_value = []
     result = await repo.get_unpromoted()
     assert result == []
-
-
-@pytest.mark.asyncio
-async def test_mark_promoted_calls_command(repo):
-    await repo.mark_promoted([5, 6, 7])
-    repo.execute_command.assert_called_once()
-    args = repo.execute_command.call_args[0][1]
-    assert args[0] == [5, 6, 7]
-
-
-@pytest.mark.asyncio
-async def test_mark_promoted_skips_empty_list(repo):
-    await repo.mark_promoted([])
-    repo.execute_command.assert_not_called()
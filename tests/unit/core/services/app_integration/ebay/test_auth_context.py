@@ -116,3 +116,142 @@ class TestResolveToken:
 
         with pytest.raises(RuntimeError, match="DB exploded"):
             await resolve_token(repo, user_id=_USER_ID, app_code=_APP_CODE)
+
+
+    async def test_refresh_runs_on_its_own_connection_and_commits_before_caching(
+        self, _patch_redis, _patch_api_repo
+    ):
+        """A rotated refresh token must not ride on the caller's transaction."""
+        from contextlib import asynccontextmanager
+
+        from automana.core.framework.service_manager import ServiceManager
+        from automana.core.services.app_integration.ebay._auth_context import resolve_token
+
+        _, redis_mock = _patch_redis
+        _patch_api_repo.exchange_refresh_token.return_value = {
+            "access_token": _ACCESS_TOKEN, "expires_in": 7200, "refresh_token": "rotated",
+        }
+        events = []
+        redis_mock.setex.side_effect = lambda *_a: events.append("cached")
+        inner = _make_auth_repo()
+        inner.upsert_refresh_token.side_effect = lambda **_kw: events.append("rotated")
+
+        class _Repo:
+            def __init__(self, connection, executor):
+                assert connection is fresh
+                self.__dict__.update(connection=connection, executor=executor)
+
+            def __getattr__(self, name):
+                return getattr(inner, name)
+
+        class _Conn:
+            @asynccontextmanager
+            async def transaction(self):
+                yield
+                events.append("commit")
+
+        fresh = _Conn()
+
+        @asynccontextmanager
+        async def _source():
+            yield fresh
+
+        callers_repo = _Repo.__new__(_Repo)
+        callers_repo.__dict__.update(connection="caller", executor=None)
+        with patch.object(ServiceManager, "connection_source", return_value=_source):
+            assert await resolve_token(callers_repo, user_id=_USER_ID, app_code=_APP_CODE) == _ACCESS_TOKEN
+
+        assert events == ["rotated", "commit", "cached"]
+
+
+@pytest.fixture
+def _patch_lock_redis():
+    """Redis used by redis_cache.single_flight for the cross-process lock."""
+    lock_redis = AsyncMock()
+    lock_redis.set.return_value = True
+    with patch(
+        "automana.core.utils.redis_cache.get_redis_client",
+        new=AsyncMock(return_value=lock_redis),
+    ):
+        yield lock_redis
+
+
+class TestSingleFlightRefresh:
+    async def test_concurrent_misses_share_one_exchange(self, _patch_redis, _patch_api_repo, _patch_lock_redis):
+        import asyncio
+        from automana.core.services.app_integration.ebay._auth_context import resolve_token
+
+        async def _slow_exchange(**_kw):
+            await asyncio.sleep(0.01)
+            return {"access_token": _ACCESS_TOKEN, "expires_in": 7200}
+
+        _patch_api_repo.exchange_refresh_token.side_effect = _slow_exchange
+        _, redis_mock = _patch_redis
+        cache = {}
+        redis_mock.get.side_effect = lambda key: cache.get(key)
+        redis_mock.setex.side_effect = lambda key, _ttl, value: cache.__setitem__(key, value)
+        repo = _make_auth_repo()
+
+        tokens = await asyncio.gather(*(
+            resolve_token(repo, user_id=_USER_ID, app_code=_APP_CODE) for _ in range(10)
+        ))
+
+        assert tokens == [_ACCESS_TOKEN] * 10
+        _patch_api_repo.exchange_refresh_token.assert_awaited_once()
+        repo.fetch_refresh_token.assert_awaited_once()
+        _patch_lock_redis.set.assert_awaited_once()
+
+    async def test_waiter_reads_token_cached_by_lock_holder(self, _patch_redis, _patch_api_repo, _patch_lock_redis):
+        """After another process's lock is released the refresh re-checks the cache first."""
+        from automana.core.services.app_integration.ebay._auth_context import resolve_token
+
+        _, redis_mock = _patch_redis
+        redis_mock.get.side_effect = [None, json.dumps({"access_token": "from-holder"}).encode()]
+        _patch_lock_redis.set.return_value = False
+        _patch_lock_redis.exists.return_value = False
+
+        repo = _make_auth_repo()
+        assert await resolve_token(repo, user_id=_USER_ID, app_code=_APP_CODE) == "from-holder"
+        _patch_api_repo.exchange_refresh_token.assert_not_called()
+
+
+class TestRenewToken:
+    async def test_fresh_token_is_left_alone(self, _patch_redis, _patch_api_repo, _patch_lock_redis):
+        from automana.core.services.app_integration.ebay._auth_context import renew_token
+
+        _, redis_mock = _patch_redis
+        redis_mock.ttl.return_value = 5000
+        redis_mock.get.return_value = json.dumps({"access_token": _ACCESS_TOKEN}).encode()
+
+        assert await renew_token(_make_auth_repo(), _USER_ID, _APP_CODE, renew_before=900) is False
+        _patch_api_repo.exchange_refresh_token.assert_not_called()
+
+    async def test_token_near_expiry_is_refreshed(self, _patch_redis, _patch_api_repo, _patch_lock_redis):
+        from automana.core.services.app_integration.ebay._auth_context import renew_token
+
+        _, redis_mock = _patch_redis
+        redis_mock.ttl.return_value = 120
+        redis_mock.get.return_value = json.dumps({"access_token": "old"}).encode()
+
+        assert await renew_token(_make_auth_repo(), _USER_ID, _APP_CODE, renew_before=900) is True
+        _patch_api_repo.exchange_refresh_token.assert_awaited_once()
+        redis_mock.setex.assert_awaited_once()
+
+    async def test_renew_service_counts_and_isolates_failures(self, _patch_redis, _patch_api_repo, _patch_lock_redis):
+        from automana.core.services.app_integration.ebay.auth_services import renew_access_tokens
+
+        _, redis_mock = _patch_redis
+        # fresh, then due (checked again inside the single-flight), then missing
+        redis_mock.ttl.side_effect = [5000, 10, 10, -2, -2]
+        redis_mock.get.return_value = json.dumps({"access_token": _ACCESS_TOKEN}).encode()
+        repo = _make_auth_repo()
+        repo.get_active_app_code_users.return_value = [
+            {"user_id": str(_USER_ID), "app_code": code} for code in ("fresh", "due", "broken")
+        ]
+        repo.fetch_refresh_token.side_effect = [
+            MagicMock(refresh_token="refresh-tok", expires_at=None), None,
+        ]
+
+        result = await renew_access_tokens(auth_repository=repo)
+
+        assert result == {"renewed": 1, "fresh": 1, "failed": 1}
@@ -0,0 +1,148 @@
+"""Tests for the vectorised MTGStock price decoding and off-loop batch writes."""
+import asyncio
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+
+import pyarrow.parquet as pq
+import pytest
+
+import automana.core.services.app_integration.mtg_stock.data_loader as loader
+
+pytestmark = pytest.mark.unit
+
+
+def _ms(day: str, hour: int = 0) -> int:
+    return int(datetime.fromisoformat(day).replace(hour=hour, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _payload(**series) -> bytes:
+    return json.dumps({name: [[_ms(d, h), p] for d, h, p in points] for name, points in series.items()}).encode()
+
+
+class TestPricesToTable:
+    def test_series_are_aligned_on_utc_day(self):
+        raw = _payload(
+            low=[("2024-01-02", 23, 1.0), ("2024-01-01", 0, 0.5)],
+            foil=[("2024-01-02", 1, 3.0)],
+            market_foil=[("2024-01-03", 0, None)],
+        )
+
+        rows = loader.prices_to_table(7, raw).to_pylist()
+
+        assert [(r["date"], r["price_low"], r["price_foil"]) for r in rows] == [
+            (date(2024, 1, 1), 0.5, None),
+            (date(2024, 1, 2), 1.0, 3.0),
+            (date(2024, 1, 3), None, None),
+        ]
+        assert {r["print_id"] for r in rows} == {7}
+        assert rows[0]["price_avg"] is None
+
+    def test_later_point_wins_on_duplicate_day(self):
+        raw = _payload(avg=[("2024-01-01", 1, 1.0), ("2024-01-01", 5, 2.0)])
+        assert loader.prices_to_table(1, raw).column("price_avg").to_pylist() == [2.0]
+
+    def test_empty_payload_keeps_schema(self):
+        table = loader.prices_to_table(1, b'{"low": []}')
+        assert table.num_rows == 0
+        assert table.column_names == [
+            "print_id", "date", "price_low", "price_avg", "price_foil", "price_market", "price_market_foil"
+        ]
+
+    def test_parquet_written_directly(self, tmp_path):
+        out = tmp_path / "1" / "prices.tcg.parquet"
+        loader.prices_to_parquet(1, _payload(low=[("2024-01-01", 0, 1.0)]), out)
+        assert pq.read_table(out).column("date").to_pylist() == [date(2024, 1, 1)]
+
+
+class TestWriteBatch:
+    async def test_runs_in_given_executor_and_reports_errors(self, tmp_path, caplog):
+        batch = [
+            {"card_id": 1, "data": {"details": b'{"name": "A"}', "prices": _payload(low=[("2024-01-01", 0, 1.0)])}},
+            {"card_id": 2, "data": {"prices": b"not json"}},
+        ]
+        with ThreadPoolExecutor(1, thread_name_prefix="convert") as executor:
+            await loader.write_batch(batch, tmp_path, market="tcg", executor=executor)
+
+        assert loader.get_existing_ids(tmp_path) == [1]
+        assert "Error decoding print 2" in caplog.text
+
+    async def test_legacy_tree_still_gets_folders(self, tmp_path):
+        (tmp_path / "existing_ids.json").write_text("[]")
+        batch = [{"card_id": 3, "data": {"details": b"{}", "prices": _payload(low=[("2024-01-01", 0, 1.0)])}}]
+
+        await loader.write_batch(batch, tmp_path, market="tcg")
+
+        assert (tmp_path / "3" / "info.json").exists()
+        assert pq.read_table(tmp_path / "3" / "prices.tcg.parquet").num_rows == 1
+
+    def test_convert_pool_disabled_by_setting(self, monkeypatch):
+        monkeypatch.setattr(loader, "_convert_pool_ready", False)
+        monkeypatch.setattr(loader, "_convert_pool", None)
+        monkeypatch.setattr(
+            loader, "get_settings", lambda: type("S", (), {"mtgstock_convert_processes": 0})()
+        )
+        assert loader._convert_executor() is None
+
+    def test_shutdown_stops_pool_and_allows_restart(self, monkeypatch):
+        class _Pool:
+            shut = False
+
+            def shutdown(self, wait, cancel_futures):
+                self.shut = True
+
+        pool = _Pool()
+        monkeypatch.setattr(loader, "_convert_pool", pool)
+        monkeypatch.setattr(loader, "_convert_pool_ready", True)
+
+        loader.shutdown_convert_executor()
+
+        assert pool.shut
+        assert loader._convert_pool is None and not loader._convert_pool_ready
+
+
+class TestPendingWrite:
+    async def test_next_fetch_overlaps_previous_write(self, tmp_path, monkeypatch):
+        events = []
+        started = defaultdict(asyncio.Event)
+        release = defaultdict(asyncio.Event)
+
+        async def fake_write_batch(result, destination_folder, market="tcg", executor=None):
+            batch = result[0]["card_id"]
+            events.append(("write_start", batch))
+            started[batch].set()
+            await release[batch].wait()
+            events.append(("write_end", batch))
+
+        class Repo:
+            async def fetch_card_data_batches(self, ids, market):
+                if ids[0] > 1:
+                    # The previous batch's write is in flight while this fetch runs.
+                    await asyncio.wait_for(started[ids[0] - 1].wait(), timeout=5)
+                    assert ("write_end", ids[0] - 1) not in events
+                    release[ids[0] - 1].set()
+                return {"data": [{"card_id": ids[0]}]}
+
+        async def last_id(repo, max_known):
+            return 3
+
+        monkeypatch.setattr(loader, "write_batch", fake_write_batch)
+        monkeypatch.setattr(loader, "get_last_print_id", last_id)
+        monkeypatch.setattr(loader, "_convert_executor", lambda: None)
+        (tmp_path / "existing_ids.json").write_text("[]")
+
+        task = asyncio.create_task(loader.discover_and_fetch_new_ids(
+            Repo(), str(tmp_path), ingestion_run_id=None, batch_size=1,
+        ))
+        await asyncio.wait_for(started[3].wait(), timeout=5)
+        assert not task.done()  # the last write is awaited before returning
+        release[3].set()
+        result = await asyncio.wait_for(task, timeout=5)
+
+        assert result == {"new_ids_count": 3, "processed": 3}
+        assert events == [
+            ("write_start", 1), ("write_end", 1),
+            ("write_start", 2), ("write_end", 2),
+            ("write_start", 3), ("write_end", 3),
+        ]
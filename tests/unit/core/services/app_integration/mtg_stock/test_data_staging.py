@@ -6,6 +6,7 @@ Scope of this file:
 - Execution-flag regressions (runs_in_transaction / command_timeout)
 - retry_rejects service (happy path + failure path + custom params)
 - bulk_load clears the raw table before loading (idempotency fix)
+- bulk_load only lands rows newer than each print's watermark
 """
 from unittest.mock import AsyncMock, patch
 
@@ -41,7 +42,7 @@ def _fake_folder_fns():
             "cardtrader_id": None,
         }
 
-    async def fake_prices(path: str, id_dict: dict, market: str = "tcg") -> pd.DataFrame:
+    async def fake_prices(path: str, id_dict: dict, market: str = "tcg", since=None) -> pd.DataFrame:
         return pd.DataFrame({
             "ts_date": ["2024-01-01"],
             "price_low": [1.0],
@@ -171,6 +172,7 @@ class TestBulkLoad:
         so re-runs on a failed pipeline start from a clean landing table."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
 
         with patch("os.listdir", return_value=[]):
@@ -187,6 +189,7 @@ class TestBulkLoad:
         We verify ordering via call_order on the mock."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
 
         call_order = []
@@ -218,6 +221,7 @@ class TestBulkLoadRangeFilter:
         """When no filter is set and listdir returns nothing, no COPY fires."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
 
         with patch("os.listdir", return_value=[]):
@@ -233,6 +237,7 @@ class TestBulkLoadRangeFilter:
         """Folders with print_id < start_id must not be processed."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         fake_info, fake_prices = _fake_folder_fns()
         processed: list[int] = []
@@ -260,6 +265,7 @@ class TestBulkLoadRangeFilter:
         """Folders with print_id > end_id must not be processed."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         fake_info, fake_prices = _fake_folder_fns()
         processed: list[int] = []
@@ -287,6 +293,7 @@ class TestBulkLoadRangeFilter:
         """Only folders within [start_id, end_id] inclusive are processed."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         fake_info, fake_prices = _fake_folder_fns()
         processed: list[int] = []
@@ -314,6 +321,7 @@ class TestBulkLoadRangeFilter:
         when range filtering is active — they must never reach process_info_file."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         fake_info, fake_prices = _fake_folder_fns()
 
@@ -343,6 +351,7 @@ class TestBulkLoadParallel:
         called exactly 3 times — one flush per chunk."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         fake_info, fake_prices = _fake_folder_fns()
 
@@ -364,6 +373,7 @@ class TestBulkLoadParallel:
         that produces at least one successful row."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         fake_info, fake_prices = _fake_folder_fns()
 
@@ -386,6 +396,7 @@ class TestBulkLoadParallel:
         propagate."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         _, fake_prices = _fake_folder_fns()
 
@@ -420,6 +431,7 @@ class TestBulkLoadParallel:
         observable result as the old sequential loop: one COPY with all rows."""
         price_repo = AsyncMock()
         price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
         ops_repo = AsyncMock()
         fake_info, fake_prices = _fake_folder_fns()
 
@@ -438,3 +450,105 @@ class TestBulkLoadParallel:
         price_repo.copy_prices_mtgstock.assert_awaited_once()
         df_arg = price_repo.copy_prices_mtgstock.await_args.args[0]
         assert len(df_arg) == 3
+
+
+# ---------------------------------------------------------------------------
+# bulk_load — per-print watermarks (delta-only ingestion)
+# ---------------------------------------------------------------------------
+
+def _history_prices():
+    async def fake_prices(path: str, id_dict: dict, market: str = "tcg", since=None) -> pd.DataFrame:
+        # Stands in for the parquet read, including its `date > since` pushdown.
+        dates = [d for d in ["2024-01-01", "2024-01-02", "2024-01-03"]
+                 if since is None or d > since.isoformat()]
+        return pd.DataFrame({
+            "ts_date": dates,
+            "price_low": [1.0] * len(dates),
+            "price_avg": [1.5] * len(dates),
+            "price_foil": [None] * len(dates),
+            "price_market": [None] * len(dates),
+            "price_market_foil": [None] * len(dates),
+            "print_id": [id_dict["mtgstock"]] * len(dates),
+            "game_code": ["mtg"] * len(dates),
+            "source_code": ["tcg"] * len(dates),
+            "scraped_at": [pd.Timestamp.now()] * len(dates),
+        })
+    return fake_prices
+
+
+class TestBulkLoadWatermarks:
+    async def test_only_rows_after_watermark_are_landed(self):
+        from datetime import date
+
+        price_repo = AsyncMock()
+        price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {
+            10: date(2024, 1, 2),   # one new day
+            20: date(2024, 1, 3),   # fully up to date
+        }
+        ops_repo = AsyncMock()
+        fake_info, _ = _fake_folder_fns()
+
+        with patch("os.listdir", return_value=["10", "20", "30"]), \
+             patch(_PATCH_INFO, side_effect=fake_info), \
+             patch(_PATCH_PRICES, side_effect=_history_prices()):
+            result = await staging.bulk_load(
+                price_repository=price_repo,
+                ops_repository=ops_repo,
+                root_folder="/fake/root",
+            )
+
+        price_repo.fetch_mtgstock_watermarks.assert_awaited_once_with("tcg")
+        df_arg = price_repo.copy_prices_mtgstock.await_args.args[0]
+        landed = sorted(zip(df_arg["print_id"], df_arg["ts_date"]))
+        # print 10 keeps only 01-03, print 20 nothing, print 30 (no watermark) everything
+        assert landed == [(10, "2024-01-03"), (30, "2024-01-01"), (30, "2024-01-02"), (30, "2024-01-03")]
+        assert result == {"raw_rows_loaded": 4, "prints_up_to_date": 1}
+
+    async def test_full_reload_ignores_watermarks(self):
+        price_repo = AsyncMock()
+        price_repo.clear_raw_prices.return_value = 0
+        ops_repo = AsyncMock()
+        fake_info, _ = _fake_folder_fns()
+
+        with patch("os.listdir", return_value=["10"]), \
+             patch(_PATCH_INFO, side_effect=fake_info), \
+             patch(_PATCH_PRICES, side_effect=_history_prices()):
+            result = await staging.bulk_load(
+                price_repository=price_repo,
+                ops_repository=ops_repo,
+                root_folder="/fake/root",
+                full_reload=True,
+            )
+
+        price_repo.fetch_mtgstock_watermarks.assert_not_awaited()
+        assert result["raw_rows_loaded"] == 3
+
+    async def test_advance_watermarks_after_promotion(self):
+        price_repo = AsyncMock()
+        price_repo.advance_mtgstock_watermarks.return_value = 12
+        ops_repo = AsyncMock()
+
+        result = await staging.advance_watermarks(
+            price_repository=price_repo, ops_repository=ops_repo, ingestion_run_id=5
+        )
+
+        assert result == {"watermarks_advanced": 12}
+        statuses = [call.kwargs["status"] for call in ops_repo.update_run.await_args_list]
+        assert statuses == ["running", "success"]
+
+    async def test_watermark_filter_is_pushed_into_the_parquet_read(self, tmp_path):
+        from datetime import date
+
+        path = tmp_path / "prices.tcg.parquet"
+        pd.DataFrame({
+            "date": [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)],
+            "price_low": [1.0, 2.0, 3.0], "price_avg": [1.0] * 3, "price_foil": [None] * 3,
+            "price_market": [None] * 3, "price_market_foil": [None] * 3,
+        }).to_parquet(path)
+
+        with patch.object(staging.pd, "read_parquet", wraps=pd.read_parquet) as read:
+            df = await staging.process_prices_file(str(path), {"mtgstock": 7}, since=date(2024, 1, 2))
+
+        assert read.call_args.kwargs["filters"] == [("date", ">", date(2024, 1, 2))]
+        assert list(df["ts_date"]) == [date(2024, 1, 3)]
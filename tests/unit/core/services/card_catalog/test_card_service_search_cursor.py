@@ -0,0 +1,144 @@
+"""Unit tests: search_cards cursor pagination and per-filter facet caching."""
+import base64
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from automana.core.exceptions.service_layer_exceptions.card_catalogue.card_exception import (
+    InvalidSearchCursorError,
+)
+from automana.core.services.card_catalog.card_service import _encode_search_cursor, search_cards
+
+pytestmark = pytest.mark.unit
+
+_ID = "aaaaaaaa-0000-0000-0000-000000000000"
+_MODULE = "automana.core.services.card_catalog.card_service"
+_FACETS = {"total_count": 42, "promo_type_facets": ["prerelease"], "rarity_facets": ["rare"]}
+
+
+def _repo(raw):
+    repo = MagicMock()
+    repo.search = AsyncMock(return_value=raw)
+    return repo
+
+
+async def _search(repo, cache, **kwargs):
+    """Run search_cards against an in-memory dict standing in for Redis."""
+    async def fake_get(key):
+        return cache.get(key)
+
+    async def fake_set(key, value, **_):
+        cache[key] = value
+
+    with patch(f"{_MODULE}.get_from_cache", side_effect=fake_get), \
+         patch(f"{_MODULE}.set_to_cache", side_effect=fake_set):
+        return await search_cards(card_repository=repo, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_keyset_cursor_round_trip_reuses_cached_facets():
+    cache = {}
+    repo = _repo({"cards": [], "next_after": {"key": "Bolt", "id": _ID}, **_FACETS})
+
+    first = await _search(repo, cache, set_code="mh2", limit=1)
+    assert first.next_cursor is not None
+    assert first.total_count == 42
+    assert repo.search.await_args.kwargs["with_facets"] is True
+
+    repo.search.return_value = {"cards": [], "next_after": None}
+    second = await _search(repo, cache, set_code="mh2", limit=1, cursor=first.next_cursor)
+
+    kwargs = repo.search.await_args.kwargs
+    assert kwargs["after"] == {"key": "Bolt", "id": _ID}
+    assert kwargs["with_facets"] is False
+    assert second.total_count == 42
+    assert second.rarity_facets == ["rare"]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_relevance_search_gets_offset_cursor():
+    cache = {}
+    card = {
+        "card_version_id": _ID, "card_name": "Lightning Bolt", "set_name": "Magic 2010",
+        "set_code": "m10", "cmc": 1, "rarity_name": "common", "digital": False,
+    }
+    repo = _repo({"cards": [card], "next_after": None, **_FACETS})
+
+    first = await _search(repo, cache, name="bolt", limit=1)
+    await _search(repo, cache, name="bolt", limit=1, cursor=first.next_cursor)
+
+    kwargs = repo.search.await_args.kwargs
+    assert kwargs["after"] is None
+    assert kwargs["offset"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cursor_for_other_filters_is_rejected():
+    cache = {}
+    repo = _repo({"cards": [], "next_after": {"key": "Bolt", "id": _ID}, **_FACETS})
+    first = await _search(repo, cache, set_code="mh2", limit=1)
+
+    with pytest.raises(InvalidSearchCursorError):
+        await _search(repo, cache, set_code="neo", limit=1, cursor=first.next_cursor)
+    with pytest.raises(InvalidSearchCursorError):
+        await _search(repo, cache, set_code="mh2", limit=1, cursor="not-a-cursor")
+
+
+def _tamper(cursor, **changes):
+    payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    if "off" in changes:
+        payload.pop("id", None)
+        payload.pop("k", None)
+    return _encode_search_cursor({**payload, **changes})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("changes", [
+    {"id": "not-a-uuid"},
+    {"id": _ID, "k": {"x": 1}},
+    {"off": -5},
+    {"off": "10"},
+])
+async def test_tampered_cursor_fields_are_rejected(changes):
+    cache = {}
+    repo = _repo({"cards": [], "next_after": {"key": "Bolt", "id": _ID}, **_FACETS})
+    first = await _search(repo, cache, set_code="mh2", limit=1)
+
+    with pytest.raises(InvalidSearchCursorError):
+        await _search(repo, cache, set_code="mh2", limit=1,
+                      cursor=_tamper(first.next_cursor, **changes))
+
+
+@pytest.mark.asyncio
+async def test_keyset_value_must_match_sort_type():
+    cache = {}
+    repo = _repo({"cards": [], "next_after": {"key": 3, "id": _ID}, **_FACETS})
+    first = await _search(repo, cache, set_code="mh2", sort_by="cmc", limit=1)
+
+    await _search(repo, cache, set_code="mh2", sort_by="cmc", limit=1, cursor=first.next_cursor)
+    with pytest.raises(InvalidSearchCursorError):
+        await _search(repo, cache, set_code="mh2", sort_by="cmc", limit=1,
+                      cursor=_tamper(first.next_cursor, k="3; DROP"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by, key, bad", [
+    ("cmc", 3, "99999999999"),
+    ("cmc", 3, "-2147483649"),
+    ("price", "1.50", "1e999999"),
+    ("price", "1.50", "1e-20000"),
+    ("price", "1.50", "0e-999999"),
+    ("price", "1.50", "NaN"),
+    ("price", "1.50", "Infinity"),
+])
+async def test_keyset_value_outside_sql_type_range_is_rejected(sort_by, key, bad):
+    cache = {}
+    repo = _repo({"cards": [], "next_after": {"key": key, "id": _ID}, **_FACETS})
+    first = await _search(repo, cache, set_code="mh2", sort_by=sort_by, limit=1)
+
+    await _search(repo, cache, set_code="mh2", sort_by=sort_by, limit=1, cursor=first.next_cursor)
+    with pytest.raises(InvalidSearchCursorError):
+        await _search(repo, cache, set_code="mh2", sort_by=sort_by, limit=1,
+                      cursor=_tamper(first.next_cursor, k=bad))
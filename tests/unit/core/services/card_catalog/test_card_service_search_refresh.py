@@ -0,0 +1,66 @@
+"""
+Unit tests for card_catalog.card_search.refresh.
+
+Scope:
+  - The service forwards force_full / full_threshold to the repository and
+    surfaces the refresh mode and row counts in its result.
+  - CardReferenceRepository.refresh_search_tables calls
+    refresh_card_search_tables() with the right arguments.
+
+Not in scope:
+  - Dirty tracking and the upsert/delete SQL — integration territory.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+import automana.core.services.card_catalog.card_service as card_service
+from automana.core.repositories.card_catalog.card_repository import CardReferenceRepository
+
+pytestmark = pytest.mark.unit
+
+_INCREMENTAL = {
+    "mode": "incremental",
+    "dirty_cards": 3,
+    "versions_upserted": 4,
+    "versions_deleted": 0,
+    "suggest_upserted": 4,
+    "suggest_deleted": 0,
+}
+
+
+@pytest.mark.asyncio
+async def test_refresh_defaults_to_incremental():
+    repo = AsyncMock()
+    repo.refresh_search_tables.return_value = dict(_INCREMENTAL)
+
+    result = await card_service.refresh_card_search_views(card_repository=repo)
+
+    repo.refresh_search_tables.assert_awaited_once_with(full_threshold=10000, force_full=False)
+    assert result == {"refreshed": True, **_INCREMENTAL}
+
+
+@pytest.mark.asyncio
+async def test_refresh_force_full_ignores_unrelated_chain_kwargs():
+    repo = AsyncMock()
+    repo.refresh_search_tables.return_value = {**_INCREMENTAL, "mode": "full"}
+
+    result = await card_service.refresh_card_search_views(
+        card_repository=repo, force_full=True, full_threshold=50, ingestion_run_id=7
+    )
+
+    repo.refresh_search_tables.assert_awaited_once_with(full_threshold=50, force_full=True)
+    assert result["mode"] == "full"
+
+
+@pytest.mark.asyncio
+async def test_repository_refresh_search_tables_returns_first_row():
+    repo = CardReferenceRepository.__new__(CardReferenceRepository)
+    repo.execute_query = AsyncMock(return_value=[_INCREMENTAL])
+
+    result = await repo.refresh_search_tables(full_threshold=25, force_full=True)
+
+    sql, args = repo.execute_query.await_args.args
+    assert "card_catalog.refresh_card_search_tables" in sql
+    assert args == (25, True)
+    assert result == _INCREMENTAL
@@ -1,10 +1,12 @@
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 from automana.core.services.app_integration.ebay.listing_actions_service import (
     stage_action,
     get_pending_action,
+    drain_pending_actions,
 )
 
 USER_ID = UUID("00000000-0000-0000-0000-000000000001")
@@ -98,3 +100,73 @@ async def test_get_pending_action_returns_none():
 
     assert result is None
     repo.get_pending_for_item.assert_called_once_with("item-789")
+
+
+# ── drain_pending_actions ─────────────────────────────────────────────────────
+
+CLAIMED_AT = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+
+def _claimed(n):
+    return [
+        {"id": UUID(int=i + 1), "item_id": f"item-{i}", "action_type": "lower", "suggested_price": 1.0,
+         "claimed_at": CLAIMED_AT}
+        for i in range(n)
+    ]
+
+
+def make_drain_repo(rows):
+    repo = make_repo()
+    repo.claim_pending = AsyncMock(return_value=rows)
+    repo.record_outcomes = AsyncMock()
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_drain_claims_once_and_batches_status_updates():
+    rows = _claimed(3)
+    repo = make_drain_repo(rows)
+
+    result = await drain_pending_actions(listing_actions_repository=repo, limit=10)
+
+    assert result == {"processed": 3, "failed": 0}
+    repo.claim_pending.assert_awaited_once_with(limit=10, lease_seconds=900)
+    repo.record_outcomes.assert_awaited_once_with([(r["id"], CLAIMED_AT, None) for r in rows])
+
+
+@pytest.mark.asyncio
+async def test_drain_runs_actions_concurrently_and_records_failures(monkeypatch):
+    import asyncio
+    from automana.core.services.app_integration.ebay import listing_actions_service as svc
+
+    in_flight = peak = 0
+
+    async def _fake_execute(row):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if row["item_id"] == "item-1":
+            raise RuntimeError("eBay timeout")
+
+    monkeypatch.setattr(svc, "_execute_action", _fake_execute)
+    rows = _claimed(6)
+    repo = make_drain_repo(rows)
+
+    result = await drain_pending_actions(listing_actions_repository=repo, concurrency=3)
+
+    assert result == {"processed": 5, "failed": 1}
+    assert peak == 3
+    outcomes = repo.record_outcomes.call_args.args[0]
+    assert [error for _, _, error in outcomes] == [None, "eBay timeout", None, None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_drain_with_nothing_claimed_writes_nothing():
+    repo = make_drain_repo([])
+
+    result = await drain_pending_actions(listing_actions_repository=repo)
+
+    assert result == {"processed": 0, "failed": 0}
+    repo.record_outcomes.assert_not_called()
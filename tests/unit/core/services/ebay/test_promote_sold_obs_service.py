@@ -67,38 +67,56 @@ def test_aggregate_null_condition_defaults_to_1():
 
 # ── _promote_channel ──────────────────────────────────────────────────────────
 
+def _promote_fn():
+    return AsyncMock(side_effect=lambda rows, ids, **kw: len(ids))
+
+
 @pytest.mark.asyncio
 async def test_promote_channel_empty_returns_zero():
-    mark_fn = AsyncMock()
-    upsert_fn = AsyncMock()
-    count = await _promote_channel([], mark_fn, upsert_fn)
+    promote_fn = _promote_fn()
+    count = await _promote_channel([], promote_fn)
     assert count == 0
-    upsert_fn.assert_not_called()
-    mark_fn.assert_not_called()
+    promote_fn.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_promote_channel_upserts_and_marks():
+async def test_promote_channel_upserts_and_marks_in_one_call():
     rows = [_row(1, 300), _row(2, 500)]
-    mark_fn = AsyncMock()
-    upsert_fn = AsyncMock()
-    count = await _promote_channel(rows, mark_fn, upsert_fn)
+    promote_fn = _promote_fn()
+    count = await _promote_channel(rows, promote_fn)
     assert count == 2
-    upsert_fn.assert_called_once()
-    call_kwargs = upsert_fn.call_args.kwargs
-    assert call_kwargs["sold_avg_cents"] == 400
-    assert call_kwargs["sold_count"] == 2
-    mark_fn.assert_called_once_with([1, 2])
+    promote_fn.assert_awaited_once()
+    groups, ids = promote_fn.call_args.args
+    assert len(groups) == 1
+    assert groups[0]["sold_avg_cents"] == 400
+    assert groups[0]["sold_count"] == 2
+    assert ids == [1, 2]
+    assert promote_fn.call_args.kwargs == {"price_type_id": 1, "data_provider_id": 4}
 
 
 @pytest.mark.asyncio
-async def test_promote_channel_mark_failure_does_not_raise():
-    rows = [_row(1, 100)]
-    mark_fn = AsyncMock(side_effect=RuntimeError("DB error"))
-    upsert_fn = AsyncMock()
-    # Should not raise
-    count = await _promote_channel(rows, mark_fn, upsert_fn)
-    assert isinstance(count, int)
+async def test_promote_channel_one_call_per_batch(monkeypatch):
+    from automana.core.services.app_integration.ebay import promote_sold_obs_service as svc
+
+    monkeypatch.setattr(svc, "_BATCH_SIZE", 2)
+    rows = [_row(i, 100, datetime(2024, 1, i, tzinfo=timezone.utc)) for i in range(1, 6)]
+    promote_fn = _promote_fn()
+    count = await _promote_channel(rows, promote_fn)
+    assert count == 5
+    assert [len(c.args[0]) for c in promote_fn.call_args_list] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_promote_channel_failed_batch_does_not_raise_or_stop_others(monkeypatch):
+    from automana.core.services.app_integration.ebay import promote_sold_obs_service as svc
+
+    monkeypatch.setattr(svc, "_BATCH_SIZE", 1)
+    rows = [_row(1, 100, datetime(2024, 1, 1, tzinfo=timezone.utc)),
+            _row(2, 100, datetime(2024, 1, 2, tzinfo=timezone.utc))]
+    promote_fn = AsyncMock(side_effect=[RuntimeError("DB error"), 1])
+    count = await _promote_channel(rows, promote_fn)
+    assert count == 1
+    assert promote_fn.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -114,11 +132,9 @@ async def test_promote_channel_applies_fx_conversion():
         "condition_id": 1,
         "language_id": 1,
     }
-    mark_fn = AsyncMock()
-    upsert_fn = AsyncMock()
-    await _promote_channel([row], mark_fn, upsert_fn, fx_map={"AUD": 0.65})
-    call_kwargs = upsert_fn.call_args.kwargs
-    assert call_kwargs["sold_avg_cents"] == 130  # 200 * 0.65 = 130
+    promote_fn = _promote_fn()
+    await _promote_channel([row], promote_fn, fx_map={"AUD": 0.65})
+    assert promote_fn.call_args.args[0][0]["sold_avg_cents"] == 130  # 200 * 0.65 = 130
 
 
 # ── promote_sold_obs ─────────────────────────────────────────────────────────
@@ -129,12 +145,11 @@ async def test_promote_sold_obs_both_channels():
 
     ebay_sales = AsyncMock()
     ebay_sales.get_unpromoted = AsyncMock(return_value=[_row(1, 200)])
-    ebay_sales.mark_promoted = AsyncMock()
-    ebay_sales.upsert_price_observation = AsyncMock()
+    ebay_sales.promote_batch = _promote_fn()
 
     ebay_scrape = AsyncMock()
     ebay_scrape.get_unpromoted = AsyncMock(return_value=[_scrape_row(10, 300)])
-    ebay_scrape.mark_promoted = AsyncMock()
+    ebay_scrape.promote_batch = _promote_fn()
 
     fx_rates = AsyncMock(spec=FxRatesRepository)
     fx_rates.get_rates_for_date = AsyncMock(return_value=[])
@@ -146,7 +161,8 @@ async def test_promote_sold_obs_both_channels():
     )
 
     assert result["promoted"] == 2
-    assert ebay_sales.upsert_price_observation.call_count == 2
+    ebay_sales.promote_batch.assert_awaited_once()
+    ebay_scrape.promote_batch.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -236,8 +252,7 @@ async def test_promote_sold_obs_applies_fx_to_scrape_channel():
 
     ebay_sales = AsyncMock()
     ebay_sales.get_unpromoted = AsyncMock(return_value=[])
-    ebay_sales.mark_promoted = AsyncMock()
-    ebay_sales.upsert_price_observation = AsyncMock()
+    ebay_sales.promote_batch = _promote_fn()
 
     ebay_scrape = AsyncMock()
     ebay_scrape.get_unpromoted = AsyncMock(return_value=[{
@@ -250,7 +265,7 @@ async def test_promote_sold_obs_applies_fx_to_scrape_channel():
         "condition_id": 1,
         "language_id": 1,
     }])
-    ebay_scrape.mark_promoted = AsyncMock()
+    ebay_scrape.promote_batch = _promote_fn()
 
     fx_rates = AsyncMock(spec=FxRatesRepository)
     fx_rates.get_rates_for_date = AsyncMock(return_value=[
@@ -264,8 +279,8 @@ async def test_promote_sold_obs_applies_fx_to_scrape_channel():
     )
 
     assert result["promoted"] == 1
-    upsert_call = ebay_sales.upsert_price_observation.call_args.kwargs
-    assert upsert_call["sold_avg_cents"] == 130  # 200 * 0.65 = 130
+    upserted = ebay_scrape.promote_batch.call_args.args[0][0]
+    assert upserted["sold_avg_cents"] == 130  # 200 * 0.65 = 130
 
 
 @pytest.mark.asyncio
@@ -275,8 +290,7 @@ async def test_promote_sold_obs_skips_fx_when_no_rates_available():
 
     ebay_sales = AsyncMock()
     ebay_sales.get_unpromoted = AsyncMock(return_value=[])
-    ebay_sales.mark_promoted = AsyncMock()
-    ebay_sales.upsert_price_observation = AsyncMock()
+    ebay_sales.promote_batch = _promote_fn()
 
     ebay_scrape = AsyncMock()
     ebay_scrape.get_unpromoted = AsyncMock(return_value=[{
@@ -289,7 +303,7 @@ async def test_promote_sold_obs_skips_fx_when_no_rates_available():
         "condition_id": 1,
         "language_id": 1,
     }])
-    ebay_scrape.mark_promoted = AsyncMock()
+    ebay_scrape.promote_batch = _promote_fn()
 
     fx_rates = AsyncMock(spec=FxRatesRepository)
     fx_rates.get_rates_for_date = AsyncMock(return_value=[])  # empty — no rates today
@@ -301,5 +315,5 @@ async def test_promote_sold_obs_skips_fx_when_no_rates_available():
     )
 
     assert result["promoted"] == 1
-    upsert_call = ebay_sales.upsert_price_observation.call_args.kwargs
-    assert upsert_call["sold_avg_cents"] == 200  # face value fallback
+    upserted = ebay_scrape.promote_batch.call_args.args[0][0]
+    assert upserted["sold_avg_cents"] == 200  # face value fallback
@@ -1,12 +1,14 @@
+import asyncio
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from automana.core.services.app_integration.ebay import sales_sync_service as svc
 from automana.core.services.app_integration.ebay.sales_sync_service import (
     _price_to_cents,
     _parse_sold_at,
-    _resolve_card_version,
+    _best_candidate,
     track_active_listing,
     sync_own_sales,
 )
@@ -54,42 +56,19 @@ def test_parse_sold_at_none_returns_now():
     assert before <= result <= after
 
 
-# ── _resolve_card_version ─────────────────────────────────────────────────────
+# ── _best_candidate ───────────────────────────────────────────────────────────
 
-@pytest.mark.asyncio
-async def test_resolve_card_version_from_active_listing():
-    ebay_sales = AsyncMock()
-    ebay_sales.get_card_version_by_item = AsyncMock(return_value=CARD_ID)
-    card_repo = AsyncMock()
-
-    result = await _resolve_card_version("item-1", "Lightning Bolt", ebay_sales, card_repo)
-    assert result == CARD_ID
-    card_repo.suggest.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_resolve_card_version_falls_back_to_suggest():
-    ebay_sales = AsyncMock()
-    ebay_sales.get_card_version_by_item = AsyncMock(return_value=None)
-    card_repo = AsyncMock()
-    card_repo.suggest = AsyncMock(return_value=[
+def test_best_candidate_picks_matching_title():
+    result = _best_candidate("Lightning Bolt M10 MTG", [
         {"card_version_id": str(CARD_ID), "card_name": "Lightning Bolt", "set_code": "M10"},
     ])
-
-    result = await _resolve_card_version(None, "Lightning Bolt M10 MTG", ebay_sales, card_repo)
     assert result == CARD_ID
 
 
-@pytest.mark.asyncio
-async def test_resolve_card_version_returns_none_when_score_low():
-    ebay_sales = AsyncMock()
-    ebay_sales.get_card_version_by_item = AsyncMock(return_value=None)
-    card_repo = AsyncMock()
-    card_repo.suggest = AsyncMock(return_value=[
+def test_best_candidate_returns_none_when_score_low():
+    result = _best_candidate("Lightning Bolt MTG", [
         {"card_version_id": str(CARD_ID), "card_name": "Counterspell", "set_code": "XYZ"},
     ])
-
-    result = await _resolve_card_version(None, "Lightning Bolt MTG", ebay_sales, card_repo)
     assert result is None
 
 
@@ -124,7 +103,7 @@ async def test_sync_own_sales_no_active_users():
         card_repository=AsyncMock(),
         selling_repository=AsyncMock(),
     )
-    assert result == {"synced_orders": 0}
+    assert result == {"synced_orders": 0, "synced_sellers": 0}
 
 
 @pytest.mark.asyncio
@@ -147,3 +126,171 @@ async def test_sync_own_sales_skips_user_on_error():
     )
     # User errored but function continues; count is 0 for this user
     assert isinstance(result, dict)
+
+
+# ── paginated, batched sync ───────────────────────────────────────────────────
+
+CV_LISTED = uuid4()
+CV_TITLE = uuid4()
+
+
+def _order(order_id, *lines):
+    return {
+        "orderId": order_id,
+        "creationDate": "2026-05-01T10:00:00.000Z",
+        "buyer": {"username": "bob"},
+        "lineItems": [
+            {"legacyItemId": item_id, "title": title, "quantity": 1,
+             "lineItemCost": {"value": price, "currency": "USD"}}
+            for item_id, title, price in lines
+        ],
+    }
+
+
+class _Selling:
+    """getOrders stand-in: serves ``orders_by_token`` in limit/offset pages."""
+
+    def __init__(self, orders_by_token, delay=0.0):
+        self.orders_by_token = orders_by_token
+        self.delay = delay
+        self.calls = []
+        self.in_flight = self.max_in_flight = 0
+
+    async def get_history(self, payload):
+        self.calls.append(payload)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        orders = self.orders_by_token[payload["token"]]
+        off, lim = payload["offset"], payload["limit"]
+        return {"orders": orders[off:off + lim], "total": len(orders)}
+
+
+def _repos():
+    auth = AsyncMock()
+    auth.get_environment.return_value = "PRODUCTION"
+    app = AsyncMock()
+    sales = AsyncMock()
+    sales.get_listing_variants.return_value = {
+        "100": {"card_version_id": CV_LISTED, "finish_id": 2, "condition_id": 3,
+                "language_id": 1, "marketplace_id": "15"},
+    }
+    sales.ensure_source_products.side_effect = lambda cvs, _src: {cv: 70 + i for i, cv in enumerate(cvs)}
+    card = AsyncMock()
+    card.suggest_many.side_effect = lambda titles, limit: {
+        t: [{"card_version_id": str(CV_TITLE), "card_name": "Lightning Bolt", "set_code": "m11"}]
+        if "Lightning Bolt" in t else []
+        for t in titles
+    }
+    return auth, app, sales, card
+
+
+@pytest.fixture(autouse=True)
+def _token(monkeypatch):
+    async def _resolve(_auth, user_id, app_code):
+        return f"tok-{app_code}"
+    monkeypatch.setattr(svc, "resolve_token", _resolve)
+
+
+async def _run(auth, app, sales, card, selling, users, **kw):
+    auth.get_active_app_code_users.return_value = users
+    return await svc.sync_own_sales(
+        auth_repository=auth, app_repository=app, ebay_sales_repository=sales,
+        card_repository=card, selling_repository=selling, **kw,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pages_through_full_history_and_batches_db_work(monkeypatch):
+    monkeypatch.setattr(svc, "_PAGE_SIZE", 2)
+    orders = [
+        _order("o1", ("100", "Listed card", "5.00")),
+        _order("o2", ("", "Lightning Bolt M11 NM", "1.25"), ("", "Mystery lot", "2.00")),
+        _order("o3", ("100", "Listed card", "5.00")),
+        {"orderId": None},
+        _order("o5", ("101", "No price", None)),
+    ]
+    auth, app, sales, card = _repos()
+    selling = _Selling({"tok-a": orders})
+
+    result = await _run(auth, app, sales, card, selling, [{"user_id": str(uuid4()), "app_code": "a"}])
+
+    assert sorted(c["offset"] for c in selling.calls) == [0, 2, 4]
+    assert {c["environment"] for c in selling.calls} == {"production"}
+    assert result == {"synced_orders": 4, "synced_sellers": 1}
+
+    app.upsert_order_statuses.assert_awaited_once_with(
+        ["o1", "o2", "o3", "o5"], app_code="a", local_status="sold"
+    )
+    sales.get_listing_variants.assert_awaited_once_with(["100"])  # "101" has no price
+    card.suggest_many.assert_awaited_once()
+    sales.ensure_source_products.assert_awaited_once()
+    rows = sales.upsert_order_source_products.await_args.args[0]
+    by_key = {(r["order_id"], r["item_id"], r["title"]): r for r in rows}
+    assert len(rows) == 4
+    listed = by_key[("o1", "100", "Listed card")]
+    assert (listed["finish_id"], listed["condition_id"], listed["marketplace_id"]) == (2, 3, "15")
+    assert listed["source_product_id"] is not None
+    bolt = by_key[("o2", "", "Lightning Bolt M11 NM")]
+    assert bolt["source_product_id"] is not None and bolt["finish_id"] == 1
+    assert by_key[("o2", "", "Mystery lot")]["source_product_id"] is None
+    assert all("card_version_id" not in r for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_pages_after_the_first_are_fetched_concurrently(monkeypatch):
+    monkeypatch.setattr(svc, "_PAGE_SIZE", 1)
+    monkeypatch.setattr(svc, "_PAGE_CONCURRENCY", 3)
+    orders = [_order(f"o{i}", ("100", "Listed", "1.00")) for i in range(7)]
+    selling = _Selling({"tok-a": orders}, delay=0.01)
+
+    fetched = await svc._fetch_all_orders(selling, "tok-a", "production")
+
+    assert [o["orderId"] for o in fetched] == [f"o{i}" for i in range(7)]
+    assert selling.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_token_is_resolved_outside_the_db_lock(monkeypatch):
+    auth, app, sales, card = _repos()
+    other_seller_used_db = asyncio.Event()
+    auth.get_environment.side_effect = lambda app_code: other_seller_used_db.set() or "PRODUCTION"
+
+    async def _resolve(_auth, user_id, app_code):
+        if app_code == "a":
+            # Seller "b" reaches the DB while "a" is still resolving its token.
+            await asyncio.wait_for(other_seller_used_db.wait(), timeout=1)
+        return f"tok-{app_code}"
+
+    monkeypatch.setattr(svc, "resolve_token", _resolve)
+    selling = _Selling({f"tok-{c}": [_order(f"{c}-1", ("100", "Listed", "1.00"))] for c in "ab"})
+    users = [{"user_id": str(uuid4()), "app_code": c} for c in "ab"]
+
+    result = await _run(auth, app, sales, card, selling, users, concurrency=2)
+
+    assert result == {"synced_orders": 2, "synced_sellers": 2}
+
+
+@pytest.mark.asyncio
+async def test_sellers_fetch_concurrently_and_failures_are_isolated():
+    auth, app, sales, card = _repos()
+    selling = _Selling({f"tok-{c}": [_order(f"{c}-1", ("100", "Listed", "1.00"))] for c in "abc"}, delay=0.02)
+    users = [{"user_id": str(uuid4()), "app_code": c} for c in "abcd"]  # "d" has no orders mapping
+
+    result = await _run(auth, app, sales, card, selling, users, concurrency=3)
+
+    assert selling.max_in_flight == 3
+    assert result == {"synced_orders": 3, "synced_sellers": 3}
+
+
+@pytest.mark.asyncio
+async def test_ensure_source_products_failure_skips_linked_lines_only():
+    auth, app, sales, card = _repos()
+    sales.ensure_source_products.side_effect = RuntimeError("boom")
+    selling = _Selling({"tok-a": [_order("o1", ("100", "Listed", "1.00"), ("", "Mystery", "2.00"))]})
+
+    await _run(auth, app, sales, card, selling, [{"user_id": str(uuid4()), "app_code": "a"}])
+
+    rows = sales.upsert_order_source_products.await_args.args[0]
+    assert [(r["title"], r["source_product_id"]) for r in rows] == [("Mystery", None)]
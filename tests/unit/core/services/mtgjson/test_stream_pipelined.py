@@ -0,0 +1,94 @@
+"""Unit tests: pipelined MTGJson staging (parse pool + parallel COPY writers)."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from automana.core.services.app_integration.mtgjson import data_loader
+
+pytestmark = pytest.mark.unit
+
+
+def _card(price):
+    return {"paper": {"tcgplayer": {"currency": "USD", "retail": {"normal": {"2026-03-01": price}}}}}
+
+
+class _Storage:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def iter_xz_json_kvitem_chunks(self, absolute_path, prefix, chunk_size=256):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _chunks(n_cards, per_chunk, sealed_every=0):
+    pairs = []
+    for i in range(n_cards):
+        uuid = f"sealed-{i}" if sealed_every and i % sealed_every == 0 else f"card-{i}"
+        pairs.append((uuid, _card(float(i))))
+    return [pairs[i:i + per_chunk] for i in range(0, len(pairs), per_chunk)]
+
+
+@pytest.fixture
+def copies():
+    """Record every batch the writers hand to the copy service."""
+    batches = []
+
+    async def fake_execute(path, records, sealed=False):
+        assert path == "staging.mtgjson.copy_staging_rows"
+        await asyncio.sleep(0)
+        batches.append(("sealed" if sealed else "card", list(records)))
+        return len(records)
+
+    with patch(
+        "automana.core.framework.service_manager.ServiceManager.execute_service",
+        new=AsyncMock(side_effect=fake_execute),
+    ), patch.object(data_loader, "_COPY_BATCH_SIZE", 7):
+        yield batches
+
+
+async def test_all_rows_reach_staging_through_writers(copies):
+    chunks = _chunks(50, per_chunk=6, sealed_every=10)
+    sealed = {f"sealed-{i}" for i in range(0, 50, 10)}
+
+    cards_seen, card_rows, sealed_rows = await data_loader._stream_pipelined(
+        _Storage(chunks), "AllPrices.json.xz", sealed, copy_writers=3, parse_processes=0
+    )
+
+    assert (cards_seen, card_rows, sealed_rows) == (50, 45, 5)
+    staged = sorted(r[0] for kind, rows in copies if kind == "card" for r in rows)
+    assert staged == sorted(f"card-{i}" for i in range(50) if i % 10)
+    assert all(len(rows) <= 7 for _, rows in copies)
+
+
+async def test_writer_failure_propagates_without_hanging():
+    async def failing_execute(path, records, sealed=False):
+        raise RuntimeError("copy failed")
+
+    with patch(
+        "automana.core.framework.service_manager.ServiceManager.execute_service",
+        new=AsyncMock(side_effect=failing_execute),
+    ), patch.object(data_loader, "_COPY_BATCH_SIZE", 2):
+        with pytest.raises(RuntimeError, match="copy failed"):
+            await asyncio.wait_for(
+                data_loader._stream_pipelined(
+                    _Storage(_chunks(200, per_chunk=5)), "f.xz", set(), copy_writers=2, parse_processes=0
+                ),
+                timeout=5,
+            )
+
+
+async def test_process_pool_parsing_matches_inline(copies):
+    chunks = _chunks(30, per_chunk=4)
+
+    _, card_rows, _ = await data_loader._stream_pipelined(
+        _Storage(chunks), "f.xz", set(), copy_writers=2, parse_processes=1
+    )
+
+    assert card_rows == 30
+    assert sorted(r[0] for _, rows in copies for r in rows) == sorted(f"card-{i}" for i in range(30))
+
+
+def test_parse_executor_disabled_without_processes():
+    assert data_loader._make_parse_executor(0) is None
@@ -149,3 +149,126 @@ async def test_run_metric_report_filters_by_category():
         repositories={}, extra_kwargs=None,
     )
     assert [r["check_name"] for r in out["rows"]] == ["cat.h"]
+
+
+# ── concurrent mode ───────────────────────────────────────────────────────────
+
+from automana.core.repositories.abstract_repositories.AbstractDBRepository import AbstractRepository  # noqa: E402
+
+
+class _ConnRepo(AbstractRepository):
+    @property
+    def name(self):
+        return "ConnRepo"
+
+    async def add(self, item=None): ...
+    async def get(self, id=None): ...
+    async def update(self, item=None): ...
+    async def delete(self, id=None): ...
+    async def list(self, items=None): ...
+
+
+_PEAK = {"in_flight": 0, "peak": 0}
+
+
+async def _test_slow(conn_repo) -> MetricResult:
+    import asyncio
+    _PEAK["in_flight"] += 1
+    _PEAK["peak"] = max(_PEAK["peak"], _PEAK["in_flight"])
+    await asyncio.sleep(0.05)
+    _PEAK["in_flight"] -= 1
+    return MetricResult(row_count=0, details={"conn": conn_repo.connection.tag})
+
+
+class _FakeConn:
+    def __init__(self, tag):
+        self.tag = tag
+        self.execute = AsyncMock()
+        self.fetchval = AsyncMock(return_value="30s")
+
+
+def _connection_source(acquired: list, fail: bool = False):
+    from contextlib import asynccontextmanager
+
+    @asynccontextmanager
+    async def _source():
+        if fail:
+            raise ConnectionError("pool exhausted")
+        conn = _FakeConn(f"c{len(acquired)}")
+        acquired.append(conn)
+        yield conn
+
+    return _source
+
+
+def _register_slow(n):
+    for i in range(n):
+        MetricRegistry._metrics[f"par.m{i}"] = MetricConfig(
+            path=f"par.m{i}", category="health", description="d", severity=None, db_repositories=[],
+            module="tests.unit.core.services.ops.test_metric_runner", function="_test_slow",
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_metric_report_concurrent_uses_one_pooled_connection_per_metric():
+    import time
+    _register_slow(6)
+    _PEAK.update(in_flight=0, peak=0)
+    acquired: list = []
+    shared = _ConnRepo(_FakeConn("shared"))
+
+    started = time.perf_counter()
+    out = await run_metric_report(
+        check_set="x_report", prefix="par.", metrics=None, category=None,
+        repositories={"conn_repo": shared},
+        connections=_connection_source(acquired), concurrency=3, metric_timeout=5,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert [r["check_name"] for r in out["rows"]] == [f"par.m{i}" for i in range(6)]
+    assert _PEAK["peak"] == 3
+    assert elapsed < 0.05 * 6
+    assert len(acquired) == 6
+    assert {r["details"]["conn"] for r in out["rows"]} == {c.tag for c in acquired}
+    assert all(r["details"]["duration_ms"] >= 0 for r in out["rows"])
+    for conn in acquired:
+        assert conn.execute.await_args_list[0].args == ("SET statement_timeout = 5000",)
+        assert conn.execute.await_args_list[-1].args == (
+            "SELECT set_config('statement_timeout', $1, false)", "30s",
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_metric_report_concurrent_connection_failure_is_an_error_row():
+    _register_slow(2)
+    out = await run_metric_report(
+        check_set="x_report", prefix="par.", metrics=None, category=None,
+        repositories={"conn_repo": _ConnRepo(_FakeConn("shared"))},
+        connections=_connection_source([], fail=True),
+    )
+    assert out["error_count"] == 2
+    assert "ConnectionError" in out["errors"][0]["details"]["exception"]
+    assert all(r["details"]["duration_ms"] >= 0 for r in out["errors"])
+
+
+@pytest.mark.asyncio
+async def test_run_metric_report_sequential_applies_timeout_and_rollback_on_shared_connection():
+    MetricRegistry._metrics["seq.boom"] = MetricConfig(
+        path="seq.boom", category="health", description="d", severity=None, db_repositories=[],
+        module="tests.unit.core.services.ops.test_metric_runner", function="_test_boom",
+    )
+    shared = _FakeConn("shared")
+
+    out = await run_metric_report(
+        check_set="x_report", prefix="seq.", metrics=None, category=None,
+        repositories={"conn_repo": _ConnRepo(shared)}, metric_timeout=2.5,
+    )
+
+    assert out["error_count"] == 1
+    assert "duration_ms" in out["errors"][0]["details"]
+    shared.fetchval.assert_awaited_once_with("SHOW statement_timeout")
+    assert [c.args for c in shared.execute.await_args_list] == [
+        ("SET statement_timeout = 2500",),
+        ("ROLLBACK",),
+        ("SELECT set_config('statement_timeout', $1, false)", "30s"),
+    ]
@@ -0,0 +1,86 @@
+"""Unit tests for pricecharting.build_match_catalog (prefetched loads + bulk registration)."""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from automana.core.services.app_integration.pricecharting import pc_match_catalog_service as svc
+from automana.core.storage import LocalStorageBackend, StorageService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return StorageService(LocalStorageBackend(str(tmp_path)))
+
+
+def _product(pid, title, product_type="single"):
+    return {"product_id": pid, "title": title, "product_type": product_type}
+
+
+def _repos(versions_by_set):
+    set_repo = AsyncMock()
+    set_repo.fetch_sets_for_matching.return_value = [
+        {"set_name": "Modern Horizons 2", "set_code": "MH2"},
+        {"set_name": "Dominaria United", "set_code": "DMU"},
+    ]
+    card_repo = AsyncMock()
+    card_repo.get_tcgplayer_ref_id.return_value = 7
+    card_repo.get_all_card_versions_for_set.side_effect = lambda code, _ref: versions_by_set[code]
+    card_repo.register_external_identifiers.return_value = 2
+    map_repo = AsyncMock()
+    map_repo.fetch_all_map.return_value = {"p-old": {"card_version_id": "cv-old", "verified": False}}
+    map_repo.upsert_map.side_effect = lambda rows: len(rows)
+    return set_repo, card_repo, map_repo
+
+
+async def test_matches_sets_and_registers_identifiers_in_one_call(storage):
+    await storage.save_json("sets.json", {"sets": [
+        {"uid": "mh2", "name": "Modern Horizons 2"},
+        {"uid": "dmu", "name": "Dominaria United"},
+        {"uid": "nope", "name": "1999 World Championship"},
+        {"uid": "nofile", "name": "Modern Horizons 2"},
+    ]})
+    await storage.save_json("products/mh2.json", {"products": [
+        _product("p1", "Ragavan #138"), _product("p-old", "Ragavan #138"),
+        _product("box", "Booster Box", "sealed"),
+    ]})
+    await storage.save_json("products/dmu.json", {"products": [
+        _product("p2", "Sheoldred"), _product("p3", "Unknown Card"),
+    ]})
+    await storage.save_json("sales/dmu.json", {"products": {"p2": {"tcgplayer_id": "55"}}})
+    set_repo, card_repo, map_repo = _repos({
+        "MH2": {"ragavan": [{"card_version_id": "cv-rag", "collector_number": "138"}]},
+        "DMU": {"sheoldred": [{"card_version_id": "cv-sheo", "collector_number": "107"}]},
+    })
+
+    result = await svc.build_match_catalog(
+        set_repository=set_repo, card_repository=card_repo,
+        pricecharting_map_repository=map_repo, storage_service=storage,
+    )
+
+    assert result == {"new_matched": 2, "new_unmatched": 1, "skipped_existing": 1,
+                      "skipped_sets": 2, "identifiers_registered": 2}
+    card_repo.register_external_identifier.assert_not_called()
+    card_repo.register_external_identifiers.assert_awaited_once_with(
+        "pricecharting_id", [("cv-rag", "p1"), ("cv-sheo", "p2")]
+    )
+    upserted = map_repo.upsert_map.call_args.args[0]
+    assert [r["pc_product_id"] for r in upserted] == ["p1", "p2", "p3"]
+
+
+async def test_registration_failure_still_persists_map(storage):
+    await storage.save_json("sets.json", {"sets": [{"uid": "mh2", "name": "Modern Horizons 2"}]})
+    await storage.save_json("products/mh2.json", {"products": [_product("p1", "Ragavan #138")]})
+    set_repo, card_repo, map_repo = _repos({
+        "MH2": {"ragavan": [{"card_version_id": "cv-rag", "collector_number": "138"}]},
+    })
+    card_repo.register_external_identifiers.side_effect = RuntimeError("boom")
+
+    result = await svc.build_match_catalog(
+        set_repository=set_repo, card_repository=card_repo,
+        pricecharting_map_repository=map_repo, storage_service=storage,
+    )
+
+    assert result["identifiers_registered"] == 0
+    map_repo.upsert_map.assert_awaited_once()
@@ -77,6 +77,75 @@ def test_match_none(index):
     assert m.match_set_code("1999 World Championship", index) == (None, None)
 
 
+def test_set_matcher_suffix_prefers_first_db_name():
+    matcher = m.SetMatcher(m.build_set_code_index([
+        {"set_name": "Realms Commander Deck", "set_code": "A"},
+        {"set_name": "Forgotten Realms Commander Deck", "set_code": "B"},
+    ]))
+    # both are suffixes; the original scan returned the first in DB order
+    assert matcher.match("Adventures Forgotten Realms Commander Deck") == ("A", "suffix")
+
+
+def test_set_matcher_prefix_shortest_wins():
+    matcher = m.SetMatcher(m.build_set_code_index([
+        {"set_name": "Kaldheim Commander Decks", "set_code": "KHC2"},
+        {"set_name": "Kaldheim Promos", "set_code": "PKHM"},
+        {"set_name": "Kaldheim Commander", "set_code": "KHC"},
+    ]))
+    assert matcher.match("Kaldheim") == ("PKHM", "prefix")
+    assert matcher.match("Kaldheim Commander") == ("KHC", "exact")
+    assert matcher.match("Kaldhm") == (None, None)
+
+
+def test_set_matcher_is_reused_by_match_set_code(index):
+    matcher = m.SetMatcher(index)
+    assert m.match_set_code("Dominara United", matcher) == ("DMU", "fuzzy")
+    assert matcher.match("Revised") == m.match_set_code("Revised", index)
+
+
+def _linear_match(pc_name, db_index):
+    """The pre-index matcher: linear suffix/prefix scans + difflib over all names."""
+    import difflib
+    import re
+    db_norms = list(db_index)
+    pc = re.sub(r"^magic\s+", "", m.normalize_set_name(pc_name))
+    if pc in m.NAME_OVERRIDES:
+        return m.NAME_OVERRIDES[pc], "override"
+    if pc in db_index:
+        return db_index[pc], "exact"
+    for dn in db_norms:
+        if len(dn.split()) >= 3 and pc.endswith(" " + dn):
+            return db_index[dn], "suffix"
+    hits = [dn for dn in db_norms if len(pc) >= 6 and dn.startswith(pc + " ")]
+    if hits:
+        return db_index[min(hits, key=len)], "prefix"
+    close = difflib.get_close_matches(pc, db_norms, n=1, cutoff=0.82)
+    return (db_index[close[0]], "fuzzy") if close else (None, None)
+
+
+def test_set_matcher_agrees_with_linear_scan():
+    names = [
+        "Modern Horizons", "Modern Horizons 2", "Modern Horizons 3 Commander",
+        "Commander Legends", "Commander Legends: Battle for Baldur's Gate",
+        "Innistrad", "Innistrad: Midnight Hunt", "Innistrad: Crimson Vow",
+        "Innistrad Crimson Vow Commander", "Dominaria", "Dominaria United",
+        "Dominaria United Commander", "Throne of Eldraine", "Core Set 2021",
+        "Core Set 2020", "Zendikar Rising", "Zendikar Rising Commander",
+    ]
+    index = m.build_set_code_index(
+        [{"set_name": n, "set_code": f"S{i}"} for i, n in enumerate(names)]
+    )
+    matcher = m.SetMatcher(index)
+    queries = names + [
+        "Modern Horizon", "Innistrad Midnight Hunts", "Dominara", "Core Set 202",
+        "Throne of Eldrain", "Zendikar", "Commander", "Innistrad Crimson",
+        "Magic Zendikar Rising Commander", "Legends Zendikar Rising Commander",
+        "Secret Lair", "Crimson Vow",
+    ]
+    for q in queries:
+        assert matcher.match(q) == _linear_match(q, index), q
+
+
 # ── parse_finish ─────────────────────────────────────────────────────────────
 @pytest.mark.parametrize("title,fid", [
     ("Ragavan [Etched Foil] #11", 3),
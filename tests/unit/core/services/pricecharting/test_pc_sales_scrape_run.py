@@ -0,0 +1,96 @@
+"""Unit tests for the concurrent, checkpointed PriceCharting sales scrape."""
+import asyncio
+import json
+
+import pytest
+
+from automana.core.services.app_integration.pricecharting import pc_sales_scrape_service as svc
+from automana.core.storage import LocalStorageBackend, StorageService
+
+pytestmark = pytest.mark.unit
+
+
+class _Crash(BaseException):
+    """Escapes the per-card ``except Exception`` the way a worker kill would."""
+
+
+class _Repo:
+    def __init__(self, crash_on: str | None = None):
+        self.fetched: list[str] = []
+        self.in_flight = self.max_in_flight = 0
+        self.crash_on = crash_on
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def fetch_sales_html(self, url: str) -> str:
+        if url == self.crash_on:
+            raise _Crash()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.fetched.append(url)
+        return "<html></html>"
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    storage = StorageService(LocalStorageBackend(base_path=str(tmp_path)))
+    await storage.save_json("sets.json", {"sets": [{"uid": "mh2", "name": "Modern Horizons 2"}]})
+    await storage.save_json("products/mh2.json", {"products": [
+        {"product_id": str(i), "url": f"/card/{i}", "product_type": "single"} for i in range(8)
+    ] + [{"product_id": "box", "url": "/box", "product_type": "sealed"}]})
+    return storage
+
+
+async def _run(repo, storage, **kw):
+    return await svc.scrape_sales(
+        repo, storage, inter_card_delay=0, parse_processes=0, **kw
+    )
+
+
+async def test_fetches_concurrently_and_writes_set_file(storage):
+    repo = _Repo()
+
+    result = await _run(repo, storage, concurrency=4)
+
+    assert result["cards_scraped"] == 8 and result["errors"] == 0
+    assert repo.max_in_flight > 1
+    sales = await storage.load_json("sales/mh2.json")
+    assert sorted(sales["products"]) == [str(i) for i in range(8)]
+    assert not await storage.file_exists("sales/mh2.partial.jsonl")
+
+
+async def test_crash_mid_set_resumes_from_checkpoint(storage):
+    with pytest.raises(_Crash):
+        await _run(_Repo(crash_on="/card/5"), storage, concurrency=1)
+    log = storage.build_path("sales/mh2.partial.jsonl")
+    assert [json.loads(line)["product_id"] for line in log.read_text().splitlines()] == ["0", "1", "2", "3", "4"]
+    with open(log, "a") as fh:
+        fh.write('{"product_id": "6", "sal')  # torn write from the crash
+
+    repo = _Repo()
+    result = await _run(repo, storage, concurrency=2)
+
+    assert sorted(repo.fetched) == ["/card/5", "/card/6", "/card/7"]
+    assert result["cards_resumed"] == 5 and result["cards_scraped"] == 3
+    assert len((await storage.load_json("sales/mh2.json"))["products"]) == 8
+
+
+async def test_rate_limit_spaces_request_starts(storage, monkeypatch):
+    acquired = []
+
+    class _Bucket:
+        def __init__(self, rate_per_sec, capacity):
+            assert (rate_per_sec, capacity) == (2.0, 1)
+
+        async def acquire(self, tokens=1):
+            acquired.append(tokens)
+
+    monkeypatch.setattr(svc, "AsyncTokenBucket", _Bucket)
+    await svc.scrape_sales(_Repo(), storage, inter_card_delay=0.5, parse_processes=0)
+    assert len(acquired) == 8
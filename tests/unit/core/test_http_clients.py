@@ -0,0 +1,66 @@
+"""Unit tests for the process-wide pooled httpx client registry."""
+import asyncio
+
+import httpx
+import pytest
+
+from automana.core.repositories.app_integration.scryfall.ApiScryfall_repository import ScryfallAPIRepository
+from automana.core.utils import http_clients
+from automana.core.utils.http_clients import close_http_clients, get_http_client
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+async def _clean_registry():
+    yield
+    await close_http_clients()
+
+
+async def test_repository_instances_share_one_client():
+    first, second = ScryfallAPIRepository(), ScryfallAPIRepository()
+    async with first:
+        pass  # leaving the context must not close the shared client
+    assert first._get_client() is second._get_client()
+    assert not second._get_client().is_closed
+
+
+async def test_clients_are_keyed_by_base_url_http2_and_limits():
+    base = get_http_client("https://a.example")
+    assert get_http_client("https://a.example") is base
+    assert get_http_client("https://b.example") is not base
+    assert get_http_client("https://a.example", http2=False) is not base
+    assert get_http_client("https://a.example", limits=httpx.Limits(max_connections=3)) is not base
+
+
+async def test_close_http_clients_closes_and_forgets():
+    client = get_http_client("https://a.example")
+    await close_http_clients()
+    assert client.is_closed
+    assert http_clients._clients == {}
+    assert get_http_client("https://a.example") is not client
+
+
+def test_client_is_not_shared_across_event_loops():
+    async def _get():
+        return get_http_client("https://loop.example")
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    assert first is not second
+
+
+def test_replaced_client_is_closed_on_its_own_loop():
+    async def _get():
+        return get_http_client("https://loop.example")
+
+    owner = asyncio.new_event_loop()
+    try:
+        first = owner.run_until_complete(_get())
+        second = asyncio.run(_get())
+        assert second is not first
+        owner.run_until_complete(asyncio.sleep(0.01))  # the owner runs the queued aclose
+        assert first.is_closed
+    finally:
+        owner.close()
+    asyncio.run(close_http_clients())
@@ -0,0 +1,229 @@
+"""Unit tests: consolidated MTGStock parquet archive and its loader/staging wiring."""
+import json
+import os
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+
+import automana.core.services.app_integration.mtg_stock.data_loader as loader
+import automana.core.services.app_integration.mtg_stock.data_staging as staging
+from automana.core.storage.mtgstock_archive import (
+    MtgStockArchive,
+    archive_enabled,
+    info_from_details,
+    migrate_legacy_folders,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _prices(rows):
+    """rows: [(print_id, date, price_low)]"""
+    return pd.DataFrame({
+        "print_id": [r[0] for r in rows],
+        "date": [r[1] for r in rows],
+        "price_low": [r[2] for r in rows],
+        "price_avg": [None] * len(rows),
+        "price_foil": [None] * len(rows),
+        "price_market": [None] * len(rows),
+        "price_market_foil": [None] * len(rows),
+    })
+
+
+def _details(pid, **extra):
+    return {"id": pid, "name": f"Card {pid}", "card_set": {"abbreviation": "abc"},
+            "collector_number": str(pid), "tcg_id": 900 + pid, **extra}
+
+
+def _raw_prices(*points):
+    """MTGStock price payload with one `low` series of (iso date, price) points."""
+    return json.dumps({"low": [
+        [int(datetime.fromisoformat(d).replace(tzinfo=timezone.utc).timestamp() * 1000), p]
+        for d, p in points
+    ]}).encode()
+
+
+class TestArchive:
+    def test_refetch_supersedes_older_rows(self, tmp_path):
+        archive = MtgStockArchive(tmp_path, bucket_size=10)
+        archive.append_prices("tcg", _prices([(1, date(2024, 1, 1), 1.0), (1, date(2024, 1, 2), 2.0)]),
+                              fetched_at=datetime(2024, 1, 3, tzinfo=timezone.utc))
+        archive.append_prices("tcg", _prices([(1, date(2024, 1, 1), 5.0)]),
+                              fetched_at=datetime(2024, 2, 1, tzinfo=timezone.utc))
+
+        df = archive.read_prices("tcg")
+        assert df["price_low"].tolist() == [5.0, 2.0]
+
+    def test_reads_filter_by_print_and_date(self, tmp_path):
+        archive = MtgStockArchive(tmp_path, bucket_size=10)
+        archive.append_prices("tcg", _prices([
+            (1, date(2024, 1, 1), 1.0), (1, date(2024, 1, 5), 1.5),
+            (25, date(2024, 1, 5), 2.0), (31, date(2024, 1, 5), 3.0),
+        ]))
+
+        df = archive.read_prices("tcg", print_ids=[1, 25], since=date(2024, 1, 1))
+        assert list(zip(df["print_id"], df["price_low"])) == [(1, 1.5), (25, 2.0)]
+        assert archive.read_prices("tcg", print_ids=[]).empty
+        assert archive.read_prices("cardkingdom").empty
+
+    def test_manifest_tracks_ids_per_market(self, tmp_path):
+        archive = MtgStockArchive(tmp_path, bucket_size=10)
+        archive.append_prices("tcg", _prices([(i, date(2024, 1, 1), 1.0) for i in (1, 2, 3, 7)]))
+        archive.append_info([info_from_details(40, _details(40))])
+
+        manifest = json.loads(archive.manifest_path.read_text())
+        assert manifest["prices"]["tcg"] == [[1, 3], [7, 7]]
+        assert archive.print_ids("tcg") == [1, 2, 3, 7]
+        assert archive.print_ids() == [1, 2, 3, 7, 40]
+
+    def test_buckets_compact_once_parts_pile_up(self, tmp_path):
+        archive = MtgStockArchive(tmp_path, bucket_size=10, max_parts_per_bucket=3)
+        for day in range(1, 6):
+            archive.append_prices("tcg", _prices([(1, date(2024, 1, day), float(day))]))
+
+        parts = list((archive.path / "prices" / "market=tcg" / "bucket=0").glob("part-*.parquet"))
+        assert len(parts) < 3
+        assert archive.read_prices("tcg")["price_low"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        archive.compact()
+        assert len(list(parts[0].parent.glob("part-*.parquet"))) == 1
+
+    def test_info_roundtrip(self, tmp_path):
+        archive = MtgStockArchive(tmp_path)
+        archive.append_info([info_from_details(5, _details(5, scryfallId="sf-5", multiverse_ids=[1]))])
+
+        row = archive.read_info([5]).iloc[0]
+        assert (row.card_name, row.set_abbr, row.scryfall_id, row.tcg_id) == ("Card 5", "abc", "sf-5", "905")
+        assert json.loads(row.multiverse_ids) == [1]
+
+
+def _legacy_tree(root):
+    for pid, points in {1: [("2024-01-01", 1.0)], 2: [("2024-01-01", 2.0), ("2024-01-02", 2.5)]}.items():
+        pdir = root / str(pid)
+        pdir.mkdir()
+        (pdir / "info.json").write_text(json.dumps(_details(pid)))
+        loader.prices_to_parquet(pid, _raw_prices(*points), pdir / "prices.tcg.parquet")
+    (root / "existing_ids.json").write_text(json.dumps([1, 2]))
+
+
+class TestMigration:
+    def test_legacy_tree_keeps_legacy_layout_until_migrated(self, tmp_path):
+        _legacy_tree(tmp_path)
+        assert archive_enabled(tmp_path) is False
+
+        stats = migrate_legacy_folders(tmp_path, batch_size=1)
+
+        assert stats["prints"] == 2 and stats["price_rows"] == 3 and stats["errors"] == 0
+        assert archive_enabled(tmp_path) is True
+        archive = MtgStockArchive(tmp_path)
+        assert archive.print_ids("tcg") == [1, 2]
+        assert archive.read_prices("tcg", [2])["price_low"].tolist() == [2.0, 2.5]
+        assert (tmp_path / "1").exists()
+
+    def test_rerun_is_idempotent_and_can_remove_legacy(self, tmp_path):
+        _legacy_tree(tmp_path)
+        migrate_legacy_folders(tmp_path)
+        migrate_legacy_folders(tmp_path, remove_legacy=True)
+
+        assert len(MtgStockArchive(tmp_path).read_prices("tcg")) == 3
+        assert not (tmp_path / "1").exists()
+
+    def test_fresh_root_uses_archive(self, tmp_path):
+        assert archive_enabled(tmp_path / "missing") is True
+
+    def test_interrupted_migration_keeps_legacy_layout_and_resumes(self, tmp_path, monkeypatch):
+        _legacy_tree(tmp_path)
+        real_append = MtgStockArchive.append_prices
+        calls = []
+
+        def crash_on_second_batch(self, market, df, fetched_at=None):
+            calls.append(df["print_id"].unique().tolist())
+            if len(calls) == 2:
+                raise RuntimeError("killed")
+            return real_append(self, market, df, fetched_at)
+
+        monkeypatch.setattr(MtgStockArchive, "append_prices", crash_on_second_batch)
+        with pytest.raises(RuntimeError):
+            migrate_legacy_folders(tmp_path, batch_size=1)
+
+        archive = MtgStockArchive(tmp_path)
+        assert archive.print_ids("tcg") == [1]
+        assert archive.exists() is False
+        assert archive_enabled(tmp_path) is False
+        assert loader.get_existing_ids(tmp_path) == [1, 2]  # still the legacy list
+
+        monkeypatch.setattr(MtgStockArchive, "append_prices", real_append)
+        stats = migrate_legacy_folders(tmp_path, batch_size=1)
+
+        assert stats["skipped"] == 1 and stats["prints"] == 1 and stats["complete"] is True
+        assert archive_enabled(tmp_path) is True
+        assert archive.print_ids("tcg") == [1, 2]
+        assert "migration" not in archive.read_manifest()
+
+    def test_failed_folders_are_kept_and_block_completion(self, tmp_path):
+        _legacy_tree(tmp_path)
+        (tmp_path / "2" / "info.json").write_text("{not json")
+
+        stats = migrate_legacy_folders(tmp_path, remove_legacy=True)
+
+        assert stats["errors"] == 1 and stats["complete"] is False
+        assert not (tmp_path / "1").exists()
+        assert (tmp_path / "2" / "prices.tcg.parquet").exists()
+        assert archive_enabled(tmp_path) is False
+
+        (tmp_path / "2" / "info.json").write_text(json.dumps(_details(2)))
+        stats = migrate_legacy_folders(tmp_path, remove_legacy=True)
+
+        assert stats["errors"] == 0 and stats["complete"] is True
+        assert MtgStockArchive(tmp_path).read_prices("tcg", [2])["price_low"].tolist() == [2.0, 2.5]
+        assert not (tmp_path / "2").exists()
+
+
+class TestLoaderWiring:
+    async def test_write_batch_appends_to_archive(self, tmp_path):
+        batch = [{"card_id": 3, "data": {"details": json.dumps(_details(3)).encode(),
+                                         "prices": _raw_prices(("2024-03-01", 4.0))}}]
+
+        await loader.write_batch(batch, tmp_path, market="tcg")
+
+        assert loader.get_existing_ids(tmp_path) == [3]
+        assert not (tmp_path / "3").exists()
+        assert MtgStockArchive(tmp_path).read_prices("tcg")["price_low"].tolist() == [4.0]
+
+
+class TestBulkLoadFromArchive:
+    async def test_reads_archive_and_applies_watermarks(self, tmp_path):
+        archive = MtgStockArchive(tmp_path)
+        archive.append_info([info_from_details(pid, _details(pid)) for pid in (1, 2)])
+        archive.append_prices("tcg", _prices([
+            (1, date(2024, 1, 1), 1.0), (1, date(2024, 1, 2), 1.5), (2, date(2024, 1, 1), 2.0),
+        ]))
+        price_repo = AsyncMock()
+        price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {1: date(2024, 1, 1), 2: date(2024, 1, 1)}
+
+        result = await staging.bulk_load(
+            price_repository=price_repo, ops_repository=AsyncMock(),
+            root_folder=str(tmp_path), ingestion_run_id=7,
+        )
+
+        assert result == {"raw_rows_loaded": 1, "prints_up_to_date": 1}
+        df = price_repo.copy_prices_mtgstock.await_args.args[0]
+        assert df[["print_id", "ts_date", "price_low", "card_name", "tcg_id"]].values.tolist() == [
+            [1, date(2024, 1, 2), 1.5, "Card 1", "901"]
+        ]
+        assert df["source_code"].tolist() == ["tcg"]
+
+    async def test_legacy_tree_is_still_read_without_archive(self, tmp_path):
+        _legacy_tree(tmp_path)
+        os.remove(tmp_path / "existing_ids.json")
+        price_repo = AsyncMock()
+        price_repo.clear_raw_prices.return_value = 0
+        price_repo.fetch_mtgstock_watermarks.return_value = {}
+
+        result = await staging.bulk_load(
+            price_repository=price_repo, ops_repository=AsyncMock(), root_folder=str(tmp_path),
+        )
+
+        assert result["raw_rows_loaded"] == 3
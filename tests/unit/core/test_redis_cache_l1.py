@@ -0,0 +1,230 @@
+"""Unit tests: in-process L1 cache tier, single-flight, invalidation fan-out and namespaces."""
+import asyncio
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from automana.core.utils import redis_cache
+from automana.core.utils.redis_cache import (
+    INVALIDATION_CHANNEL,
+    L1Cache,
+    get_from_cache,
+    invalidate_cache_pattern,
+    invalidate_namespace,
+    namespaced_key,
+    set_to_cache,
+    single_flight,
+    unlink_stale_generations,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _AsyncIter:
+    def __init__(self, items):
+        self._items = list(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._items:
+            raise StopAsyncIteration
+        return self._items.pop(0)
+
+
+@pytest.fixture
+def redis_client():
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.setex = AsyncMock()
+    client.delete = AsyncMock()
+    client.publish = AsyncMock()
+    client.set = AsyncMock(return_value=True)
+    client.exists = AsyncMock(return_value=0)
+    with patch.object(redis_cache, "_l1", L1Cache(max_entries=4, ttl_seconds=30)), \
+         patch.object(redis_cache, "get_redis_client", AsyncMock(return_value=client)):
+        yield client
+
+
+def test_l1_evicts_least_recently_used():
+    l1 = L1Cache(max_entries=2, ttl_seconds=30)
+    l1.set("a", b"1")
+    l1.set("b", b"2")
+    l1.get("a")
+    l1.set("c", b"3")
+    assert l1.get("b") is None
+    assert l1.get("a") == b"1"
+
+
+def test_l1_entry_expires_after_shorter_of_both_ttls():
+    l1 = L1Cache(max_entries=8, ttl_seconds=30)
+    with patch("automana.core.utils.redis_cache.time.monotonic", return_value=100.0):
+        l1.set("k", b"1", ttl_seconds=5)
+    with patch("automana.core.utils.redis_cache.time.monotonic", return_value=104.0):
+        assert l1.get("k") == b"1"
+    with patch("automana.core.utils.redis_cache.time.monotonic", return_value=105.0):
+        assert l1.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_l1_hit_skips_redis(redis_client):
+    redis_client.get.return_value = orjson.dumps({"x": 1})
+    assert await get_from_cache("card_search:page:abc") == {"x": 1}
+    assert await get_from_cache("card_search:page:abc") == {"x": 1}
+    assert redis_client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_set_to_cache_populates_l1(redis_client):
+    await set_to_cache("k", [1, 2], expiry_seconds=60)
+    assert await get_from_cache("k") == [1, 2]
+    redis_client.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_redis_read_racing_invalidation_does_not_repopulate_l1(redis_client):
+    async def slow_get(key):
+        redis_cache.get_l1_cache().invalidate_pattern("card_search:*")
+        return orjson.dumps("stale")
+
+    redis_client.get.side_effect = slow_get
+    await get_from_cache("card_search:page:abc")
+    assert redis_cache.get_l1_cache().get("card_search:page:abc") is None
+
+
+@pytest.mark.asyncio
+async def test_set_to_cache_after_invalidation_skips_l1(redis_client):
+    epoch = redis_cache.get_l1_cache().epoch
+    redis_cache.get_l1_cache().invalidate_pattern("card_search:*")
+
+    assert await set_to_cache("card_search:page:abc", "stale", epoch=epoch)
+
+    redis_client.setex.assert_awaited_once()
+    assert redis_cache.get_l1_cache().get("card_search:page:abc") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_pattern_clears_l1_and_publishes(redis_client):
+    redis_client.scan_iter = MagicMock(return_value=_AsyncIter([b"card_search:page:abc"]))
+    await set_to_cache("card_search:page:abc", 1)
+    await set_to_cache("price_history:xyz", 2)
+
+    assert await invalidate_cache_pattern("card_search:*") == 1
+
+    l1 = redis_cache.get_l1_cache()
+    assert l1.get("card_search:page:abc") is None
+    assert l1.get("price_history:xyz") is not None
+    redis_client.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, "card_search:*")
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_loads(redis_client):
+    cache, computed = {}, 0
+
+    def loader():
+        async def load():
+            nonlocal computed
+            if "k" in cache:
+                return cache["k"]
+            computed += 1
+            await asyncio.sleep(0.01)
+            cache["k"] = "value"
+            return "value"
+        return AsyncMock(side_effect=load)
+
+    loads = [loader() for _ in range(5)]
+    results = await asyncio.gather(*(single_flight("k", load) for load in loads))
+    assert results == ["value"] * 5
+    assert computed == 1
+    # Every caller ran its own load (on its own connection); only the wait was shared.
+    for load in loads:
+        load.assert_awaited_once()
+    redis_client.set.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_leader_releases_waiters(redis_client):
+    started = asyncio.Event()
+
+    async def slow_load():
+        started.set()
+        await asyncio.sleep(10)
+
+    leader = asyncio.create_task(single_flight("k", slow_load))
+    await started.wait()
+    follower = asyncio.create_task(single_flight("k", AsyncMock(return_value="mine")))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "mine"
+    assert redis_cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_waits_for_lock_held_elsewhere(redis_client):
+    redis_client.set.return_value = None
+    redis_client.exists.side_effect = [1, 1, 0]
+    load = AsyncMock(return_value="value")
+
+    with patch.object(redis_cache, "_LOCK_POLL_SECONDS", 0):
+        assert await single_flight("k", load) == "value"
+    assert redis_client.exists.await_count == 3
+    load.assert_awaited_once()
+    redis_client.delete.assert_not_awaited()
+
+
+@pytest.fixture
+def generations():
+    with patch.object(redis_cache, "_generations", {}) as gens:
+        yield gens
+
+
+@pytest.mark.asyncio
+async def test_namespaced_key_embeds_generation_and_caches_it(redis_client, generations):
+    redis_client.get.return_value = b"7"
+    assert await namespaced_key("card_search", "page:abc") == "card_search:g7:page:abc"
+    assert await namespaced_key("card_search", "facets:def") == "card_search:g7:facets:def"
+    redis_client.get.assert_awaited_once_with("cache_gen:card_search")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_namespace_is_a_single_incr(redis_client, generations):
+    redis_client.get.return_value = b"7"
+    await namespaced_key("card_search", "page:abc")
+    redis_client.incr = AsyncMock(return_value=8)
+    redis_client.scan_iter = MagicMock()
+
+    assert await invalidate_namespace("card_search") == 8
+
+    redis_client.scan_iter.assert_not_called()
+    redis_client.delete.assert_not_awaited()
+    redis_client.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, "card_search:*")
+    redis_client.get.return_value = b"8"
+    assert await namespaced_key("card_search", "page:abc") == "card_search:g8:page:abc"
+
+
+@pytest.mark.asyncio
+async def test_disabled_l1_always_reads_redis(redis_client, generations):
+    redis_cache.disable_l1_cache()
+    redis_client.get.return_value = b"7"
+    await namespaced_key("card_search", "page:abc")
+    await set_to_cache("k", [1, 2])
+    await get_from_cache("k")
+
+    assert not generations
+    assert len(redis_cache.get_l1_cache()) == 0
+    assert redis_client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unlink_stale_generations_keeps_current_generation(redis_client):
+    redis_client.get.return_value = b"1"
+    redis_client.scan_iter = MagicMock(return_value=_AsyncIter([
+        b"card_search:g0:page:a", b"card_search:g1:page:b", b"card_search:g10:page:c",
+    ]))
+    redis_client.unlink = AsyncMock(side_effect=lambda *keys: len(keys))
+
+    assert await unlink_stale_generations("card_search") == 2
+    redis_client.unlink.assert_awaited_once_with(b"card_search:g0:page:a", b"card_search:g10:page:c")
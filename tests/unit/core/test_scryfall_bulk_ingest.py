@@ -0,0 +1,162 @@
+"""Unit tests for the single-pass Scryfall bulk ingest (staging.scryfall.ingest_cards_bulk).
+
+Verifies:
+  - Cards, prices and purchase URIs are all produced from one file read
+  - Price / URI batches are flushed only after the card batch they belong to
+    has been merged (COPY loader, the default)
+  - Non-imported languages are still routed to the price router
+  - loader_mode="jsonb" keeps the per-batch insert_batch_card_versions path
+  - A failed copy load reports the batch to resume from, and resuming skips it
+"""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from automana.core.repositories.card_catalog.card_repository import CardReferenceRepository
+from automana.core.services.app_integration.scryfall.bulk_ingest import ingest_cards_bulk
+from automana.core.services.card_catalog.card_service import (
+    EnhancedCardImportService,
+    ProcessingConfig,
+)
+from automana.core.exceptions.service_layer_exceptions.card_catalogue import card_exception
+from automana.core.storage import LocalStorageBackend, StorageService
+
+
+def _batch_response(n: int) -> CardReferenceRepository.BatchInsertResponse:
+    return CardReferenceRepository.BatchInsertResponse(
+        total_processed=n,
+        successful_inserts=n,
+        failed_inserts=0,
+        inserted_card_ids=[],
+        errors=[],
+    )
+
+
+@pytest.fixture
+def repos():
+    # One parent mock so call order across the two repositories is recorded.
+    parent = MagicMock()
+    card_repo = AsyncMock()
+    card_repo.add_many.side_effect = lambda values: _batch_response(len(json.loads(values)))
+    card_repo.stage_card_batch.side_effect = lambda load_id, batch_seq, cards: len(cards)
+    card_repo.merge_staged_cards.side_effect = lambda load_id: [(1, _batch_response(1))]
+    card_repo.update_purchase_uris_batch.return_value = 1
+    pricing_repo = AsyncMock()
+    pricing_repo.upsert_scryfall_price_batch.side_effect = lambda rows, ts_date: len(rows)
+    parent.attach_mock(card_repo, "card")
+    parent.attach_mock(pricing_repo, "pricing")
+    return parent, card_repo, pricing_repo
+
+
+def _write_bulk(tmp_path, cards) -> StorageService:
+    (tmp_path / "cards.json").write_text(json.dumps(cards))
+    return StorageService(LocalStorageBackend(base_path=str(tmp_path)))
+
+
+async def test_no_file_skips(repos):
+    _, card_repo, pricing_repo = repos
+    result = await ingest_cards_bulk(
+        card_repository=card_repo,
+        pricing_repository=pricing_repo,
+        file_name=None,
+    )
+    assert result["prices_loaded"] == 0
+    card_repo.add_many.assert_not_called()
+    pricing_repo.upsert_scryfall_price_batch.assert_not_called()
+
+
+async def test_single_pass_loads_cards_prices_and_uris(tmp_path, repos, scryfall_card):
+    parent, card_repo, pricing_repo = repos
+    storage = _write_bulk(tmp_path, [scryfall_card])
+
+    result = await ingest_cards_bulk(
+        card_repository=card_repo,
+        pricing_repository=pricing_repo,
+        storage_service=storage,
+        file_name="cards.json",
+    )
+
+    card_repo.stage_card_batch.assert_awaited_once()
+    card_repo.merge_staged_cards.assert_awaited_once()
+    card_repo.add_many.assert_not_called()
+    rows = pricing_repo.upsert_scryfall_price_batch.call_args[0][0]
+    assert {(r["source_code"], r["finish_code"]) for r in rows} == {
+        ("tcg", "NONFOIL"),
+        ("cardmarket", "NONFOIL"),
+        ("cardhoarder", "NONFOIL"),
+    }
+    card_repo.update_purchase_uris_batch.assert_awaited_once()
+    assert result["prices_loaded"] == 3
+    assert result["total_cards"] == 1
+    assert result["successful_inserts"] == 1
+
+    # Prices must resolve against card versions written earlier in the pass.
+    names = [c[0] for c in parent.mock_calls]
+    assert names.index("card.merge_staged_cards") < names.index("pricing.upsert_scryfall_price_batch")
+
+
+async def test_non_imported_language_still_routed_to_prices(tmp_path, repos, scryfall_card):
+    _, card_repo, pricing_repo = repos
+    french = {**scryfall_card, "id": "fr-1", "lang": "fr"}
+    storage = _write_bulk(tmp_path, [french])
+
+    result = await ingest_cards_bulk(
+        card_repository=card_repo,
+        pricing_repository=pricing_repo,
+        storage_service=storage,
+        file_name="cards.json",
+    )
+
+    card_repo.stage_card_batch.assert_not_called()
+    card_repo.merge_staged_cards.assert_not_called()
+    rows = pricing_repo.upsert_scryfall_price_batch.call_args[0][0]
+    assert {r["scryfall_id"] for r in rows} == {"fr-1"}
+    assert result["total_cards"] == 0
+
+
+async def test_jsonb_loader_mode(tmp_path, repos, scryfall_card):
+    parent, card_repo, pricing_repo = repos
+    storage = _write_bulk(tmp_path, [scryfall_card])
+
+    result = await ingest_cards_bulk(
+        card_repository=card_repo,
+        pricing_repository=pricing_repo,
+        storage_service=storage,
+        file_name="cards.json",
+        loader_mode="jsonb",
+    )
+
+    card_repo.add_many.assert_awaited_once()
+    card_repo.stage_card_batch.assert_not_called()
+    assert result["prices_loaded"] == 3
+    names = [c[0] for c in parent.mock_calls]
+    assert names.index("card.add_many") < names.index("pricing.upsert_scryfall_price_batch")
+
+
+async def test_copy_failure_reports_resume_batch(tmp_path, repos, scryfall_card):
+    _, card_repo, _ = repos
+    cards = [{**scryfall_card, "id": f"550e8400-e29b-41d4-a716-44665544010{i}"} for i in range(3)]
+    storage = _write_bulk(tmp_path, cards)
+    config = dict(batch_size=1, max_retries=0, skip_validation_errors=False,
+                  loader_mode="copy", copy_merge_every=2)
+
+    def stage(load_id, batch_seq, rows):
+        if batch_seq == 3:
+            raise RuntimeError("copy failed")
+        return len(rows)
+
+    card_repo.stage_card_batch.side_effect = stage
+    card_repo.merge_staged_cards.side_effect = lambda load_id: [(1, _batch_response(1)), (2, _batch_response(1))]
+    service = EnhancedCardImportService(card_repo, config=ProcessingConfig(**config), storage_service=storage)
+    with pytest.raises(card_exception.CardInsertError, match="resume_from_batch=2"):
+        await service.process_large_cards_json("cards.json")
+
+    card_repo.stage_card_batch.reset_mock()
+    card_repo.stage_card_batch.side_effect = lambda load_id, batch_seq, rows: len(rows)
+    card_repo.merge_staged_cards.side_effect = lambda load_id: [(3, _batch_response(1))]
+    service = EnhancedCardImportService(card_repo, config=ProcessingConfig(**config), storage_service=storage)
+    stats = await service.process_large_cards_json("cards.json", resume_from_batch=2)
+
+    assert [c.args[1] for c in card_repo.stage_card_batch.await_args_list] == [3]
+    assert stats.total_cards == 1
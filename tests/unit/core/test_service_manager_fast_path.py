@@ -0,0 +1,194 @@
+"""Unit tests: ServiceManager read-only fast path and resolved-callable cache."""
+import sys
+from contextlib import asynccontextmanager
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from automana.core.framework.registry import ServiceRegistry
+from automana.core.framework.service_manager import ServiceManager
+
+pytestmark = pytest.mark.unit
+
+_MODULE = "tests_fast_path_services"
+
+
+class _Repo:
+    def __init__(self, connection, executor=None):
+        self.connection = connection
+
+
+def _pool(conn):
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool.acquire = MagicMock(side_effect=acquire)
+    pool.release = AsyncMock()
+    return pool
+
+
+def _conn():
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.transaction = MagicMock()
+    return conn
+
+
+@pytest.fixture
+def registered():
+    """Register a read-only and a transactional service backed by a throwaway module."""
+    module = ModuleType(_MODULE)
+
+    async def read_thing(thing_repository, **kwargs):
+        return thing_repository.connection
+
+    async def write_thing(thing_repository, **kwargs):
+        return thing_repository.connection
+
+    module.read_thing, module.write_thing, module._Repo = read_thing, write_thing, _Repo
+    read_thing.__module__ = write_thing.__module__ = _MODULE
+    sys.modules[_MODULE] = module
+    ServiceRegistry.register_db_repository("thing", _MODULE, "_Repo")
+    ServiceRegistry.register("tests.thing.read", db_repositories=["thing"], read_only=True,
+                             command_timeout=5)(read_thing)
+    ServiceRegistry.register("tests.thing.write", db_repositories=["thing"])(write_thing)
+    ServiceRegistry.register("tests.thing.load", db_repositories=["thing"], pool="bulk")(write_thing)
+    ServiceRegistry.register("tests.thing.pinned", db_repositories=["thing"], read_only=True,
+                             pool="primary")(read_thing)
+    try:
+        yield
+    finally:
+        ServiceRegistry._services.pop("tests.thing.read", None)
+        ServiceRegistry._services.pop("tests.thing.write", None)
+        ServiceRegistry._services.pop("tests.thing.load", None)
+        ServiceRegistry._services.pop("tests.thing.pinned", None)
+        ServiceRegistry._repository_registry.pop("thing", None)
+        sys.modules.pop(_MODULE, None)
+
+
+def _manager(pool, **pools):
+    manager = object.__new__(ServiceManager)
+    manager.connection_pool = pool
+    manager.pools = pools
+    manager.query_executor = None
+    manager._service_callables = {}
+    manager._db_repository_classes = {}
+    manager._api_repository_classes = {}
+    manager._resolve_registered()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_read_only_service_uses_read_pool_without_transaction(registered):
+    write_conn, read_conn = _conn(), _conn()
+    manager = _manager(_pool(write_conn), read=_pool(read_conn))
+
+    assert await manager._execute_service("tests.thing.read") is read_conn
+    read_conn.transaction.assert_not_called()
+    # No transaction, so the timeout is session-scoped and reset afterwards
+    assert [c.args[0] for c in read_conn.execute.await_args_list] == [
+        "SET SESSION statement_timeout = 5000",
+        "RESET statement_timeout",
+    ]
+    write_conn.transaction.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transactional_service_still_opens_transaction(registered):
+    conn = _conn()
+    pool = _pool(conn)
+    pool.acquire = AsyncMock(return_value=conn)
+    tx = MagicMock(start=AsyncMock(), commit=AsyncMock(), rollback=AsyncMock())
+    conn.transaction.return_value = tx
+
+    manager = _manager(pool)
+    assert await manager._execute_service("tests.thing.write") is conn
+    tx.start.assert_awaited_once()
+    tx.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_resolved_callables_skip_import_per_call(registered):
+    manager = _manager(_pool(_conn()))
+    assert "tests.thing.read" in manager._service_callables
+    assert manager._db_repository_classes["thing"] is _Repo
+
+    with patch("automana.core.framework.service_manager.importlib.import_module") as import_module:
+        await manager._execute_service("tests.thing.read")
+    import_module.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_services_route_to_named_pools(registered):
+    primary_conn, read_conn, bulk_conn = _conn(), _conn(), _conn()
+    bulk = _pool(bulk_conn)
+    bulk.acquire = AsyncMock(return_value=bulk_conn)
+    bulk_conn.transaction.return_value = MagicMock(start=AsyncMock(), commit=AsyncMock())
+    manager = _manager(_pool(primary_conn), read=_pool(read_conn), bulk=bulk)
+
+    assert await manager._execute_service("tests.thing.load") is bulk_conn
+    bulk.release.assert_awaited_once_with(bulk_conn)
+    # Pinned read-only services skip the replica
+    assert await manager._execute_service("tests.thing.pinned") is primary_conn
+
+
+@pytest.mark.asyncio
+async def test_unconfigured_pool_falls_back_to_primary(registered):
+    conn = _conn()
+    manager = _manager(_pool(conn))
+    assert await manager._execute_service("tests.thing.read") is conn
+
+
+@pytest.mark.asyncio
+async def test_connection_source_hands_out_pool_connections(monkeypatch):
+    monkeypatch.setattr(ServiceManager, "_instance", None)
+    assert ServiceManager.connection_source() is None
+
+    primary_conn, bulk_conn = _conn(), _conn()
+    manager = _manager(_pool(primary_conn), bulk=_pool(bulk_conn))
+    manager._initialized = True
+    monkeypatch.setattr(ServiceManager, "_instance", manager)
+
+    async with ServiceManager.connection_source()() as conn:
+        assert conn is primary_conn
+    async with ServiceManager.connection_source("bulk")() as conn:
+        assert conn is bulk_conn
+    async with ServiceManager.connection_source("read")() as conn:
+        assert conn is primary_conn  # unconfigured pool falls back to primary
+
+
+@pytest.mark.asyncio
+async def test_post_commit_callbacks_run_after_commit_only(registered):
+    from automana.core.framework import post_commit
+
+    conn = _conn()
+    pool = _pool(conn)
+    pool.acquire = AsyncMock(return_value=conn)
+    events = []
+    tx = MagicMock(start=AsyncMock(), rollback=AsyncMock(),
+                   commit=AsyncMock(side_effect=lambda: events.append("commit")))
+    conn.transaction.return_value = tx
+
+    async def record():
+        events.append("callback")
+
+    async def queue_and(fail, thing_repository, **kwargs):
+        assert post_commit.after_commit(record)
+        if fail:
+            raise RuntimeError("boom")
+
+    manager = _manager(pool)
+    manager._service_callables["tests.thing.write"] = lambda **kw: queue_and(False, **kw)
+    await manager._execute_service("tests.thing.write")
+    assert events == ["commit", "callback"]
+
+    events.clear()
+    manager._service_callables["tests.thing.write"] = lambda **kw: queue_and(True, **kw)
+    with pytest.raises(RuntimeError):
+        await manager._execute_service("tests.thing.write")
+    assert events == []
+    assert post_commit.after_commit(record) is False
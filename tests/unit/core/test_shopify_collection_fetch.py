@@ -38,9 +38,9 @@ async def test_bulk_copy_prices_uses_pricing_schema():
 
     await repo.bulk_copy_prices(df)
 
-    table_arg = mock_conn.copy_to_table.call_args.kwargs["table_name"]
-    assert table_arg == "pricing.shopify_staging_raw", (
-        f"Expected 'pricing.shopify_staging_raw', got: {table_arg!r}"
+    kwargs = mock_conn.copy_to_table.call_args.kwargs
+    assert (kwargs["schema_name"], kwargs["table_name"]) == ("pricing", "shopify_staging_raw"), (
+        f"Expected pricing.shopify_staging_raw, got: {kwargs!r}"
     )
 
 
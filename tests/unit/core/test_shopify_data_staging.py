@@ -42,3 +42,167 @@ class TestDedupeWithCollectionTier:
         ])
         result = _dedupe_batch(df)
         assert len(result) == 1
+
+
+# ── columnar JSON -> parquet conversion ──────────────────────────────────────
+import json
+from unittest.mock import AsyncMock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from bs4 import BeautifulSoup
+
+from automana.core.services.app_integration.shopify import data_staging_service as staging
+from automana.core.storage import LocalStorageBackend, StorageService
+
+
+def _bs4_metadata(html):
+    div = BeautifulSoup(html, "html.parser").find("div", class_="catalogMetaData")
+    if not div:
+        return {}
+    return {"card_id": div.get("data-cardid"), "tcg_id": div.get("data-tcgid"),
+            "card_type": div.get("data-cardtype"), "last_updated": div.get("data-lastupdated")}
+
+
+@pytest.mark.parametrize("html", [
+    '<p>Text</p><div class="catalogMetaData" data-cardid="123" data-tcgid="456" '
+    'data-cardtype="Creature" data-lastupdated="2026-05-01"></div>',
+    "<div class='x catalogMetaData y' data-tcgid='9' data-cardid=7>ok</div>",
+    '<div class="other" data-cardid="1"></div><div class="catalogMetaData" data-cardid="2"></div>',
+    '<DIV class="catalogMetaData" data-cardtype="Land &amp; Lair"></DIV>',
+    "<p>no metadata here</p>",
+    "",
+])
+def test_parse_catalog_metadata_matches_beautifulsoup(html):
+    assert staging.parse_catalog_metadata(html) == _bs4_metadata(html)
+
+
+def _item(pid, price, updated="2026-05-01T10:00:00+10:00", title="Near Mint", handle=None):
+    return {
+        "id": pid, "title": f"Card {pid}", "handle": handle or f"card-{pid}", "tags": ["MTG"],
+        "body_html": f'<div class="catalogMetaData" data-cardid="{pid}0" data-tcgid="{pid}1"></div>',
+        "variants": [{"title": title, "price": price, "updated_at": updated}],
+    }
+
+
+def _write_page(root, name, handle, items):
+    page = root / "7_fetch" / name
+    page.parent.mkdir(parents=True, exist_ok=True)
+    page.write_text(json.dumps({"_collection_handle": handle, "items": items}))
+
+
+@pytest.fixture
+def shop_storage(tmp_path):
+    return StorageService(LocalStorageBackend(str(tmp_path)))
+
+
+async def _process(storage):
+    market_repo = AsyncMock()
+    market_repo.get_market_code.return_value = 7
+    await staging.process_json_dir_to_parquet(
+        market_repository=market_repo, storage_service=storage,
+        path_to_json=str(storage.backend.base_path), market_code="gg",
+        output_path=str(storage.backend.base_path / "parquet" / "7"),
+    )
+
+
+class TestProcessToParquet:
+    async def test_writes_one_deduped_part_and_info_table(self, shop_storage):
+        root = shop_storage.backend.base_path
+        _write_page(root, "mtg-set_products.json", "mtg-set", [_item(1, "4.50"), _item(2, "1.00")])
+        _write_page(root, "mtg-in-stock_products.json", "mtg-in-stock", [_item(1, "5.00")])
+
+        await _process(shop_storage)
+
+        parts = list((root / "parquet" / "7" / "prices").glob("part-*.parquet"))
+        assert len(parts) == 1
+        table = pq.read_table(parts[0])
+        assert table.schema.equals(staging.PRICE_SCHEMA)
+        assert table.column("product_id").to_pylist() == [1, 2]
+        assert table.column("price").to_pylist() == [5.00, 1.00]
+        assert table.column("card_id").to_pylist() == ["10", "20"]
+        assert str(table.column("date")[0].as_py().date()) == "2026-05-01"
+        assert not list((root / "parquet" / "7").glob("*/info.json"))
+
+        info = staging.read_product_info(shop_storage, "parquet/7")
+        assert [(r["product_id"], r["shop_id"], r["tcg_id"]) for r in info] == [(1, 7, "11"), (2, 7, "21")]
+
+    async def test_dedupes_across_flushes_with_in_stock_winning(self, shop_storage, monkeypatch):
+        monkeypatch.setattr(staging, "FLUSH_ROWS", 1)
+        root = shop_storage.backend.base_path
+        # The per-set file sorts first by name; the in-stock copy must still win.
+        _write_page(root, "a-set_products.json", "a-set", [_item(1, "4.50"), _item(2, "1.00"), _item(1, "4.75")])
+        _write_page(root, "z-in-stock_products.json", "z-in-stock", [_item(1, "5.00")])
+
+        await _process(shop_storage)
+
+        (part,) = (root / "parquet" / "7" / "prices").glob("part-*.parquet")
+        table = pq.read_table(part)
+        assert list(zip(table.column("product_id").to_pylist(), table.column("price").to_pylist())) == [
+            (1, 5.00), (2, 1.00),
+        ]
+        assert table.schema.equals(staging.PRICE_SCHEMA)
+        assert not list(part.parent.glob("*.tmp"))
+
+    async def test_info_table_upserts_across_runs(self, shop_storage):
+        root = shop_storage.backend.base_path
+        _write_page(root, "a_products.json", "a", [_item(1, "1.00"), _item(2, "1.00")])
+        await _process(shop_storage)
+        _write_page(root, "a_products.json", "a", [_item(2, "2.00", handle="renamed")])
+        await _process(shop_storage)
+
+        info = staging.read_product_info(shop_storage, "parquet/7")
+        assert [(r["product_id"], r["handle"]) for r in info] == [(1, "card-1"), (2, "renamed")]
+
+
+async def test_stage_reads_run_parts_and_legacy_product_files(shop_storage):
+    root = shop_storage.backend.base_path
+    _write_page(root, "a_products.json", "a", [_item(1, "1.00")])
+    await _process(shop_storage)
+    legacy = pa.table({
+        "product_id": pa.array([2], pa.int64()),
+        "date": pa.array([pd.Timestamp("2026-04-01", tz="UTC")]),
+        "variation": pa.array(["Near Mint"]).dictionary_encode(),
+        "price": pa.array([3.0]),
+        "scraped_at": pa.array([pd.Timestamp("2026-04-02", tz="UTC")]),
+    })
+    (root / "parquet" / "7" / "2").mkdir()
+    pq.write_table(legacy, root / "parquet" / "7" / "2" / "data.parquet")
+    product_repo = AsyncMock()
+
+    await staging.stage_data_from_parquet(
+        product_repository=product_repo, storage_service=shop_storage,
+        parquet_base_path=str(root / "parquet" / "7"),
+    )
+
+    table = product_repo.bulk_copy_prices.await_args.args[0]
+    assert table.schema.equals(staging.PRICE_SCHEMA)
+    assert sorted(table.column("product_id").to_pylist()) == [1, 2]
+    assert table.column("card_id").to_pylist()[table.column("product_id").to_pylist().index(2)] is None
+
+
+async def test_stage_streams_coalesced_batches_and_skips_unreadable_files(shop_storage):
+    base = shop_storage.backend.base_path / "parquet" / "7"
+    for pid in range(1, 8):
+        (base / str(pid)).mkdir(parents=True)
+        rows = pa.table({
+            "product_id": pa.array([pid] * 3, pa.int64()),
+            "date": pa.array([pd.Timestamp(f"2026-04-0{d}", tz="UTC") for d in (1, 2, 3)]),
+            "variation": pa.array(["Near Mint"] * 3),
+            "price": pa.array([1.0, 2.0, 3.0]),
+            "scraped_at": pa.array([pd.Timestamp("2026-04-04", tz="UTC")] * 3),
+        })
+        pq.write_table(rows, base / str(pid) / "data.parquet")
+    (base / "8").mkdir()
+    (base / "8" / "data.parquet").write_bytes(b"not parquet")
+    product_repo = AsyncMock()
+
+    await staging.stage_data_from_parquet(
+        product_repository=product_repo, storage_service=shop_storage,
+        parquet_base_path=str(base), batch_size=5,
+    )
+
+    sizes = [c.args[0].num_rows for c in product_repo.bulk_copy_prices.await_args_list]
+    assert sum(sizes) == 21
+    assert all(n >= 5 for n in sizes[:-1])
+    assert not (shop_storage.backend.base_path / "_tmp").exists()
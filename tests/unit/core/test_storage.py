@@ -1,5 +1,8 @@
+import json
 from pathlib import Path
 
+import pytest
+
 from automana.core.storage import LocalStorageBackend, StorageService
 
 
@@ -18,3 +21,22 @@ def test_build_path_is_not_timestamped(tmp_path):
     svc = _make_service(tmp_path)
     result = svc.build_path("AllIdentifiers.json")
     assert result.name == "AllIdentifiers.json"
+
+
+async def test_iter_json_items_yields_all_items_in_chunks(tmp_path):
+    svc = _make_service(tmp_path)
+    (tmp_path / "cards.json").write_text(json.dumps([{"id": i} for i in range(7)]))
+
+    chunks = [chunk async for chunk in svc.iter_json_items("cards.json", chunk_size=3)]
+
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    assert [item["id"] for c in chunks for item in c] == list(range(7))
+
+
+async def test_iter_json_items_propagates_parse_errors(tmp_path):
+    svc = _make_service(tmp_path)
+    (tmp_path / "broken.json").write_text('[{"id": 1}, {"id": ')
+
+    with pytest.raises(Exception):
+        async for _ in svc.iter_json_items("broken.json"):
+            pass
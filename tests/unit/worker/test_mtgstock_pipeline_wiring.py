@@ -22,6 +22,7 @@ EXPECTED_MTGSTOCK_STEPS = [
     "mtg_stock.data_staging.from_raw_to_staging",
     "mtg_stock.data_staging.retry_rejects",
     "mtg_stock.data_staging.from_staging_to_prices",
+    "mtg_stock.data_staging.advance_watermarks",
     "ops.pipeline_services.finish_run",
 ]
 
@@ -45,6 +46,12 @@ class TestTUIPanelSteps:
         idx_prices = task.steps.index("mtg_stock.data_staging.from_staging_to_prices")
         assert idx_raw < idx_retry < idx_prices
 
+    def test_watermarks_advance_only_after_promotion(self):
+        task = next(t for t in KNOWN_TASKS if t.name == "mtgStock_download_pipeline")
+        idx_prices = task.steps.index("mtg_stock.data_staging.from_staging_to_prices")
+        idx_wm = task.steps.index("mtg_stock.data_staging.advance_watermarks")
+        assert idx_wm == idx_prices + 1
+
 
 class TestBeatSchedule:
     def test_mtgstock_daily_entry_removed(self):
@@ -15,8 +15,7 @@ EXPECTED_SCRYFALL_STEPS = [
     "staging.scryfall.download_sets",
     "card_catalog.set.process_large_sets_json",
     "staging.scryfall.download_cards_bulk",
-    "card_catalog.card.process_large_json",
-    "staging.scryfall.load_prices_from_bulk",
+    "staging.scryfall.ingest_cards_bulk",
     "card_catalog.card_search.refresh",
     "card_catalog.card_search.invalidate",
     "staging.scryfall.download_and_load_migrations",